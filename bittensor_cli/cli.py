@@ -4,6 +4,7 @@ import copy
 import curses
 import datetime
 import importlib
+import importlib.util
 import json
 import logging
 import os.path
@@ -18,11 +19,6 @@ from typing import Coroutine, Optional, Union
 
 import rich
 import typer
-from async_substrate_interface.errors import (
-    SubstrateRequestException,
-    ConnectionClosed,
-    InvalidHandshake,
-)
 from bittensor_wallet import Wallet
 from bittensor_wallet.utils import (
     is_valid_ss58_address as btwallet_is_valid_ss58_address,
@@ -31,7 +27,7 @@ from rich import box
 from rich.prompt import FloatPrompt, Prompt, IntPrompt
 from rich.table import Column, Table
 from rich.tree import Tree
-from typing import Annotated
+from typing import Annotated, TYPE_CHECKING
 from yaml import safe_dump, safe_load
 
 from bittensor_cli.src import (
@@ -44,15 +40,12 @@ from bittensor_cli.src import (
     HYPERPARAMS,
     HYPERPARAMS_METADATA,
     RootSudoOnly,
+    SortByBalance,
     WalletOptions,
 )
 from bittensor_cli.src.bittensor import utils
 from bittensor_cli.src.bittensor.balances import Balance
-from bittensor_cli.src.bittensor.chain_data import SubnetHyperparameters
-from bittensor_cli.src.bittensor.subtensor_interface import (
-    SubtensorInterface,
-    best_connection,
-)
+from bittensor_cli.src.bittensor.query_cache import QueryCache
 from bittensor_cli.src.bittensor.utils import (
     console,
     err_console,
@@ -69,55 +62,63 @@ from bittensor_cli.src.bittensor.utils import (
     prompt_for_subnet_identity,
     validate_rate_tolerance,
     get_hotkey_pub_ss58,
-    ensure_address_book_tables_exist,
     ProxyAddressBook,
     ProxyAnnouncements,
     confirm_action,
     print_protection_warnings,
 )
-from bittensor_cli.src.commands import sudo, wallets, view
-from bittensor_cli.src.commands import weights as weights_cmds
-from bittensor_cli.src.commands.liquidity import liquidity
-from bittensor_cli.src.commands.crowd import (
-    contribute as crowd_contribute,
-    create as create_crowdloan,
-    dissolve as crowd_dissolve,
-    view as view_crowdloan,
-    update as crowd_update,
-    refund as crowd_refund,
-    contributors as crowd_contributors,
-)
-from bittensor_cli.src.commands.liquidity.utils import (
-    prompt_liquidity,
-    prompt_position_id,
-)
-from bittensor_cli.src.commands import proxy as proxy_commands
 from bittensor_cli.src.commands.proxy import ProxyType
-from bittensor_cli.src.commands.stake import (
-    auto_staking as auto_stake,
-    children_hotkeys,
-    list as list_stake,
-    move as move_stake,
-    add as add_stake,
-    remove as remove_stake,
-    claim as claim_stake,
-    wizard as stake_wizard,
-)
-from bittensor_cli.src.commands.subnets import (
-    price,
-    subnets,
-    mechanisms as subnet_mechanisms,
-)
-from bittensor_cli.src.commands.axon import axon
 from bittensor_cli.version import __version__, __version_as_int__
 
-try:
-    from git import Repo, GitError
-except ImportError:
-    Repo = None
+if TYPE_CHECKING:
+    from bittensor_cli.src.bittensor.subtensor_interface import SubtensorInterface
+
 
-    class GitError(Exception):
-        pass
+def _lazy_import(name: str):
+    """
+    Returns the named module, deferring its execution until one of its attributes is first accessed. This keeps the
+    (substrate, plotting, templating) dependencies of the command modules from being loaded by commands which do not
+    use them.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+_commands = "bittensor_cli.src.commands"
+chain_data = _lazy_import("bittensor_cli.src.bittensor.chain_data")
+sudo = _lazy_import(f"{_commands}.sudo")
+wallets = _lazy_import(f"{_commands}.wallets")
+view = _lazy_import(f"{_commands}.view")
+weights_cmds = _lazy_import(f"{_commands}.weights")
+liquidity = _lazy_import(f"{_commands}.liquidity.liquidity")
+liquidity_utils = _lazy_import(f"{_commands}.liquidity.utils")
+crowd_contribute = _lazy_import(f"{_commands}.crowd.contribute")
+create_crowdloan = _lazy_import(f"{_commands}.crowd.create")
+crowd_dissolve = _lazy_import(f"{_commands}.crowd.dissolve")
+view_crowdloan = _lazy_import(f"{_commands}.crowd.view")
+crowd_update = _lazy_import(f"{_commands}.crowd.update")
+crowd_refund = _lazy_import(f"{_commands}.crowd.refund")
+crowd_contributors = _lazy_import(f"{_commands}.crowd.contributors")
+proxy_commands = _lazy_import(f"{_commands}.proxy")
+auto_stake = _lazy_import(f"{_commands}.stake.auto_staking")
+children_hotkeys = _lazy_import(f"{_commands}.stake.children_hotkeys")
+list_stake = _lazy_import(f"{_commands}.stake.list")
+move_stake = _lazy_import(f"{_commands}.stake.move")
+add_stake = _lazy_import(f"{_commands}.stake.add")
+remove_stake = _lazy_import(f"{_commands}.stake.remove")
+claim_stake = _lazy_import(f"{_commands}.stake.claim")
+stake_wizard = _lazy_import(f"{_commands}.stake.wizard")
+price = _lazy_import(f"{_commands}.subnets.price")
+subnets = _lazy_import(f"{_commands}.subnets.subnets")
+subnet_mechanisms = _lazy_import(f"{_commands}.subnets.mechanisms")
+axon = _lazy_import(f"{_commands}.axon.axon")
 
 
 logger = logging.getLogger("btcli")
@@ -152,7 +153,7 @@ def is_valid_ss58_address_param(address: Optional[str]) -> Optional[str]:
     return address
 
 
-def validate_claim_type(value: Optional[str]) -> Optional[claim_stake.ClaimType]:
+def validate_claim_type(value: Optional[str]) -> Optional["claim_stake.ClaimType"]:
     """
     Validates the claim type argument, allowing case-insensitive input.
     """
@@ -282,7 +283,8 @@ class Options:
         "--subtensor.network",
         "--chain",
         "--subtensor.chain_endpoint",
-        help="The subtensor network to connect to. Default: finney.",
+        help="The subtensor network to connect to. Default: finney. Specify multiple times to pool connections: "
+        "reads are routed to the fastest healthy endpoint, and extrinsics are submitted through the first.",
         show_default=False,
     )
     netuids = typer.Option(
@@ -708,6 +710,14 @@ def version_callback(value: bool) -> None:
     Prints the current version/branch-name
     """
     if value:
+        try:
+            from git import Repo, GitError
+        except ImportError:
+            Repo = None
+
+            class GitError(Exception):
+                pass
+
         try:
             repo = Repo(os.path.dirname(os.path.dirname(__file__)))
             version = (
@@ -782,7 +792,7 @@ class CLIManager:
     :var subtensor: the `SubtensorInterface` object passed to the various commands that require it
     """
 
-    subtensor: Optional[SubtensorInterface]
+    subtensor: Optional["SubtensorInterface"]
     app: typer.Typer
     config_app: typer.Typer
     wallet_app: typer.Typer
@@ -803,6 +813,7 @@ class CLIManager:
             "network": None,
             "use_cache": True,
             "disk_cache": True,
+            "query_cache": False,
             "rate_tolerance": None,
             "safe_staking": True,
             "allow_partial_stake": False,
@@ -828,7 +839,7 @@ class CLIManager:
             #     "COLDKEY": True,
             # },
         }
-        self.proxies = {}
+        self._proxies: Optional[dict[str, dict]] = None
         self.subtensor = None
 
         if sys.version_info < (3, 10):
@@ -875,6 +886,7 @@ class CLIManager:
         self.liquidity_app = typer.Typer(epilog=_epilog)
         self.crowd_app = typer.Typer(epilog=_epilog)
         self.utils_app = typer.Typer(epilog=_epilog)
+        self.utils_cache_app = typer.Typer(epilog=_epilog)
         self.axon_app = typer.Typer(epilog=_epilog)
         self.proxy_app = typer.Typer(epilog=_epilog)
 
@@ -966,6 +978,12 @@ class CLIManager:
         self.app.add_typer(
             self.utils_app, name="utils", no_args_is_help=True, hidden=False
         )
+        self.utils_app.add_typer(
+            self.utils_cache_app,
+            name="cache",
+            short_help="On-disk query cache commands",
+            no_args_is_help=True,
+        )
 
         # view app
         self.app.add_typer(
@@ -1381,6 +1399,8 @@ class CLIManager:
         # utils app
         self.utils_app.command("convert")(self.convert)
         self.utils_app.command("latency")(self.best_connection)
+        self.utils_cache_app.command("stats")(self.cache_stats)
+        self.utils_cache_app.command("clear")(self.cache_clear)
 
     def generate_command_tree(self) -> Tree:
         """
@@ -1419,7 +1439,7 @@ class CLIManager:
     def initialize_chain(
         self,
         network: Optional[list[str]] = None,
-    ) -> SubtensorInterface:
+    ) -> "SubtensorInterface":
         """
         Intelligently initializes a connection to the chain, depending on the supplied (or in config) values. Sets the
         `self.subtensor` object to this created connection.
@@ -1434,25 +1454,23 @@ class CLIManager:
                 "Verify this is intended.",
             )
             if not self.subtensor:
+                from bittensor_cli.src.bittensor.subtensor_interface import (
+                    SubtensorInterface,
+                )
+
                 use_disk_cache = self.config.get("disk_cache", True)
+                query_cache = QueryCache() if self.config.get("query_cache") else None
                 if network:
-                    network_ = None
-                    for item in network:
-                        if item.startswith("ws"):
-                            network_ = item
-                            break
-                        else:
-                            network_ = item
-
-                    not_selected_networks = [net for net in network if net != network_]
-                    if not_selected_networks:
+                    networks = list(dict.fromkeys(network))
+                    if len(networks) > 1:
                         console.print(
-                            f"Networks not selected: "
-                            f"{arg__(', '.join(not_selected_networks))}"
+                            f"Using a connection pool across networks: "
+                            f"{arg__(', '.join(networks))}"
                         )
-
                     self.subtensor = SubtensorInterface(
-                        network_, use_disk_cache=use_disk_cache
+                        networks[0] if len(networks) == 1 else networks,
+                        use_disk_cache=use_disk_cache,
+                        query_cache=query_cache,
                     )
                 elif self.config["network"]:
                     console.print(
@@ -1460,11 +1478,15 @@ class CLIManager:
                         f"[/{COLORS.G.LINKS}] from config"
                     )
                     self.subtensor = SubtensorInterface(
-                        self.config["network"], use_disk_cache=use_disk_cache
+                        self.config["network"],
+                        use_disk_cache=use_disk_cache,
+                        query_cache=query_cache,
                     )
                 else:
                     self.subtensor = SubtensorInterface(
-                        defaults.subtensor.network, use_disk_cache=use_disk_cache
+                        defaults.subtensor.network,
+                        use_disk_cache=use_disk_cache,
+                        query_cache=query_cache,
                     )
         return self.subtensor
 
@@ -1472,6 +1494,11 @@ class CLIManager:
         """
         Runs the supplied coroutine with `asyncio.run`
         """
+        from async_substrate_interface.errors import (
+            SubstrateRequestException,
+            ConnectionClosed,
+            InvalidHandshake,
+        )
 
         async def _run():
             initiated = False
@@ -1546,35 +1573,7 @@ class CLIManager:
         Command line interface (CLI) for Bittensor. Uses the values in the configuration file. These values can be
             overridden by passing them explicitly in the command line.
         """
-        # Load or create the config file
-        if os.path.exists(self.config_path):
-            with open(self.config_path, "r") as f:
-                config = safe_load(f) or {}
-        else:
-            directory_path = Path(self.config_base_path)
-            directory_path.mkdir(exist_ok=True, parents=True)
-            config = defaults.config.dictionary.copy()
-            with open(self.config_path, "w") as f:
-                safe_dump(config, f)
-
-        # Update missing values
-        updated = False
-        for key, value in defaults.config.dictionary.items():
-            if key not in config:
-                config[key] = value
-                updated = True
-            elif isinstance(value, dict):
-                for sub_key, sub_value in value.items():
-                    if sub_key not in config[key]:
-                        config[key][sub_key] = sub_value
-                        updated = True
-            elif isinstance(value, bool) and config[key] is None:
-                config[key] = value
-                updated = True
-        if updated:
-            with open(self.config_path, "w") as f:
-                safe_dump(config, f)
-
+        config = self._load_config()
         for k, v in config.items():
             if k in self.config.keys():
                 self.config[k] = v
@@ -1601,19 +1600,104 @@ class CLIManager:
             asi_logger.addHandler(handler)
             logger.addHandler(handler)
 
-        ensure_address_book_tables_exist()
-        # load proxies address book
-        with ProxyAddressBook.get_db() as (conn, cursor):
-            rows = ProxyAddressBook.read_rows(conn, cursor, include_header=False)
-        proxies = {}
-        for name, ss58_address, delay, spawner, proxy_type, _ in rows:
-            proxies[name] = {
-                "address": ss58_address,
-                "spawner": spawner,
-                "proxy_type": proxy_type,
-                "delay": delay,
+    def _load_config(self) -> dict:
+        """
+        Loads the config file, creating it if it does not exist, and adding any missing default values. The config file
+        is only written to if it was missing values.
+
+        The parsed config is cached as JSON next to the config file, keyed by the config file's mtime and size, so the
+        YAML is only parsed again after the config file changes. The cache is only written when it was missing or
+        stale, and only if the config survives a JSON round trip unchanged (e.g. no non-string keys).
+        """
+        config_dir, config_name = os.path.split(self.config_path)
+        cache_path = os.path.join(config_dir, f".{config_name}.json")
+        config = None
+        cache_hit = False
+        try:
+            stat = os.stat(self.config_path)
+        except FileNotFoundError:
+            Path(config_dir or self.config_base_path).mkdir(exist_ok=True, parents=True)
+            config = copy.deepcopy(defaults.config.dictionary)
+            with open(self.config_path, "w") as f:
+                safe_dump(config, f)
+            stat = os.stat(self.config_path)
+        else:
+            try:
+                with open(cache_path, "r") as f:
+                    cached = json.load(f)
+                if (cached["mtime_ns"], cached["size"]) == (
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                ):
+                    config = cached["config"]
+                    cache_hit = True
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+            if config is None:
+                with open(self.config_path, "r") as f:
+                    config = safe_load(f) or {}
+
+        # Update missing values
+        updated = False
+        for key, value in defaults.config.dictionary.items():
+            if key not in config:
+                config[key] = value
+                updated = True
+            elif isinstance(value, dict):
+                for sub_key, sub_value in value.items():
+                    if sub_key not in config[key]:
+                        config[key][sub_key] = sub_value
+                        updated = True
+            elif isinstance(value, bool) and config[key] is None:
+                config[key] = value
+                updated = True
+        if updated:
+            with open(self.config_path, "w") as f:
+                safe_dump(config, f)
+            stat = os.stat(self.config_path)
+
+        if cache_hit and not updated:
+            return config
+        try:
+            encoded = json.dumps(
+                {
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "config": config,
+                }
+            )
+            if json.loads(encoded)["config"] == config:
+                with open(cache_path, "w") as f:
+                    f.write(encoded)
+        except (OSError, TypeError, ValueError):
+            pass
+        return config
+
+    @property
+    def proxies(self) -> dict[str, dict]:
+        """
+        The proxy address book, read from the database on first access, so that only commands using it pay for it.
+        """
+        if self._proxies is None:
+            if not os.path.exists(utils.DB().db_path):
+                self._proxies = {}
+                return self._proxies
+            with ProxyAddressBook.get_db() as (conn, cursor):
+                rows = ProxyAddressBook.read_rows(conn, cursor, include_header=False)
+            self._proxies = {
+                name: {
+                    "address": ss58_address,
+                    "spawner": spawner,
+                    "proxy_type": proxy_type,
+                    "delay": delay,
+                }
+                for name, ss58_address, delay, spawner, proxy_type, _ in rows
             }
-        self.proxies = proxies
+        return self._proxies
+
+    @proxies.setter
+    def proxies(self, value: dict[str, dict]):
+        self._proxies = value
 
     def verbosity_handler(
         self,
@@ -1695,6 +1779,13 @@ class CLIManager:
             help="Enables or disables the caching on disk. Enabling this can significantly speed up commands run "
             "sequentially",
         ),
+        query_cache: Optional[bool] = typer.Option(
+            None,
+            "--query-cache/--no-query-cache",
+            " /--no-query-cache",
+            help="Enables or disables the on-disk cache of large chain queries (such as subnet and identity data). "
+            "Enabling this can significantly speed up commands run back to back. Manage it with `btcli utils cache`.",
+        ),
         rate_tolerance: Optional[float] = typer.Option(
             None,
             "--tolerance",
@@ -1744,12 +1835,19 @@ class CLIManager:
             "network": network,
             "use_cache": use_cache,
             "disk_cache": disk_cache,
+            "query_cache": query_cache,
             "rate_tolerance": rate_tolerance,
             "safe_staking": safe_staking,
             "allow_partial_stake": allow_partial_stake,
             "dashboard_path": dashboard_path,
         }
-        bools = ["use_cache", "disk_cache", "safe_staking", "allow_partial_stake"]
+        bools = [
+            "use_cache",
+            "disk_cache",
+            "query_cache",
+            "safe_staking",
+            "allow_partial_stake",
+        ]
         if all(v is None for v in args.values()):
             # Print existing configs
             self.get_config()
@@ -3647,7 +3745,7 @@ class CLIManager:
             "-a",
             help="Whether to display the balances for all the wallets.",
         ),
-        sort_by: Optional[wallets.SortByBalance] = typer.Option(
+        sort_by: Optional[SortByBalance] = typer.Option(
             None,
             "--sort",
             help="When using `--all`, sorts the wallets by a given column",
@@ -6842,7 +6940,7 @@ class CLIManager:
                 )
                 return False
             hyperparam_list = sorted(
-                [field.name for field in fields(SubnetHyperparameters)]
+                [field.name for field in fields(chain_data.SubnetHyperparameters)]
             )
             console.print("Available hyperparameters:\n")
 
@@ -8571,18 +8669,22 @@ class CLIManager:
         if liquidity_:
             liquidity_ = Balance.from_tao(liquidity_)
         else:
-            liquidity_ = prompt_liquidity("Enter the amount of liquidity")
+            liquidity_ = liquidity_utils.prompt_liquidity(
+                "Enter the amount of liquidity"
+            )
 
         # Determine price range
         if price_low:
             price_low = Balance.from_tao(price_low)
         else:
-            price_low = prompt_liquidity("Enter liquidity position low price")
+            price_low = liquidity_utils.prompt_liquidity(
+                "Enter liquidity position low price"
+            )
 
         if price_high:
             price_high = Balance.from_tao(price_high)
         else:
-            price_high = prompt_liquidity(
+            price_high = liquidity_utils.prompt_liquidity(
                 "Enter liquidity position high price (must be greater than low price)"
             )
 
@@ -8686,7 +8788,7 @@ class CLIManager:
             return
 
         if not position_id and not all_liquidity_ids:
-            position_id = prompt_position_id()
+            position_id = liquidity_utils.prompt_position_id()
 
         if not netuid:
             netuid = IntPrompt.ask(
@@ -8771,12 +8873,12 @@ class CLIManager:
         )
 
         if not position_id:
-            position_id = prompt_position_id()
+            position_id = liquidity_utils.prompt_position_id()
 
         if liquidity_delta:
             liquidity_delta = Balance.from_tao(liquidity_delta)
         else:
-            liquidity_delta = prompt_liquidity(
+            liquidity_delta = liquidity_utils.prompt_liquidity(
                 f"Enter the [blue]liquidity delta[/blue] to modify position with id "
                 f"[blue]{position_id}[/blue] (can be positive or negative)",
                 negative_allowed=True,
@@ -10125,6 +10227,61 @@ class CLIManager:
                 f"{Balance.from_tao(tao).rao}{Balance.rao_unit}",
             )
 
+    def cache_stats(
+        self,
+        json_output: bool = Options.json_output,
+    ):
+        """
+        Shows the size and contents of the on-disk query cache.
+
+        Enable the cache with [green]$[/green] btcli config set --query-cache
+
+        EXAMPLE
+
+        [green]$[/green] btcli utils cache stats
+        """
+        stats = QueryCache().stats()
+        stats["enabled"] = bool(self.config.get("query_cache"))
+        if json_output:
+            json_console.print_json(data=stats)
+            return
+        if not stats["enabled"]:
+            console.print(
+                "The query cache is disabled. Enable it with "
+                "[green]btcli config set --query-cache[/green]"
+            )
+        table = Table(
+            Column("Query"),
+            Column("Entries", justify="right", style="cyan"),
+            Column("Size (MB)", justify="right", style="cyan"),
+            title="Query Cache",
+            caption=f"{stats['size_bytes'] / 1024**2:.2f} MB of "
+            f"{stats['max_size_bytes'] / 1024**2:.0f} MB used\n{stats['path']}",
+        )
+        for name, (entries, size) in stats["queries"].items():
+            table.add_row(name, str(entries), f"{size / 1024**2:.2f}")
+        console.print(table)
+
+    @staticmethod
+    def cache_clear(
+        decline: bool = Options.decline,
+        quiet: bool = Options.quiet,
+        prompt: bool = Options.prompt,
+    ):
+        """
+        Removes every entry from the on-disk query cache.
+
+        EXAMPLE
+
+        [green]$[/green] btcli utils cache clear
+        """
+        if prompt and not confirm_action(
+            "Do you want to clear the query cache?", decline=decline, quiet=quiet
+        ):
+            return
+        removed = QueryCache().clear()
+        console.print(f"Removed {removed} entries from the query cache.")
+
     def best_connection(
         self,
         additional_networks: Optional[list[str]] = typer.Option(
@@ -10132,16 +10289,29 @@ class CLIManager:
             "--network",
             help="Network(s) to test for the best connection",
         ),
+        samples: int = typer.Option(
+            5,
+            "--samples",
+            min=1,
+            help="Number of samples to take of each measurement",
+        ),
+        timeout: float = typer.Option(
+            10.0,
+            "--timeout",
+            help="Seconds after which probing an endpoint is abandoned",
+        ),
+        json_output: bool = Options.json_output,
     ):
         """
         This command will give you the latency of all finney-like network in additional to any additional networks you specify via the '--network' flag
 
-        The results are three-fold. One column is the overall time to initialise a connection, send the requests, and wait for the results. The second column measures single ping-pong speed once connected. The third makes a real world call to fetch the chain head.
+        All endpoints are probed concurrently. For each, the time to open a connection is measured, followed by several samples of the ping-pong speed, and of three real world requests: fetching the chain head (chain_getHead), reading a storage value (state_getStorage), and making a runtime call (state_call). The median (p50), 95th percentile (p95) and jitter of each are reported, along with the throughput of pipelined storage reads and runtime calls.
 
         EXAMPLE
 
         [green]$[/green] btcli utils latency --network ws://189.234.12.45 --network wss://mysubtensor.duckdns.org
 
+        [green]$[/green] btcli utils latency --samples 20 --json-output
         """
         additional_networks = additional_networks or []
         if any(not x.startswith("ws") for x in additional_networks):
@@ -10151,30 +10321,73 @@ class CLIManager:
                 f"[{COLORS.G.LINKS}]wss://[/{COLORS.G.LINKS}]).",
             )
             return False
-        results: dict[str, list[float]] = self._run_command(
-            best_connection(Constants.lite_nodes + additional_networks)
-        )
+        from bittensor_cli.src.bittensor.subtensor_interface import best_connection
+
+        with console.status(":satellite: Probing endpoints..."):
+            results: dict[str, dict] = self._run_command(
+                best_connection(
+                    Constants.lite_nodes + additional_networks,
+                    samples=samples,
+                    timeout=timeout,
+                )
+            )
+        # fastest first, by median storage read latency, with unreachable endpoints last
         sorted_results = {
-            k: v for k, v in sorted(results.items(), key=lambda item: item[1][0])
+            k: v
+            for k, v in sorted(
+                results.items(),
+                key=lambda item: (
+                    item[1]["state_getStorage"]["p50"]
+                    if "error" not in item[1]
+                    else float("inf")
+                ),
+            )
         }
+        if json_output:
+            json_console.print(json.dumps(sorted_results))
+            return True
+
+        def ms(seconds: float) -> str:
+            return f"{seconds * 1000:.1f}"
+
         table = Table(
             Column("Network"),
-            Column("End to End Latency", style="cyan"),
-            Column("Single Request Ping", style="cyan"),
-            Column("Chain Head Request Latency", style="cyan"),
-            title="Connection Latencies (seconds)",
-            caption="lower value is faster",
-        )
-        for n_name, (
-            overall_latency,
-            single_request,
-            chain_head,
-        ) in sorted_results.items():
+            Column("Connect", style="cyan"),
+            Column("Ping p50", style="cyan"),
+            Column("Head p50", style="cyan"),
+            Column("Storage p50", style="cyan"),
+            Column("Storage p95", style="cyan"),
+            Column("Storage Jitter", style="cyan"),
+            Column("Call p50", style="cyan"),
+            Column("Call p95", style="cyan"),
+            Column("Storage req/s", style="green"),
+            Column("Call req/s", style="green"),
+            title="Connection Latencies (ms)",
+            caption=f"lower latency is faster, {samples} samples per measurement",
+        )
+        for n_name, result in sorted_results.items():
+            if "error" in result:
+                print_error(f"Error attempting network {n_name}: {result['error']}")
+                continue
+            storage = result["state_getStorage"]
+            call = result["state_call"]
             table.add_row(
-                n_name, str(overall_latency), str(single_request), str(chain_head)
+                n_name,
+                ms(result["connect"]),
+                ms(result["ping"]["p50"]),
+                ms(result["chain_getHead"]["p50"]),
+                ms(storage["p50"]),
+                ms(storage["p95"]),
+                ms(storage["jitter"]),
+                ms(call["p50"]),
+                ms(call["p95"]),
+                f"{storage['throughput']:.1f}",
+                f"{call['throughput']:.1f}",
             )
-        console.print(table)
         fastest = next(iter(sorted_results.keys()))
+        if "error" in sorted_results[fastest]:
+            return False
+        console.print(table)
         if conf_net := self.config.get("network", ""):
             if not conf_net.startswith("ws") and conf_net in Constants.networks:
                 conf_net = Constants.network_map[conf_net]
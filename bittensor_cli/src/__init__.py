@@ -50,6 +50,7 @@ class Defaults:
             "wallet_hotkey": None,
             "use_cache": True,
             "disk_cache": False,
+            "query_cache": False,
             "metagraph_cols": {
                 "UID": True,
                 "GLOBAL_STAKE": True,
@@ -71,6 +72,16 @@ class Defaults:
             },
         }
 
+    class query_cache:
+        path = "~/.bittensor/query_cache.db"
+        max_size_bytes = 256 * 1024 * 1024
+        # How many blocks old a head-relative result may be before it is refetched
+        ttl_blocks = {
+            "all_subnets": 5,
+            "get_subnet_prices": 5,
+            "query_all_identities": 25,
+        }
+
     class proxies:
         base_path = "~/.bittensor"
         path = "~/.bittensor/bittensor.db"
@@ -111,6 +122,13 @@ class WalletValidationTypes(Enum):
     WALLET_AND_HOTKEY = "wallet_and_hotkey"
 
 
+class SortByBalance(Enum):
+    name = "name"
+    free = "free"
+    staked = "staked"
+    total = "total"
+
+
 TYPE_REGISTRY = {
     "types": {
         "Balance": "u64",  # Need to override default u128
@@ -17,10 +17,40 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
-from typing import Union
+from array import array
+from typing import Iterable, Iterator, Optional, Union
 from bittensor_cli.src import UNITS
 from scalecodec.utils.math import fixed_to_float
 
+TAO_UNIT = chr(0x03C4)
+RAO_UNIT = chr(0x03C1)
+# fractional bits of the chain's U64F64 fixed point numbers (e.g. prices), as read by `fixed_to_float`
+U64F64_FRACTIONAL_BITS = 64
+
+
+class _Unit:
+    """
+    A unit attribute of Balance, stored in a slot. Balances which never had their unit set leave the slot empty and
+    read the tao/rao default, which is also what the attribute reads as on the class itself (e.g. `Balance.unit`).
+    """
+
+    def __init__(self, default: str):
+        self.default = default
+
+    def __set_name__(self, owner: type, name: str):
+        self.slot = getattr(owner, f"_{name}")
+
+    def __get__(self, instance, owner=None) -> str:
+        if instance is None:
+            return self.default
+        try:
+            return self.slot.__get__(instance, owner)
+        except AttributeError:
+            return self.default
+
+    def __set__(self, instance, value: str):
+        self.slot.__set__(instance, value)
+
 
 class Balance:
     """
@@ -34,8 +64,10 @@ class Balance:
     :var tao: A float property that gives the balance in tao units.
     """
 
-    unit: str = chr(0x03C4)  # This is the tao unit
-    rao_unit: str = chr(0x03C1)  # This is the rao unit
+    __slots__ = ("rao", "_unit", "_rao_unit")
+
+    unit: str = _Unit(TAO_UNIT)  # This is the tao unit
+    rao_unit: str = _Unit(RAO_UNIT)  # This is the rao unit
     rao: int
     tao: float
 
@@ -54,9 +86,23 @@ class Balance:
         else:
             raise TypeError("balance must be an int (rao) or a float (tao)")
 
+    @classmethod
+    def _from_int(cls, rao: int) -> "Balance":
+        # skips the type checks of __init__, for results of arithmetic on Balances, which are always ints
+        balance = object.__new__(cls)
+        balance.rao = rao
+        return balance
+
+    def __setstate__(self, state):
+        # Balances pickled before Balance had __slots__ (e.g. in the query cache) have a __dict__ state
+        if isinstance(state, tuple):
+            state = state[1]
+        for name, value in state.items():
+            setattr(self, name, value)
+
     @property
     def tao(self):
-        return self.rao / pow(10, 9)
+        return self.rao / 1_000_000_000
 
     def __int__(self):
         """
@@ -99,6 +145,8 @@ class Balance:
         return self.rao != 0
 
     def __eq__(self, other: Union[int, float, "Balance"]):
+        if type(other) is Balance:
+            return self.rao == other.rao
         if other is None:
             return False
 
@@ -116,7 +164,7 @@ class Balance:
         return not self == other
 
     def __gt__(self, other: Union[int, float, "Balance"]):
-        if hasattr(other, "rao"):
+        if type(other) is Balance or hasattr(other, "rao"):
             return self.rao > other.rao
         else:
             try:
@@ -127,7 +175,7 @@ class Balance:
                 raise NotImplementedError("Unsupported type")
 
     def __lt__(self, other: Union[int, float, "Balance"]):
-        if hasattr(other, "rao"):
+        if type(other) is Balance or hasattr(other, "rao"):
             return self.rao < other.rao
         else:
             try:
@@ -138,18 +186,24 @@ class Balance:
                 raise NotImplementedError("Unsupported type")
 
     def __le__(self, other: Union[int, float, "Balance"]):
+        if type(other) is Balance:
+            return self.rao <= other.rao
         try:
             return self < other or self == other
         except TypeError:
             raise NotImplementedError("Unsupported type")
 
     def __ge__(self, other: Union[int, float, "Balance"]):
+        if type(other) is Balance:
+            return self.rao >= other.rao
         try:
             return self > other or self == other
         except TypeError:
             raise NotImplementedError("Unsupported type")
 
     def __add__(self, other: Union[int, float, "Balance"]):
+        if type(other) is Balance:
+            return Balance._from_int(self.rao + other.rao)
         if hasattr(other, "rao"):
             return Balance.from_rao(int(self.rao + other.rao))
         else:
@@ -166,6 +220,8 @@ class Balance:
             raise NotImplementedError("Unsupported type")
 
     def __sub__(self, other: Union[int, float, "Balance"]):
+        if type(other) is Balance:
+            return Balance._from_int(self.rao - other.rao)
         try:
             return self + -other
         except TypeError:
@@ -178,6 +234,8 @@ class Balance:
             raise NotImplementedError("Unsupported type")
 
     def __mul__(self, other: Union[int, float, "Balance"]):
+        if type(other) is Balance:
+            return Balance._from_int(self.rao * other.rao)
         if hasattr(other, "rao"):
             return Balance.from_rao(int(self.rao * other.rao))
         else:
@@ -234,13 +292,13 @@ class Balance:
         return bool(self.rao)
 
     def __neg__(self):
-        return Balance.from_rao(-self.rao)
+        return Balance._from_int(-self.rao)
 
     def __pos__(self):
-        return Balance.from_rao(self.rao)
+        return Balance._from_int(self.rao)
 
     def __abs__(self):
-        return Balance.from_rao(abs(self.rao))
+        return Balance._from_int(abs(self.rao))
 
     def to_dict(self) -> dict:
         return {"rao": self.rao, "tao": self.tao}
@@ -298,4 +356,81 @@ class Balance:
         return self
 
 
-__all__ = ["Balance", "UNITS", "fixed_to_float"]
+def fixed_to_bits(value, frac_bits: int = U64F64_FRACTIONAL_BITS) -> int:
+    """
+    Returns a chain fixed point value as its exact integer bits, i.e. `value * 2**frac_bits` (truncated), without
+    going through a float. Accepts the same inputs as `fixed_to_float`.
+    """
+    if isinstance(value, dict) and "mantissa" in value:
+        mantissa, exponent = int(value["mantissa"]), int(value["exponent"])
+        if exponent >= 0:
+            return (mantissa * 10**exponent) << frac_bits
+        return (mantissa << frac_bits) // 10**-exponent
+    if isinstance(value, dict):
+        value = value["bits"]
+    return int(value)
+
+
+class BalanceArray:
+    """
+    A sequence of balances in a single unit, stored as one array of rao (int64) values rather than one Balance object
+    per value. Used for aggregations, where the individual Balance objects (and the temporaries created by summing
+    them one by one) are not needed.
+    """
+
+    __slots__ = ("rao", "netuid")
+
+    def __init__(self, rao: Iterable[int] = (), netuid: Optional[int] = None):
+        """
+        :param rao: the balances, in rao
+        :param netuid: the netuid whose unit the balances are in, or None for tao
+        """
+        self.rao = array("q", rao)
+        self.netuid = netuid
+
+    @classmethod
+    def from_balances(
+        cls, balances: Iterable[Balance], netuid: Optional[int] = None
+    ) -> "BalanceArray":
+        return cls((balance.rao for balance in balances), netuid)
+
+    def _balance(self, rao: int) -> Balance:
+        balance = Balance._from_int(rao)
+        if self.netuid is not None:
+            balance.set_unit(self.netuid)
+        return balance
+
+    def __len__(self) -> int:
+        return len(self.rao)
+
+    def __getitem__(self, i: int) -> Balance:
+        return self._balance(self.rao[i])
+
+    def __iter__(self) -> Iterator[Balance]:
+        return map(self._balance, self.rao)
+
+    def append(self, balance: Union[Balance, int]):
+        """
+        Appends a Balance, or an amount in rao.
+        """
+        self.rao.append(balance if isinstance(balance, int) else balance.rao)
+
+    @property
+    def tao(self) -> list[float]:
+        return [rao / 1_000_000_000 for rao in self.rao]
+
+    def sum(self) -> Balance:
+        return self._balance(sum(self.rao))
+
+    def scale(self, factor: float) -> "BalanceArray":
+        """
+        Multiplies every balance by `factor`, truncating to whole rao as `Balance * float` does.
+        """
+        return BalanceArray((int(rao * factor) for rao in self.rao), self.netuid)
+
+    def set_unit(self, netuid: Optional[int]) -> "BalanceArray":
+        self.netuid = netuid
+        return self
+
+
+__all__ = ["Balance", "BalanceArray", "UNITS", "fixed_to_bits", "fixed_to_float"]
@@ -1,13 +1,21 @@
+import sys
 from abc import abstractmethod
+from array import array
+from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, Any, Union
+from operator import itemgetter
+from typing import Iterable, Optional, Any, Union
 
 import netaddr
 from scalecodec.utils.math import FixedPoint
 from scalecodec.utils.ss58 import ss58_encode
 
-from bittensor_cli.src.bittensor.balances import Balance, fixed_to_float
+from bittensor_cli.src.bittensor.balances import (
+    U64F64_FRACTIONAL_BITS,
+    Balance,
+    fixed_to_float,
+)
 from bittensor_cli.src.bittensor.networking import int_to_ip
 from bittensor_cli.src.bittensor.utils import (
     SS58_FORMAT,
@@ -88,10 +96,54 @@ class AxonInfo:
         )
 
 
+class InfoTable(Sequence):
+    """
+    Columnar (struct-of-arrays) form of a list of decoded info objects, see `InfoBase.table_from_any`.
+
+    Each column is available as an attribute (e.g. `table.uid`): numeric columns are `array`s, and SS58 address
+    columns are lists of interned strings. Indexing the table materializes (and caches) the info object for that
+    row, so it can still be used wherever a list of info objects is expected.
+    """
+
+    def __init__(
+        self,
+        info_class: type["InfoBase"],
+        decoded: list[Any],
+        columns: dict[str, Union[array, list[str]]],
+    ):
+        self.info_class = info_class
+        self.columns = columns
+        self._decoded = decoded
+        self._rows: dict[int, "InfoBase"] = {}
+
+    def __len__(self) -> int:
+        return len(self._decoded)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        row = self._rows.get(index)
+        if row is None:
+            row = self._rows[index] = self.info_class.from_any(self._decoded[index])
+        return row
+
+    def __getattr__(self, name: str):
+        try:
+            return self.__dict__["columns"][name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
 @dataclass
 class InfoBase:
     """Base dataclass for info objects."""
 
+    # columns of the table created by `table_from_any`, as {name: (array typecode or "str", extractor)}, where the
+    # extractor gets the column's value from a single decoded item
+    _table_columns = {}
+
     @abstractmethod
     def _fix_decoded(self, decoded: Any) -> Self:
         raise NotImplementedError(
@@ -106,6 +158,22 @@ class InfoBase:
     def list_from_any(cls, data_list: list[Any]) -> list[Self]:
         return [cls.from_any(data) for data in data_list]
 
+    @classmethod
+    def table_from_any(cls, data_list: list[Any]) -> InfoTable:
+        """
+        Decodes a list into columns, without creating an info object (and its Balance objects) per item. Info
+        objects are only created for the rows which are indexed.
+        """
+        columns = {}
+        for name, (typecode, extract) in cls._table_columns.items():
+            values = map(extract, data_list)
+            columns[name] = (
+                [sys.intern(value) for value in values]
+                if typecode == "str"
+                else array(typecode, values)
+            )
+        return InfoTable(cls, data_list, columns)
+
     def __getitem__(self, item):
         return getattr(self, item)
 
@@ -251,6 +319,18 @@ class StakeInfo(InfoBase):
     drain: int
     is_registered: bool
 
+    _table_columns = {
+        "hotkey_ss58": ("str", itemgetter("hotkey")),
+        "coldkey_ss58": ("str", itemgetter("coldkey")),
+        "netuid": ("q", itemgetter("netuid")),
+        "stake_rao": ("Q", itemgetter("stake")),
+        "locked_rao": ("Q", itemgetter("locked")),
+        "emission_rao": ("Q", itemgetter("emission")),
+        "tao_emission_rao": ("Q", itemgetter("tao_emission")),
+        "drain": ("q", itemgetter("drain")),
+        "is_registered": ("B", itemgetter("is_registered")),
+    }
+
     @classmethod
     def _fix_decoded(cls, decoded: Any) -> "StakeInfo":
         hotkey = decoded.get("hotkey")
@@ -415,6 +495,26 @@ class NeuronInfoLite(InfoBase):
     pruning_score: int
     is_null: bool = False
 
+    _table_columns = {
+        "hotkey": ("str", itemgetter("hotkey")),
+        "coldkey": ("str", itemgetter("coldkey")),
+        "uid": ("q", itemgetter("uid")),
+        "netuid": ("q", itemgetter("netuid")),
+        "active": ("B", itemgetter("active")),
+        # matches `stake`, where a repeated account only counts once
+        "stake_rao": ("Q", lambda d: sum(dict(d["stake"]).values())),
+        "rank": ("d", lambda d: u16tf(d["rank"])),
+        "emission": ("d", lambda d: d["emission"] / 1e9),
+        "incentive": ("d", lambda d: u16tf(d["incentive"])),
+        "consensus": ("d", lambda d: u16tf(d["consensus"])),
+        "trust": ("d", lambda d: u16tf(d["trust"])),
+        "validator_trust": ("d", lambda d: u16tf(d["validator_trust"])),
+        "dividends": ("d", lambda d: u16tf(d["dividends"])),
+        "last_update": ("q", itemgetter("last_update")),
+        "validator_permit": ("B", itemgetter("validator_permit")),
+        "pruning_score": ("q", itemgetter("pruning_score")),
+    }
+
     @staticmethod
     def get_null_neuron() -> "NeuronInfoLite":
         neuron = NeuronInfoLite(
@@ -681,7 +781,7 @@ class DynamicInfo(InfoBase):
     alpha_out: Balance
     tao_in: Balance
     price: Balance
-    k: float
+    k: int
     is_dynamic: bool
     alpha_out_emission: Balance
     alpha_in_emission: Balance
@@ -771,12 +871,78 @@ class DynamicInfo(InfoBase):
 
     def tao_to_alpha(self, tao: Balance) -> Balance:
         if self.price.tao != 0:
-            return Balance.from_tao(tao.tao / self.price.tao).set_unit(self.netuid)
+            return Balance.from_rao(
+                (tao.rao << U64F64_FRACTIONAL_BITS) // self.price_u64f64
+            ).set_unit(self.netuid)
         else:
             return Balance.from_tao(0)
 
     def alpha_to_tao(self, alpha: Balance) -> Balance:
-        return Balance.from_tao(alpha.tao * self.price.tao)
+        return Balance.from_rao(
+            (alpha.rao * self.price_u64f64) >> U64F64_FRACTIONAL_BITS
+        )
+
+    @property
+    def price_u64f64(self) -> int:
+        """
+        The price of alpha in TAO (`price`, as read from the Swap pallet), as U64F64 fixed point bits (see
+        `fixed_to_float`), so that conversions at the price can be done in integer rao.
+        """
+        if not self.is_dynamic:
+            return 1 << U64F64_FRACTIONAL_BITS
+        return (self.price.rao << U64F64_FRACTIONAL_BITS) // pow(10, 9)
+
+    def swap_rao(self, amount: int, to_alpha: bool) -> tuple[int, int]:
+        """
+        Prices a swap against the pool's constant product (tao_in * alpha_in), in integer rao, without creating any
+        Balance objects. The ideal amount is converted at `price`, exactly as `tao_to_alpha` and `alpha_to_tao` do.
+
+        :param amount: the amount to swap, in rao of TAO (if `to_alpha`) or of the subnet's alpha
+        :param to_alpha: True to swap TAO for alpha (staking), False to swap alpha for TAO (unstaking)
+
+        :return: (received, ideal): the amount received, and the amount which would be received at the current price,
+            i.e. without slippage
+        """
+        if not self.is_dynamic:
+            return amount, amount
+        if to_alpha:
+            reserve_in, reserve_out = self.tao_in.rao, self.alpha_in.rao
+            price = self.price_u64f64
+            ideal = (amount << U64F64_FRACTIONAL_BITS) // price if price else 0
+        else:
+            reserve_in, reserve_out = self.alpha_in.rao, self.tao_in.rao
+            ideal = (amount * self.price_u64f64) >> U64F64_FRACTIONAL_BITS
+        new_reserve_in = reserve_in + amount
+        if new_reserve_in == 0:
+            return amount, amount
+        received = reserve_out - (reserve_in * reserve_out) // new_reserve_in
+        return received, ideal
+
+    @classmethod
+    def swaps_rao(
+        cls,
+        pools: Union[dict[int, "DynamicInfo"], list["DynamicInfo"]],
+        netuids: Iterable[int],
+        amounts: Iterable[int],
+        to_alpha: bool,
+    ) -> tuple[array, array]:
+        """
+        Prices many swaps, across any number of subnets, in one call. See `swap_rao`.
+
+        :param pools: the DynamicInfo of each subnet, indexable by netuid
+        :param netuids: the netuid of each swap
+        :param amounts: the amount of each swap, in rao
+        :param to_alpha: True to swap TAO for alpha (staking), False to swap alpha for TAO (unstaking)
+
+        :return: (received, ideal) arrays of rao amounts, in the order of the swaps
+        """
+        received = array("q")
+        ideal = array("q")
+        for netuid, amount in zip(netuids, amounts):
+            received_rao, ideal_rao = pools[netuid].swap_rao(amount, to_alpha)
+            received.append(received_rao)
+            ideal.append(ideal_rao)
+        return received, ideal
 
     def tao_to_alpha_with_slippage(
         self, tao: Balance
@@ -793,23 +959,16 @@ class DynamicInfo(InfoBase):
             amount as if there was no slippage
         """
         if self.is_dynamic:
-            new_tao_in = self.tao_in + tao
-            if new_tao_in == 0:
+            if self.tao_in.rao + tao.rao == 0:
                 return tao, Balance.from_rao(0), 0.0
-            new_alpha_in = self.k / new_tao_in
+            received, ideal = self.swap_rao(tao.rao, to_alpha=True)
 
             # Amount of alpha given to the staker
-            alpha_returned = Balance.from_rao(
-                self.alpha_in.rao - new_alpha_in.rao
-            ).set_unit(self.netuid)
+            alpha_returned = Balance.from_rao(received).set_unit(self.netuid)
 
-            # Ideal conversion as if there is no slippage, just price
-            alpha_ideal = self.tao_to_alpha(tao)
-
-            if alpha_ideal.tao > alpha_returned.tao:
-                slippage = Balance.from_tao(
-                    alpha_ideal.tao - alpha_returned.tao
-                ).set_unit(self.netuid)
+            # Compared to the ideal conversion as if there is no slippage, just price
+            if ideal > received:
+                slippage = Balance.from_rao(ideal - received).set_unit(self.netuid)
             else:
                 slippage = Balance.from_tao(0)
         else:
@@ -838,16 +997,13 @@ class DynamicInfo(InfoBase):
             amount as if there was no slippage
         """
         if self.is_dynamic:
-            new_alpha_in = self.alpha_in + alpha
-            new_tao_reserve = self.k / new_alpha_in
+            received, ideal = self.swap_rao(alpha.rao, to_alpha=False)
             # Amount of TAO given to the unstaker
-            tao_returned = Balance.from_rao(self.tao_in - new_tao_reserve)
-
-            # Ideal conversion as if there is no slippage, just price
-            tao_ideal = self.alpha_to_tao(alpha)
+            tao_returned = Balance.from_rao(received)
 
-            if tao_ideal > tao_returned:
-                slippage = Balance.from_tao(tao_ideal.tao - tao_returned.tao)
+            # Compared to the ideal conversion as if there is no slippage, just price
+            if ideal > received:
+                slippage = Balance.from_rao(ideal - received)
             else:
                 slippage = Balance.from_tao(0)
         else:
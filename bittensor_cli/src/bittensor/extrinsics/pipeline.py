@@ -0,0 +1,285 @@
+"""
+Pipelined submission of several independent extrinsics from the same account.
+
+Rather than signing an extrinsic, submitting it, and waiting for it to be included before signing the next one, the
+nonces are allocated locally, all the extrinsics are signed up front and submitted back-to-back, and their inclusion
+(or finalization) is then tracked together, by scanning each new block for all of the outstanding extrinsic hashes. A
+set of N extrinsics is therefore usually included within a block or two, rather than N blocks.
+
+Submission goes through the transaction pool's validation, so an extrinsic which is rejected is rejected before any
+later one is submitted. When that happens, its nonce was not consumed, so the remaining extrinsics are re-signed with
+their nonces shifted down, leaving no gap for them to be stuck behind. If the rejection was because of the nonce
+itself (e.g. another transaction from the same account was included in the meantime), the nonce is refetched and the
+extrinsic is resubmitted once.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal, Optional
+
+from async_substrate_interface import AsyncExtrinsicReceipt
+from async_substrate_interface.errors import SubstrateRequestException
+from bittensor_wallet import Wallet
+
+from bittensor_cli.src.bittensor.substrate_pool import pinned_substrate
+from bittensor_cli.src.bittensor.utils import format_error_message
+
+if TYPE_CHECKING:
+    from scalecodec import GenericCall, GenericExtrinsic
+    from bittensor_cli.src.bittensor.subtensor_interface import SubtensorInterface
+
+# Fraction of the chain's per-extrinsic weight and length limits which a batch is filled to, leaving room for the
+# batch and proxy wrappers
+BATCH_LIMIT_MARGIN = 0.8
+# Batches of at most this many calls, totalling at most this many bytes, are far within the chain's per-extrinsic
+# limits, so they are not checked against them
+UNCHECKED_BATCH_CALLS = 32
+UNCHECKED_BATCH_LENGTH = 64 * 1024
+
+# Substrings of the pool's rejection messages which mean the nonce itself was invalid
+NONCE_ERRORS = ("outdated", "stale", "priority is too low")
+
+
+@dataclass
+class BatchResult:
+    """
+    The outcome of one of the extrinsics a list of batched calls was submitted in, which covers `calls[start:stop]`.
+    """
+
+    start: int
+    stop: int
+    success: bool
+    # the error message, if the extrinsic failed
+    message: str
+    receipt: Optional[AsyncExtrinsicReceipt]
+
+
+def is_nonce_error(error: Exception) -> bool:
+    message = str(error).lower()
+    return any(e in message for e in NONCE_ERRORS)
+
+
+async def sign_and_send_pipelined(
+    subtensor: "SubtensorInterface",
+    calls: list["GenericCall"],
+    wallet: Wallet,
+    wait_for_inclusion: bool = True,
+    wait_for_finalization: bool = False,
+    era: Optional[dict[str, int]] = None,
+    proxy: Optional[str] = None,
+    sign_with: Literal["coldkey", "hotkey", "coldkeypub"] = "coldkey",
+    timeout_blocks: int = 8,
+    status=None,
+) -> list[tuple[bool, str, Optional[AsyncExtrinsicReceipt]]]:
+    """
+    Signs and submits several extrinsic calls with consecutive nonces, without waiting for each to be included before
+    submitting the next, and then waits for all of them together.
+
+    Unlike a `Utility.batch` of the calls, each call is its own extrinsic, so the calls succeed or fail independently,
+    and each has its own receipt.
+
+    :param subtensor: SubtensorInterface object
+    :param calls: the prepared Call objects, in the order they should be submitted
+    :param wallet: the wallet whose keypair will sign the extrinsics
+    :param wait_for_inclusion: whether to wait until the extrinsics are included on the chain
+    :param wait_for_finalization: whether to wait until the extrinsics are finalized on the chain
+    :param era: The length (in blocks) for which the transactions should be valid.
+    :param proxy: The real account used to create the proxy. None if not using a proxy for these calls.
+    :param sign_with: Determine which of the wallet's keypairs to use to sign the extrinsics.
+    :param timeout_blocks: the number of blocks after the last submission to wait for the extrinsics to be included
+    :param status: Optional rich.Status object for progress updates.
+
+    :return: one (success, error message, extrinsic receipt | None) per call, in the order of the calls
+    """
+    substrate = subtensor.substrate
+    keypair = getattr(wallet, sign_with)
+    if proxy is not None:
+        calls = await asyncio.gather(
+            *[
+                substrate.compose_call(
+                    "Proxy",
+                    "proxy",
+                    {"real": proxy, "call": call, "force_proxy_type": None},
+                )
+                for call in calls
+            ]
+        )
+
+    async def _sign(call: "GenericCall", nonce: int) -> "GenericExtrinsic":
+        kwargs = {"call": call, "keypair": keypair, "nonce": nonce}
+        if era is not None:
+            kwargs["era"] = era
+        return await substrate.create_signed_extrinsic(**kwargs)
+
+    async def _sign_from(index: int, nonce: int) -> dict[int, "GenericExtrinsic"]:
+        # signs the calls from `index` onwards, with consecutive nonces from `nonce`
+        extrinsics = await asyncio.gather(
+            *[_sign(call, nonce + i) for i, call in enumerate(calls[index:])]
+        )
+        return dict(enumerate(extrinsics, start=index))
+
+    results: list[Optional[tuple[bool, str, Optional[AsyncExtrinsicReceipt]]]] = [
+        None
+    ] * len(calls)
+    # extrinsic hash: index of its call, for the extrinsics accepted into the pool
+    pending: dict[str, int] = {}
+
+    nonce = await substrate.get_account_next_index(
+        keypair.ss58_address, use_cache=False
+    )
+    start_block = await substrate.get_block_number(None)
+    signed = await _sign_from(0, nonce)
+    index = 0
+    retried = False
+    while index < len(calls):
+        if status:
+            status.update(f"Submitting extrinsic {index + 1} of {len(calls)}...")
+        extrinsic = signed[index]
+        try:
+            await substrate.submit_extrinsic(
+                extrinsic, wait_for_inclusion=False, wait_for_finalization=False
+            )
+        except SubstrateRequestException as e:
+            if is_nonce_error(e) and not retried:
+                # refetch the nonce, and resubmit this extrinsic once
+                retried = True
+                nonce = await substrate.get_account_next_index(
+                    keypair.ss58_address, use_cache=False
+                )
+                signed.update(await _sign_from(index, nonce))
+                continue
+            results[index] = (False, format_error_message(e), None)
+            index += 1
+            retried = False
+            # the rejected extrinsic's nonce was not consumed, so the rest move down by one
+            if index < len(calls):
+                signed.update(await _sign_from(index, nonce))
+            continue
+        pending[f"0x{extrinsic.extrinsic_hash.hex()}"] = index
+        index += 1
+        nonce += 1
+        retried = False
+    # the node's cached next-index no longer matches what was used here
+    substrate.clear_nonce_cache_for_account(keypair.ss58_address)
+
+    if not wait_for_inclusion and not wait_for_finalization:
+        for extrinsic_hash, i in pending.items():
+            results[i] = (
+                True,
+                "",
+                AsyncExtrinsicReceipt(
+                    substrate=substrate, extrinsic_hash=extrinsic_hash
+                ),
+            )
+        return results
+    if not pending:
+        return results
+
+    # the extrinsics can only be in blocks after the head at the time they were submitted
+    included = await _wait_for_extrinsics(
+        subtensor,
+        set(pending),
+        start_block + 1,
+        await substrate.get_block_number(None) + timeout_blocks,
+        wait_for_finalization,
+        status,
+    )
+    for extrinsic_hash, i in pending.items():
+        if (receipt := included.get(extrinsic_hash)) is None:
+            results[i] = (
+                False,
+                f"Extrinsic {extrinsic_hash} was not included within {timeout_blocks} blocks",
+                None,
+            )
+        elif await receipt.is_success:
+            results[i] = (True, "", receipt)
+        else:
+            results[i] = (
+                False,
+                format_error_message(await receipt.error_message),
+                None,
+            )
+    return results
+
+
+async def _wait_for_extrinsics(
+    subtensor: "SubtensorInterface",
+    extrinsic_hashes: set[str],
+    start_block: int,
+    last_block: int,
+    finalized: bool,
+    status=None,
+) -> dict[str, AsyncExtrinsicReceipt]:
+    """
+    Follows the chain's new (or newly finalized) blocks, from `start_block`, until all the extrinsics have been found
+    or `last_block` has been scanned.
+
+    :return: the receipt of each extrinsic found, by its hash
+    """
+    substrate = subtensor.substrate
+    pinned = pinned_substrate(substrate)
+    found: dict[str, AsyncExtrinsicReceipt] = {}
+    next_block = start_block
+
+    async def _scan(block_number: int) -> bool:
+        # returns False if the block is not available yet, in which case it is scanned again at the next head
+        block_hash = await pinned.get_block_hash(block_number)
+        if block_hash is None:
+            return False
+        for idx, extrinsic in enumerate(await pinned.get_extrinsics(block_hash)):
+            extrinsic_hash = f"0x{extrinsic.extrinsic_hash.hex()}"
+            if extrinsic_hash in extrinsic_hashes:
+                found[extrinsic_hash] = AsyncExtrinsicReceipt(
+                    substrate=pinned,
+                    extrinsic_hash=extrinsic_hash,
+                    block_hash=block_hash,
+                    block_number=block_number,
+                    extrinsic_idx=idx,
+                    finalized=finalized,
+                )
+        return True
+
+    async def _handler(obj: dict, update_nr: int, subscription_id: str):
+        nonlocal next_block
+        head = obj["header"]["number"]
+        # a new head may be several blocks on from the last one, notably for finalized heads
+        while next_block <= head and await _scan(next_block):
+            next_block += 1
+        if status:
+            status.update(
+                f"Waiting for {len(extrinsic_hashes) - len(found)} of {len(extrinsic_hashes)} extrinsics to be "
+                f"{'finalized' if finalized else 'included'}..."
+            )
+        if len(found) == len(extrinsic_hashes) or next_block > last_block:
+            return True
+        return None
+
+    await pinned.subscribe_block_headers(_handler, finalized_only=finalized)
+    return found
+
+
+def chunk_by_limits(
+    costs: list[tuple[int, ...]], limits: tuple[int, ...]
+) -> list[tuple[int, int]]:
+    """
+    Splits a sequence of items, in order, into the fewest consecutive chunks whose summed costs are within the limits
+    in every dimension (e.g. ref time, proof size and length). Filling each chunk before starting the next is optimal
+    for consecutive chunks. An item which exceeds the limits by itself gets a chunk of its own.
+
+    :param costs: the cost of each item, one value per dimension
+    :param limits: the maximum total cost of a chunk, one value per dimension
+
+    :return: the (start, stop) indices of each chunk
+    """
+    chunks = []
+    start = 0
+    totals = [0] * len(limits)
+    for i, cost in enumerate(costs):
+        if i > start and any(t + c > m for t, c, m in zip(totals, cost, limits)):
+            chunks.append((start, i))
+            start = i
+            totals = [0] * len(limits)
+        totals = [t + c for t, c in zip(totals, cost)]
+    if costs:
+        chunks.append((start, len(costs)))
+    return chunks
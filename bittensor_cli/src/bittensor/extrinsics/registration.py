@@ -85,18 +85,14 @@ async def burned_register_extrinsic(
             uid=my_uid, netuid=netuid, block_hash=block_hash
         )
         if not era:
-            current_block, tempo, blocks_since_last_step = await asyncio.gather(
+            current_block, hyperparameters = await asyncio.gather(
                 subtensor.substrate.get_block_number(block_hash=block_hash),
-                subtensor.get_hyperparameter(
-                    "Tempo", netuid=netuid, block_hash=block_hash
-                ),
-                subtensor.query(
-                    "SubtensorModule",
-                    "BlocksSinceLastStep",
-                    [netuid],
-                    block_hash=block_hash,
+                subtensor.get_hyperparameters(
+                    ["Tempo", "BlocksSinceLastStep"], [netuid], block_hash=block_hash
                 ),
             )
+            tempo = hyperparameters[netuid]["Tempo"]
+            blocks_since_last_step = hyperparameters[netuid]["BlocksSinceLastStep"]
             validity_period = tempo - blocks_since_last_step
             era_ = {
                 "period": validity_period,
@@ -17,6 +17,7 @@
 
 import asyncio
 import hashlib
+from contextlib import aclosing
 from typing import List, Sequence, Optional
 
 from bittensor_wallet import Wallet, Keypair
@@ -59,24 +60,30 @@ async def get_current_weights_for_uid(
     Returns:
         A dictionary mapping destination netuid to normalized weight (0.0-1.0).
     """
-    weights_data = await subtensor.weights(netuid=netuid)
     current_weights: dict[int, float] = {}
-
-    for validator_uid, weight_list in weights_data:
-        if validator_uid == uid:
-            for dest_netuid, raw_weight in weight_list:
-                current_weights[dest_netuid] = u16_normalized_float(raw_weight)
-            break
+    # the rest of the subnet's weights are not read once the uid's are found
+    async with aclosing(
+        subtensor.stream_query_map(
+            module="SubtensorModule", storage_function="Weights", params=[netuid]
+        )
+    ) as weights_data:
+        async for validator_uid, weight_list in weights_data:
+            if validator_uid == uid:
+                for dest_netuid, raw_weight in weight_list:
+                    current_weights[dest_netuid] = u16_normalized_float(raw_weight)
+                break
 
     return current_weights
 
 
 async def get_limits(subtensor: SubtensorInterface) -> tuple[int, float]:
     # Get weight restrictions.
-    maw, mwl = await asyncio.gather(
-        subtensor.get_hyperparameter("MinAllowedWeights", netuid=0),
-        subtensor.get_hyperparameter("MaxWeightsLimit", netuid=0),
-    )
+    hyperparameters = (
+        await subtensor.get_hyperparameters(
+            ["MinAllowedWeights", "MaxWeightsLimit"], netuids=[0]
+        )
+    )[0]
+    maw, mwl = hyperparameters["MinAllowedWeights"], hyperparameters["MaxWeightsLimit"]
     min_allowed_weights = int(maw)
     max_weight_limit = u16_normalized_float(int(mwl))
     return min_allowed_weights, max_weight_limit
@@ -0,0 +1,245 @@
+"""
+Index of the chain's identities, shared by every command which shows them.
+
+Building it from scratch walks the whole `IdentitiesV2` map, which is one of the heaviest reads the CLI makes. The
+`OwnedHotkeys` of each identity-bearing coldkey are only read (and from then on kept up to date) once a command needs
+them, as most commands only need the identities. Its contents almost never change though, so once an index
+has been built (in this session, or persisted in the query cache by an earlier one), it is brought up to date with a
+block-range delta instead: `state_queryStorage` reports which of the index's storage keys changed between the block
+it was read at and the requested block, and the keys of the map are listed to find the added and removed coldkeys.
+Only the coldkeys which changed are then re-read.
+"""
+
+import asyncio
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Optional
+
+from async_substrate_interface.utils.storage import StorageKey
+from bittensor_wallet.utils import SS58_FORMAT
+from scalecodec.utils.ss58 import ss58_encode
+
+if TYPE_CHECKING:
+    from bittensor_cli.src.bittensor.subtensor_interface import SubtensorInterface
+
+# The widest block range (~6 hours) which is brought up to date with a delta, rather than rebuilt from scratch. The
+# node reads every key at every block of the range, so this is bounded.
+IDENTITY_DELTA_MAX_BLOCKS = 1800
+
+# The number of storage keys sent in a single `state_queryStorage` request
+QUERY_STORAGE_PAGE_SIZE = 500
+
+
+@dataclass
+class IdentityIndex:
+    block: int
+    block_hash: str
+    # coldkey ss58: identity
+    identities: dict[str, dict]
+    # coldkey ss58: hotkey ss58s, for each coldkey with an identity. None until they are first needed.
+    owned_hotkeys: Optional[dict[str, list[str]]] = None
+
+    def coldkey_hotkey_identities(self) -> dict[str, dict]:
+        """
+        :return: {"coldkeys": {coldkey: {"identity", "hotkeys"}}, "hotkeys": {hotkey: {"coldkey", "identity"}}}
+
+        :raises ValueError: if the owned hotkeys have not been read (see `with_owned_hotkeys`)
+        """
+        if self.owned_hotkeys is None:
+            raise ValueError("The owned hotkeys of the identity index were not read")
+        identities = {"coldkeys": {}, "hotkeys": {}}
+        for coldkey_ss58, hotkeys in self.owned_hotkeys.items():
+            coldkey_identity = self.identities.get(coldkey_ss58)
+            identities["coldkeys"][coldkey_ss58] = {
+                "identity": coldkey_identity,
+                "hotkeys": hotkeys,
+            }
+            for hotkey_ss58 in hotkeys:
+                identities["hotkeys"][hotkey_ss58] = {
+                    "coldkey": coldkey_ss58,
+                    "identity": coldkey_identity,
+                }
+        return identities
+
+
+async def _read_owned_hotkeys(
+    subtensor: "SubtensorInterface", coldkeys: list[str], block_hash: str
+) -> dict[str, list[str]]:
+    """
+    :return: the hotkeys owned by each of the given coldkeys
+    """
+    if not coldkeys:
+        return {}
+    (owned_keys,) = await subtensor.create_storage_keys(
+        ("SubtensorModule", "OwnedHotkeys", [[ck] for ck in coldkeys]),
+        block_hash=block_hash,
+    )
+    return {
+        key.params[0]: hotkeys or []
+        for key, hotkeys in await subtensor.query_multi(owned_keys, block_hash)
+    }
+
+
+async def _read_coldkeys(
+    subtensor: "SubtensorInterface",
+    coldkeys: list[str],
+    block_hash: str,
+    with_owned_hotkeys: bool,
+) -> tuple[dict[str, dict], dict[str, list[str]]]:
+    """
+    Reads the identities, and (if `with_owned_hotkeys`) owned hotkeys, of the given coldkeys.
+
+    :return: (identities, owned hotkeys), both by coldkey, omitting the coldkeys without an identity
+    """
+    if not coldkeys:
+        return {}, {}
+    queries = [("SubtensorModule", "IdentitiesV2", [[ck] for ck in coldkeys])]
+    if with_owned_hotkeys:
+        queries.append(("SubtensorModule", "OwnedHotkeys", [[ck] for ck in coldkeys]))
+    identity_keys, *owned = await subtensor.create_storage_keys(
+        *queries, block_hash=block_hash
+    )
+    owned_keys = owned[0] if owned else []
+    results = await subtensor.query_multi(identity_keys + owned_keys, block_hash)
+    identities = {
+        key.params[0]: identity
+        for key, identity in results[: len(identity_keys)]
+        if identity
+    }
+    owned_hotkeys = {
+        key.params[0]: hotkeys or []
+        for key, hotkeys in results[len(identity_keys) :]
+        if key.params[0] in identities
+    }
+    return identities, owned_hotkeys
+
+
+async def build_identity_index(
+    subtensor: "SubtensorInterface", block_hash: str, block: int
+) -> IdentityIndex:
+    """
+    Builds the index of the identities from scratch, at the given block, without their owned hotkeys.
+    """
+    identities = {
+        ss58_address: identity
+        async for ss58_address, identity in subtensor.stream_query_map(
+            module="SubtensorModule",
+            storage_function="IdentitiesV2",
+            block_hash=block_hash,
+        )
+    }
+    return IdentityIndex(block, block_hash, identities)
+
+
+async def with_owned_hotkeys(
+    subtensor: "SubtensorInterface", index: IdentityIndex
+) -> IdentityIndex:
+    """
+    Returns the index with the owned hotkeys of its coldkeys, reading them at the index's block if they were not
+    read yet.
+    """
+    if index.owned_hotkeys is not None:
+        return index
+    owned_hotkeys = await _read_owned_hotkeys(
+        subtensor, list(index.identities), index.block_hash
+    )
+    return replace(index, owned_hotkeys=owned_hotkeys)
+
+
+async def _identity_map_keys(subtensor: "SubtensorInterface", block_hash: str) -> set:
+    """
+    Lists the storage keys (not their values) of the `IdentitiesV2` map.
+    """
+    runtime = await subtensor.substrate.init_runtime(block_hash=block_hash)
+    prefix = StorageKey.create_from_storage_function(
+        "SubtensorModule",
+        "IdentitiesV2",
+        [],
+        runtime_config=runtime.runtime_config,
+        metadata=runtime.metadata,
+    ).to_hex()
+    response = await subtensor.substrate.rpc_request(
+        "state_getKeys", [prefix, block_hash]
+    )
+    return set(response.get("result") or [])
+
+
+async def update_identity_index(
+    subtensor: "SubtensorInterface",
+    base: IdentityIndex,
+    block_hash: str,
+    block: int,
+) -> IdentityIndex:
+    """
+    Brings an index up to date, re-reading only the coldkeys whose identity or owned hotkeys changed since the block
+    it was read at, and the coldkeys which have since set an identity. The owned hotkeys are only tracked if the base
+    index has them.
+
+    :raises SubstrateRequestException: if the node does not serve `state_queryStorage` (it is an unsafe RPC), or no
+        longer has the state of the base block
+    """
+    coldkeys = list(base.identities)
+    with_owned = base.owned_hotkeys is not None
+    queries = [("SubtensorModule", "IdentitiesV2", [[ck] for ck in coldkeys])]
+    if with_owned:
+        queries.append(("SubtensorModule", "OwnedHotkeys", [[ck] for ck in coldkeys]))
+    identity_keys, *owned = await subtensor.create_storage_keys(
+        *queries, block_hash=block_hash
+    )
+    owned_keys = owned[0] if owned else []
+    coldkey_by_identity_key = {
+        key.to_hex(): ck for key, ck in zip(identity_keys, coldkeys)
+    }
+    coldkey_by_key = {
+        **coldkey_by_identity_key,
+        **{key.to_hex(): ck for key, ck in zip(owned_keys, coldkeys)},
+    }
+    tracked_keys = list(coldkey_by_key)
+
+    current_keys, *pages = await asyncio.gather(
+        _identity_map_keys(subtensor, block_hash),
+        *[
+            subtensor.substrate.rpc_request(
+                "state_queryStorage",
+                [
+                    tracked_keys[i : i + QUERY_STORAGE_PAGE_SIZE],
+                    base.block_hash,
+                    block_hash,
+                ],
+            )
+            for i in range(0, len(tracked_keys), QUERY_STORAGE_PAGE_SIZE)
+        ],
+    )
+    changed = set()
+    for page in pages:
+        # the first change set is the state of the keys at the base block, the rest are the changes after it
+        for change_set in (page.get("result") or [])[1:]:
+            changed.update(coldkey_by_key[key] for key, _ in change_set["changes"])
+    removed = {
+        ck for key, ck in coldkey_by_identity_key.items() if key not in current_keys
+    }
+    added_keys = current_keys - coldkey_by_identity_key.keys()
+
+    identities = {
+        ck: identity for ck, identity in base.identities.items() if ck not in removed
+    }
+    owned_hotkeys = {
+        ck: hotkeys
+        for ck, hotkeys in (base.owned_hotkeys or {}).items()
+        if ck in identities
+    }
+    # the map is Blake2_128Concat over the coldkey, so the coldkey is the last 32 bytes of its key
+    changed.update(
+        ss58_encode(bytes.fromhex(key[-64:]), SS58_FORMAT) for key in added_keys
+    )
+    changed -= removed
+    for ck in changed:
+        identities.pop(ck, None)
+        owned_hotkeys.pop(ck, None)
+    new_identities, new_owned_hotkeys = await _read_coldkeys(
+        subtensor, sorted(changed), block_hash, with_owned
+    )
+    identities.update(new_identities)
+    owned_hotkeys.update(new_owned_hotkeys)
+    return IdentityIndex(
+        block, block_hash, identities, owned_hotkeys if with_owned else None
+    )
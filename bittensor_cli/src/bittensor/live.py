@@ -0,0 +1,118 @@
+"""
+Block-driven refreshing of the live views (`stake list --live` and `subnets list --live`).
+
+Rather than refetching on a fixed timer, which is up to a block behind (or a block ahead, refetching an unchanged
+state), the views follow the chain's new heads, and refresh exactly once per block. Data which rarely changes (e.g.
+identities or subnet mechanisms) is only refetched every `SLOW_REFRESH_BLOCKS` blocks, and the rows of the tables are
+only re-formatted when the values they show change.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Callable, Hashable, Optional
+
+from bittensor_cli.src.bittensor.substrate_pool import pinned_substrate
+
+if TYPE_CHECKING:
+    from bittensor_cli.src.bittensor.subtensor_interface import SubtensorInterface
+
+# The number of blocks (~5 minutes) between refreshes of the slow-changing data of a live view
+SLOW_REFRESH_BLOCKS = 25
+
+
+@dataclass
+class LiveTick:
+    block_number: int
+    block_hash: str
+    # the block of the previous tick, None for the first tick
+    previous_block: Optional[int]
+    # whether the slow-changing data should be refetched at this block
+    refresh_slow: bool
+
+
+async def follow_chain_heads(
+    subtensor: "SubtensorInterface",
+    slow_refresh_blocks: int = SLOW_REFRESH_BLOCKS,
+    refresh_slow_first: bool = True,
+) -> AsyncGenerator[LiveTick, None]:
+    """
+    Yields a tick for each new head of the chain, until the generator is closed.
+
+    If the heads arrive faster than the ticks are processed, only the latest head is yielded, so that a slow refresh
+    never falls behind the chain.
+
+    :param subtensor: SubtensorInterface object
+    :param slow_refresh_blocks: the number of blocks between ticks with `refresh_slow` set
+    :param refresh_slow_first: whether `refresh_slow` is set on the first tick, e.g. False if the slow-changing data
+        was just fetched
+
+    :raises: any error of the block header subscription
+    """
+    heads: asyncio.Queue[int] = asyncio.Queue()
+    substrate = pinned_substrate(subtensor.substrate)
+
+    async def _handler(obj: dict, update_nr: int, subscription_id: str):
+        heads.put_nowait(obj["header"]["number"])
+        return None  # follow the chain indefinitely
+
+    subscription = asyncio.create_task(substrate.subscribe_block_headers(_handler))
+    previous_block = None
+    slow_refreshed_at = None
+    try:
+        while True:
+            next_head = asyncio.ensure_future(heads.get())
+            await asyncio.wait(
+                {next_head, subscription}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not next_head.done():
+                next_head.cancel()
+                # the subscription ended, most likely with an error, which is raised here
+                subscription.result()
+                return
+            block_number = next_head.result()
+            # skip the heads which arrived while the previous tick was being processed
+            while not heads.empty():
+                block_number = heads.get_nowait()
+            if (block_hash := await substrate.get_block_hash(block_number)) is None:
+                # not available yet, so no tick until the next head
+                continue
+
+            if slow_refreshed_at is None:
+                refresh_slow = refresh_slow_first
+                slow_refreshed_at = block_number
+            else:
+                refresh_slow = block_number - slow_refreshed_at >= slow_refresh_blocks
+                if refresh_slow:
+                    slow_refreshed_at = block_number
+            yield LiveTick(
+                block_number=block_number,
+                block_hash=block_hash,
+                previous_block=previous_block,
+                refresh_slow=refresh_slow,
+            )
+            previous_block = block_number
+    finally:
+        subscription.cancel()
+
+
+class RowCache:
+    """
+    The formatted rows of a live table, by key (e.g. netuid), which are only re-formatted when the values they are
+    formatted from change.
+    """
+
+    def __init__(self):
+        self._rows: dict[Hashable, tuple[Any, list]] = {}
+
+    def row(self, key: Hashable, values: Any, format_row: Callable[[], list]) -> list:
+        """
+        :param key: the key of the row
+        :param values: everything the row is formatted from, e.g. its current and previous values
+        :param format_row: formats the row from the values
+
+        :return: the formatted row
+        """
+        cached = self._rows.get(key)
+        if cached is None or cached[0] != values:
+            cached = self._rows[key] = (values, format_row())
+        return cached[1]
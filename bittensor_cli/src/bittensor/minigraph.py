@@ -1,60 +1,157 @@
 import asyncio
-
 from array import array
+from operator import attrgetter
+from typing import Iterable, Iterator, Optional, Union
 
-from bittensor_cli.src.bittensor.chain_data import NeuronInfo, SubnetState
+from bittensor_cli.src.bittensor.chain_data import (
+    NeuronInfo,
+    NeuronInfoLite,
+    SubnetState,
+)
 from bittensor_cli.src.bittensor.subtensor_interface import SubtensorInterface
 
 
+class CSRMatrix:
+    """
+    Compressed sparse row (CSR) matrix of float32 values, used for the weights and bonds of a metagraph, which are
+    sparse: each neuron only sets weights/bonds for a small subset of the other neurons.
+
+    Row `i` is stored as the column indices `indices[indptr[i]:indptr[i + 1]]` and their corresponding values
+    `data[indptr[i]:indptr[i + 1]]`. Dense rows are only materialized on request.
+    """
+
+    __slots__ = ("n_rows", "n_cols", "indptr", "indices", "data")
+
+    def __init__(
+        self, n_rows: int, n_cols: int, indptr: array, indices: array, data: array
+    ):
+        self.n_rows = n_rows
+        self.n_cols = n_cols
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[list[tuple[int, int]]],
+        n_cols: int,
+        normalize: bool = False,
+    ) -> "CSRMatrix":
+        """
+        Builds the matrix directly from the chain's per-neuron `(column, value)` tuples.
+
+        :param rows: one list of `(column, value)` tuples per row
+        :param n_cols: the number of columns. Entries for columns outside of `range(n_cols)` are dropped.
+        :param normalize: whether to scale each row so that its values sum to 1.0
+
+        :return: the CSR matrix
+        """
+        indptr = array("q", [0])
+        indices = array("q")
+        data = array("f")
+        for row in rows:
+            if row:
+                if not all(0 <= col < n_cols for col, _ in row):
+                    row = [(col, value) for col, value in row if 0 <= col < n_cols]
+                cols = [col for col, _ in row]
+                values = [value for _, value in row]
+                if normalize:
+                    row_sum = sum(values)
+                    if row_sum > 0:
+                        values = [value / row_sum for value in values]
+                indices.extend(cols)
+                data.extend(values)
+            indptr.append(len(indices))
+        return cls(len(indptr) - 1, n_cols, indptr, indices, data)
+
+    @property
+    def nnz(self) -> int:
+        """
+        The number of stored (non-zero) entries.
+        """
+        return len(self.data)
+
+    def row(self, i: int) -> array:
+        """
+        Materializes a single dense row.
+        """
+        dense = array("f", bytes(4 * self.n_cols))
+        for k in range(self.indptr[i], self.indptr[i + 1]):
+            dense[self.indices[k]] = self.data[k]
+        return dense
+
+    def dense(self) -> list[array]:
+        """
+        Materializes the full dense matrix, as one `array("f", ...)` row per row.
+        """
+        return [self.row(i) for i in range(self.n_rows)]
+
+    def __len__(self) -> int:
+        return self.n_rows
+
+    def __getitem__(self, i: int) -> array:
+        if i < 0:
+            i += self.n_rows
+        if not 0 <= i < self.n_rows:
+            raise IndexError(i)
+        return self.row(i)
+
+    def __iter__(self) -> Iterator[array]:
+        return (self.row(i) for i in range(self.n_rows))
+
+
 class MiniGraph:
+    # (attribute, NeuronInfo field, array typecode) of each per-neuron column
+    columns = (
+        ("uids", "uid", "q"),
+        ("trust", "trust", "f"),
+        ("consensus", "consensus", "f"),
+        ("incentive", "incentive", "f"),
+        ("dividends", "dividends", "f"),
+        ("ranks", "rank", "f"),
+        ("emission", "emission", "f"),
+        ("active", "active", "q"),
+        ("last_update", "last_update", "q"),
+        ("validator_permit", "validator_permit", "B"),
+        ("validator_trust", "validator_trust", "f"),
+    )
+
     def __init__(
         self,
         netuid: int,
-        neurons: list[NeuronInfo],
+        neurons: Union[list[NeuronInfo], list[NeuronInfoLite]],
         subtensor: "SubtensorInterface",
-        subnet_state: "SubnetState",
+        subnet_state: Optional["SubnetState"],
         block: int,
+        block_hash: Optional[str] = None,
     ):
+        """
+        :param netuid: the netuid of the subnet
+        :param neurons: the subnet's neurons. If these are `NeuronInfoLite`, the weights and bonds are fetched from
+            the chain (at `block_hash`) only when they are first needed, on entering the `async with` block.
+        :param subtensor: SubtensorInterface object
+        :param subnet_state: the subnet state to read the stakes from. If None, the stakes are all zero.
+        :param block: the block number the data was read at
+        :param block_hash: the block hash the data was read at
+        """
         self.neurons = neurons
         self.netuid = netuid
-        self.weights = None
+        self.block_hash = block_hash
+        self.weights: Optional[CSRMatrix] = None
+        self.bonds: Optional[CSRMatrix] = None
         self.subtensor = subtensor
         self.network = subtensor.network
 
         self.axons = [n.axon_info for n in self.neurons]
         self.n = self._create_tensor([len(self.neurons)], ctype="q")
         self.block = self._create_tensor([block], "q")
-        self.uids = self._create_tensor([neuron.uid for neuron in self.neurons], "q")
-        self.trust = self._create_tensor(
-            [neuron.trust for neuron in self.neurons], ctype="f"
-        )
-        self.consensus = self._create_tensor(
-            [neuron.consensus for neuron in self.neurons], ctype="f"
-        )
-        self.incentive = self._create_tensor(
-            [neuron.incentive for neuron in self.neurons], ctype="f"
-        )
-        self.dividends = self._create_tensor(
-            [neuron.dividends for neuron in self.neurons], ctype="f"
-        )
-        self.ranks = self._create_tensor(
-            [neuron.rank for neuron in self.neurons], ctype="f"
-        )
-        self.emission = self._create_tensor(
-            [neuron.emission for neuron in self.neurons], ctype="f"
-        )
-        self.active = self._create_tensor(
-            [neuron.active for neuron in self.neurons], ctype="q"
-        )
-        self.last_update = self._create_tensor(
-            [neuron.last_update for neuron in self.neurons], ctype="q"
-        )
-        self.validator_permit = self._create_tensor(
-            [neuron.validator_permit for neuron in self.neurons], ctype="B"
-        )
-        self.validator_trust = self._create_tensor(
-            [neuron.validator_trust for neuron in self.neurons], ctype="f"
-        )
+        for attribute, field, ctype in self.columns:
+            setattr(
+                self,
+                attribute,
+                self._create_tensor(map(attrgetter(field), self.neurons), ctype),
+            )
 
         # Fetch stakes from subnet_state until we get updated data in NeuronInfo
         global_stake_list, local_stake_list, stake_weights_list = self._process_stakes(
@@ -65,7 +162,7 @@ class MiniGraph:
         self.stake_weights = self._create_tensor(stake_weights_list, ctype="f")
 
     async def __aenter__(self):
-        if not self.weights:
+        if self.weights is None:
             await self._set_weights_and_bonds()
         return self
 
@@ -104,31 +201,51 @@ class MiniGraph:
         # TODO: Check and test the computation of weights and bonds
         if self.netuid == 0:
             self.weights = await self._process_root_weights(
-                [neuron.weights for neuron in self.neurons], "weights"
+                await self._weights_or_bonds_rows("weights"), "weights"
             )
         else:
-            self.weights = self._process_weights_or_bonds(
-                [neuron.weights for neuron in self.neurons], "weights"
-            )
-            self.bonds = self._process_weights_or_bonds(
-                [neuron.bonds for neuron in self.neurons], "bonds"
+            weights, bonds = await asyncio.gather(
+                self._weights_or_bonds_rows("weights"),
+                self._weights_or_bonds_rows("bonds"),
             )
+            self.weights = self._process_weights_or_bonds(weights, "weights")
+            self.bonds = self._process_weights_or_bonds(bonds, "bonds")
+
+    async def _weights_or_bonds_rows(
+        self, attribute: str
+    ) -> list[list[tuple[int, int]]]:
+        """
+        Gets the raw weights or bonds of each neuron, from the neurons themselves if they are full `NeuronInfo`
+        objects, else from the chain.
+
+        :param attribute: ``"weights"`` or ``"bonds"``
+
+        :return: One list of ``(uid, value)`` tuples per neuron.
+        """
+        if all(hasattr(neuron, attribute) for neuron in self.neurons):
+            return [getattr(neuron, attribute) for neuron in self.neurons]
+        fetch = getattr(self.subtensor, attribute)
+        by_uid = dict(await fetch(self.netuid, block_hash=self.block_hash))
+        return [by_uid.get(neuron.uid, []) for neuron in self.neurons]
 
     def _process_stakes(
         self,
-        neurons: list[NeuronInfo],
-        subnet_state: SubnetState,
+        neurons: Union[list[NeuronInfo], list[NeuronInfoLite]],
+        subnet_state: Optional[SubnetState],
     ) -> tuple[list[float], list[float], list[float]]:
         """
         Processes the global_stake, local_stake, and stake_weights based on the neuron's hotkey.
 
         Args:
             neurons (List[NeuronInfo]): List of neurons.
-            subnet_state (SubnetState): The subnet state containing stake information.
+            subnet_state (SubnetState): The subnet state containing stake information, or None to use zero stakes.
 
         Returns:
             tuple[list[float], list[float], list[float]]: Lists of global_stake, local_stake, and stake_weights.
         """
+        if subnet_state is None:
+            zeros = [0.0] * len(neurons)
+            return zeros, zeros.copy(), zeros.copy()
         global_stake_list = []
         local_stake_list = []
         stake_weights_list = []
@@ -149,37 +266,20 @@ class MiniGraph:
 
         return global_stake_list, local_stake_list, stake_weights_list
 
-    def _process_weights_or_bonds(self, data, attribute: str) -> list[array]:
+    def _process_weights_or_bonds(self, data, attribute: str) -> CSRMatrix:
         """
-        Processes the raw weights or bonds data and converts it into a list of per-neuron float32 rows.
+        Processes the raw weights or bonds data and converts it into a sparse matrix with one row per neuron.
 
         :param data: The raw weights or bonds data to be processed. This data typically comes from the subtensor.
         :param attribute: ``"weights"`` (normalized to sum to 1.0) or ``"bonds"`` (no normalization).
 
-        :return: One ``array("f", ...)`` row per input item, each of length ``len(self.neurons)``.
-        """
-        n = len(self.neurons)
-        data_array: list[array] = []
-        for item in data:
-            row = array("f", bytes(4 * n))
-            if len(item) == 0:
-                data_array.append(row)
-                continue
-
-            uids, values = zip(*item)
-            if attribute == "weights":
-                for uid_j, wij in zip(uids, values):
-                    row[uid_j] = float(wij)
-                row_sum = sum(row)
-                if row_sum > 0:
-                    row = array("f", (v / row_sum for v in row))
-            else:  # bonds
-                for uid_j, bij in zip(uids, values):
-                    row[uid_j] = float(int(bij))
-            data_array.append(row)
-        return data_array
-
-    async def _process_root_weights(self, data, attribute: str) -> list[array]:
+        :return: A ``CSRMatrix`` with one row per input item, each of length ``len(self.neurons)``.
+        """
+        return CSRMatrix.from_rows(
+            data, n_cols=len(self.neurons), normalize=attribute == "weights"
+        )
+
+    async def _process_root_weights(self, data, attribute: str) -> CSRMatrix:
         """
         Specifically processes the root weights data for the metagraph. This method is similar to
         `_process_weights_or_bonds` but is tailored for processing root weights, which have a different structure and
@@ -188,39 +288,13 @@ class MiniGraph:
         :param data: The raw root weights data to be processed.
         :param attribute: A string indicating the attribute type, here it's typically `weights`.
 
-        :return: One ``array("f", ...)`` row per input item, each of length ``n_subnets``.
+        :return: A ``CSRMatrix`` with one row per input item, each of length ``n_subnets``.
         """
-
-        async def get_total_subnets():
-            _result = await self.subtensor.query(
-                module="SubtensorModule",
-                storage_function="TotalNetworks",
-                params=[],
-            )
-            return _result
-
-        async def get_subnets():
-            _result = await self.subtensor.query(
-                module="SubtensorModule",
-                storage_function="TotalNetworks",
-            )
-            return [i for i in range(_result)]
-
-        n_subnets, subnets = await asyncio.gather(get_total_subnets(), get_subnets())
-        data_array: list[array] = []
-        for item in data:
-            row = array("f", bytes(4 * n_subnets))
-            if len(item) == 0:
-                data_array.append(row)
-                continue
-
-            uids, values = zip(*item)
-            for uid_j, wij in zip(uids, values):
-                if uid_j in subnets:
-                    index_s = subnets.index(uid_j)
-                    row[index_s] = float(wij)
-            row_sum = sum(row)
-            if row_sum > 0:
-                row = array("f", (v / row_sum for v in row))
-            data_array.append(row)
-        return data_array
+        n_subnets = await self.subtensor.query(
+            module="SubtensorModule",
+            storage_function="TotalNetworks",
+            params=[],
+            block_hash=self.block_hash,
+        )
+        # netuids are 0..n_subnets-1, so each netuid is its own column index
+        return CSRMatrix.from_rows(data, n_cols=n_subnets, normalize=True)
@@ -0,0 +1,267 @@
+"""
+Persistent, block-keyed cache for expensive chain queries.
+
+Every entry is keyed by the block hash it was read at. Since a block hash always refers to the same chain state,
+those entries never go stale, and are only removed by LRU eviction once the cache grows beyond its size cap.
+
+Some queries (e.g. `all_subnets` or `query_all_identities`) are almost always made at the chain head, so an exact
+block hash match is rare between separate invocations. For these, a "head-relative" lookup is also supported: a
+result read at most `ttl_blocks` blocks before the requested block is considered fresh enough to be served.
+
+The cache only ever saves reading from the chain, so a broken or locked database, or an entry which can no longer be
+unpickled, is treated as a miss rather than an error.
+"""
+
+import os
+import pickle
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Any, Generator, Optional
+
+from bittensor_cli.src import defaults
+from bittensor_cli.version import __version__
+
+# Entries pickled by another version of btcli are never served, as the classes they were pickled from may have
+# changed. The suffix is bumped when a pickled class changes within a version.
+CACHE_VERSION = f"{__version__}/1"
+
+# Tables of earlier cache layouts, which are dropped when the cache is opened
+LEGACY_TABLES = ("query_cache",)
+
+UNPICKLING_ERRORS = (
+    pickle.UnpicklingError,
+    AttributeError,
+    EOFError,
+    ImportError,
+    IndexError,
+    TypeError,
+    ValueError,
+)
+
+
+class QueryCache:
+    """
+    SQLite-backed store of pickled query results, keyed by `(endpoint, query name, params, block hash)`.
+    """
+
+    table = "query_cache_v2"
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        max_size_bytes: int = defaults.query_cache.max_size_bytes,
+    ):
+        if db_path is None:
+            db_path = os.getenv("BTCLI_QUERY_CACHE_PATH") or os.path.expanduser(
+                defaults.query_cache.path
+            )
+        self.db_path = db_path
+        self.max_size_bytes = max_size_bytes
+        self._initialized = False
+        # key: last access time, of the entries read since the last write. These are written along with the next
+        # write, rather than committing on every read.
+        self._accessed: dict[str, float] = {}
+
+    @contextmanager
+    def _db(self) -> Generator[tuple[sqlite3.Connection, sqlite3.Cursor], None, None]:
+        if not self._initialized:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.db_path)
+        try:
+            if not self._initialized:
+                for table in LEGACY_TABLES:
+                    conn.execute(f"DROP TABLE IF EXISTS {table}")
+                conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                    "key TEXT PRIMARY KEY, endpoint TEXT, name TEXT, block_hash TEXT, "
+                    "block INTEGER, value BLOB, size INTEGER, last_access REAL, version TEXT)"
+                )
+                conn.execute(
+                    f"DELETE FROM {self.table} WHERE version != ?", (CACHE_VERSION,)
+                )
+                conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS {self.table}_recent "
+                    f"ON {self.table} (endpoint, name, block)"
+                )
+                conn.commit()
+                self._initialized = True
+            yield conn, conn.cursor()
+        finally:
+            conn.close()
+
+    @staticmethod
+    def make_key(endpoint: str, name: str, block_hash: str) -> str:
+        return f"{endpoint}|{name}|{block_hash}"
+
+    def _flush_accessed(self, conn: sqlite3.Connection) -> None:
+        conn.executemany(
+            f"UPDATE {self.table} SET last_access = ? WHERE key = ?",
+            [(last_access, key) for key, last_access in self._accessed.items()],
+        )
+        self._accessed.clear()
+
+    def _load(self, key: str, blob: bytes) -> tuple[bool, Any]:
+        """
+        Unpickles an entry read from the cache, deleting it if it cannot be unpickled.
+
+        :return: (hit, value)
+        """
+        try:
+            value = pickle.loads(blob)
+        except UNPICKLING_ERRORS:
+            self._delete(key)
+            return False, None
+        self._accessed[key] = time.time()
+        return True, value
+
+    def _delete(self, key: str) -> None:
+        try:
+            with self._db() as (conn, _):
+                conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+                conn.commit()
+        except sqlite3.Error:
+            pass
+
+    def get(self, endpoint: str, name: str, block_hash: str) -> tuple[bool, Any]:
+        """
+        Looks up a result read at exactly the given block hash.
+
+        :return: (hit, value)
+        """
+        key = self.make_key(endpoint, name, block_hash)
+        try:
+            with self._db() as (_, cursor):
+                cursor.execute(f"SELECT value FROM {self.table} WHERE key = ?", (key,))
+                row = cursor.fetchone()
+        except sqlite3.Error:
+            return False, None
+        if row is None:
+            return False, None
+        return self._load(key, row[0])
+
+    def get_recent(
+        self, endpoint: str, name: str, block: int, ttl_blocks: int
+    ) -> tuple[bool, Any]:
+        """
+        Looks up the newest result read within `ttl_blocks` blocks before (and including) the given block.
+
+        :return: (hit, value)
+        """
+        try:
+            with self._db() as (_, cursor):
+                cursor.execute(
+                    f"SELECT key, value FROM {self.table} "
+                    "WHERE endpoint = ? AND name = ? AND block <= ? AND block > ? "
+                    "ORDER BY block DESC LIMIT 1",
+                    (endpoint, name, block, block - ttl_blocks),
+                )
+                row = cursor.fetchone()
+        except sqlite3.Error:
+            return False, None
+        if row is None:
+            return False, None
+        return self._load(row[0], row[1])
+
+    def set(
+        self,
+        endpoint: str,
+        name: str,
+        block_hash: str,
+        block: Optional[int],
+        value: Any,
+    ) -> None:
+        """
+        Stores a result, evicting the least recently used entries if the cache grows beyond its size cap.
+        Values which cannot be pickled are silently not cached.
+        """
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+        if len(blob) > self.max_size_bytes:
+            return
+        key = self.make_key(endpoint, name, block_hash)
+        try:
+            with self._db() as (conn, cursor):
+                self._flush_accessed(conn)
+                conn.execute(
+                    f"INSERT OR REPLACE INTO {self.table} "
+                    "(key, endpoint, name, block_hash, block, value, size, last_access, version) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        endpoint,
+                        name,
+                        block_hash,
+                        block,
+                        blob,
+                        len(blob),
+                        time.time(),
+                        CACHE_VERSION,
+                    ),
+                )
+                conn.commit()
+                self._evict(conn, cursor)
+        except sqlite3.Error:
+            pass  # e.g. the database is locked by another btcli process
+
+    def _evict(self, conn: sqlite3.Connection, cursor: sqlite3.Cursor) -> int:
+        cursor.execute(f"SELECT COALESCE(SUM(size), 0) FROM {self.table}")
+        total = cursor.fetchone()[0]
+        if total <= self.max_size_bytes:
+            return 0
+        cursor.execute(f"SELECT key, size FROM {self.table} ORDER BY last_access ASC")
+        to_delete = []
+        for key, size in cursor.fetchall():
+            if total <= self.max_size_bytes:
+                break
+            to_delete.append((key,))
+            total -= size
+        conn.executemany(f"DELETE FROM {self.table} WHERE key = ?", to_delete)
+        conn.commit()
+        return len(to_delete)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Summarises the cache contents.
+
+        :return: {"path", "entries", "size_bytes", "max_size_bytes", "queries": {name: (entries, size_bytes)}}
+        """
+        rows = []
+        # if nothing was ever cached, there is no need to create the database just to report that
+        if os.path.exists(self.db_path):
+            with self._db() as (_, cursor):
+                cursor.execute(
+                    f"SELECT name, COUNT(*), COALESCE(SUM(size), 0) FROM {self.table} "
+                    "GROUP BY name ORDER BY name"
+                )
+                rows = cursor.fetchall()
+        queries = {}
+        for name, count, size in rows:
+            # strip the encoded params, so queries are grouped by their method
+            query_name = name.split(":", 1)[0]
+            prev_count, prev_size = queries.get(query_name, (0, 0))
+            queries[query_name] = (prev_count + count, prev_size + size)
+        return {
+            "path": self.db_path,
+            "entries": sum(x[0] for x in queries.values()),
+            "size_bytes": sum(x[1] for x in queries.values()),
+            "max_size_bytes": self.max_size_bytes,
+            "queries": queries,
+        }
+
+    def clear(self) -> int:
+        """
+        Removes every entry from the cache.
+
+        :return: the number of entries removed
+        """
+        if not os.path.exists(self.db_path):
+            return 0
+        with self._db() as (conn, cursor):
+            cursor.execute(f"DELETE FROM {self.table}")
+            removed = cursor.rowcount
+            conn.commit()
+            conn.execute("VACUUM")
+        return removed
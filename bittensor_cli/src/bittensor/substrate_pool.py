@@ -0,0 +1,186 @@
+"""
+Pool of warm substrate connections to several endpoints of the same chain.
+
+Read-only RPCs are routed to the lowest-latency healthy endpoint, and retried on a sibling endpoint if they fail.
+Everything else (composing calls, nonces, fee estimation, extrinsic submission, subscriptions) stays on a single
+pinned endpoint, so that a signed extrinsic is never built against one node and submitted to another. The chain head
+is read from the pinned endpoint too, as its hash is passed on to those calls: a faster endpoint may be ahead of the
+pinned one, which would then not know the block.
+"""
+
+import asyncio
+import time
+from functools import partial
+from typing import Any, Optional
+
+from async_substrate_interface.async_substrate import AsyncSubstrateInterface
+from async_substrate_interface.errors import (
+    BlockNotFound,
+    ConnectionClosed,
+    InvalidHandshake,
+    MaxRetriesExceeded,
+    StateDiscardedError,
+)
+
+# Methods which only read chain state, and can therefore be served by any endpoint
+READ_METHODS = frozenset(
+    {
+        "get_block",
+        "get_block_hash",
+        "get_block_header",
+        "get_block_number",
+        "get_constant",
+        "get_events",
+        "get_extrinsics",
+        "init_runtime",
+        "query",
+        "query_map",
+        "query_multi",
+        "runtime_call",
+    }
+)
+
+# Errors which indicate the endpoint itself is unhealthy
+TRANSPORT_ERRORS = (
+    ConnectionClosed,
+    InvalidHandshake,
+    MaxRetriesExceeded,
+    OSError,
+    asyncio.TimeoutError,
+)
+# Errors which indicate the endpoint does not (yet, or any longer) have the requested state, e.g. when it is
+# lagging behind, or is a pruned node being asked for an old block
+STATE_ERRORS = (BlockNotFound, StateDiscardedError)
+
+
+class SubstratePool:
+    """
+    Drop-in stand-in for an AsyncSubstrateInterface, backed by several connections. Attributes and non-read methods
+    are served by the pinned (primary) connection.
+    """
+
+    def __init__(
+        self,
+        substrates: list[AsyncSubstrateInterface],
+        failure_cooldown: float = 30.0,
+        smoothing: float = 0.3,
+    ):
+        """
+        :param substrates: one connection per endpoint. The first is the pinned endpoint, unless it fails to connect.
+        :param failure_cooldown: seconds for which an endpoint is deprioritised after a transport error
+        :param smoothing: weight of the newest sample in each endpoint's moving average latency
+        """
+        self.substrates = substrates
+        self.primary = substrates[0]
+        self.failure_cooldown = failure_cooldown
+        self.smoothing = smoothing
+        self.latency: dict[str, Optional[float]] = {s.url: None for s in substrates}
+        self._unhealthy_until: dict[str, float] = {}
+        self.initialized = False
+
+    def __getattr__(self, name: str) -> Any:
+        # only called for attributes not found on the pool itself
+        if name.startswith("__") or "primary" not in self.__dict__:
+            raise AttributeError(name)
+        if name in READ_METHODS:
+            return partial(self._routed, name)
+        return getattr(self.primary, name)
+
+    @property
+    def url(self) -> str:
+        return self.primary.url
+
+    @property
+    def last_block_hash(self) -> Optional[str]:
+        return self.primary.last_block_hash
+
+    def is_healthy(self, substrate: AsyncSubstrateInterface) -> bool:
+        return self._unhealthy_until.get(substrate.url, 0.0) <= time.monotonic()
+
+    def ranked(self) -> list[AsyncSubstrateInterface]:
+        """
+        Returns the connections in the order they should be tried: healthy endpoints by ascending latency, then
+        unhealthy endpoints by how soon their cooldown expires.
+        """
+        healthy = [s for s in self.substrates if self.is_healthy(s)]
+        unhealthy = [s for s in self.substrates if not self.is_healthy(s)]
+        healthy.sort(key=lambda s: self.latency[s.url] or float("inf"))
+        unhealthy.sort(key=lambda s: self._unhealthy_until[s.url])
+        return healthy + unhealthy
+
+    def _record_latency(self, substrate: AsyncSubstrateInterface, elapsed: float):
+        previous = self.latency[substrate.url]
+        self.latency[substrate.url] = (
+            elapsed
+            if previous is None
+            else self.smoothing * elapsed + (1 - self.smoothing) * previous
+        )
+        self._unhealthy_until.pop(substrate.url, None)
+
+    def _mark_failed(self, substrate: AsyncSubstrateInterface):
+        self._unhealthy_until[substrate.url] = time.monotonic() + self.failure_cooldown
+
+    async def _routed(self, method: str, *args, **kwargs):
+        if kwargs.get("subscription_handler") is not None:
+            # subscriptions are long-lived, and stay on the pinned endpoint
+            return await getattr(self.primary, method)(*args, **kwargs)
+        error: Optional[Exception] = None
+        for substrate in self.ranked():
+            start = time.monotonic()
+            try:
+                result = await getattr(substrate, method)(*args, **kwargs)
+            except TRANSPORT_ERRORS as e:
+                self._mark_failed(substrate)
+                error = e
+                continue
+            except STATE_ERRORS as e:
+                error = e
+                continue
+            self._record_latency(substrate, time.monotonic() - start)
+            return result
+        raise error
+
+    async def _initialize_one(self, substrate: AsyncSubstrateInterface):
+        await substrate.initialize()
+        start = time.monotonic()
+        await substrate.rpc_request("system_health", [])
+        self._record_latency(substrate, time.monotonic() - start)
+
+    async def initialize(self):
+        """
+        Connects to every endpoint concurrently. Endpoints which fail to connect are marked unhealthy. If the pinned
+        endpoint is one of them, the fastest connected endpoint is pinned instead.
+
+        :raises: the pinned endpoint's connection error, if no endpoint could be connected to
+        """
+        if self.initialized:
+            return
+        results = await asyncio.gather(
+            *[self._initialize_one(s) for s in self.substrates],
+            return_exceptions=True,
+        )
+        for substrate, result in zip(self.substrates, results):
+            if isinstance(result, Exception):
+                self._mark_failed(substrate)
+        connected = [
+            s for s, r in zip(self.substrates, results) if not isinstance(r, Exception)
+        ]
+        if not connected:
+            raise results[0]
+        if self.primary not in connected:
+            self.primary = min(connected, key=lambda s: self.latency[s.url])
+        self.initialized = True
+
+    async def close(self):
+        await asyncio.gather(
+            *[s.close() for s in self.substrates], return_exceptions=True
+        )
+
+
+def pinned_substrate(substrate):
+    """
+    Returns the connection which block header subscriptions are served by: the pinned endpoint of a pool, or the
+    substrate itself. Blocks announced by a subscription should be looked up on the same connection, as a lagging
+    endpoint of the pool may not have them yet.
+    """
+    return substrate.primary if isinstance(substrate, SubstratePool) else substrate
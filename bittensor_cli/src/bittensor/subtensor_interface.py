@@ -1,12 +1,28 @@
 import asyncio
+import contextvars
+import itertools
+import json
+import math
 import os
+import statistics
 import time
-from typing import Optional, Any, Union, TypedDict, Iterable, Literal
+from typing import (
+    Optional,
+    Any,
+    Union,
+    TypedDict,
+    Iterable,
+    Literal,
+    Callable,
+    Awaitable,
+    AsyncGenerator,
+)
 
 from async_substrate_interface import AsyncExtrinsicReceipt
 from async_substrate_interface.async_substrate import (
     DiskCachedAsyncSubstrateInterface,
     AsyncSubstrateInterface,
+    AsyncQueryMapResult,
 )
 from async_substrate_interface.errors import SubstrateRequestException
 from async_substrate_interface.utils.storage import StorageKey
@@ -28,11 +44,42 @@ from bittensor_cli.src.bittensor.chain_data import (
     MetagraphInfo,
     SimSwapResult,
     CrowdloanData,
+    InfoTable,
     ColdkeySwapAnnouncementInfo,
 )
-from bittensor_cli.src.bittensor.balances import Balance, fixed_to_float
+from bittensor_cli.src.bittensor.balances import (
+    Balance,
+    BalanceArray,
+    fixed_to_bits,
+    fixed_to_float,
+)
 from bittensor_cli.src import Constants, defaults, TYPE_REGISTRY
-from bittensor_cli.src.bittensor.extrinsics.mev_shield import encrypt_extrinsic
+from bittensor_cli.src.bittensor.extrinsics.mev_shield import (
+    encrypt_extrinsic,
+    wait_for_extrinsic_by_hash,
+)
+from bittensor_cli.src.bittensor.extrinsics.pipeline import (
+    BATCH_LIMIT_MARGIN,
+    UNCHECKED_BATCH_CALLS,
+    UNCHECKED_BATCH_LENGTH,
+    BatchResult,
+    chunk_by_limits,
+    sign_and_send_pipelined,
+)
+from bittensor_cli.src.bittensor.identity_index import (
+    IDENTITY_DELTA_MAX_BLOCKS,
+    IdentityIndex,
+    build_identity_index,
+    update_identity_index,
+    with_owned_hotkeys,
+)
+from bittensor_cli.src.bittensor.query_cache import QueryCache
+from bittensor_cli.src.bittensor.substrate_pool import SubstratePool
+from bittensor_cli.src.bittensor.swap_simulator import (
+    VERIFY_SWAP_SIMULATION_ENV,
+    SwapPool,
+    SwapSimulator,
+)
 from bittensor_cli.src.bittensor.utils import (
     format_error_message,
     console,
@@ -46,6 +93,15 @@ from bittensor_cli.src.bittensor.utils import (
 from scalecodec.base import ScaleType
 
 GENESIS_ADDRESS = "5C4hrfjw9DjXZTzV3MwzrrAr9P1MJhSrvWGWqi1eSuyUpnhM"
+# Max keys sent in a single `state_queryStorageAt` request, to stay within the node's RPC size limits
+QUERY_MULTI_PAGE_SIZE = 500
+# Records per page of a streamed storage map
+STREAM_PAGE_SIZE = 1000
+# Hyperparameters which are also fields of DynamicInfo, so can be served from an already loaded `all_subnets`
+DYNAMIC_INFO_HYPERPARAMETERS = {
+    "Tempo": "tempo",
+    "BlocksSinceLastStep": "blocks_since_last_step",
+}
 
 
 class ParamWithTypes(TypedDict):
@@ -68,56 +124,204 @@ class ProposalVoteData:
         self.end = proposal_dict["end"]
 
 
+class BlockSnapshot:
+    """
+    A consistent view of the chain, pinned to a single block hash.
+
+    Obtained through `SubtensorInterface.at_block`. While the snapshot is active, every SubtensorInterface helper
+    called without an explicit `block_hash` reads at the pinned hash, and storage reads, runtime calls and storage
+    keys for that hash are memoized for the lifetime of the snapshot.
+
+    Example:
+
+    ```
+    async with subtensor.at_block() as snapshot:
+        balance, subnets = await asyncio.gather(
+            subtensor.get_balance(coldkey_ss58),
+            subtensor.all_subnets(),
+        )
+        block = await subtensor.substrate.get_block_number(snapshot.block_hash)
+    ```
+    """
+
+    def __init__(
+        self, subtensor: "SubtensorInterface", block_hash: Optional[str] = None
+    ):
+        self.subtensor = subtensor
+        self.block_hash = block_hash
+        # whether the snapshot is of the chain head, rather than an explicitly requested block
+        self.at_head = block_hash is None
+        self._results: dict[tuple, asyncio.Future] = {}
+        self._token: Optional[contextvars.Token] = None
+
+    async def __aenter__(self) -> "BlockSnapshot":
+        if self.block_hash is None:
+            self.block_hash = await self.subtensor.substrate.get_chain_head()
+        self._token = self.subtensor._active_snapshot.set(self)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.subtensor._active_snapshot.reset(self._token)
+        self._token = None
+        self._results.clear()
+
+    async def memoize(self, key: tuple, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Returns the result of `fetch()` for the given key, only running it the first time the key is requested.
+        Concurrent requests for the same key share a single in-flight fetch. Failed fetches are not memoized.
+
+        :param key: hashable key identifying the read
+        :param fetch: zero-argument callable returning the awaitable to run on a cache miss
+
+        :return: the (possibly memoized) result of the fetch
+        """
+        try:
+            future = self._results[key]
+        except KeyError:
+            future = asyncio.ensure_future(fetch())
+            self._results[key] = future
+        try:
+            # shielded so a cancelled caller doesn't cancel the fetch for everyone else sharing it
+            return await asyncio.shield(future)
+        except Exception:
+            self._results.pop(key, None)
+            raise
+
+    async def memoize_many(
+        self,
+        keys: list[tuple],
+        fetch: Callable[[list[tuple]], Awaitable[list[Any]]],
+    ) -> list[Any]:
+        """
+        Like `memoize`, for many keys at once. `fetch` is run a single time, for only the keys which are not already
+        memoized (or in flight).
+
+        :param keys: hashable keys identifying the reads
+        :param fetch: callable taking the keys to read, and returning an awaitable of their results, in order
+
+        :return: the (possibly memoized) result of each key, in order
+        """
+        missing = [key for key in dict.fromkeys(keys) if key not in self._results]
+        if missing:
+            batch = asyncio.ensure_future(fetch(missing))
+
+            async def _pick(idx: int) -> Any:
+                return (await asyncio.shield(batch))[idx]
+
+            for idx, key in enumerate(missing):
+                self._results[key] = asyncio.ensure_future(_pick(idx))
+
+        async def _fetch_one(key: tuple) -> Any:
+            # only used if a read shared with an earlier call failed in the meantime
+            return (await fetch([key]))[0]
+
+        return list(
+            await asyncio.gather(
+                *[self.memoize(key, lambda key=key: _fetch_one(key)) for key in keys]
+            )
+        )
+
+    def loaded(self, key: tuple) -> tuple[bool, Any]:
+        """
+        Looks up a result which has already been read successfully, without starting a read.
+
+        :return: (loaded, result)
+        """
+        future = self._results.get(key)
+        if future is None or not future.done() or future.exception() is not None:
+            return False, None
+        return True, future.result()
+
+
 class SubtensorInterface:
     """
     Thin layer for interacting with Substrate Interface. Mostly a collection of frequently-used calls.
     """
 
-    def __init__(self, network, use_disk_cache: bool = True):
+    def __init__(
+        self,
+        network: Union[str, list[str]],
+        use_disk_cache: bool = True,
+        query_cache: Optional[QueryCache] = None,
+    ):
+        """
+        :param network: network name (e.g. finney) or chain endpoint. If several distinct networks are supplied, a
+            pool of connections is kept to all of them: read-only RPCs are routed to the fastest healthy endpoint,
+            while extrinsics are submitted through the first.
+        :param use_disk_cache: whether to use the DiskCachedAsyncSubstrateInterface
+        :param query_cache: optional persistent cache for expensive queries
+        """
+        networks = [network] if isinstance(network, str) or network is None else network
+        endpoints = list(dict.fromkeys(self._resolve_network(n) for n in networks))
+        self.chain_endpoint, self.network = endpoints[0]
+        self.chain_endpoints = [endpoint for endpoint, _ in endpoints]
+        substrate_class = (
+            DiskCachedAsyncSubstrateInterface
+            if (use_disk_cache or os.getenv("DISK_CACHE", "1") == "1")
+            else AsyncSubstrateInterface
+        )
+        substrates = [
+            substrate_class(
+                url=endpoint,
+                ss58_format=SS58_FORMAT,
+                type_registry=TYPE_REGISTRY,
+                chain_name="Bittensor",
+                ws_shutdown_timer=None,
+            )
+            for endpoint in self.chain_endpoints
+        ]
+        self.substrate = (
+            substrates[0] if len(substrates) == 1 else SubstratePool(substrates)
+        )
+        # kept per task, so concurrent `at_block` scopes on this interface (e.g. in gathered helpers) don't clash
+        self._active_snapshot: contextvars.ContextVar[Optional[BlockSnapshot]] = (
+            contextvars.ContextVar(f"subtensor_snapshot_{id(self)}", default=None)
+        )
+        self.query_cache = query_cache
+        self._identity_index: Optional[IdentityIndex] = None
+        self._identity_index_lock = asyncio.Lock()
+        self._identity_deltas_supported = True
+        # (runtime spec version, encoded call): decoded call
+        self._decoded_calls: dict[tuple[Any, Any], Optional[dict[str, Any]]] = {}
+
+    @staticmethod
+    def _resolve_network(network: Optional[str]) -> tuple[str, str]:
+        """
+        Resolves a network name or chain endpoint.
+
+        :param network: network name (e.g. finney) or chain endpoint (e.g. ws://127.0.0.1:9944)
+
+        :return: (chain endpoint, network name)
+        """
         if network in Constants.network_map:
-            self.chain_endpoint = Constants.network_map[network]
-            self.network = network
             if network == "local":
                 console.log(
                     "[yellow]Warning[/yellow]: Verify your local subtensor is running on port 9944."
                 )
-        else:
-            is_valid, _ = validate_chain_endpoint(network)
-            if is_valid:
-                self.chain_endpoint = network
-                if network in Constants.network_map.values():
-                    self.network = next(
-                        key
-                        for key, value in Constants.network_map.items()
-                        if value == network
-                    )
-                else:
-                    self.network = "custom"
-            else:
-                console.log(
-                    f"Network not specified or not valid. Using default chain endpoint: "
-                    f"{Constants.network_map[defaults.subtensor.network]}.\n"
-                    f"You can set this for commands with the `--network` flag, or by setting this"
-                    f" in the config. If you're sure you're using the correct URL, ensure it begins"
-                    f" with 'ws://' or 'wss://'"
+            return Constants.network_map[network], network
+        is_valid, _ = validate_chain_endpoint(network)
+        if is_valid:
+            if network in Constants.network_map.values():
+                return network, next(
+                    key
+                    for key, value in Constants.network_map.items()
+                    if value == network
                 )
-                self.chain_endpoint = Constants.network_map[defaults.subtensor.network]
-                self.network = defaults.subtensor.network
-        substrate_class = (
-            DiskCachedAsyncSubstrateInterface
-            if (use_disk_cache or os.getenv("DISK_CACHE", "1") == "1")
-            else AsyncSubstrateInterface
+            return network, "custom"
+        console.log(
+            f"Network not specified or not valid. Using default chain endpoint: "
+            f"{Constants.network_map[defaults.subtensor.network]}.\n"
+            f"You can set this for commands with the `--network` flag, or by setting this"
+            f" in the config. If you're sure you're using the correct URL, ensure it begins"
+            f" with 'ws://' or 'wss://'"
         )
-        self.substrate = substrate_class(
-            url=self.chain_endpoint,
-            ss58_format=SS58_FORMAT,
-            type_registry=TYPE_REGISTRY,
-            chain_name="Bittensor",
-            ws_shutdown_timer=None,
+        return (
+            Constants.network_map[defaults.subtensor.network],
+            defaults.subtensor.network,
         )
 
     def __str__(self):
-        return f"Network: {self.network}, Chain: {self.chain_endpoint}"
+        return f"Network: {self.network}, Chain: {', '.join(self.chain_endpoints)}"
 
     async def __aenter__(self):
         with console.status(
@@ -136,6 +340,92 @@ class SubtensorInterface:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.substrate.close()
 
+    def at_block(self, block_hash: Optional[str] = None) -> BlockSnapshot:
+        """
+        Pins all reads made through this interface to a single block for the duration of an `async with` block.
+
+        :param block_hash: the block hash to pin to. If not specified, the chain head at entry is used.
+
+        :return: a BlockSnapshot async context manager
+        """
+        return BlockSnapshot(self, block_hash)
+
+    @property
+    def _snapshot(self) -> Optional[BlockSnapshot]:
+        """
+        The snapshot active in the current task, if any.
+        """
+        return self._active_snapshot.get()
+
+    def _pinned_block_hash(self, block_hash: Optional[str]) -> Optional[str]:
+        """
+        Returns the explicitly requested block hash, falling back to the active snapshot's block hash (if any).
+        """
+        if block_hash is None and (snapshot := self._snapshot) is not None:
+            return snapshot.block_hash
+        return block_hash
+
+    async def _block_hash_or_head(self, block_hash: Optional[str]) -> str:
+        """
+        Returns the explicitly requested block hash, falling back to the active snapshot's block hash, and then to
+        the current chain head.
+        """
+        return (
+            self._pinned_block_hash(block_hash) or await self.substrate.get_chain_head()
+        )
+
+    def _snapshot_for(self, block_hash: Optional[str]) -> Optional[BlockSnapshot]:
+        """
+        Returns the active snapshot if it is pinned to the given block hash, else None.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.block_hash == block_hash:
+            return snapshot
+        return None
+
+    async def _cached_query(
+        self,
+        name: str,
+        block_hash: Optional[str],
+        fetch: Callable[[str], Awaitable[Any]],
+        params: Optional[Any] = None,
+    ) -> Any:
+        """
+        Reads a query result through the on-disk query cache, if enabled.
+
+        Results are stored keyed by the block hash they were read at. When reading at the chain head (no block hash
+        requested, and no snapshot of an explicit block active), queries with a TTL configured in
+        `defaults.query_cache.ttl_blocks` may additionally be served from a result read up to that many blocks
+        before the head. Reads at an explicit block hash are only ever served from that exact block.
+
+        :param name: the name of the query, used for the cache key and TTL lookup
+        :param block_hash: the block hash at which to query. Resolved to the pinned block or chain head if None.
+        :param fetch: callable taking the resolved block hash, and returning an awaitable of the query result
+        :param params: any params of the query which affect the result, used for the cache key
+
+        :return: the query result
+        """
+        if self.query_cache is None:
+            return await fetch(self._pinned_block_hash(block_hash))
+        at_head = block_hash is None and (
+            (snapshot := self._snapshot) is None or snapshot.at_head
+        )
+        block_hash = await self._block_hash_or_head(block_hash)
+        cache_name = name if params is None else f"{name}:{params!r}"
+        hit, value = self.query_cache.get(self.chain_endpoint, cache_name, block_hash)
+        if hit:
+            return value
+        block = await self.substrate.get_block_number(block_hash)
+        if at_head and (ttl_blocks := defaults.query_cache.ttl_blocks.get(name)):
+            hit, value = self.query_cache.get_recent(
+                self.chain_endpoint, cache_name, block, ttl_blocks
+            )
+            if hit:
+                return value
+        value = await fetch(block_hash)
+        self.query_cache.set(self.chain_endpoint, cache_name, block_hash, block, value)
+        return value
+
     async def query(
         self,
         module: str,
@@ -148,15 +438,199 @@ class SubtensorInterface:
         """
         Pass-through to substrate.query which automatically returns the .value
         """
-        result: Optional[ScaleType] = await self.substrate.query(
-            module,
-            storage_function,
-            params,
-            block_hash,
-            raw_storage_key,
-            subscription_handler,
+
+        async def _query():
+            result: Optional[ScaleType] = await self.substrate.query(
+                module,
+                storage_function,
+                params,
+                block_hash,
+                raw_storage_key,
+                subscription_handler,
+            )
+            return result.value
+
+        block_hash = self._pinned_block_hash(block_hash)
+        snapshot = self._snapshot_for(block_hash)
+        if snapshot is None or subscription_handler is not None:
+            return await _query()
+        return await snapshot.memoize(
+            ("query", module, storage_function, repr(params), raw_storage_key),
+            _query,
         )
-        return result.value
+
+    async def query_map(
+        self,
+        module: str,
+        storage_function: str,
+        params: Optional[list] = None,
+        block_hash: Optional[str] = None,
+        page_size: int = 100,
+        fully_exhaust: bool = False,
+    ) -> AsyncQueryMapResult:
+        """
+        Pass-through to substrate.query_map which reads at the pinned snapshot block, if any
+        """
+        return await self.substrate.query_map(
+            module=module,
+            storage_function=storage_function,
+            params=params,
+            block_hash=self._pinned_block_hash(block_hash),
+            page_size=page_size,
+            fully_exhaust=fully_exhaust,
+        )
+
+    async def stream_query_map(
+        self,
+        module: str,
+        storage_function: str,
+        params: Optional[list] = None,
+        block_hash: Optional[str] = None,
+        page_size: int = STREAM_PAGE_SIZE,
+        status=None,
+    ) -> AsyncGenerator[tuple[Any, Any], None]:
+        """
+        Yields the decoded (key, value) records of a storage map page by page, as they arrive, rather than collecting
+        the whole map first. While the records of a page are consumed, the next page is already being fetched.
+
+        All the pages are read at the same block, so a consumer which has found what it needs can stop early. The
+        generator should then be closed (e.g. with `contextlib.aclosing`) so that the prefetch is cancelled at once.
+
+        Example:
+
+        ```
+        async with aclosing(subtensor.stream_query_map("SubtensorModule", "Weights", [netuid])) as records:
+            async for uid, weights in records:
+                if uid == my_uid:
+                    break
+        ```
+
+        :param module: the pallet of the storage map
+        :param storage_function: the storage map
+        :param params: the leading keys of the map, if any, to only read the entries below them
+        :param block_hash: the hash of the block at which to read. Resolved to the pinned block or chain head if None.
+        :param page_size: the number of records per page
+        :param status: optional rich.Status object, updated with the number of records read
+
+        :return: async generator of (key, value) records
+        """
+        block_hash = await self._block_hash_or_head(block_hash)
+
+        def _fetch(start_key: Optional[str]) -> asyncio.Future:
+            page_ = asyncio.ensure_future(
+                self.substrate.query_map(
+                    module=module,
+                    storage_function=storage_function,
+                    params=params,
+                    block_hash=block_hash,
+                    page_size=page_size,
+                    start_key=start_key,
+                )
+            )
+            # retrieves the error of a prefetch which is abandoned, so it isn't logged as never retrieved
+            page_.add_done_callback(lambda f: f.cancelled() or f.exception())
+            return page_
+
+        next_page = _fetch(None)
+        records_read = 0
+        try:
+            while next_page is not None:
+                page = await next_page
+                next_page = (
+                    _fetch(page.last_key)
+                    if len(page.records) >= page_size and page.last_key
+                    else None
+                )
+                records_read += len(page.records)
+                if status:
+                    status.update(
+                        f"Reading {module}.{storage_function}: {records_read} records..."
+                    )
+                for record in page.records:
+                    yield record
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    async def query_multi(
+        self,
+        storage_keys: list[StorageKey],
+        block_hash: Optional[str] = None,
+        page_size: int = QUERY_MULTI_PAGE_SIZE,
+    ) -> list[tuple[StorageKey, Any]]:
+        """
+        Pass-through to substrate.query_multi which reads at the pinned snapshot block, if any.
+
+        Large key sets are split into pages of `page_size` keys, which are dispatched concurrently so that no
+        single request exceeds the node's RPC request/response size limits.
+
+        :param storage_keys: the storage keys to query
+        :param block_hash: the hash of the block at which to query
+        :param page_size: the maximum number of keys to send in a single `state_queryStorageAt` request
+
+        :return: list of `(storage_key, value)` tuples, in the same order as `storage_keys`
+        """
+        block_hash = self._pinned_block_hash(block_hash)
+        if len(storage_keys) <= page_size:
+            return await self.substrate.query_multi(storage_keys, block_hash=block_hash)
+        runtime = await self.substrate.init_runtime(block_hash=block_hash)
+        pages = await asyncio.gather(
+            *[
+                self.substrate.query_multi(
+                    storage_keys[i : i + page_size],
+                    block_hash=block_hash,
+                    runtime=runtime,
+                )
+                for i in range(0, len(storage_keys), page_size)
+            ]
+        )
+        return [item for page in pages for item in page]
+
+    async def create_storage_keys(
+        self,
+        *queries: tuple[str, str, list[list]],
+        block_hash: Optional[str] = None,
+    ) -> list[list[StorageKey]]:
+        """
+        Builds storage keys for many (pallet, storage function, params) combinations at once. The runtime is resolved
+        a single time, and each storage function's metadata and key prefix are resolved once per query group, after
+        which all keys are encoded synchronously.
+
+        Example:
+
+        ```
+        balance_keys, owner_keys = await subtensor.create_storage_keys(
+            ("System", "Account", [[ss58] for ss58 in coldkeys]),
+            ("SubtensorModule", "Owner", [[ss58] for ss58 in hotkeys]),
+            block_hash=block_hash,
+        )
+        ```
+
+        Within an active snapshot, the resulting keys are memoized.
+
+        :param queries: tuples of (pallet, storage function, list of params for each key)
+        :param block_hash: the hash of the block whose runtime to use
+
+        :return: a list of storage keys for each query group, in the order they were provided
+        """
+        block_hash = self._pinned_block_hash(block_hash)
+
+        async def _create():
+            runtime = await self.substrate.init_runtime(block_hash=block_hash)
+            return [
+                StorageKey.create_from_storage_function_batch(
+                    pallet,
+                    storage_function,
+                    params_list,
+                    runtime_config=runtime.runtime_config,
+                    metadata=runtime.metadata,
+                )
+                for pallet, storage_function, params_list in queries
+            ]
+
+        if (snapshot := self._snapshot_for(block_hash)) is None:
+            return await _create()
+        return await snapshot.memoize(("storage_keys", repr(queries)), _create)
 
     async def _decode_inline_call(
         self,
@@ -166,17 +640,54 @@ class SubtensorInterface:
         """
         Decode an `Option<BoundedCall>` returned from storage into a structured dictionary.
         """
-        if not call_option or "Inline" not in call_option:
-            return None
+        (decoded,) = await self._decode_inline_calls([call_option], block_hash)
+        return decoded
+
+    async def _decode_inline_calls(
+        self,
+        call_options: list[Any],
+        block_hash: Optional[str] = None,
+    ) -> list[Optional[dict[str, Any]]]:
+        """
+        Decodes many `Option<BoundedCall>`s at once, see `_decode_inline_call`. The runtime is resolved once for all
+        of them, and each distinct encoded call is decoded once, and remembered for the session.
+
+        :return: the decoded calls, in the order of `call_options`
+        """
+
+        def _encoded(call_option: Any) -> Any:
+            if not call_option or "Inline" not in call_option:
+                return None
+            data = call_option["Inline"]
+            return data if isinstance(data, (str, bytes)) else bytes(data)
+
+        encoded_calls = [_encoded(call_option) for call_option in call_options]
+        if not any(encoded is not None for encoded in encoded_calls):
+            return [None] * len(call_options)
+
         runtime = await self.substrate.init_runtime(block_hash=block_hash)
-        call_obj = await self.substrate.create_scale_object(
-            "Call",
-            data=ScaleBytes(call_option["Inline"]),
-            block_hash=block_hash,
-            runtime=runtime,
-        )
-        call_value = call_obj.decode()
+        keys = [
+            (runtime.runtime_version, encoded) if encoded is not None else None
+            for encoded in encoded_calls
+        ]
+        to_decode = {
+            key for key in keys if key is not None and key not in self._decoded_calls
+        }
 
+        async def _decode(key: tuple[Any, Any]) -> None:
+            call_obj = await self.substrate.create_scale_object(
+                "Call",
+                data=ScaleBytes(key[1]),
+                block_hash=block_hash,
+                runtime=runtime,
+            )
+            self._decoded_calls[key] = self._format_decoded_call(call_obj.decode())
+
+        await asyncio.gather(*[_decode(key) for key in to_decode])
+        return [self._decoded_calls[key] if key else None for key in keys]
+
+    @staticmethod
+    def _format_decoded_call(call_value: Any) -> Optional[dict[str, Any]]:
         if not isinstance(call_value, dict):
             return None
 
@@ -210,7 +721,7 @@ class SubtensorInterface:
         This function provides a comprehensive view of the subnets within the Bittensor network,
         offering insights into its diversity and scale.
         """
-        result = await self.substrate.query_map(
+        result = await self.query_map(
             module="SubtensorModule",
             storage_function="NetworksAdded",
             block_hash=block_hash,
@@ -260,7 +771,7 @@ class SubtensorInterface:
     ) -> dict[int, str]:
         """Retrieve auto-stake destinations configured for a coldkey."""
 
-        query = await self.substrate.query_map(
+        query = await self.query_map(
             module="SubtensorModule",
             storage_function="AutoStakeDestination",
             params=[coldkey_ss58],
@@ -324,9 +835,19 @@ class SubtensorInterface:
         This function enables access to the deeper layers of the Bittensor blockchain, allowing for detailed
         and specific interactions with the network's runtime environment.
         """
-        result = await self.substrate.runtime_call(
-            runtime_api, method, params, block_hash
-        )
+        block_hash = self._pinned_block_hash(block_hash)
+
+        async def _call():
+            return await self.substrate.runtime_call(
+                runtime_api, method, params, block_hash
+            )
+
+        if (snapshot := self._snapshot_for(block_hash)) is None:
+            result = await _call()
+        else:
+            result = await snapshot.memoize(
+                ("runtime_call", runtime_api, method, repr(params)), _call
+            )
 
         return result
 
@@ -362,17 +883,12 @@ class SubtensorInterface:
         :param block_hash: the block hash, optional
         :return: dict of {address: Balance objects}
         """
-        if not block_hash:
-            block_hash = await self.substrate.get_chain_head()
-        calls = [
-            (
-                await self.substrate.create_storage_key(
-                    "System", "Account", [address], block_hash=block_hash
-                )
-            )
-            for address in addresses
-        ]
-        batch_call = await self.substrate.query_multi(calls, block_hash=block_hash)
+        block_hash = await self._block_hash_or_head(block_hash)
+        (calls,) = await self.create_storage_keys(
+            ("System", "Account", [[address] for address in addresses]),
+            block_hash=block_hash,
+        )
+        batch_call = await self.query_multi(calls, block_hash=block_hash)
         results = {}
         for item in batch_call:
             value = item[1] or {"data": {"free": 0}}
@@ -400,32 +916,18 @@ class SubtensorInterface:
 
         results = {}
         for ss58, stake_info_list in sub_stakes.items():
-            total_tao_value = Balance(0)
-            total_swapped_tao_value = Balance(0)
-            for sub_stake in stake_info_list:
-                if sub_stake.stake.rao == 0:
-                    continue
-                netuid = sub_stake.netuid
-                pool = dynamic_info[netuid]
-
-                alpha_value = Balance.from_rao(int(sub_stake.stake.rao)).set_unit(
-                    netuid
-                )
-
-                # Without slippage
-                tao_value = pool.alpha_to_tao(alpha_value)
-                total_tao_value += tao_value
-
-                # With slippage
-                if netuid == 0:
-                    swapped_tao_value = tao_value
-                else:
-                    swapped_tao_value, _, _ = pool.alpha_to_tao_with_slippage(
-                        sub_stake.stake
-                    )
-                total_swapped_tao_value += swapped_tao_value
-
-            results[ss58] = (total_tao_value, total_swapped_tao_value)
+            sub_stakes_ = [s for s in stake_info_list if s.stake.rao != 0]
+            # the swapped values are with slippage, the tao values without
+            swapped_tao_values, tao_values = DynamicInfo.swaps_rao(
+                dynamic_info,
+                netuids=(sub_stake.netuid for sub_stake in sub_stakes_),
+                amounts=(sub_stake.stake.rao for sub_stake in sub_stakes_),
+                to_alpha=False,
+            )
+            results[ss58] = (
+                BalanceArray(tao_values).sum(),
+                BalanceArray(swapped_tao_values).sum(),
+            )
         return results
 
     async def get_total_stake_for_hotkey(
@@ -456,23 +958,18 @@ class SubtensorInterface:
                 ...
             }
         """
-        if not block_hash:
-            block_hash = await self.substrate.get_chain_head()
+        block_hash = await self._block_hash_or_head(block_hash)
 
         netuids = netuids or await self.get_all_subnet_netuids(block_hash=block_hash)
-        calls = [
+        (calls,) = await self.create_storage_keys(
             (
-                await self.substrate.create_storage_key(
-                    "SubtensorModule",
-                    "TotalHotkeyAlpha",
-                    params=[ss58, netuid],
-                    block_hash=block_hash,
-                )
-            )
-            for ss58 in ss58_addresses
-            for netuid in netuids
-        ]
-        query = await self.substrate.query_multi(calls, block_hash=block_hash)
+                "SubtensorModule",
+                "TotalHotkeyAlpha",
+                [[ss58, netuid] for ss58 in ss58_addresses for netuid in netuids],
+            ),
+            block_hash=block_hash,
+        )
+        query = await self.query_multi(calls, block_hash=block_hash)
         results: dict[str, dict[int, "Balance"]] = {
             hk_ss58: {} for hk_ss58 in ss58_addresses
         }
@@ -529,7 +1026,7 @@ class SubtensorInterface:
         :return: A list of netuids where the neuron is a member.
         """
 
-        result = await self.substrate.query_map(
+        result = await self.query_map(
             module="SubtensorModule",
             storage_function="IsNetworkMember",
             params=[hotkey_ss58],
@@ -643,21 +1140,98 @@ class SubtensorInterface:
 
         :return: The value of the specified hyperparameter if the subnet exists, or None
         """
-        if not await self.subnet_exists(netuid, block_hash):
+        hyperparameters = (
+            await self.get_hyperparameters([param_name], [netuid], block_hash)
+        )[netuid]
+        if hyperparameters is None:
             print("subnet does not exist")
             return None
+        return hyperparameters[param_name]
 
-        result = await self.query(
-            module="SubtensorModule",
-            storage_function=param_name,
-            params=[netuid],
-            block_hash=block_hash,
-        )
+    async def get_hyperparameters(
+        self,
+        param_names: Iterable[str],
+        netuids: Iterable[int],
+        block_hash: Optional[str] = None,
+    ) -> dict[int, Optional[dict[str, Any]]]:
+        """
+        Retrieves several hyperparameters (netuid-keyed SubtensorModule storage values) of several subnets, along with
+        the subnets' existence, with a single `query_multi`.
 
-        if result is None:
-            return None
+        Within an active snapshot, each value (and each subnet's existence) is only read once, and values which are
+        also fields of DynamicInfo (see `DYNAMIC_INFO_HYPERPARAMETERS`) are served from `all_subnets`, if it has
+        already been loaded.
 
-        return result
+        :param param_names: The names of the hyperparameters to retrieve.
+        :param netuids: The unique identifiers of the subnets.
+        :param block_hash: The hash of blockchain block number for the query.
+
+        :return: {netuid: {param name: value}}, with None for the subnets which do not exist
+        """
+        block_hash = self._pinned_block_hash(block_hash)
+        param_names = list(dict.fromkeys(param_names))
+        netuids = list(dict.fromkeys(netuids))
+        snapshot = self._snapshot_for(block_hash)
+        output: dict[int, Optional[dict[str, Any]]] = {n: {} for n in netuids}
+
+        to_read = [("NetworksAdded", n) for n in netuids]
+        loaded, subnets = (
+            snapshot.loaded(("all_subnets",)) if snapshot else (False, None)
+        )
+        if loaded:
+            dynamic_info = {sn.netuid: sn for sn in subnets}
+            to_read = [("NetworksAdded", n) for n in netuids if n not in dynamic_info]
+            for netuid in dynamic_info.keys() & output.keys():
+                for param_name in param_names:
+                    if field := DYNAMIC_INFO_HYPERPARAMETERS.get(param_name):
+                        output[netuid][param_name] = getattr(
+                            dynamic_info[netuid], field
+                        )
+        to_read += [
+            (param_name, netuid)
+            for netuid in netuids
+            for param_name in param_names
+            if param_name not in output[netuid]
+        ]
+
+        async def _read(items: list[tuple[str, int]]) -> list[Any]:
+            storage_functions = list(dict.fromkeys(fn for fn, _ in items))
+            keys = await self.create_storage_keys(
+                *[
+                    ("SubtensorModule", fn, [[n] for fn_, n in items if fn_ == fn])
+                    for fn in storage_functions
+                ],
+                block_hash=block_hash,
+            )
+            query = await self.query_multi(
+                [key for group in keys for key in group], block_hash=block_hash
+            )
+            grouped_items = [
+                (fn, n) for fn in storage_functions for fn_, n in items if fn_ == fn
+            ]
+            values = {item: value for item, (_, value) in zip(grouped_items, query)}
+            return [values[item] for item in items]
+
+        if not to_read:
+            values = []
+        elif snapshot is None:
+            values = await _read(to_read)
+        else:
+            # keyed as `query` keys its reads, so that the two share their results
+            items = {
+                ("query", "SubtensorModule", fn, repr([netuid]), None): (fn, netuid)
+                for fn, netuid in to_read
+            }
+            values = await snapshot.memoize_many(
+                list(items), lambda keys: _read([items[key] for key in keys])
+            )
+        for (storage_function, netuid), value in zip(to_read, values):
+            if storage_function == "NetworksAdded":
+                if not value:
+                    output[netuid] = None
+            elif output[netuid] is not None:
+                output[netuid][storage_function] = value
+        return output
 
     async def filter_netuids_by_registered_hotkeys(
         self,
@@ -676,19 +1250,14 @@ class SubtensorInterface:
 
         :return: the filtered list of netuids.
         """
-        netuids_with_registered_hotkeys = [
-            item
-            for sublist in await asyncio.gather(
-                *[
-                    self.get_netuids_for_hotkey(
-                        get_hotkey_pub_ss58(wallet),
-                        block_hash=block_hash,
-                    )
-                    for wallet in all_hotkeys
-                ]
+        all_netuids = list(all_netuids)
+        netuids_with_registered_hotkeys = list(
+            await self.get_uids_for_hotkeys(
+                [get_hotkey_pub_ss58(wallet) for wallet in all_hotkeys],
+                all_netuids,
+                block_hash=block_hash,
             )
-            for item in sublist
-        ]
+        )
 
         if not filter_for_netuids:
             all_netuids = netuids_with_registered_hotkeys
@@ -728,7 +1297,7 @@ class SubtensorInterface:
             await self.substrate.get_constant(
                 module_name="Balances",
                 constant_name="ExistentialDeposit",
-                block_hash=block_hash,
+                block_hash=self._pinned_block_hash(block_hash),
             ),
             "value",
             None,
@@ -801,6 +1370,30 @@ class SubtensorInterface:
 
         return NeuronInfoLite.list_from_any(result)
 
+    async def neurons_lite_table(
+        self, netuid: int, block_hash: Optional[str] = None
+    ) -> Union[InfoTable, list]:
+        """
+        Retrieves the same neurons as `neurons_lite`, decoded into columns (see `InfoBase.table_from_any`). This is
+        much cheaper when only a few of the subnet's neurons, or only a few of their fields, are used.
+
+        :param netuid: The unique identifier of the subnet.
+        :param block_hash: The hash of the blockchain block number for the query.
+
+        :return: A table of the subnet's neurons, which can be indexed for the NeuronInfoLite of a row.
+        """
+        result = await self.query_runtime_api(
+            runtime_api="NeuronInfoRuntimeApi",
+            method="get_neurons_lite",
+            params=[netuid],
+            block_hash=block_hash,
+        )
+
+        if result is None:
+            return []
+
+        return NeuronInfoLite.table_from_any(result)
+
     async def neuron_for_uid(
         self, uid: Optional[int], netuid: int, block_hash: Optional[str] = None
     ) -> NeuronInfo:
@@ -837,6 +1430,65 @@ class SubtensorInterface:
 
         return NeuronInfo.from_any(result)
 
+    async def neuron_lite_for_uid(
+        self, uid: int, netuid: int, block_hash: Optional[str] = None
+    ) -> Optional[NeuronInfoLite]:
+        """
+        Retrieves the 'lite' information of a single neuron, without downloading the rest of its subnet's neurons.
+
+        :param uid: The unique identifier of the neuron.
+        :param netuid: The unique identifier of the subnet.
+        :param block_hash: The hash of the blockchain block number for the query.
+
+        :return: The neuron's information, or None if there is no such neuron.
+        """
+        result = await self.query_runtime_api(
+            runtime_api="NeuronInfoRuntimeApi",
+            method="get_neuron_lite",
+            params=[netuid, uid],
+            block_hash=block_hash,
+        )
+        if not result:
+            return None
+        return NeuronInfoLite.from_any(result)
+
+    async def get_uids_for_hotkeys(
+        self,
+        hotkey_ss58s: Iterable[str],
+        netuids: Iterable[int],
+        block_hash: Optional[str] = None,
+    ) -> dict[int, dict[str, int]]:
+        """
+        Resolves where each of many hotkeys is registered, with a single `query_multi` of their Uids entries on each
+        of the subnets.
+
+        :param hotkey_ss58s: The SS58 addresses of the hotkeys.
+        :param netuids: The netuids to check.
+        :param block_hash: The hash of the blockchain block number for the query.
+
+        :return: {netuid: {hotkey ss58: uid}}, only including the netuids on which any of the hotkeys is registered,
+            and with the hotkeys in the order they were given
+        """
+        hotkey_ss58s = list(dict.fromkeys(hotkey_ss58s))
+        netuids = list(netuids)
+        if not hotkey_ss58s or not netuids:
+            return {}
+        block_hash = await self._block_hash_or_head(block_hash)
+        (keys,) = await self.create_storage_keys(
+            (
+                "SubtensorModule",
+                "Uids",
+                [[netuid, hotkey] for netuid in netuids for hotkey in hotkey_ss58s],
+            ),
+            block_hash=block_hash,
+        )
+        uids: dict[int, dict[str, int]] = {}
+        for key, uid in await self.query_multi(keys, block_hash=block_hash):
+            if uid is not None:
+                netuid, hotkey = key.params
+                uids.setdefault(netuid, {})[hotkey] = uid
+        return uids
+
     async def get_delegated(
         self,
         coldkey_ss58: str,
@@ -866,6 +1518,91 @@ class SubtensorInterface:
 
         return DelegateInfo.list_from_any(result)
 
+    async def get_identity_index(
+        self, block_hash: Optional[str] = None, owned_hotkeys: bool = False
+    ) -> IdentityIndex:
+        """
+        Returns the index of all identities, and optionally the hotkeys owned by each identity-bearing coldkey, at a
+        block.
+
+        The index is kept for the session, and persisted in the query cache (if enabled). For a read at the chain head,
+        a previous index is served as-is if it was read within `defaults.query_cache.ttl_blocks["query_all_identities"]`
+        blocks (only with the query cache enabled). Otherwise, it is brought up to date with a block-range delta, which
+        re-reads only the coldkeys whose storage changed. It is only rebuilt from scratch if there is no previous index
+        within `IDENTITY_DELTA_MAX_BLOCKS`, or the node does not serve the delta.
+
+        :param block_hash: The hash of the blockchain block number at which to perform the query.
+        :param owned_hotkeys: whether the index needs the owned hotkeys, which are otherwise only read once some
+            command needs them
+
+        :return: the IdentityIndex
+        """
+        at_head = block_hash is None and (
+            (snapshot := self._snapshot) is None or snapshot.at_head
+        )
+        block_hash = await self._block_hash_or_head(block_hash)
+        async with self._identity_index_lock:
+            index = self._identity_index
+            persist = False
+            if index is None or index.block_hash != block_hash:
+                index = await self._refresh_identity_index(index, block_hash, at_head)
+                persist = index.block_hash == block_hash
+            if owned_hotkeys and index.owned_hotkeys is None:
+                index = await with_owned_hotkeys(self, index)
+                persist = True
+            if persist and self.query_cache is not None:
+                self.query_cache.set(
+                    self.chain_endpoint,
+                    "identity_index",
+                    index.block_hash,
+                    index.block,
+                    index,
+                )
+            self._identity_index = index
+            return index
+
+    async def _refresh_identity_index(
+        self, index: Optional[IdentityIndex], block_hash: str, at_head: bool
+    ) -> IdentityIndex:
+        """
+        Returns an index for the given block, from the session's index or the persisted one where possible (see
+        `get_identity_index`).
+        """
+        block = await self.substrate.get_block_number(block_hash)
+        base = None
+        if index is not None and 0 <= block - index.block:
+            base = index
+        elif self.query_cache is not None:
+            hit, value = self.query_cache.get_recent(
+                self.chain_endpoint,
+                "identity_index",
+                block,
+                IDENTITY_DELTA_MAX_BLOCKS,
+            )
+            base = value if hit else None
+
+        ttl_blocks = defaults.query_cache.ttl_blocks["query_all_identities"]
+        if base is not None and (
+            base.block_hash == block_hash
+            or (
+                at_head
+                and self.query_cache is not None
+                and block - base.block < ttl_blocks
+            )
+        ):
+            return base
+        if (
+            base is not None
+            and block - base.block <= IDENTITY_DELTA_MAX_BLOCKS
+            and self._identity_deltas_supported
+        ):
+            try:
+                return await update_identity_index(self, base, block_hash, block)
+            except SubstrateRequestException:
+                # e.g. a public node rejecting the unsafe `state_queryStorage`, or a pruned one
+                self._identity_deltas_supported = False
+        return await build_identity_index(self, block_hash, block)
+
     async def query_all_identities(
         self,
         block_hash: Optional[str] = None,
@@ -877,18 +1614,8 @@ class SubtensorInterface:
 
         :return: A dictionary mapping addresses to their decoded identity data.
         """
-
-        identities = await self.substrate.query_map(
-            module="SubtensorModule",
-            storage_function="IdentitiesV2",
-            block_hash=block_hash,
-            fully_exhaust=True,
-        )
-        all_identities = {
-            ss58_address: identity for (ss58_address, identity) in identities.records
-        }
-
-        return all_identities
+        # a copy, as the index is shared across commands
+        return dict((await self.get_identity_index(block_hash)).identities)
 
     async def query_identity(
         self,
@@ -934,35 +1661,8 @@ class SubtensorInterface:
         :param block_hash: The hash of the blockchain block number for the query.
         :return: Dict with 'coldkeys' and 'hotkeys' as keys.
         """
-        if block_hash is None:
-            block_hash = await self.substrate.get_chain_head()
-        coldkey_identities = await self.query_all_identities(block_hash=block_hash)
-        identities = {"coldkeys": {}, "hotkeys": {}}
-        sks = [
-            await self.substrate.create_storage_key(
-                "SubtensorModule", "OwnedHotkeys", [ck], block_hash=block_hash
-            )
-            for ck in coldkey_identities.keys()
-        ]
-        query = await self.substrate.query_multi(sks, block_hash=block_hash)
-
-        storage_key: StorageKey
-        for storage_key, hotkeys in query:
-            coldkey_ss58 = storage_key.params[0]
-            coldkey_identity = coldkey_identities.get(coldkey_ss58)
-
-            identities["coldkeys"][coldkey_ss58] = {
-                "identity": coldkey_identity,
-                "hotkeys": hotkeys,
-            }
-
-            for hotkey_ss58 in hotkeys:
-                identities["hotkeys"][hotkey_ss58] = {
-                    "coldkey": coldkey_ss58,
-                    "identity": coldkey_identity,
-                }
-
-        return identities
+        index = await self.get_identity_index(block_hash, owned_hotkeys=True)
+        return index.coldkey_hotkey_identities()
 
     async def weights(
         self, netuid: int, block_hash: Optional[str] = None
@@ -980,17 +1680,15 @@ class SubtensorInterface:
         The weight distribution is a key factor in the network's consensus algorithm and the ranking of neurons,
         influencing their influence and reward allocation within the subnet.
         """
-        w_map_encoded = await self.substrate.query_map(
-            module="SubtensorModule",
-            storage_function="Weights",
-            params=[netuid],
-            block_hash=block_hash,
-        )
-        w_map = []
-        async for uid, w in w_map_encoded:
-            w_map.append((uid, w))
-
-        return w_map
+        return [
+            (uid, w)
+            async for uid, w in self.stream_query_map(
+                module="SubtensorModule",
+                storage_function="Weights",
+                params=[netuid],
+                block_hash=block_hash,
+            )
+        ]
 
     async def bonds(
         self, netuid: int, block_hash: Optional[str] = None
@@ -1010,17 +1708,15 @@ class SubtensorInterface:
         within the subnet. It reflects how neurons recognize and invest in each other's intelligence and
         contributions, supporting diverse and niche systems within the Bittensor ecosystem.
         """
-        b_map_encoded = await self.substrate.query_map(
-            module="SubtensorModule",
-            storage_function="Bonds",
-            params=[netuid],
-            block_hash=block_hash,
-        )
-        b_map = []
-        async for uid, b in b_map_encoded:
-            b_map.append((uid, b))
-
-        return b_map
+        return [
+            (uid, b)
+            async for uid, b in self.stream_query_map(
+                module="SubtensorModule",
+                storage_function="Bonds",
+                params=[netuid],
+                block_hash=block_hash,
+            )
+        ]
 
     async def do_hotkeys_exist(
         self, hotkeys_ss58: Iterable[str], block_hash: Optional[str] = None
@@ -1035,15 +1731,12 @@ class SubtensorInterface:
         Returns:
             {hotkey ss58: exists (True/False)}
         """
-        if block_hash is None:
-            block_hash = await self.substrate.get_chain_head()
-        keys = [
-            await self.substrate.create_storage_key(
-                "SubtensorModule", "Owner", [ss58], block_hash=block_hash
-            )
-            for ss58 in hotkeys_ss58
-        ]
-        query = await self.substrate.query_multi(
+        block_hash = await self._block_hash_or_head(block_hash)
+        (keys,) = await self.create_storage_keys(
+            ("SubtensorModule", "Owner", [[ss58] for ss58 in hotkeys_ss58]),
+            block_hash=block_hash,
+        )
+        query = await self.query_multi(
             storage_keys=keys,
             block_hash=block_hash,
         )
@@ -1259,16 +1952,28 @@ class SubtensorInterface:
         announce_only: bool = False,
         mev_protection: bool = False,
         block_hash: Optional[str] = None,
-    ) -> tuple[bool, str, Optional[AsyncExtrinsicReceipt]]:
+        batch_function: Literal["batch_all", "batch", "force_batch"] = "batch_all",
+        status=None,
+    ) -> list[BatchResult]:
         """
-        Wraps multiple extrinsic calls into a single Utility.batch_all transaction
-        and submits it. This reduces fees by combining N separate transactions into one.
+        Wraps multiple extrinsic calls into a Utility.batch_all transaction and submits it.
+        This reduces fees by combining N separate transactions into one.
+
+        With batch_all, if any call in the batch fails, the entire batch reverts.
+        `batch` instead stops at the first failing call, keeping the calls before it,
+        and `force_batch` carries on past failing calls.
 
-        batch_all is atomic: if any call in the batch fails, the entire batch reverts.
+        If the calls would not fit in a single extrinsic, they are split, in order, into
+        the fewest batches which stay within the chain's per-extrinsic weight and length
+        limits (see `_chunk_batch_calls`), and the batches are submitted with pipelined
+        nonces. The batches succeed or fail independently, so there is one result per batch.
 
         For a single call, this delegates directly to sign_and_send_extrinsic without
         wrapping, so there's no overhead for non-batch use cases.
 
+        With MEV protection, the encrypted extrinsics' inner extrinsics are waited for (when waiting at all), and
+        their receipts are returned.
+
         :param calls: list of prepared GenericCall objects to batch together.
         :param wallet: the wallet whose key will sign the extrinsic.
         :param wait_for_inclusion: wait until the extrinsic is included on chain.
@@ -1280,49 +1985,171 @@ class SubtensorInterface:
         :param announce_only: make the call as a proxy announcement.
         :param mev_protection: encrypt the extrinsic via MEV Shield.
         :param block_hash: cached block hash for compose_call. Fetched if None.
+        :param batch_function: the Utility batch call to wrap the calls in.
+        :param status: Optional rich.Status object for progress updates.
 
-        :return: (success, error message or inner hash, extrinsic receipt | None)
+        :return: the result of each extrinsic, in the order of the calls. Each result covers the calls from its
+            `start` up to its `stop`.
         """
         if not calls:
-            return False, "No calls to batch", None
+            return [BatchResult(0, 0, False, "No calls to batch", None)]
 
-        # No need to wrap a single call in a batch
-        if len(calls) == 1:
-            return await self.sign_and_send_extrinsic(
-                call=calls[0],
+        async def _send(
+            call: GenericCall, start: int, stop: int, nonce_: Optional[int]
+        ) -> BatchResult:
+            success, message, receipt = await self.sign_and_send_extrinsic(
+                call=call,
                 wallet=wallet,
                 wait_for_inclusion=wait_for_inclusion,
                 wait_for_finalization=wait_for_finalization,
                 era=era,
                 proxy=proxy,
-                nonce=nonce,
+                nonce=nonce_,
                 sign_with=sign_with,
                 announce_only=announce_only,
                 mev_protection=mev_protection,
             )
+            if (
+                success
+                and mev_protection
+                and (wait_for_inclusion or wait_for_finalization)
+            ):
+                # the message is the hash of the inner extrinsic
+                success, message, receipt = await wait_for_extrinsic_by_hash(
+                    self, message, receipt.block_hash, status=status
+                )
+            return BatchResult(
+                start, stop, success, "" if success else message, receipt
+            )
 
-        if block_hash is None:
-            block_hash = await self.substrate.get_chain_head()
+        # No need to wrap a single call in a batch
+        if len(calls) == 1:
+            return [await _send(calls[0], 0, 1, nonce)]
+
+        block_hash = await self._block_hash_or_head(block_hash)
+
+        chunks = await self._chunk_batch_calls(calls, wallet, block_hash)
+        # compose_call with a block_hash does no I/O, so no need for gather
+        batch_calls = []
+        for start, stop in chunks:
+            batch_calls.append(
+                await self.substrate.compose_call(
+                    call_module="Utility",
+                    call_function=batch_function,
+                    call_params={"calls": calls[start:stop]},
+                    block_hash=block_hash,
+                )
+            )
 
-        batch_call = await self.substrate.compose_call(
-            call_module="Utility",
-            call_function="batch_all",
-            call_params={"calls": calls},
-            block_hash=block_hash,
-        )
+        if len(batch_calls) == 1:
+            return [await _send(batch_calls[0], 0, len(calls), nonce)]
+
+        n_batches = len(batch_calls)
+        if mev_protection or announce_only or nonce is not None:
+            # these need each extrinsic to be signed and submitted on its own, so the batches go one after another
+            results = []
+            for i, (batch_call, (start, stop)) in enumerate(zip(batch_calls, chunks)):
+                if status:
+                    status.update(f"Submitting batch {i + 1} of {n_batches}...")
+                result = await _send(
+                    batch_call, start, stop, None if nonce is None else nonce + i
+                )
+                results.append(result)
+                if not result.success:
+                    # with explicit nonces, the later batches would be stuck behind the unused nonce
+                    results.extend(
+                        BatchResult(
+                            start_,
+                            stop_,
+                            False,
+                            f"Not submitted, as batch {i + 1} of {n_batches} failed",
+                            None,
+                        )
+                        for start_, stop_ in chunks[i + 1 :]
+                    )
+                    break
+            return results
 
-        return await self.sign_and_send_extrinsic(
-            call=batch_call,
-            wallet=wallet,
+        results = await sign_and_send_pipelined(
+            self,
+            batch_calls,
+            wallet,
             wait_for_inclusion=wait_for_inclusion,
             wait_for_finalization=wait_for_finalization,
             era=era,
             proxy=proxy,
-            nonce=nonce,
             sign_with=sign_with,
-            announce_only=announce_only,
-            mev_protection=mev_protection,
+            status=status,
         )
+        return [
+            BatchResult(start, stop, success, message, receipt)
+            for (start, stop), (success, message, receipt) in zip(chunks, results)
+        ]
+
+    async def _chunk_batch_calls(
+        self, calls: list[GenericCall], wallet: Wallet, block_hash: str
+    ) -> list[tuple[int, int]]:
+        """
+        Splits the calls, in order, into the fewest batches which each fit in a single extrinsic: within
+        `BATCH_LIMIT_MARGIN` of the chain's maximum weight (ref time and proof size) and length of a normal
+        extrinsic.
+
+        A batch of at most `UNCHECKED_BATCH_CALLS` calls, totalling at most `UNCHECKED_BATCH_LENGTH` bytes, is not
+        checked against the limits at all. Otherwise, the weight of a call is fixed by its call function, so it is
+        estimated with `TransactionPaymentApi.query_info` once per call function, rather than once per call. The
+        estimate includes the extrinsic's base weight, so it errs on the safe side.
+
+        :param calls: the calls to batch
+        :param wallet: the wallet which will sign the batches
+        :param block_hash: the block hash to read the limits at
+
+        :return: the (start, stop) indices of the calls of each batch
+        """
+        if (
+            len(calls) <= UNCHECKED_BATCH_CALLS
+            and sum(len(call.data) for call in calls) <= UNCHECKED_BATCH_LENGTH
+        ):
+            return [(0, len(calls))]
+        block_weights, block_length = await asyncio.gather(
+            self.substrate.get_constant(
+                "System", "BlockWeights", block_hash=block_hash
+            ),
+            self.substrate.get_constant("System", "BlockLength", block_hash=block_hash),
+        )
+        normal = block_weights.value["per_class"]["normal"]
+        max_weight = (
+            normal["max_extrinsic"]
+            or normal["max_total"]
+            or block_weights.value["max_block"]
+        )
+        limits = (
+            int(max_weight["ref_time"] * BATCH_LIMIT_MARGIN),
+            int(max_weight["proof_size"] * BATCH_LIMIT_MARGIN),
+            int(block_length.value["max"]["normal"] * BATCH_LIMIT_MARGIN),
+        )
+
+        def _function(call: GenericCall) -> tuple[str, str]:
+            return call.value["call_module"], call.value["call_function"]
+
+        representatives = {}
+        for call in calls:
+            representatives.setdefault(_function(call), call)
+        payment_infos = await asyncio.gather(
+            *[
+                self.substrate.get_payment_info(call, wallet.coldkeypub)
+                for call in representatives.values()
+            ]
+        )
+        weights = {}
+        for function, info in zip(representatives, payment_infos):
+            weight = info["weight"]
+            if isinstance(weight, int):
+                # pre-WeightV2 runtimes only have the ref time
+                weight = {"ref_time": weight, "proof_size": 0}
+            weights[function] = (weight["ref_time"], weight["proof_size"])
+
+        costs = [(*weights[_function(call)], len(call.data)) for call in calls]
+        return chunk_by_limits(costs, limits)
 
     async def get_children(self, hotkey, netuid) -> tuple[bool, list, str]:
         """
@@ -1353,6 +2180,69 @@ class SubtensorInterface:
         except SubstrateRequestException as e:
             return False, [], format_error_message(e)
 
+    async def get_children_all_netuids(
+        self,
+        hotkey: str,
+        netuids: Optional[list[int]] = None,
+        block_hash: Optional[str] = None,
+    ) -> tuple[dict[int, list[tuple[int, str]]], dict[int, list[tuple[int, str]]]]:
+        """
+        Retrieves the children, and the parents, of a hotkey on many subnets at once, with a single `query_multi` of
+        their ChildKeys and ParentKeys entries.
+
+        :param hotkey: The hotkey ss58 address.
+        :param netuids: The netuids to query. If not specified, every subnet is queried.
+        :param block_hash: The hash of the block at which to query.
+
+        :return: ({netuid: [(proportion, child ss58)]}, {netuid: [(proportion, parent ss58)]}), only including the
+            netuids on which the hotkey has children, or parents, respectively
+        """
+        block_hash = await self._block_hash_or_head(block_hash)
+        if netuids is None:
+            netuids = await self.get_all_subnet_netuids(block_hash=block_hash)
+        children_keys, parents_keys = await self.create_storage_keys(
+            ("SubtensorModule", "ChildKeys", [[hotkey, n] for n in netuids]),
+            ("SubtensorModule", "ParentKeys", [[hotkey, n] for n in netuids]),
+            block_hash=block_hash,
+        )
+        query = await self.query_multi(children_keys + parents_keys, block_hash)
+        children: dict[int, list[tuple[int, str]]] = {}
+        parents: dict[int, list[tuple[int, str]]] = {}
+        for idx, (key, relations) in enumerate(query):
+            if relations:
+                output = children if idx < len(children_keys) else parents
+                output[key.params[1]] = [
+                    (int(proportion), ss58) for proportion, ss58 in relations
+                ]
+        return children, parents
+
+    async def get_childkey_takes(
+        self,
+        hotkey_netuids: Iterable[tuple[str, int]],
+        block_hash: Optional[str] = None,
+    ) -> dict[tuple[str, int], int]:
+        """
+        Retrieves the childkey takes of many (hotkey, netuid) pairs, with a single `query_multi`.
+
+        :param hotkey_netuids: the (hotkey ss58, netuid) pairs to query
+        :param block_hash: The hash of the block at which to query.
+
+        :return: {(hotkey ss58, netuid): take (u16)}
+        """
+        block_hash = await self._block_hash_or_head(block_hash)
+        (keys,) = await self.create_storage_keys(
+            (
+                "SubtensorModule",
+                "ChildkeyTake",
+                [[hotkey, netuid] for hotkey, netuid in hotkey_netuids],
+            ),
+            block_hash=block_hash,
+        )
+        return {
+            (key.params[0], key.params[1]): int(take or 0)
+            for key, take in await self.query_multi(keys, block_hash)
+        }
+
     async def get_subnet_hyperparameters(
         self, netuid: int, block_hash: Optional[str] = None
     ) -> Optional[Union[list, SubnetHyperparameters]]:
@@ -1368,8 +2258,7 @@ class SubtensorInterface:
         Understanding the hyperparameters is crucial for comprehending how subnets are configured and
         managed, and how they interact with the network's consensus and incentive mechanisms.
         """
-        if block_hash is None:
-            block_hash = await self.substrate.get_chain_head()
+        block_hash = await self._block_hash_or_head(block_hash)
         result, burn_increase_mult, burn_half_life = await asyncio.gather(
             self.query_runtime_api(
                 runtime_api="SubnetInfoRuntimeApi",
@@ -1377,10 +2266,10 @@ class SubtensorInterface:
                 params=[netuid],
                 block_hash=block_hash,
             ),
-            self.substrate.query(
+            self.query(
                 "SubtensorModule", "BurnIncreaseMult", [netuid], block_hash=block_hash
             ),
-            self.substrate.query(
+            self.query(
                 "SubtensorModule", "BurnHalfLife", [netuid], block_hash=block_hash
             ),
         )
@@ -1388,8 +2277,8 @@ class SubtensorInterface:
             return []
 
         additional = {
-            "burn_increase_mult": burn_increase_mult.value,
-            "burn_half_life": burn_half_life.value,
+            "burn_increase_mult": burn_increase_mult,
+            "burn_half_life": burn_half_life,
         }
 
         return SubnetHyperparameters.from_any(result | additional)
@@ -1415,7 +2304,7 @@ class SubtensorInterface:
     ) -> dict[int, int]:
         """Return mechanism counts for every subnet with a recorded value."""
 
-        results = await self.substrate.query_map(
+        results = await self.query_map(
             module="SubtensorModule",
             storage_function="MechanismCountCurrent",
             params=[],
@@ -1559,19 +2448,19 @@ class SubtensorInterface:
             }
 
         """
-        calls = [
+        (calls,) = await self.create_storage_keys(
             (
-                await self.substrate.create_storage_key(
-                    "SubtensorModule",
-                    "Alpha",
-                    [hk_ss58, coldkey_ss58, netuid],
-                    block_hash=block_hash,
-                )
-            )
-            for hk_ss58 in hotkey_ss58s
-            for netuid in netuids
-        ]
-        batch_call = await self.substrate.query_multi(calls, block_hash=block_hash)
+                "SubtensorModule",
+                "Alpha",
+                [
+                    [hk_ss58, coldkey_ss58, netuid]
+                    for hk_ss58 in hotkey_ss58s
+                    for netuid in netuids
+                ],
+            ),
+            block_hash=block_hash,
+        )
+        batch_call = await self.query_multi(calls, block_hash=block_hash)
         results: dict[str, dict[int, "Balance"]] = {
             hk_ss58: {} for hk_ss58 in hotkey_ss58s
         }
@@ -1627,14 +2516,29 @@ class SubtensorInterface:
         return stake_info_map if stake_info_map else None
 
     async def all_subnets(self, block_hash: Optional[str] = None) -> list[DynamicInfo]:
-        result, prices = await asyncio.gather(
-            self.query_runtime_api(
-                "SubnetInfoRuntimeApi",
-                "get_all_dynamic_info",
-                block_hash=block_hash,
-            ),
-            self.get_subnet_prices(block_hash=block_hash, page_size=129),
+        block_hash = self._pinned_block_hash(block_hash)
+        if (snapshot := self._snapshot_for(block_hash)) is not None:
+            return await snapshot.memoize(
+                ("all_subnets",), lambda: self._all_subnets(block_hash)
+            )
+        return await self._all_subnets(block_hash)
+
+    async def _all_subnets(self, block_hash: Optional[str] = None) -> list[DynamicInfo]:
+        async def _fetch(block_hash_: str) -> tuple[Any, list[tuple[int, Any]]]:
+            return await asyncio.gather(
+                self.query_runtime_api(
+                    "SubnetInfoRuntimeApi",
+                    "get_all_dynamic_info",
+                    block_hash=block_hash_,
+                ),
+                self._subnet_price_records(block_hash_, page_size=129),
+            )
+
+        # cached as one entry, so the subnets and their prices are always from the same block
+        result, price_records = await self._cached_query(
+            "all_subnets", block_hash, _fetch
         )
+        prices = self._prices_from_records(price_records)
         sns: list[DynamicInfo] = DynamicInfo.list_from_any(result)
         for sn in sns:
             if sn.netuid == 0:
@@ -1728,7 +2632,7 @@ class SubtensorInterface:
         Returns:
             SimSwapResult object representing the result
         """
-        block_hash = block_hash or await self.substrate.get_chain_head()
+        block_hash = await self._block_hash_or_head(block_hash)
         if origin_netuid > 0 and destination_netuid > 0:
             # for cross-subnet moves where neither origin nor destination is root
             intermediate_result_, sn_price = await asyncio.gather(
@@ -1781,6 +2685,78 @@ class SubtensorInterface:
                 destination_netuid,
             )
 
+    async def get_swap_simulator(
+        self,
+        netuids: Iterable[int],
+        block_hash: Optional[str] = None,
+        dynamic_info: Optional[dict[int, DynamicInfo]] = None,
+    ) -> SwapSimulator:
+        """
+        Reads the swap state of the given subnets in a single `query_multi`, and returns a simulator which can price
+        any number of swaps on them locally, in place of calling `sim_swap` for each.
+
+        :param netuids: the subnets which will be swapped on
+        :param block_hash: the hash of the block to read the swap state at
+        :param dynamic_info: the DynamicInfo of the subnets, by netuid, if already fetched at this block. It is only
+            needed for subnets whose swap has not been initialized yet, which are seeded from their reserves.
+
+        :return: the swap simulator
+        """
+        block_hash = await self._block_hash_or_head(block_hash)
+        verify = os.getenv(VERIFY_SWAP_SIMULATION_ENV) == "1"
+        netuids = sorted({netuid for netuid in netuids if netuid != 0})
+        if not netuids:
+            return SwapSimulator({}, self, block_hash, verify=verify)
+        storage_functions = (
+            "AlphaSqrtPrice",
+            "CurrentLiquidity",
+            "FeeRate",
+            "SwapV3Initialized",
+            "EnabledUserLiquidity",
+        )
+        key_groups = await self.create_storage_keys(
+            *[
+                ("Swap", storage_function, [[netuid] for netuid in netuids])
+                for storage_function in storage_functions
+            ],
+            block_hash=block_hash,
+        )
+        results = await self.query_multi(
+            [key for keys in key_groups for key in keys], block_hash=block_hash
+        )
+        values = [value for _, value in results]
+        columns = [
+            values[i * len(netuids) : (i + 1) * len(netuids)]
+            for i in range(len(storage_functions))
+        ]
+        pools = {}
+        for netuid, sqrt_price, liquidity, fee_rate, initialized, user_liquidity in zip(
+            netuids, *columns
+        ):
+            if initialized:
+                pools[netuid] = SwapPool.from_sqrt_price(
+                    netuid,
+                    sqrt_price_bits=fixed_to_bits(sqrt_price),
+                    liquidity=liquidity or 0,
+                    fee_rate=fee_rate or 0,
+                    exact=not user_liquidity,
+                )
+                continue
+            # the chain initializes the swap from the subnet's reserves on its first use
+            if dynamic_info is None:
+                dynamic_info = {
+                    di.netuid: di for di in await self.all_subnets(block_hash)
+                }
+            if (subnet := dynamic_info.get(netuid)) is not None:
+                pools[netuid] = SwapPool.from_reserves(
+                    netuid,
+                    tao_reserve=subnet.tao_in.rao,
+                    alpha_reserve=subnet.alpha_in.rao,
+                    fee_rate=fee_rate or 0,
+                    exact=not user_liquidity,
+                )
+        return SwapSimulator(pools, self, block_hash, verify=verify)
+
     async def get_coldkey_swap_announcements(
         self,
         block_hash: Optional[str] = None,
@@ -1793,7 +2769,7 @@ class SubtensorInterface:
         Returns:
             A list of ColdkeySwapAnnouncementInfo for all pending announcements.
         """
-        result = await self.substrate.query_map(
+        result = await self.query_map(
             module="SubtensorModule",
             storage_function="ColdkeySwapAnnouncements",
             block_hash=block_hash,
@@ -1846,7 +2822,7 @@ class SubtensorInterface:
         Returns:
             list[tuple[str, int]]: Tuples of `(coldkey_ss58, disputed_block)`.
         """
-        result = await self.substrate.query_map(
+        result = await self.query_map(
             module="SubtensorModule",
             storage_function="ColdkeySwapDisputes",
             block_hash=block_hash,
@@ -1899,19 +2875,22 @@ class SubtensorInterface:
 
         This function fetches information about all crowdloans
         """
-        crowdloans_data = await self.substrate.query_map(
-            module="Crowdloan",
-            storage_function="Crowdloans",
-            block_hash=block_hash,
-            fully_exhaust=True,
-        )
-        crowdloans = {}
-        for fund_id, fund_info in crowdloans_data.records:
-            decoded_call = await self._decode_inline_call(
-                fund_info["call"],
+        block_hash = await self._block_hash_or_head(block_hash)
+        fund_infos = {
+            fund_id: dict(fund_info)
+            async for fund_id, fund_info in self.stream_query_map(
+                module="Crowdloan",
+                storage_function="Crowdloans",
                 block_hash=block_hash,
             )
-            info_dict = dict(fund_info)
+        }
+        decoded_calls = await self._decode_inline_calls(
+            [info["call"] for info in fund_infos.values()], block_hash=block_hash
+        )
+        crowdloans = {}
+        for (fund_id, info_dict), decoded_call in zip(
+            fund_infos.items(), decoded_calls
+        ):
             info_dict["call_details"] = decoded_call
             crowdloans[fund_id] = CrowdloanData.from_any(info_dict)
 
@@ -1984,12 +2963,14 @@ class SubtensorInterface:
         self,
         crowdloan_id: int,
         block_hash: Optional[str] = None,
+        status=None,
     ) -> dict[str, Balance]:
         """Retrieves all contributors and their contributions for a specific crowdloan.
 
         Args:
             crowdloan_id (int): The ID of the crowdloan.
             block_hash (Optional[str]): The blockchain block hash at which to perform the query.
+            status: Optional rich.Status object, updated with the progress of the read.
 
         Returns:
             dict[str, Balance]: A dictionary mapping contributor SS58 addresses to their
@@ -1998,16 +2979,14 @@ class SubtensorInterface:
         This function queries the Contributions storage map with the crowdloan_id as the first key
         to retrieve all contributors and their contribution amounts.
         """
-        contributors_data = await self.substrate.query_map(
+        contributor_contributions = {}
+        async for contributor_address, contribution_amount in self.stream_query_map(
             module="Crowdloan",
             storage_function="Contributions",
             params=[crowdloan_id],
             block_hash=block_hash,
-            fully_exhaust=True,
-        )
-
-        contributor_contributions = {}
-        for contributor_address, contribution_amount in contributors_data.records:
+            status=status,
+        ):
             try:
                 contribution_balance = Balance.from_rao(contribution_amount)
                 contributor_contributions[contributor_address] = contribution_balance
@@ -2079,7 +3058,7 @@ class SubtensorInterface:
         swap_cost = await self.substrate.get_constant(
             module_name="SubtensorModule",
             constant_name="KeySwapCost",
-            block_hash=block_hash,
+            block_hash=self._pinned_block_hash(block_hash),
         )
         if swap_cost is None:
             return None
@@ -2129,32 +3108,30 @@ class SubtensorInterface:
     async def get_all_coldkeys_claim_type(
         self,
         block_hash: Optional[str] = None,
+        status=None,
     ) -> dict[str, dict[str, str | list[int]]]:
         """
         Retrieves all root claim types for all coldkeys in the network.
 
         Args:
             block_hash: The hash of the blockchain block number for the query.
+            status: Optional rich.Status object, updated with the progress of the read.
 
         Returns:
             dict[str, dict]: Mapping of coldkey SS58 addresses to claim type dicts
         """
-        result = await self.substrate.query_map(
-            module="SubtensorModule",
-            storage_function="RootClaimType",
-            params=[],
-            block_hash=block_hash,
-            fully_exhaust=True,
-            page_size=1_000,
-        )
-
         root_claim_types = {}
         coldkey_ss58: str
         claim_type_key: str
         claim_type_dict: dict
         claim_type_data: str | dict
 
-        for coldkey_ss58, claim_type_data in result.records:
+        async for coldkey_ss58, claim_type_data in self.stream_query_map(
+            module="SubtensorModule",
+            storage_function="RootClaimType",
+            block_hash=block_hash,
+            status=status,
+        ):
             if isinstance(claim_type_data, str):
                 claim_type_key = claim_type_data
                 claim_type_dict = {}
@@ -2237,7 +3214,7 @@ class SubtensorInterface:
         Returns:
             dict[int, Balance]: Dictionary mapping netuid to claimed stake.
         """
-        query = await self.substrate.query_map(
+        query = await self.query_map(
             module="SubtensorModule",
             storage_function="RootClaimed",
             params=[hotkey_ss58, coldkey_ss58],
@@ -2386,32 +3363,25 @@ class SubtensorInterface:
         if not unique_hotkeys:
             return {}
 
-        batch_claimable_calls = []
-        batch_claimed_calls = []
-
-        # Get the claimable rate
-        for hotkey in unique_hotkeys:
-            batch_claimable_calls.append(
-                await self.substrate.create_storage_key(
-                    "SubtensorModule", "RootClaimable", [hotkey], block_hash=block_hash
-                )
-            )
-
-        # Get already claimed
+        # Get the claimable rate, and the already claimed amounts
         claimed_pairs = target_pairs
-        for hotkey, netuid in claimed_pairs:
-            batch_claimed_calls.append(
-                await self.substrate.create_storage_key(
-                    "SubtensorModule",
-                    "RootClaimed",
-                    [netuid, hotkey, coldkey_ss58],
-                    block_hash=block_hash,
-                )
-            )
+        batch_claimable_calls, batch_claimed_calls = await self.create_storage_keys(
+            (
+                "SubtensorModule",
+                "RootClaimable",
+                [[hotkey] for hotkey in unique_hotkeys],
+            ),
+            (
+                "SubtensorModule",
+                "RootClaimed",
+                [[netuid, hotkey, coldkey_ss58] for hotkey, netuid in claimed_pairs],
+            ),
+            block_hash=block_hash,
+        )
 
         batch_claimable, batch_claimed = await asyncio.gather(
-            self.substrate.query_multi(batch_claimable_calls, block_hash=block_hash),
-            self.substrate.query_multi(batch_claimed_calls, block_hash=block_hash),
+            self.query_multi(batch_claimable_calls, block_hash=block_hash),
+            self.query_multi(batch_claimed_calls, block_hash=block_hash),
         )
 
         claimable_rates: dict[str, dict[int, float]] = {}
@@ -2483,16 +3453,30 @@ class SubtensorInterface:
 
         :return: A dictionary mapping netuid to the current Alpha price in TAO units.
         """
-        query = await self.substrate.query_map(
+
+        records = await self._cached_query(
+            "get_subnet_prices",
+            block_hash,
+            lambda block_hash_: self._subnet_price_records(block_hash_, page_size),
+        )
+        return self._prices_from_records(records)
+
+    async def _subnet_price_records(
+        self, block_hash: Optional[str], page_size: int
+    ) -> list[tuple[int, Any]]:
+        query = await self.query_map(
             module="Swap",
             storage_function="AlphaSqrtPrice",
             page_size=page_size,
             block_hash=block_hash,
             fully_exhaust=True,
         )
+        return query.records
 
+    @staticmethod
+    def _prices_from_records(records: list[tuple[int, Any]]) -> dict[int, Balance]:
         map_ = {}
-        for netuid_, current_sqrt_price in query.records:
+        for netuid_, current_sqrt_price in records:
             current_sqrt_price_ = fixed_to_float(current_sqrt_price)
             current_price = current_sqrt_price_**2
             map_[netuid_] = Balance.from_rao(int(current_price * 1e9))
@@ -2517,7 +3501,7 @@ class SubtensorInterface:
         Returns:
             Dict mapping netuid -> Balance(EMA TAO inflow).
         """
-        query = await self.substrate.query_map(
+        query = await self.query_map(
             module="SubtensorModule",
             storage_function="SubnetEmaTaoFlow",
             page_size=page_size,
@@ -2651,30 +3635,111 @@ class SubtensorInterface:
             return None, f"Failed to compose call: {str(e)}"
 
 
-async def best_connection(networks: list[str]):
+# storage key of System.Number, a small value present on every substrate chain
+SYSTEM_NUMBER_STORAGE_KEY = (
+    "0x26aa394eea5630e07c48ae0c9558cef702a5c1b19ab7a04f536c519aca4983ac"
+)
+# the RPC requests timed by `best_connection`, as {method: params}
+LATENCY_PROBES = {
+    "chain_getHead": [],
+    "state_getStorage": [SYSTEM_NUMBER_STORAGE_KEY],
+    "state_call": ["Core_version", "0x"],
+}
+
+
+def _latency_stats(samples: list[float]) -> dict[str, float]:
+    """
+    Summarises latency samples as their median, 95th percentile (nearest rank), and jitter (the mean absolute
+    difference between consecutive samples).
     """
-    Basic function to compare the latency of a given list of websocket endpoints
+    ordered = sorted(samples)
+    p95_rank = max(math.ceil(0.95 * len(ordered)) - 1, 0)
+    jitter = (
+        statistics.mean(abs(b - a) for a, b in zip(samples, samples[1:]))
+        if len(samples) > 1
+        else 0.0
+    )
+    return {
+        "p50": statistics.median(ordered),
+        "p95": ordered[p95_rank],
+        "jitter": jitter,
+    }
+
+
+async def _probe_endpoint(network: str, samples: int) -> dict[str, Any]:
+    """
+    Measures connection time, ping, and the latency and throughput of each of the `LATENCY_PROBES` for a single
+    websocket endpoint.
+    """
+    request_ids = itertools.count()
+
+    async def _send(websocket, method: str, params: list) -> int:
+        request_id = next(request_ids)
+        await websocket.send(
+            json.dumps(
+                {"jsonrpc": "2.0", "method": method, "params": params, "id": request_id}
+            )
+        )
+        return request_id
+
+    async def _receive(websocket, request_ids_: set[int]):
+        while request_ids_:
+            response = json.loads(await websocket.recv())
+            if "error" in response:
+                raise SubstrateRequestException(response["error"])
+            request_ids_.discard(response.get("id"))
+
+    start = time.monotonic()
+    async with websockets.connect(network, max_size=2**24) as websocket:
+        result: dict[str, Any] = {"connect": time.monotonic() - start}
+        pings = []
+        for _ in range(samples):
+            pong = await websocket.ping()
+            pings.append(await pong)
+        result["ping"] = _latency_stats(pings)
+        for method, params in LATENCY_PROBES.items():
+            latencies = []
+            for _ in range(samples):
+                request_start = time.monotonic()
+                await _receive(websocket, {await _send(websocket, method, params)})
+                latencies.append(time.monotonic() - request_start)
+            # pipeline the same number of requests to measure throughput
+            batch_start = time.monotonic()
+            sent = {await _send(websocket, method, params) for _ in range(samples)}
+            await _receive(websocket, sent)
+            result[method] = {
+                **_latency_stats(latencies),
+                "throughput": samples / (time.monotonic() - batch_start),
+            }
+    return result
+
+
+async def best_connection(
+    networks: list[str], samples: int = 5, timeout: float = 10.0
+) -> dict[str, dict[str, Any]]:
+    """
+    Compares the latency of a given list of websocket endpoints. All endpoints are probed concurrently, each within
+    its own deadline, so unreachable endpoints do not hold up the others.
+
     Args:
         networks: list of network URIs
+        samples: number of samples to take of each measurement
+        timeout: seconds after which probing an endpoint is abandoned
 
     Returns:
-        {network_name: [end_to_end_latency, single_request_latency, chain_head_request_latency]}
-
+        {network: {"connect": seconds, "ping": stats, <method>: stats with "throughput" in requests/second}}, where
+        stats are {"p50", "p95", "jitter"} in seconds, and <method> is each of `LATENCY_PROBES`. Endpoints which
+        could not be probed map to {"error": message}.
     """
-    results = {}
-    for network in networks:
+
+    async def _probe(network: str) -> dict[str, Any]:
         try:
-            t1 = time.monotonic()
-            async with websockets.connect(network) as websocket:
-                pong = await websocket.ping()
-                latency = await pong
-                pt1 = time.monotonic()
-                await websocket.send(
-                    "{'jsonrpc': '2.0', 'method': 'chain_getHead', 'params': [], 'id': '82'}"
-                )
-                await websocket.recv()
-                t2 = time.monotonic()
-            results[network] = [t2 - t1, latency, t2 - pt1]
+            return await asyncio.wait_for(_probe_endpoint(network, samples), timeout)
+        except asyncio.TimeoutError:
+            return {"error": f"Timed out after {timeout} seconds"}
         except Exception as e:
-            print_error(f"Error attempting network {network}: {e}")
-    return results
+            return {"error": str(e) or type(e).__name__}
+
+    networks = list(dict.fromkeys(networks))
+    results = await asyncio.gather(*[_probe(network) for network in networks])
+    return dict(zip(networks, results))
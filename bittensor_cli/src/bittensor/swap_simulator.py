@@ -0,0 +1,245 @@
+"""
+Local simulation of the chain's swap runtime API (`SwapRuntimeApi.sim_swap_tao_for_alpha` and
+`sim_swap_alpha_for_tao`), so that previews covering many subnets can be priced without one or two runtime API calls
+per row.
+
+Each subnet's pool is seeded once, from the Swap pallet's state at a block (see
+`SubtensorInterface.get_swap_simulator`): the current sqrt price (`AlphaSqrtPrice`), the active liquidity
+(`CurrentLiquidity`) and the fee rate (`FeeRate`). Within the active tick range, a swap against liquidity L moves along
+the constant product of the virtual reserves L * sqrt(P) TAO and L / sqrt(P) alpha, which is what is simulated here, in
+integer rao. Protocol liquidity spans the whole price range, so this holds for any amount unless user liquidity is
+enabled on the subnet; swaps on those subnets are passed on to the runtime API.
+
+Setting `BTCLI_VERIFY_SWAP_SIMULATION=1` prices every swap with both the simulation and the runtime API, reporting any
+mismatch and using the runtime API's result.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+from bittensor_cli.src.bittensor.balances import U64F64_FRACTIONAL_BITS, Balance
+from bittensor_cli.src.bittensor.chain_data import SimSwapResult
+from bittensor_cli.src.bittensor.utils import err_console, print_console
+
+if TYPE_CHECKING:
+    from bittensor_cli.src.bittensor.subtensor_interface import SubtensorInterface
+
+# FeeRate is stored as a fraction of u16::MAX
+FEE_RATE_DENOMINATOR = 65_535
+# Environment variable enabling the cross-check of every simulated swap against the runtime API
+VERIFY_SWAP_SIMULATION_ENV = "BTCLI_VERIFY_SWAP_SIMULATION"
+
+
+def fee_amount(amount: int, fee_rate: int) -> int:
+    """
+    The fee charged on a swap of `amount` rao, rounded as the Swap pallet does: the rate is taken as the U64F64
+    `FeeRate / u16::MAX`, and the fee is the product truncated to rao. This can be 1 rao less than
+    `amount * fee_rate // u16::MAX`.
+    """
+    fee_rate_bits = (fee_rate << U64F64_FRACTIONAL_BITS) // FEE_RATE_DENOMINATOR
+    return (amount * fee_rate_bits) >> U64F64_FRACTIONAL_BITS
+
+
+@dataclass(frozen=True)
+class SwapPool:
+    """
+    A subnet's pool, as (virtual) reserves in rao.
+    """
+
+    netuid: int
+    tao_reserve: int
+    alpha_reserve: int
+    fee_rate: int
+    # False if user liquidity is enabled, in which case a swap may cross into ticks with different liquidity
+    exact: bool = True
+
+    @classmethod
+    def from_sqrt_price(
+        cls,
+        netuid: int,
+        sqrt_price_bits: int,
+        liquidity: int,
+        fee_rate: int,
+        exact: bool = True,
+    ) -> "SwapPool":
+        """
+        :param netuid: the subnet's netuid
+        :param sqrt_price_bits: `AlphaSqrtPrice`, as U64F64 bits
+        :param liquidity: `CurrentLiquidity`
+        :param fee_rate: `FeeRate`
+        :param exact: whether the pool only has protocol liquidity
+        """
+        if sqrt_price_bits == 0:
+            return cls(netuid, 0, 0, fee_rate, exact)
+        return cls(
+            netuid,
+            tao_reserve=(liquidity * sqrt_price_bits) >> U64F64_FRACTIONAL_BITS,
+            alpha_reserve=(liquidity << U64F64_FRACTIONAL_BITS) // sqrt_price_bits,
+            fee_rate=fee_rate,
+            exact=exact,
+        )
+
+    @classmethod
+    def from_reserves(
+        cls,
+        netuid: int,
+        tao_reserve: int,
+        alpha_reserve: int,
+        fee_rate: int,
+        exact: bool = True,
+    ) -> "SwapPool":
+        """
+        Seeds the pool of a subnet whose swap has not been initialized yet, as the Swap pallet does on its first use:
+        at the square root of the reserves' price, with liquidity sqrt(tao_reserve * alpha_reserve).
+
+        :param netuid: the subnet's netuid
+        :param tao_reserve: the subnet's `tao_in`, in rao
+        :param alpha_reserve: the subnet's `alpha_in`, in rao
+        :param fee_rate: `FeeRate`
+        :param exact: whether the pool only has protocol liquidity
+        """
+        if alpha_reserve == 0:
+            return cls(netuid, 0, 0, fee_rate, exact)
+        return cls.from_sqrt_price(
+            netuid,
+            sqrt_price_bits=math.isqrt(
+                (tao_reserve << (2 * U64F64_FRACTIONAL_BITS)) // alpha_reserve
+            ),
+            liquidity=math.isqrt(tao_reserve * alpha_reserve),
+            fee_rate=fee_rate,
+            exact=exact,
+        )
+
+    @property
+    def price(self) -> Balance:
+        """
+        The price of alpha in TAO.
+        """
+        if self.alpha_reserve == 0:
+            return Balance.from_rao(0)
+        return Balance.from_rao(self.tao_reserve * 1_000_000_000 // self.alpha_reserve)
+
+    def swap(self, amount: int, to_alpha: bool) -> tuple[int, int]:
+        """
+        Swaps `amount` rao of TAO for alpha (if `to_alpha`), or of alpha for TAO. The fee (see `fee_amount`) is taken
+        from the input amount, and the rest is swapped, rounding in the pool's favour.
+
+        :return: (received, fee), in rao of the output and input token respectively
+        """
+        fee = fee_amount(amount, self.fee_rate)
+        if to_alpha:
+            reserve_in, reserve_out = self.tao_reserve, self.alpha_reserve
+        else:
+            reserve_in, reserve_out = self.alpha_reserve, self.tao_reserve
+        new_reserve_in = reserve_in + amount - fee
+        if new_reserve_in == 0:
+            return 0, fee
+        # ceiling division, so the output reserve is never left below the constant product
+        new_reserve_out = -(-reserve_in * reserve_out // new_reserve_in)
+        return max(reserve_out - new_reserve_out, 0), fee
+
+
+class SwapSimulator:
+    """
+    Reproduces `SubtensorInterface.sim_swap` for the subnets seeded in `pools`, without any network I/O. Root swaps
+    1:1 without fees, as on chain.
+    """
+
+    def __init__(
+        self,
+        pools: dict[int, SwapPool],
+        subtensor: Optional["SubtensorInterface"] = None,
+        block_hash: Optional[str] = None,
+        verify: bool = False,
+    ):
+        """
+        :param pools: the pool of each dynamic subnet
+        :param subtensor: used for the swaps which cannot be simulated locally, and for verification
+        :param block_hash: the block hash the pools were read at
+        :param verify: whether to also price every swap with the runtime API, reporting any mismatch and returning the
+            runtime API's result
+        """
+        self.pools = pools
+        self.subtensor = subtensor
+        self.block_hash = block_hash
+        self.verify = verify
+
+    def _pool(self, netuid: int) -> Optional[SwapPool]:
+        return None if netuid == 0 else self.pools[netuid]
+
+    def is_exact(self, netuid: int) -> bool:
+        """
+        Whether swaps on the subnet can be simulated exactly.
+        """
+        return netuid == 0 or (netuid in self.pools and self.pools[netuid].exact)
+
+    def _tao_for_alpha(self, netuid: int, tao: int) -> SimSwapResult:
+        pool = self._pool(netuid)
+        alpha, fee = pool.swap(tao, to_alpha=True) if pool else (tao, 0)
+        return SimSwapResult.from_dict(
+            {"tao_amount": tao, "alpha_amount": alpha, "tao_fee": fee, "alpha_fee": 0},
+            netuid,
+        )
+
+    def _alpha_for_tao(self, netuid: int, alpha: int) -> SimSwapResult:
+        pool = self._pool(netuid)
+        tao, fee = pool.swap(alpha, to_alpha=False) if pool else (alpha, 0)
+        return SimSwapResult.from_dict(
+            {"tao_amount": tao, "alpha_amount": alpha, "tao_fee": 0, "alpha_fee": fee},
+            netuid,
+        )
+
+    def simulate(
+        self, origin_netuid: int, destination_netuid: int, amount: int
+    ) -> SimSwapResult:
+        """
+        Simulates a swap locally, with the same arguments and result as `SubtensorInterface.sim_swap`.
+
+        :raises KeyError: if a dynamic subnet of the swap was not seeded
+        """
+        if origin_netuid > 0 and destination_netuid > 0:
+            # for cross-subnet moves where neither origin nor destination is root
+            intermediate_result = self._alpha_for_tao(origin_netuid, amount)
+            result = self._tao_for_alpha(
+                destination_netuid, intermediate_result.tao_amount.rao
+            )
+            sn_price = self._pool(origin_netuid).price
+            secondary_fee = (result.tao_fee / sn_price.tao).set_unit(origin_netuid)
+            result.alpha_fee = result.alpha_fee + secondary_fee
+            return result
+        elif origin_netuid > 0:
+            # dynamic to tao
+            return self._alpha_for_tao(origin_netuid, amount)
+        else:
+            # tao to dynamic or unstaked to staked tao (SN0)
+            return self._tao_for_alpha(destination_netuid, amount)
+
+    async def sim_swap(
+        self, origin_netuid: int, destination_netuid: int, amount: int
+    ) -> SimSwapResult:
+        """
+        Simulates a swap locally where possible, else falls back to the runtime API, at the block the pools were read
+        at. In verification mode, swaps which can be simulated are also priced by the runtime API, and compared.
+        """
+        if self.subtensor is None:
+            return self.simulate(origin_netuid, destination_netuid, amount)
+        if not (self.is_exact(origin_netuid) and self.is_exact(destination_netuid)):
+            return await self.subtensor.sim_swap(
+                origin_netuid, destination_netuid, amount, block_hash=self.block_hash
+            )
+        if not self.verify:
+            return self.simulate(origin_netuid, destination_netuid, amount)
+        runtime_result = await self.subtensor.sim_swap(
+            origin_netuid, destination_netuid, amount, block_hash=self.block_hash
+        )
+        local_result = self.simulate(origin_netuid, destination_netuid, amount)
+        if local_result != runtime_result:
+            print_console(
+                f"Simulated swap of {amount} rao from netuid {origin_netuid} to netuid {destination_netuid} "
+                f"differs from SwapRuntimeApi at {self.block_hash}: simulated {local_result}, runtime {runtime_result}",
+                "yellow",
+                err_console,
+                "Warning",
+            )
+        return runtime_result
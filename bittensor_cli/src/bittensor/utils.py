@@ -1,6 +1,8 @@
 import ast
+import asyncio
 import json
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 import math
 import os
 import sqlite3
@@ -9,19 +11,29 @@ import webbrowser
 from contextlib import contextmanager
 from decimal import Decimal
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Optional, Union, Callable, Generator
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Optional,
+    TypeVar,
+    Union,
+    Callable,
+    Generator,
+    Iterable,
+)
 from urllib.parse import urlparse
-from functools import partial
+from functools import cache, partial
 import re
 
-import aiohttp
-from async_substrate_interface import AsyncExtrinsicReceipt
 from bittensor_wallet import Wallet, Keypair
 from bittensor_wallet.utils import SS58_FORMAT
 from bittensor_wallet.errors import KeyFileError, PasswordError
+from bittensor_wallet.keyfile import (
+    deserialize_keypair_from_keyfile_data,
+    keyfile_data_is_encrypted,
+)
 from bittensor_wallet import utils
-from jinja2 import Template, Environment, PackageLoader, select_autoescape
-from markupsafe import Markup
 from rich.console import Console
 from rich.prompt import Confirm, Prompt
 from rich.table import Table
@@ -34,12 +46,15 @@ from bittensor_cli.src import defaults, Constants
 from scalecodec.utils.math import fixed_to_float
 
 if TYPE_CHECKING:
+    from async_substrate_interface import AsyncExtrinsicReceipt
     from bittensor_cli.src.bittensor.chain_data import SubnetHyperparameters
     from rich.prompt import PromptBase
 
 BT_DOCS_LINK = "https://docs.learnbittensor.org"
 
 GLOBAL_MAX_SUBNET_COUNT = 4096
+# The number of requests `gather_bounded` makes at once by default, so as not to flood the websocket
+MAX_CONCURRENT_REQUESTS = 16
 MEV_SHIELD_PUBLIC_KEY_SIZE = 1184
 
 # Detect if we're in a test environment (pytest captures stdout, making it non-TTY)
@@ -168,10 +183,19 @@ def get_coldkey_identity_name(
     return identity_data.get("name") or identity_data.get("display") or None
 
 
-jinja_env = Environment(
-    loader=PackageLoader("bittensor_cli", "src/bittensor/templates"),
-    autoescape=select_autoescape(),
-)
+@cache
+def get_jinja_env():
+    """
+    Returns the jinja environment for the HTML templates. Created on first use, as jinja is only needed by the
+    commands which render HTML.
+    """
+    from jinja2 import Environment, PackageLoader, select_autoescape
+
+    return Environment(
+        loader=PackageLoader("bittensor_cli", "src/bittensor/templates"),
+        autoescape=select_autoescape(),
+    )
+
 
 UnlockStatus = namedtuple("UnlockStatus", ["success", "message"])
 
@@ -369,12 +393,277 @@ def u16_to_float(value: int) -> float:
     return value / u16_max
 
 
+# The maximum number of threads reading hotkey files at once, when scanning a wallets directory
+HOTKEY_SCAN_WORKERS = 16
+
+# The mtimes of a key file and of its public file, when it was read
+KeyStamp = tuple[Optional[int], Optional[int]]
+
+# The keys read so far, by the path of the hotkey file for hotkeys, and of the coldkeypub file for coldkeys: the mtimes
+# of the files when they were read, and (whether the key is encrypted, its ss58 address), or None if they are not key
+# files. It is persisted in the `WalletAddressIndex` table of the database.
+_key_index: dict[str, tuple[KeyStamp, Optional[tuple[bool, Optional[str]]]]] = {}
+# the key paths read since the index was last persisted, and whether each is a hotkey
+_key_index_updated: dict[str, bool] = {}
+# the key paths of deleted keys, not yet removed from the persisted index
+_key_index_removed: set[str] = set()
+# the wallets paths whose persisted entries have been loaded into the index
+_key_index_loaded: set[str] = set()
+
+
+def _wallets_root(path: str) -> str:
+    return os.path.abspath(os.path.expanduser(path))
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _key_stamp(key_path: Path, hotkey: bool) -> KeyStamp:
+    if hotkey:
+        return _mtime_ns(key_path), _mtime_ns(
+            key_path.with_name(f"{key_path.name}pub.txt")
+        )
+    return _mtime_ns(key_path), None
+
+
+def _load_key_index(wallets_paths: Iterable[str]) -> None:
+    """
+    Loads the persisted index entries of the keys in the wallets paths, once per process.
+    """
+    to_load = {_wallets_root(p) for p in wallets_paths} - _key_index_loaded
+    if not to_load:
+        return
+    _key_index_loaded.update(to_load)
+    try:
+        with WalletAddressIndex.get_db() as (conn, cursor):
+            for wallets_path in to_load:
+                for key_path, stamp, entry in WalletAddressIndex.read_entries(
+                    conn, cursor, wallets_path=wallets_path
+                ):
+                    _key_index.setdefault(key_path, (stamp, entry))
+    except sqlite3.Error:
+        pass  # the index only saves reading the key files
+
+
+def _save_key_index() -> None:
+    """
+    Persists the index entries which have been read or removed since it was last persisted.
+    """
+    if not (_key_index_updated or _key_index_removed):
+        return
+    entries = [
+        (key_path, hotkey, *_key_index[key_path])
+        for key_path, hotkey in _key_index_updated.items()
+        if key_path in _key_index
+    ]
+    removed = list(_key_index_removed)
+    _key_index_updated.clear()
+    _key_index_removed.clear()
+    try:
+        with WalletAddressIndex.get_db() as (conn, cursor):
+            WalletAddressIndex.add_entries(conn, cursor, entries=entries)
+            WalletAddressIndex.delete_entries(conn, cursor, key_paths=removed)
+    except sqlite3.Error:
+        pass
+
+
+def _indexed_key(
+    key_path: Path,
+    stamp: KeyStamp,
+    hotkey: bool,
+    read: Callable[[], tuple[bool, Optional[str]]],
+) -> tuple[bool, Optional[str]]:
+    """
+    Gets a key's entry from the index, reading the key files with `read` if it is missing or they have been modified
+    since.
+
+    :raises KeyFileError: if the files are not key files (which is also cached)
+    """
+    key = str(key_path)
+    if (cached := _key_index.get(key)) is None or cached[0] != stamp:
+        try:
+            entry = read()
+        except (KeyFileError, ValueError, UnicodeDecodeError):
+            entry = None
+        _key_index[key] = cached = (stamp, entry)
+        _key_index_updated[key] = hotkey
+    if cached[1] is None:
+        raise KeyFileError(f"{key_path} is not a key file")
+    return cached[1]
+
+
+def _read_hotkey(hotkey_path: Path) -> Optional[tuple[bool, Optional[str]]]:
+    """
+    Reads whether a hotkey is encrypted, and its ss58 address, taking the address from the public `<hotkey>pub.txt`
+    file where possible. The result is cached until either file is modified.
+
+    :param hotkey_path: the absolute path of the hotkey file, whether or not it exists
+
+    :return: (whether the hotkey is encrypted, its ss58 address), or None if neither the hotkey nor its hotkeypub file
+             exists. The address is None if the hotkey is encrypted and has no readable hotkeypub file.
+    :raises KeyFileError: if the files are not key files
+    """
+    stamp = _key_stamp(hotkey_path, hotkey=True)
+    if stamp == (None, None):
+        return None
+    return _indexed_key(
+        hotkey_path,
+        stamp,
+        hotkey=True,
+        read=partial(
+            _read_hotkey_files,
+            hotkey_path,
+            hotkey_path.with_name(f"{hotkey_path.name}pub.txt"),
+        ),
+    )
+
+
+def _read_hotkey_files(hotkey_path: Path, pub_path: Path) -> tuple[bool, Optional[str]]:
+    encrypted = False
+    ss58 = None
+    hotkey_data = None
+    if hotkey_path.exists():
+        hotkey_data = hotkey_path.read_bytes()
+        encrypted = keyfile_data_is_encrypted(hotkey_data)
+    if pub_path.exists():
+        try:
+            ss58 = deserialize_keypair_from_keyfile_data(
+                pub_path.read_bytes()
+            ).ss58_address
+        except KeyFileError:
+            pass  # as in `get_hotkey_pub_ss58`, fall back to the hotkey itself
+    if ss58 is None and not encrypted:
+        if hotkey_data is None:
+            raise KeyFileError(f"Unable to read the hotkeypub file {pub_path}")
+        ss58 = deserialize_keypair_from_keyfile_data(hotkey_data).ss58_address
+    return encrypted, ss58
+
+
+def _read_coldkeypub(coldkeypub_path: Path) -> str:
+    """
+    Reads the ss58 address of a coldkeypub file. The result is cached until the file is modified.
+
+    :param coldkeypub_path: the absolute path of the coldkeypub file
+
+    :raises KeyFileError: if the file does not exist, or is not a key file
+    """
+    stamp = _key_stamp(coldkeypub_path, hotkey=False)
+    if stamp[0] is None:
+        raise KeyFileError(f"{coldkeypub_path} does not exist")
+    _, ss58 = _indexed_key(
+        coldkeypub_path,
+        stamp,
+        hotkey=False,
+        read=lambda: (
+            False,
+            deserialize_keypair_from_keyfile_data(
+                coldkeypub_path.read_bytes()
+            ).ss58_address,
+        ),
+    )
+    return ss58
+
+
+def _scan_hotkeys(
+    wallets: list[Wallet],
+) -> list[list[tuple[str, Optional[tuple[bool, Optional[str]]]]]]:
+    """
+    Reads the hotkeys of several wallets, with a pool of threads shared by all of them.
+
+    :return: for each wallet, the (hotkey name, result of `_read_hotkey`) of each of its hotkeys, in directory order.
+             Files which are not key files (e.g. .DS_Store) are left out. A hotkey with only a hotkeypub file is named
+             without the `pub.txt` suffix.
+    """
+    _load_key_index(wallet.path for wallet in wallets)
+    hotkey_names = []
+    for wallet in wallets:
+        hotkeys_path = Path(_wallets_root(wallet.path)) / wallet.name / "hotkeys"
+        try:
+            entries = [entry.name for entry in hotkeys_path.iterdir()]
+        except (FileNotFoundError, NotADirectoryError):
+            entries = []
+        existing = set(entries)
+        names = []
+        for h_name in entries:
+            if h_name.endswith("pub.txt"):
+                # a hotkeypub file is read along with its hotkey, if there is one
+                if h_name.split("pub.txt")[0] in existing:
+                    continue
+                h_name = h_name.split("pub.txt")[0]
+            names.append(h_name)
+        hotkey_names.append((hotkeys_path, names))
+
+    def _read(hotkey_path: Path):
+        try:
+            return True, _read_hotkey(hotkey_path)
+        except (OSError, KeyFileError):
+            return False, None
+
+    paths = [
+        hotkeys_path / h_name
+        for hotkeys_path, names in hotkey_names
+        for h_name in names
+    ]
+    results = []
+    if paths:
+        with ThreadPoolExecutor(min(HOTKEY_SCAN_WORKERS, len(paths))) as executor:
+            results = list(executor.map(_read, paths))
+
+    # forget the hotkeys which have been deleted from the scanned directories
+    scanned_dirs = {str(hotkeys_path) for hotkeys_path, _ in hotkey_names}
+    scanned = {str(p) for p in paths}
+    for key_path in [
+        k for k in _key_index if os.path.dirname(k) in scanned_dirs and k not in scanned
+    ]:
+        del _key_index[key_path]
+        _key_index_removed.add(key_path)
+    _save_key_index()
+
+    results_ = iter(results)
+    return [
+        [
+            (h_name, entry)
+            for h_name, (readable, entry) in zip(names, results_)
+            if readable
+        ]
+        for _, names in hotkey_names
+    ]
+
+
+def _hotkey_wallets(
+    wallet: Wallet,
+    hotkeys: list[tuple[str, Optional[tuple[bool, Optional[str]]]]],
+    show_nulls: bool = False,
+    show_encrypted: bool = False,
+) -> list[Optional[Wallet]]:
+    wallet_path = Path(wallet.path).expanduser()
+    hotkey_wallets = []
+    for h_name, entry in hotkeys:
+        encrypted = entry is not None and entry[0]
+        if entry is not None and not encrypted:
+            hotkey_wallets.append(
+                Wallet(path=str(wallet_path), name=wallet.name, hotkey=h_name)
+            )
+        elif show_encrypted and encrypted:
+            hotkey_wallets.append(WalletLike(str(wallet_path), "<ENCRYPTED>", h_name))
+        elif show_nulls:
+            hotkey_wallets.append(None)
+    return hotkey_wallets
+
+
 def get_hotkey_wallets_for_wallet(
     wallet: Wallet, show_nulls: bool = False, show_encrypted: bool = False
 ) -> list[Optional[Wallet]]:
     """
     Returns wallet objects with hotkeys for a single given wallet
 
+    The hotkey files are read concurrently, and each hotkey's address is kept in an index, so that subsequent scans
+    and `get_hotkey_pub_ss58` calls only re-read the files which have been modified.
+
     :param wallet: Wallet object to use for the path
     :param show_nulls: will add `None` into the output if a hotkey is encrypted or not on the device
     :param show_encrypted: will add some basic info about the encrypted hotkey
@@ -382,57 +671,9 @@ def get_hotkey_wallets_for_wallet(
     :return: a list of wallets (with Nones included for cases of a hotkey being encrypted or not on the device, if
              `show_nulls` is set to `True`)
     """
-    hotkey_wallets = []
-    wallet_path = Path(wallet.path).expanduser()
-    hotkeys_path = wallet_path / wallet.name / "hotkeys"
-    try:
-        hotkeys = [entry.name for entry in hotkeys_path.iterdir()]
-    except (FileNotFoundError, NotADirectoryError):
-        hotkeys = []
-    for h_name in hotkeys:
-        if h_name.endswith("pub.txt"):
-            if h_name.split("pub.txt")[0] in hotkeys:
-                continue
-            else:
-                hotkey_for_name = Wallet(
-                    path=str(wallet_path),
-                    name=wallet.name,
-                    hotkey=h_name.split("pub.txt")[0],
-                )
-        else:
-            hotkey_for_name = Wallet(
-                path=str(wallet_path), name=wallet.name, hotkey=h_name
-            )
-        try:
-            exists = (
-                hotkey_for_name.hotkey_file.exists_on_device()
-                or hotkey_for_name.hotkeypub_file.exists_on_device()
-            )
-            if (
-                exists
-                and not hotkey_for_name.hotkey_file.is_encrypted()
-                # and hotkey_for_name.coldkeypub.ss58_address
-                and get_hotkey_pub_ss58(hotkey_for_name)
-            ):
-                hotkey_wallets.append(hotkey_for_name)
-            elif (
-                show_encrypted and exists and hotkey_for_name.hotkey_file.is_encrypted()
-            ):
-                hotkey_wallets.append(
-                    WalletLike(str(wallet_path), "<ENCRYPTED>", h_name)
-                )
-            elif show_nulls:
-                hotkey_wallets.append(None)
-        except (
-            UnicodeDecodeError,
-            AttributeError,
-            TypeError,
-            KeyFileError,
-            ValueError,
-        ):  # usually an unrelated file like .DS_Store
-            continue
-
-    return hotkey_wallets
+    return _hotkey_wallets(
+        wallet, _scan_hotkeys([wallet])[0], show_nulls, show_encrypted
+    )
 
 
 def get_coldkey_wallets_for_path(path: str) -> list[Wallet]:
@@ -452,16 +693,19 @@ def get_coldkey_wallets_for_path(path: str) -> list[Wallet]:
 def get_all_wallets_for_path(path: str) -> list[Wallet]:
     """Gets all wallets from a given path."""
     all_wallets = []
-    cold_wallets = get_coldkey_wallets_for_path(path)
-    for cold_wallet in cold_wallets:
+    cold_wallets = []
+    for cold_wallet in get_coldkey_wallets_for_path(path):
         try:
             if (
                 cold_wallet.coldkeypub_file.exists_on_device()
                 and not cold_wallet.coldkeypub_file.is_encrypted()
             ):
-                all_wallets.extend(get_hotkey_wallets_for_wallet(cold_wallet))
+                cold_wallets.append(cold_wallet)
         except UnicodeDecodeError:  # usually an incorrect file like .DS_Store
             continue
+    # the hotkeys of all the wallets are read together
+    for cold_wallet, hotkeys in zip(cold_wallets, _scan_hotkeys(cold_wallets)):
+        all_wallets.extend(_hotkey_wallets(cold_wallet, hotkeys))
     return all_wallets
 
 
@@ -895,9 +1139,14 @@ class TableDefinition:
     @contextmanager
     def get_db() -> Generator[tuple[sqlite3.Connection, sqlite3.Cursor], None, None]:
         """
-        Helper function to get a DB connection
+        Helper function to get a DB connection. The address book tables are created on the first connection made to
+        each database by this process.
         """
-        with DB() as (conn, cursor):
+        db = DB()
+        with db as (conn, cursor):
+            if db.db_path not in _address_book_dbs:
+                _create_address_book_tables(conn, cursor)
+                _address_book_dbs.add(db.db_path)
             yield conn, cursor
 
     @classmethod
@@ -1316,6 +1565,9 @@ def render_table(table_name: str, table_info: str, columns: list[dict], show=Tru
     :param show: whether to open a browser window with the rendered table HTML
     :return: None
     """
+    from jinja2 import Template
+    from markupsafe import Markup
+
     db_cols, rows = read_table(table_name)
     template_dir = os.path.join(os.path.dirname(__file__), "templates")
     with open(os.path.join(template_dir, "table.j2"), "r") as f:
@@ -1367,6 +1619,9 @@ def render_tree(
     :param show: whether to open a browser window with the rendered table HTML
     :return: None
     """
+    from jinja2 import Template
+    from markupsafe import Markup
+
     db_cols, rows = read_table(table_name, "ORDER BY CHILD ASC")
     template_dir = os.path.join(os.path.dirname(__file__), "templates")
     result = []
@@ -1403,15 +1658,158 @@ def render_tree(
         webbrowser.open(f"file://{output_file}")
 
 
+class WalletAddressIndex(TableDefinition):
+    """
+    Index of the ss58 addresses of the coldkeys and hotkeys of the wallets on this device, so that they can be looked
+    up in either direction without reading the key files. Each entry records the mtimes of the files it was read from,
+    and is only used while they are unchanged.
+    """
+
+    name = "wallet_address_index"
+    cols = (
+        # the hotkey file for hotkeys, and the coldkeypub file for coldkeys
+        ("key_path", "TEXT PRIMARY KEY"),
+        ("wallets_path", "TEXT"),
+        ("wallet", "TEXT"),
+        # NULL for coldkeys
+        ("hotkey", "TEXT"),
+        # NULL if the key is encrypted without a public file, or the files are not key files
+        ("ss58_address", "TEXT"),
+        # NULL if the files are not key files
+        ("encrypted", "INTEGER"),
+        ("key_mtime", "INTEGER"),
+        ("pub_mtime", "INTEGER"),
+    )
+
+    @classmethod
+    def create_if_not_exists(cls, conn: sqlite3.Connection, _: sqlite3.Cursor) -> None:
+        super().create_if_not_exists(conn, _)
+        conn.execute(
+            f"CREATE INDEX IF NOT EXISTS {cls.name}_ss58 ON {cls.name} (wallets_path, ss58_address)"
+        )
+        conn.commit()
+
+    @classmethod
+    def read_entries(
+        cls, _: sqlite3.Connection, cursor: sqlite3.Cursor, *, wallets_path: str
+    ) -> list[tuple[str, KeyStamp, Optional[tuple[bool, Optional[str]]]]]:
+        """
+        Reads the entries of the keys in a wallets path.
+
+        :return: (key path, key file mtimes, (whether the key is encrypted, ss58 address) or None) of each key
+        """
+        cursor.execute(
+            f"SELECT key_path, ss58_address, encrypted, key_mtime, pub_mtime FROM {cls.name} "
+            "WHERE wallets_path = ?",
+            (wallets_path,),
+        )
+        return [
+            (
+                key_path,
+                (key_mtime, pub_mtime),
+                None if encrypted is None else (bool(encrypted), ss58_address),
+            )
+            for key_path, ss58_address, encrypted, key_mtime, pub_mtime in cursor.fetchall()
+        ]
+
+    @classmethod
+    def find_address(
+        cls,
+        _: sqlite3.Connection,
+        cursor: sqlite3.Cursor,
+        *,
+        wallets_path: str,
+        ss58_address: str,
+    ) -> list[tuple[str, str, Optional[str], KeyStamp]]:
+        """
+        Finds the keys in a wallets path with the given ss58 address.
+
+        :return: (key path, wallet name, hotkey name or None, key file mtimes) of each key
+        """
+        cursor.execute(
+            f"SELECT key_path, wallet, hotkey, key_mtime, pub_mtime FROM {cls.name} "
+            "WHERE wallets_path = ? AND ss58_address = ?",
+            (wallets_path, ss58_address),
+        )
+        return [
+            (key_path, wallet, hotkey, (key_mtime, pub_mtime))
+            for key_path, wallet, hotkey, key_mtime, pub_mtime in cursor.fetchall()
+        ]
+
+    @classmethod
+    def add_entries(
+        cls,
+        conn: sqlite3.Connection,
+        _: sqlite3.Cursor,
+        *,
+        entries: list[tuple[str, bool, KeyStamp, Optional[tuple[bool, Optional[str]]]]],
+    ) -> None:
+        """
+        Adds or replaces the entries of keys.
+
+        :param entries: (key path, whether it is a hotkey, key file mtimes, (whether the key is encrypted, ss58
+                        address) or None) of each key
+        """
+        rows = []
+        for key_path, hotkey, (key_mtime, pub_mtime), entry in entries:
+            path = Path(key_path)
+            # <wallets path>/<wallet>/hotkeys/<hotkey>, or <wallets path>/<wallet>/coldkeypub.txt
+            wallet_path = path.parent.parent if hotkey else path.parent
+            encrypted, ss58_address = entry if entry is not None else (None, None)
+            rows.append(
+                (
+                    key_path,
+                    str(wallet_path.parent),
+                    wallet_path.name,
+                    path.name if hotkey else None,
+                    ss58_address,
+                    encrypted,
+                    key_mtime,
+                    pub_mtime,
+                )
+            )
+        conn.executemany(
+            f"INSERT OR REPLACE INTO {cls.name} (key_path, wallets_path, wallet, hotkey, ss58_address, encrypted, "
+            "key_mtime, pub_mtime) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        conn.commit()
+
+    @classmethod
+    def delete_entries(
+        cls, conn: sqlite3.Connection, _: sqlite3.Cursor, *, key_paths: list[str]
+    ) -> None:
+        conn.executemany(
+            f"DELETE FROM {cls.name} WHERE key_path = ?",
+            [(key_path,) for key_path in key_paths],
+        )
+        conn.commit()
+
+
+# paths of the databases whose address book tables have been created by this process
+_address_book_dbs: set[str] = set()
+
+
+def _create_address_book_tables(conn: sqlite3.Connection, cursor: sqlite3.Cursor):
+    for table in (
+        AddressBook,
+        ProxyAddressBook,
+        ProxyAnnouncements,
+        WalletAddressIndex,
+    ):
+        table.create_if_not_exists(conn, cursor)
+
+
 def ensure_address_book_tables_exist():
     """
     Creates address book tables if they don't exist.
 
-    Should be run at startup to ensure that the address book tables exist.
+    Connections made through `TableDefinition.get_db` do this automatically.
     """
-    with DB() as (conn, cursor):
-        for table in (AddressBook, ProxyAddressBook, ProxyAnnouncements):
-            table.create_if_not_exists(conn, cursor)
+    db = DB()
+    with db as (conn, cursor):
+        _create_address_book_tables(conn, cursor)
+        _address_book_dbs.add(db.db_path)
 
 
 def group_subnets(registrations):
@@ -1903,12 +2301,94 @@ def get_hotkey_pub_ss58(wallet: Wallet) -> str:
     bt-wallet 3.1.1 and thus not have a wallet hotkeypub. In this case, it will return the hotkey
     SS58.
     """
+    if (indexed := _indexed_hotkey_ss58(wallet)) is not None:
+        return indexed
     try:
         return wallet.hotkeypub.ss58_address
     except (KeyFileError, AttributeError):
         return wallet.hotkey.ss58_address
 
 
+def _indexed_hotkey_ss58(wallet: Wallet) -> Optional[str]:
+    """The wallet's hotkey ss58 from the key index, reading its files if they are not indexed, or have changed."""
+    hotkey_path = getattr(getattr(wallet, "hotkey_file", None), "path", None)
+    if not isinstance(hotkey_path, str):
+        return None
+    _load_key_index([wallet.path])
+    try:
+        entry = _read_hotkey(Path(_wallets_root(hotkey_path)))
+    except (OSError, KeyFileError):
+        return None
+    finally:
+        _save_key_index()
+    return entry[1] if entry is not None else None
+
+
+def get_coldkey_pub_ss58(wallet: Wallet) -> str:
+    """
+    Retrieves the coldkeypub ss58 of a wallet, from the key index if its coldkeypub file has not changed since it was
+    last read.
+    """
+    coldkeypub_path = getattr(getattr(wallet, "coldkeypub_file", None), "path", None)
+    if isinstance(coldkeypub_path, str):
+        _load_key_index([wallet.path])
+        try:
+            return _read_coldkeypub(Path(_wallets_root(coldkeypub_path)))
+        except (OSError, KeyFileError):
+            pass
+        finally:
+            _save_key_index()
+    return wallet.coldkeypub.ss58_address
+
+
+def get_coldkey_ss58_addresses(path: str, wallet_names: list[str]) -> list[str]:
+    """
+    Retrieves the coldkeypub ss58 addresses of wallets, only reading the coldkeypub files which are not in the key
+    index, or have changed since they were indexed.
+
+    :param path: the wallets path
+    :param wallet_names: the names of the wallets in the path
+
+    :return: the addresses, in the order of the wallet names
+    :raises KeyFileError: if a wallet's coldkeypub file is missing or is not a key file
+    """
+    root = Path(_wallets_root(path))
+    _load_key_index([path])
+    try:
+        return [
+            _read_coldkeypub(root / name / "coldkeypub.txt") for name in wallet_names
+        ]
+    finally:
+        _save_key_index()
+
+
+def find_wallets_by_ss58(
+    path: str, ss58_address: str
+) -> list[tuple[str, Optional[str]]]:
+    """
+    Looks up the wallets of a wallets path with a key of the given ss58 address, in the persisted key index. Only keys
+    which have been read before (e.g. when scanning the path), and have not changed since, are found.
+
+    :param path: the wallets path
+    :param ss58_address: the address to look up
+
+    :return: the (wallet name, hotkey name, or None for the coldkey) of each key with the address
+    """
+    root = _wallets_root(path)
+    try:
+        with WalletAddressIndex.get_db() as (conn, cursor):
+            rows = WalletAddressIndex.find_address(
+                conn, cursor, wallets_path=root, ss58_address=ss58_address
+            )
+    except sqlite3.Error:
+        return []
+    return [
+        (wallet, hotkey)
+        for key_path, wallet, hotkey, stamp in rows
+        if _key_stamp(Path(key_path), hotkey=hotkey is not None) == stamp
+    ]
+
+
 def get_netuid_and_subuid_by_storage_index(storage_index: int) -> tuple[int, int]:
     """Returns the netuid and subuid from the storage index.
 
@@ -1930,7 +2410,7 @@ def get_netuid_and_subuid_by_storage_index(storage_index: int) -> tuple[int, int
 
 
 async def print_extrinsic_id(
-    extrinsic_receipt: Optional[AsyncExtrinsicReceipt],
+    extrinsic_receipt: Optional["AsyncExtrinsicReceipt"],
 ) -> None:
     """
     Prints the extrinsic identifier to the console. If the substrate attached to the extrinsic receipt is on a finney
@@ -1956,6 +2436,26 @@ async def print_extrinsic_id(
     return
 
 
+T = TypeVar("T")
+
+
+async def gather_bounded(
+    awaitables: Iterable[Awaitable[T]], limit: int = MAX_CONCURRENT_REQUESTS
+) -> list[T]:
+    """
+    Like `asyncio.gather`, but with at most `limit` of the awaitables running at once.
+
+    :return: the results, in the order of the awaitables
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _bounded(awaitable: Awaitable[T]) -> T:
+        async with semaphore:
+            return await awaitable
+
+    return await asyncio.gather(*[_bounded(a) for a in awaitables])
+
+
 async def check_img_mimetype(img_url: str) -> tuple[bool, str, str]:
     """
     Checks to see if the given URL is an image, as defined by its mimetype.
@@ -1970,6 +2470,8 @@ async def check_img_mimetype(img_url: str) -> tuple[bool, str, str]:
             str: error message if the URL could not be retrieved
 
     """
+    import aiohttp
+
     async with aiohttp.ClientSession() as session:
         try:
             async with session.get(img_url) as response:
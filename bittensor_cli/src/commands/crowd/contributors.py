@@ -48,9 +48,11 @@ async def list_contributors(
             print_error(f"{error_msg}")
         return False
 
-    with console.status(":satellite: Fetching contributors and identities..."):
+    with console.status(
+        ":satellite: Fetching contributors and identities..."
+    ) as status:
         contributor_contributions, all_identities = await asyncio.gather(
-            subtensor.get_crowdloan_contributors(crowdloan_id),
+            subtensor.get_crowdloan_contributors(crowdloan_id, status=status),
             subtensor.query_all_identities(),
         )
 
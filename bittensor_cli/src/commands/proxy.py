@@ -1,7 +1,6 @@
 from typing import TYPE_CHECKING, Optional
 import sys
 
-from async_substrate_interface.errors import StateDiscardedError
 from rich.prompt import Prompt, FloatPrompt, IntPrompt
 from scalecodec import GenericCall, ScaleBytes
 
@@ -568,6 +567,9 @@ async def execute_announced(
         True if the submission was successful, False otherwise.
 
     """
+    # deferred, as this module is imported at startup for ProxyType
+    from async_substrate_interface.errors import StateDiscardedError
+
     if prompt and created_block is not None:
         current_block = await subtensor.substrate.get_block_number()
         if current_block - delay < created_block:
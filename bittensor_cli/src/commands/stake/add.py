@@ -27,6 +27,10 @@ from bittensor_cli.src.bittensor.utils import (
     get_hotkey_pub_ss58,
     print_extrinsic_id,
 )
+from bittensor_cli.src.commands.stake.preview import (
+    PreviewTarget,
+    preview_stake_operations,
+)
 from bittensor_wallet import Wallet
 
 if TYPE_CHECKING:
@@ -77,15 +81,15 @@ async def stake_add(
         bool: True if stake operation is successful, False otherwise
     """
 
-    async def get_stake_extrinsic_fee(
+    def stake_preview_target(
         netuid_: int,
         amount_: Balance,
         staking_address_: str,
         safe_staking_: bool,
         price_limit: Optional[Balance] = None,
-    ):
+    ) -> PreviewTarget:
         """
-        Quick method to get the extrinsic fee for adding stake depending on the args supplied.
+        Quick method to get the preview target for adding stake depending on the args supplied.
         Args:
             netuid_: The netuid where the stake will be added
             amount_: the amount of stake to add
@@ -94,7 +98,7 @@ async def stake_add(
             price_limit: rate with tolerance
 
         Returns:
-            Balance object representing the extrinsic fee for adding stake.
+            PreviewTarget for the extrinsic fee and swap of adding this stake.
         """
         call_fn = "add_stake" if not safe_staking_ else "add_stake_limit"
         call_params = {
@@ -109,12 +113,15 @@ async def stake_add(
                     "allow_partial": allow_partial_stake,
                 }
             )
-        call = await subtensor.substrate.compose_call(
-            call_module="SubtensorModule",
+        return PreviewTarget(
             call_function=call_fn,
             call_params=call_params,
+            origin_netuid=0,
+            destination_netuid=netuid_,
+            amount=amount_,
+            # the fee is paid by the proxy, if any
+            fee_from_amount=not proxy,
         )
-        return await subtensor.get_extrinsic_fee(call, wallet.coldkeypub, proxy=proxy)
 
     async def safe_stake_extrinsic(
         netuid_: int,
@@ -300,196 +307,211 @@ async def stake_add(
             )
             return True, "", response
 
-    netuids = (
-        netuids if netuids is not None else await subtensor.get_all_subnet_netuids()
-    )
-    coldkey_ss58 = proxy or wallet.coldkeypub.ss58_address
-    signer_ss58 = wallet.coldkeypub.ss58_address
-
-    hotkeys_to_stake_to = _get_hotkeys_to_stake_to(
-        wallet=wallet,
-        all_hotkeys=all_hotkeys,
-        include_hotkeys=include_hotkeys,
-        exclude_hotkeys=exclude_hotkeys,
-    )
-
-    # Get subnet data and stake information for coldkey
-    chain_head = await subtensor.substrate.get_chain_head()
-    (
-        _all_subnets,
-        _stake_info,
-        current_wallet_balance,
-        hotkey_existence,
-    ) = await asyncio.gather(
-        subtensor.all_subnets(block_hash=chain_head),
-        subtensor.get_stake_for_coldkey(
-            coldkey_ss58=coldkey_ss58,
-            block_hash=chain_head,
-        ),
-        subtensor.get_balance(coldkey_ss58, block_hash=chain_head),
-        subtensor.do_hotkeys_exist(
-            [x[1] for x in hotkeys_to_stake_to],
-            block_hash=chain_head,
-        ),
-    )
-    hotkeys_that_exists = [
-        x for x in hotkeys_to_stake_to if hotkey_existence[x[1]] is True
-    ]
-    if not hotkeys_that_exists:
-        err_msg = "No keys existing on chain that can be staked to."
-        if json_output:
-            json_console.print_json(
-                data={
-                    "staking_success": False,
-                    "error_messages": [err_msg],
-                    "extrinsic_ids": None,
-                }
-            )
-        else:
-            print_error(err_msg)
-        return None
-
-    if hotkeys_that_exists != hotkeys_to_stake_to:
-        difference = set(x[1] for x in hotkeys_to_stake_to).symmetric_difference(
-            set(x[1] for x in hotkeys_that_exists)
+    # Pin every read of the preview to a single block, sharing repeated reads of it
+    async with subtensor.at_block() as snapshot:
+        netuids = (
+            netuids if netuids is not None else await subtensor.get_all_subnet_netuids()
         )
-        sames = set(x[1] for x in hotkeys_to_stake_to).intersection(
-            set(x[1] for x in hotkeys_that_exists)
+        coldkey_ss58 = proxy or wallet.coldkeypub.ss58_address
+        signer_ss58 = wallet.coldkeypub.ss58_address
+
+        hotkeys_to_stake_to = _get_hotkeys_to_stake_to(
+            wallet=wallet,
+            all_hotkeys=all_hotkeys,
+            include_hotkeys=include_hotkeys,
+            exclude_hotkeys=exclude_hotkeys,
         )
-        msg = (
-            "Some hotkeys attempting to stake to are not present: "
-            + ", ".join(difference)
-            + ". Using hotkeys:\n"
-            + "\n".join(sames)
+
+        # Get subnet data and stake information for coldkey
+        chain_head = snapshot.block_hash
+        (
+            _all_subnets,
+            _stake_info,
+            current_wallet_balance,
+            hotkey_existence,
+        ) = await asyncio.gather(
+            subtensor.all_subnets(block_hash=chain_head),
+            subtensor.get_stake_for_coldkey(
+                coldkey_ss58=coldkey_ss58,
+                block_hash=chain_head,
+            ),
+            subtensor.get_balance(coldkey_ss58, block_hash=chain_head),
+            subtensor.do_hotkeys_exist(
+                [x[1] for x in hotkeys_to_stake_to],
+                block_hash=chain_head,
+            ),
         )
-        console.print(msg)
-        if prompt:
-            if not confirm_action("Do you want to continue?"):
-                return None
-    hotkeys_to_stake_to = hotkeys_that_exists
-    all_subnets = {di.netuid: di for di in _all_subnets}
-
-    # Map current stake balances for hotkeys
-    hotkey_stake_map = {}
-    for _, hotkey_ss58 in hotkeys_to_stake_to:
-        hotkey_stake_map[hotkey_ss58] = {}
-        for netuid in netuids:
-            hotkey_stake_map[hotkey_ss58][netuid] = Balance.from_rao(0)
-
-    for stake_info in _stake_info:
-        if stake_info.hotkey_ss58 in hotkey_stake_map:
-            hotkey_stake_map[stake_info.hotkey_ss58][stake_info.netuid] = (
-                stake_info.stake
-            )
+        hotkeys_that_exists = [
+            x for x in hotkeys_to_stake_to if hotkey_existence[x[1]] is True
+        ]
+        if not hotkeys_that_exists:
+            err_msg = "No keys existing on chain that can be staked to."
+            if json_output:
+                json_console.print_json(
+                    data={
+                        "staking_success": False,
+                        "error_messages": [err_msg],
+                        "extrinsic_ids": None,
+                    }
+                )
+            else:
+                print_error(err_msg)
+            return None
 
-    # Determine the amount we are staking.
-    operation_targets = []
-    for hotkey in hotkeys_to_stake_to:
-        for netuid in netuids:
-            # Check that the subnet exists.
-            subnet_info = all_subnets.get(netuid)
-            if not subnet_info:
-                print_error(f"Subnet with netuid: {netuid} does not exist.")
-                continue
-            operation_targets.append(
-                (hotkey, netuid, subnet_info, hotkey_stake_map[hotkey[1]][netuid])
+        if hotkeys_that_exists != hotkeys_to_stake_to:
+            difference = set(x[1] for x in hotkeys_to_stake_to).symmetric_difference(
+                set(x[1] for x in hotkeys_that_exists)
             )
-
-    if stake_all and not operation_targets:
-        print_error("No valid staking operations to perform.")
-        return
-
-    rows = []
-    operations = []
-    remaining_wallet_balance = current_wallet_balance
-    max_slippage = 0.0
-
-    for hotkey, netuid, subnet_info, current_stake_balance in operation_targets:
-        staking_address = hotkey[1]
-
-        # Get the amount.
-        amount_to_stake = Balance(0)
-        if amount:
-            amount_to_stake = Balance.from_tao(amount)
-        elif stake_all:
-            amount_to_stake = current_wallet_balance / len(operation_targets)
-        elif not amount:
-            amount_to_stake, _ = _prompt_stake_amount(
-                current_balance=remaining_wallet_balance,
-                netuid=netuid,
-                action_name="stake",
+            sames = set(x[1] for x in hotkeys_to_stake_to).intersection(
+                set(x[1] for x in hotkeys_that_exists)
             )
-
-        # Check enough to stake.
-        if amount_to_stake > remaining_wallet_balance:
-            print_error(
-                f"Not enough stake:[bold white]\n wallet balance:{remaining_wallet_balance} < "
-                f"staking amount: {amount_to_stake}[/bold white]"
+            msg = (
+                "Some hotkeys attempting to stake to are not present: "
+                + ", ".join(difference)
+                + ". Using hotkeys:\n"
+                + "\n".join(sames)
             )
+            console.print(msg)
+            if prompt:
+                if not confirm_action("Do you want to continue?"):
+                    return None
+        hotkeys_to_stake_to = hotkeys_that_exists
+        all_subnets = {di.netuid: di for di in _all_subnets}
+
+        # Map current stake balances for hotkeys
+        hotkey_stake_map = {}
+        for _, hotkey_ss58 in hotkeys_to_stake_to:
+            hotkey_stake_map[hotkey_ss58] = {}
+            for netuid in netuids:
+                hotkey_stake_map[hotkey_ss58][netuid] = Balance.from_rao(0)
+
+        for stake_info in _stake_info:
+            if stake_info.hotkey_ss58 in hotkey_stake_map:
+                hotkey_stake_map[stake_info.hotkey_ss58][stake_info.netuid] = (
+                    stake_info.stake
+                )
+
+        # Determine the amount we are staking.
+        operation_targets = []
+        for hotkey in hotkeys_to_stake_to:
+            for netuid in netuids:
+                # Check that the subnet exists.
+                subnet_info = all_subnets.get(netuid)
+                if not subnet_info:
+                    print_error(f"Subnet with netuid: {netuid} does not exist.")
+                    continue
+                operation_targets.append(
+                    (hotkey, netuid, subnet_info, hotkey_stake_map[hotkey[1]][netuid])
+                )
+
+        if stake_all and not operation_targets:
+            print_error("No valid staking operations to perform.")
             return
-        remaining_wallet_balance -= amount_to_stake
-
-        # Calculate slippage
-        # TODO: Update for V3, slippage calculation is significantly different in v3
-        # try:
-        #     received_amount, slippage_pct, slippage_pct_float, rate = (
-        #         _calculate_slippage(subnet_info, amount_to_stake, stake_fee)
-        #     )
-        # except ValueError:
-        #     return False
-        #
-        # max_slippage = max(slippage_pct_float, max_slippage)
-
-        # Temporary workaround - calculations without slippage
-        current_price_float = float(subnet_info.price.tao)
-        rate = _safe_inverse_rate(current_price_float)
-        price_with_tolerance = None
-
-        # If we are staking safe, add price tolerance
-        if safe_staking:
-            if subnet_info.is_dynamic:
-                price_with_tolerance = current_price_float * (1 + rate_tolerance)
-                _rate_with_tolerance = _safe_inverse_rate(
-                    price_with_tolerance
-                )  # Rate only for display
-                rate_with_tolerance = f"{_rate_with_tolerance:.4f}"
-                price_with_tolerance = Balance.from_tao(
-                    price_with_tolerance
-                )  # Actual price to pass to extrinsic
+
+        rows = []
+        operations = []
+        preview_targets = []
+        row_extensions = []
+        remaining_wallet_balance = current_wallet_balance
+        max_slippage = 0.0
+
+        for hotkey, netuid, subnet_info, current_stake_balance in operation_targets:
+            staking_address = hotkey[1]
+
+            # Get the amount.
+            amount_to_stake = Balance(0)
+            if amount:
+                amount_to_stake = Balance.from_tao(amount)
+            elif stake_all:
+                amount_to_stake = current_wallet_balance / len(operation_targets)
+            elif not amount:
+                amount_to_stake, _ = _prompt_stake_amount(
+                    current_balance=remaining_wallet_balance,
+                    netuid=netuid,
+                    action_name="stake",
+                )
+
+            # Check enough to stake.
+            if amount_to_stake > remaining_wallet_balance:
+                print_error(
+                    f"Not enough stake:[bold white]\n wallet balance:{remaining_wallet_balance} < "
+                    f"staking amount: {amount_to_stake}[/bold white]"
+                )
+                return
+            remaining_wallet_balance -= amount_to_stake
+
+            # Calculate slippage
+            # TODO: Update for V3, slippage calculation is significantly different in v3
+            # try:
+            #     received_amount, slippage_pct, slippage_pct_float, rate = (
+            #         _calculate_slippage(subnet_info, amount_to_stake, stake_fee)
+            #     )
+            # except ValueError:
+            #     return False
+            #
+            # max_slippage = max(slippage_pct_float, max_slippage)
+
+            # Temporary workaround - calculations without slippage
+            current_price_float = float(subnet_info.price.tao)
+            rate = _safe_inverse_rate(current_price_float)
+            price_with_tolerance = None
+
+            # If we are staking safe, add price tolerance
+            if safe_staking:
+                if subnet_info.is_dynamic:
+                    price_with_tolerance = current_price_float * (1 + rate_tolerance)
+                    _rate_with_tolerance = _safe_inverse_rate(
+                        price_with_tolerance
+                    )  # Rate only for display
+                    rate_with_tolerance = f"{_rate_with_tolerance:.4f}"
+                    price_with_tolerance = Balance.from_tao(
+                        price_with_tolerance
+                    )  # Actual price to pass to extrinsic
+                else:
+                    rate_with_tolerance = "1"
+                    price_with_tolerance = Balance.from_rao(1)
+                row_extension = [
+                    f"{rate_with_tolerance} {Balance.get_unit(netuid)}/{Balance.get_unit(0)} ",
+                    f"[{'dark_sea_green3' if allow_partial_stake else 'red'}]"
+                    # safe staking
+                    f"{allow_partial_stake}[/{'dark_sea_green3' if allow_partial_stake else 'red'}]",
+                ]
             else:
-                rate_with_tolerance = "1"
-                price_with_tolerance = Balance.from_rao(1)
-            extrinsic_fee = await get_stake_extrinsic_fee(
-                netuid_=netuid,
-                amount_=amount_to_stake,
-                staking_address_=staking_address,
-                safe_staking_=safe_staking,
-                price_limit=price_with_tolerance,
+                row_extension = []
+            preview_targets.append(
+                stake_preview_target(
+                    netuid_=netuid,
+                    amount_=amount_to_stake,
+                    staking_address_=staking_address,
+                    safe_staking_=safe_staking,
+                    price_limit=price_with_tolerance,
+                )
             )
-            row_extension = [
-                f"{rate_with_tolerance} {Balance.get_unit(netuid)}/{Balance.get_unit(0)} ",
-                f"[{'dark_sea_green3' if allow_partial_stake else 'red'}]"
-                # safe staking
-                f"{allow_partial_stake}[/{'dark_sea_green3' if allow_partial_stake else 'red'}]",
-            ]
-        else:
-            extrinsic_fee = await get_stake_extrinsic_fee(
-                netuid_=netuid,
-                amount_=amount_to_stake,
-                staking_address_=staking_address,
-                safe_staking_=safe_staking,
+            row_extensions.append((rate, row_extension))
+            operations.append(
+                (
+                    netuid,
+                    staking_address,
+                    amount_to_stake,
+                    current_stake_balance,
+                    price_with_tolerance,
+                )
             )
-            row_extension = []
-        # TODO this should be asyncio gathered before the for loop
-        amount_minus_fee = (
-            (amount_to_stake - extrinsic_fee) if not proxy else amount_to_stake
-        )
-        sim_swap = await subtensor.sim_swap(
-            origin_netuid=0,
-            destination_netuid=netuid,
-            amount=amount_minus_fee.rao,
+
+        # price every row together, rather than one fee and swap request at a time
+        previews = await preview_stake_operations(
+            subtensor,
+            wallet,
+            preview_targets,
+            block_hash=chain_head,
+            dynamic_info=all_subnets,
+            proxy=proxy,
         )
-        received_amount = sim_swap.alpha_amount
+    for (netuid, staking_address, amount_to_stake, _, _), (
+        rate,
+        row_extension,
+    ), preview in zip(operations, row_extensions, previews):
+        received_amount = preview.sim_swap.alpha_amount
         # Add rows for the table
         base_row = [
             str(netuid),  # netuid
@@ -497,20 +519,11 @@ async def stake_add(
             str(amount_to_stake),  # amount
             str(rate) + f" {Balance.get_unit(netuid)}/{Balance.get_unit(0)} ",  # rate
             str(received_amount.set_unit(netuid)),  # received
-            str(sim_swap.tao_fee),  # fee
-            str(extrinsic_fee),
+            str(preview.sim_swap.tao_fee),  # fee
+            str(preview.extrinsic_fee),
             # str(slippage_pct),  # slippage
         ] + row_extension
         rows.append(tuple(base_row))
-        operations.append(
-            (
-                netuid,
-                staking_address,
-                amount_to_stake,
-                current_stake_balance,
-                price_with_tolerance,
-            )
-        )
 
     # Define and print stake table + slippage warning
     table = _define_stake_table(wallet, subtensor, safe_staking, rate_tolerance)
@@ -534,7 +547,7 @@ async def stake_add(
     extrinsic_ids = defaultdict(dict)
 
     if use_batch:
-        # Batch path: compose all calls, submit as a single Utility.batch_all transaction
+        # Batch path: compose all calls, and submit them in as few Utility.batch_all transactions as fit
         with console.status(
             f"\n:satellite: Batching {total_ops} stake operations on netuid(s): {netuids} ..."
         ) as status:
@@ -575,72 +588,70 @@ async def stake_add(
                         )
                     )
 
-            success, err_msg, response = await subtensor.sign_and_send_batch_extrinsic(
+            results = await subtensor.sign_and_send_batch_extrinsic(
                 calls=list(calls),
                 wallet=wallet,
                 era={"period": era},
                 proxy=proxy,
                 mev_protection=mev_protection,
                 block_hash=batch_block_hash,
+                status=status,
             )
 
-            if success and mev_protection:
-                inner_hash = err_msg
-                success, mev_error, response = await wait_for_extrinsic_by_hash(
-                    subtensor=subtensor,
-                    extrinsic_hash=inner_hash,
-                    submit_block_hash=response.block_hash,
-                    status=status,
+            # the batches succeed or fail independently, so each operation gets the outcome of its own batch
+            staked = []
+            for result in results:
+                ext_id = (
+                    await result.receipt.get_extrinsic_identifier()
+                    if result.success and result.receipt
+                    else None
                 )
-                if not success:
-                    err_msg = mev_error
-
-            # batch_all is atomic: all succeed or all revert
-            for ni, hk, am, curr, _ in operations:
-                successes[ni][hk] = success
-                error_messages[ni][hk] = "" if success else err_msg
-
-            if success:
-                ext_id = await response.get_extrinsic_identifier()
-                for ni, hk, _, _, _ in operations:
-                    extrinsic_ids[ni][hk] = ext_id
-
-                if not json_output:
-                    await print_extrinsic_id(response)
-                    new_block_hash = await subtensor.substrate.get_chain_head()
-                    new_balance = await subtensor.get_balance(
-                        coldkey_ss58, block_hash=new_block_hash
+                for ni, hk, am, curr, _ in operations[result.start : result.stop]:
+                    successes[ni][hk] = result.success
+                    error_messages[ni][hk] = result.message
+                    if ext_id:
+                        extrinsic_ids[ni][hk] = ext_id
+                    if result.success:
+                        staked.append((ni, hk, curr))
+                if not result.success:
+                    print_error(
+                        f":cross_mark: [red]Batch staking failed[/red] for operations "
+                        f"{result.start + 1} to {result.stop} of {total_ops}: {result.message}",
+                        status=status,
                     )
-                    print_success(
-                        f"[dark_sea_green3]Batch finalized. "
-                        f"Staked across {total_ops} operations.[/dark_sea_green3]"
+                elif not json_output:
+                    await print_extrinsic_id(result.receipt)
+
+            if staked and not json_output:
+                new_block_hash = await subtensor.substrate.get_chain_head()
+                new_balance = await subtensor.get_balance(
+                    coldkey_ss58, block_hash=new_block_hash
+                )
+                print_success(
+                    f"[dark_sea_green3]Batch finalized. "
+                    f"Staked across {len(staked)} of {total_ops} operations.[/dark_sea_green3]"
+                )
+                console.print(
+                    f"Balance:\n  [blue]{current_balance}[/blue] :arrow_right: "
+                    f"[{COLOR_PALETTE['STAKE']['STAKE_AMOUNT']}]{new_balance}"
+                )
+                for ni, hk, curr in staked:
+                    new_stake = await subtensor.get_stake(
+                        hotkey_ss58=hk,
+                        coldkey_ss58=coldkey_ss58,
+                        netuid=ni,
+                        block_hash=new_block_hash,
                     )
                     console.print(
-                        f"Balance:\n  [blue]{current_balance}[/blue] :arrow_right: "
-                        f"[{COLOR_PALETTE['STAKE']['STAKE_AMOUNT']}]{new_balance}"
+                        f"Subnet: [{COLOR_PALETTE['GENERAL']['SUBHEADING']}]"
+                        f"{ni}[/{COLOR_PALETTE['GENERAL']['SUBHEADING']}] "
+                        f"Hotkey: [{COLOR_PALETTE['GENERAL']['HOTKEY']}]{hk}"
+                        f"[/{COLOR_PALETTE['GENERAL']['HOTKEY']}] "
+                        f"Stake:\n"
+                        f"  [blue]{curr}[/blue] "
+                        f":arrow_right: "
+                        f"[{COLOR_PALETTE['STAKE']['STAKE_AMOUNT']}]{new_stake}"
                     )
-                    for ni, hk, am, curr, _ in operations:
-                        new_stake = await subtensor.get_stake(
-                            hotkey_ss58=hk,
-                            coldkey_ss58=coldkey_ss58,
-                            netuid=ni,
-                            block_hash=new_block_hash,
-                        )
-                        console.print(
-                            f"Subnet: [{COLOR_PALETTE['GENERAL']['SUBHEADING']}]"
-                            f"{ni}[/{COLOR_PALETTE['GENERAL']['SUBHEADING']}] "
-                            f"Hotkey: [{COLOR_PALETTE['GENERAL']['HOTKEY']}]{hk}"
-                            f"[/{COLOR_PALETTE['GENERAL']['HOTKEY']}] "
-                            f"Stake:\n"
-                            f"  [blue]{curr}[/blue] "
-                            f":arrow_right: "
-                            f"[{COLOR_PALETTE['STAKE']['STAKE_AMOUNT']}]{new_stake}"
-                        )
-            else:
-                print_error(
-                    f":cross_mark: [red]Batch staking failed[/red]: {err_msg}",
-                    status=status,
-                )
     else:
         # Single operation path: use the existing per-operation extrinsics
         with console.status(
@@ -10,6 +10,7 @@ from rich.text import Text
 from async_substrate_interface.errors import SubstrateRequestException
 
 from bittensor_cli.src.bittensor.balances import Balance
+from bittensor_cli.src.bittensor.extrinsics.pipeline import sign_and_send_pipelined
 from bittensor_cli.src.bittensor.subtensor_interface import SubtensorInterface
 from bittensor_cli.src.bittensor.utils import (
     confirm_action,
@@ -36,17 +37,14 @@ async def get_childkey_completion_block(
     Calculates the block at which the childkey set request will complete
     """
     bh = await subtensor.substrate.get_chain_head()
-    blocks_since_last_step_query = subtensor.query(
-        "SubtensorModule", "BlocksSinceLastStep", params=[netuid], block_hash=bh
-    )
-    tempo_query = subtensor.get_hyperparameter(
-        param_name="Tempo", netuid=netuid, block_hash=bh
-    )
-    block_number, blocks_since_last_step, tempo = await asyncio.gather(
+    block_number, hyperparameters = await asyncio.gather(
         subtensor.substrate.get_block_number(block_hash=bh),
-        blocks_since_last_step_query,
-        tempo_query,
+        subtensor.get_hyperparameters(
+            ["Tempo", "BlocksSinceLastStep"], [netuid], block_hash=bh
+        ),
     )
+    tempo = hyperparameters[netuid]["Tempo"]
+    blocks_since_last_step = hyperparameters[netuid]["BlocksSinceLastStep"]
     cooldown = block_number + 7200
     blocks_left_in_tempo = tempo - blocks_since_last_step
     next_tempo = block_number + blocks_left_in_tempo
@@ -117,19 +115,8 @@ async def set_children_extrinsic(
     with console.status(
         f":satellite: {operation} on [white]{subtensor.network}[/white] ..."
     ):
-        if not all_revoked:
-            normalized_children = prepare_child_proportions(children_with_proportions)
-        else:
-            normalized_children = []
-
-        call = await subtensor.substrate.compose_call(
-            call_module="SubtensorModule",
-            call_function="set_children",
-            call_params={
-                "hotkey": hotkey,
-                "children": normalized_children,
-                "netuid": netuid,
-            },
+        call = await _compose_set_children_call(
+            subtensor, hotkey, netuid, children_with_proportions
         )
         success, error_message, ext_receipt = await subtensor.sign_and_send_extrinsic(
             call, wallet, wait_for_inclusion, wait_for_finalization, proxy=proxy
@@ -155,6 +142,109 @@ async def set_children_extrinsic(
             return False, error_message, None
 
 
+async def _compose_set_children_call(
+    subtensor: "SubtensorInterface",
+    hotkey: str,
+    netuid: int,
+    children_with_proportions: list[tuple[float, str]],
+):
+    """
+    Composes the `set_children` call for the hotkey on the subnet. No children revokes all of them.
+    """
+    if children_with_proportions:
+        normalized_children = prepare_child_proportions(children_with_proportions)
+    else:
+        normalized_children = []
+    return await subtensor.substrate.compose_call(
+        call_module="SubtensorModule",
+        call_function="set_children",
+        call_params={
+            "hotkey": hotkey,
+            "children": normalized_children,
+            "netuid": netuid,
+        },
+    )
+
+
+async def set_children_on_netuids_extrinsic(
+    subtensor: "SubtensorInterface",
+    wallet: Wallet,
+    hotkey: str,
+    netuids: list[int],
+    proxy: Optional[str],
+    children_with_proportions: list[tuple[float, str]],
+    prompt: bool = False,
+    decline: bool = False,
+    quiet: bool = False,
+) -> dict[int, tuple[bool, str, Optional[str]]]:
+    """
+    Sets children hotkeys with proportions assigned from the parent, on several subnets at once. The `set_children`
+    extrinsics are independent of each other, so rather than waiting for each to be included before submitting the
+    next, they are all submitted back-to-back, with consecutive nonces, and waited for together.
+
+    :param: subtensor: Subtensor endpoint to use.
+    :param: wallet: Bittensor wallet object.
+    :param: hotkey: Parent hotkey.
+    :param: netuids: Unique identifiers of the subnets.
+    :param: proxy: The real account used to create the proxy, if any.
+    :param: children_with_proportions: Children hotkeys. Empty to revoke all children.
+    :param: prompt: If `True`, the call waits for confirmation from the user before proceeding.
+
+    :return: A dict of netuid to a tuple containing a success flag, an optional error message, and the extrinsic
+        identifier
+    """
+    all_revoked = len(children_with_proportions) == 0
+    operation = "Revoking all child hotkeys" if all_revoked else "Setting child hotkeys"
+    netuids_str = ", ".join(str(netuid) for netuid in netuids)
+
+    if prompt:
+        if all_revoked:
+            question = (
+                f"Do you want to revoke all children hotkeys for hotkey {hotkey} "
+                f"on netuids {netuids_str}?"
+            )
+        else:
+            children_str = "\n".join(
+                f"  {child[1]}: {child[0]}" for child in children_with_proportions
+            )
+            question = (
+                f"Do you want to set children hotkeys on netuids {netuids_str}:\n"
+                f"[bold white]{children_str}[/bold white]?"
+            )
+        if not confirm_action(question, decline=decline, quiet=quiet):
+            return {netuid: (False, "Operation Cancelled", None) for netuid in netuids}
+
+    # Decrypt coldkey.
+    if not (unlock_status := unlock_key(wallet, print_out=False)).success:
+        return {netuid: (False, unlock_status.message, "") for netuid in netuids}
+
+    with console.status(
+        f":satellite: {operation} on [white]{subtensor.network}[/white] ..."
+    ) as status:
+        calls = await asyncio.gather(
+            *[
+                _compose_set_children_call(
+                    subtensor, hotkey, netuid, children_with_proportions
+                )
+                for netuid in netuids
+            ]
+        )
+        results = await sign_and_send_pipelined(
+            subtensor, calls, wallet, proxy=proxy, status=status
+        )
+
+    outcomes = {}
+    for netuid, (success, error_message, ext_receipt) in zip(netuids, results):
+        if success:
+            ext_id = await ext_receipt.get_extrinsic_identifier()
+            await print_extrinsic_id(ext_receipt)
+            outcomes[netuid] = (True, f"{operation} successfully included.", ext_id)
+        else:
+            print_error(f"Failed on netuid {netuid}: {error_message}")
+            outcomes[netuid] = (False, error_message, None)
+    return outcomes
+
+
 async def set_childkey_take_extrinsic(
     subtensor: "SubtensorInterface",
     wallet: Wallet,
@@ -322,27 +412,6 @@ async def get_children(
     - If netuid is not specified, generates and prints a summary table of all child hotkeys across all subnets.
     """
 
-    async def get_take(child: tuple, netuid__: int) -> float:
-        """
-        Get the take value for a given subtensor, hotkey, and netuid.
-
-        Arguments:
-            child: The hotkey to retrieve the take value for.
-            netuid__: the netuid to retrieve the take value for.
-
-        Returns:
-            The take value as a float. If the take value is not available, it returns 0.
-
-        """
-        child_hotkey = child[1]
-        take_u16 = await get_childkey_take(
-            subtensor=subtensor, hotkey=child_hotkey, netuid=netuid__
-        )
-        if take_u16:
-            return u16_to_float(take_u16)
-        else:
-            return 0
-
     async def _render_table(
         parent_hotkey: str,
         netuid_children_: list[tuple[int, list[tuple[int, str]]]],
@@ -385,9 +454,18 @@ async def get_children(
             [parent_hotkey]
             + [s for _, child_list in netuid_children_ for _, s in child_list]
         )
-        hotkey_stake_dict = await subtensor.get_total_stake_for_hotkey(
-            *unique_keys,
-            netuids=[n[0] for n in netuid_children_],
+        hotkey_stake_dict, childkey_takes = await asyncio.gather(
+            subtensor.get_total_stake_for_hotkey(
+                *unique_keys,
+                netuids=[n[0] for n in netuid_children_],
+            ),
+            subtensor.get_childkey_takes(
+                [
+                    (child_hotkey, netuid_)
+                    for netuid_, child_list in netuid_children_
+                    for _, child_hotkey in child_list
+                ]
+            ),
         )
         parent_total = sum(hotkey_stake_dict[parent_hotkey].values())
         insert_text = (
@@ -408,12 +486,8 @@ async def get_children(
             hotkey_stake: dict[int, Balance] = hotkey_stake_dict[parent_hotkey]
 
             children_info = []
-            child_takes = await asyncio.gather(
-                *[get_take(c, child_netuid) for c in children_]
-            )
-            for child, child_take in zip(children_, child_takes):
-                proportion = child[0]
-                child_hotkey = child[1]
+            for proportion, child_hotkey in children_:
+                child_take = u16_to_float(childkey_takes[(child_hotkey, child_netuid)])
 
                 # add to totals
                 avg_take_per_netuid += child_take
@@ -478,35 +552,22 @@ async def get_children(
 
         console.print(table)
 
-    netuid_children_tuples = []
     # Core logic for get_children
-    if netuid is None:
-        # get all netuids
-        netuids = await subtensor.get_all_subnet_netuids()
-        for netuid_ in netuids:
-            success, children, err_mg = await subtensor.get_children(
-                get_hotkey_pub_ss58(wallet), netuid_
-            )
-            if children:
-                netuid_children_tuples.append((netuid_, children))
-            if not success:
-                print_error(
-                    f"Failed to get children from subtensor {netuid_}: {err_mg}"
-                )
-        await _render_table(get_hotkey_pub_ss58(wallet), netuid_children_tuples)
-    else:
-        success, children, err_mg = await subtensor.get_children(
-            get_hotkey_pub_ss58(wallet), netuid
+    parent_hotkey = get_hotkey_pub_ss58(wallet)
+    try:
+        children, _ = await subtensor.get_children_all_netuids(
+            parent_hotkey, netuids=None if netuid is None else [netuid]
         )
-        if not success:
-            print_error(f"Failed to get children from subtensor: {err_mg}")
-        if children:
-            netuid_children_tuples = [(netuid, children)]
-            await _render_table(get_hotkey_pub_ss58(wallet), netuid_children_tuples)
+    except SubstrateRequestException as e:
+        print_error(f"Failed to get children from subtensor: {format_error_message(e)}")
+        children = {}
+    netuid_children_tuples = list(children.items())
+    if netuid is None or netuid_children_tuples:
+        await _render_table(parent_hotkey, netuid_children_tuples)
     output = defaultdict(dict)
     for netuid_, children_ in netuid_children_tuples:
         for proportion_, addr in children_:
-            output[netuid][addr] = proportion_
+            output[netuid_][addr] = proportion_
     return output
 
 
@@ -579,25 +640,28 @@ async def set_children(
             print_error(f"Unable to set children hotkeys. {message}")
     else:
         # set children on all subnets that parent is registered on
-        netuids = await subtensor.get_all_subnet_netuids()
-        for netuid_ in netuids:
-            if netuid_ == 0:  # dont include root network
-                continue
-            console.print(f"Setting children on netuid {netuid_}.")
-            success, message, ext_id = await set_children_extrinsic(
-                subtensor=subtensor,
-                wallet=wallet,
-                netuid=netuid_,
-                hotkey=hotkey,
-                proxy=proxy,
-                children_with_proportions=children_with_proportions,
-                prompt=prompt,
-                wait_for_inclusion=True,
-                wait_for_finalization=False,
-            )
-            current_block, completion_block = await get_childkey_completion_block(
-                subtensor, netuid_
-            )
+        netuids = [
+            netuid_
+            for netuid_ in await subtensor.get_all_subnet_netuids()
+            if netuid_ != 0  # dont include root network
+        ]
+        console.print(f"Setting children on netuids {netuids}.")
+        outcomes = await set_children_on_netuids_extrinsic(
+            subtensor=subtensor,
+            wallet=wallet,
+            netuids=netuids,
+            hotkey=hotkey,
+            proxy=proxy,
+            children_with_proportions=children_with_proportions,
+            prompt=prompt,
+        )
+        completion_blocks = await asyncio.gather(
+            *[get_childkey_completion_block(subtensor, netuid_) for netuid_ in netuids]
+        )
+        for netuid_, (current_block, completion_block) in zip(
+            netuids, completion_blocks
+        ):
+            success, message, ext_id = outcomes[netuid_]
             successes[netuid_] = {
                 "success": success,
                 "error": message,
@@ -663,22 +727,35 @@ async def revoke_children(
             console.print(f"Unable to revoke children hotkeys. {message}")
     else:
         # revoke children from ALL netuids
-        netuids = await subtensor.get_all_subnet_netuids()
-        for netuid_ in netuids:
-            if netuid_ == 0:  # dont include root network
-                continue
-            console.print(f"Revoking children from netuid {netuid_}.")
-            success, message, ext_id = await set_children_extrinsic(
-                subtensor=subtensor,
-                wallet=wallet,
-                netuid=netuid_,
-                hotkey=get_hotkey_pub_ss58(wallet),
-                children_with_proportions=[],
-                proxy=proxy,
-                prompt=prompt,
-                wait_for_inclusion=True,
-                wait_for_finalization=False,
+        netuids = [
+            netuid_
+            for netuid_ in await subtensor.get_all_subnet_netuids()
+            if netuid_ != 0  # dont include root network
+        ]
+        console.print(f"Revoking children from netuids {netuids}.")
+        outcomes = await set_children_on_netuids_extrinsic(
+            subtensor=subtensor,
+            wallet=wallet,
+            netuids=netuids,
+            hotkey=get_hotkey_pub_ss58(wallet),
+            children_with_proportions=[],
+            proxy=proxy,
+            prompt=prompt,
+        )
+        succeeded = [netuid_ for netuid_ in netuids if outcomes[netuid_][0]]
+        completion_blocks = dict(
+            zip(
+                succeeded,
+                await asyncio.gather(
+                    *[
+                        get_childkey_completion_block(subtensor, netuid_)
+                        for netuid_ in succeeded
+                    ]
+                ),
             )
+        )
+        for netuid_ in netuids:
+            success, message, ext_id = outcomes[netuid_]
             dict_output[netuid_] = {
                 "success": success,
                 "error": message,
@@ -687,9 +764,7 @@ async def revoke_children(
                 "extrinsic_identifier": ext_id,
             }
             if success:
-                current_block, completion_block = await get_childkey_completion_block(
-                    subtensor, netuid_
-                )
+                current_block, completion_block = completion_blocks[netuid_]
                 dict_output[netuid_]["completion_block"] = completion_block
                 dict_output[netuid_]["set_block"] = current_block
                 console.print(
@@ -747,16 +822,14 @@ async def childkey_take(
     async def chk_all_subnets(ss58):
         """Aggregate data for childkey take from all subnets"""
         all_netuids = await subtensor.get_all_subnet_netuids()
-        takes = []
-        for subnet in all_netuids:
-            if subnet == 0:
-                continue
-            curr_take = await get_childkey_take(
-                subtensor=subtensor, netuid=subnet, hotkey=ss58
-            )
-            if curr_take is not None:
-                take_value = u16_to_float(curr_take)
-                takes.append((subnet, take_value * 100))
+        childkey_takes = await subtensor.get_childkey_takes(
+            [(ss58, subnet) for subnet in all_netuids if subnet != 0]
+        )
+        takes = [
+            (subnet, u16_to_float(curr_take) * 100)
+            for (_, subnet), curr_take in childkey_takes.items()
+            if curr_take
+        ]
         table = Table(
             title=f"Current Child Takes for [bright_magenta]{ss58}[/bright_magenta]"
         )
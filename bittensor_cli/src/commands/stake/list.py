@@ -7,13 +7,13 @@ from bittensor_wallet import Wallet
 from rich.prompt import Prompt
 from rich.table import Table
 from rich import box
-from rich.progress import Progress, BarColumn, TextColumn
 from rich.console import Group
 from rich.live import Live
 
 from bittensor_cli.src import COLOR_PALETTE
 from bittensor_cli.src.bittensor.balances import Balance
 from bittensor_cli.src.bittensor.chain_data import StakeInfo
+from bittensor_cli.src.bittensor.live import RowCache, follow_chain_heads
 from bittensor_cli.src.bittensor.utils import (
     console,
     print_error,
@@ -38,7 +38,7 @@ async def stake_list(
 ):
     coldkey_address = coldkey_ss58 if coldkey_ss58 else wallet.coldkeypub.ss58_address
 
-    async def get_stake_data(block_hash_: str = None):
+    async def get_stake_data(block_hash_: str = None, fetch_identities: bool = True):
         (
             sub_stakes_,
             hotkey_identity_map_,
@@ -47,7 +47,9 @@ async def stake_list(
             subtensor.get_stake_for_coldkey(
                 coldkey_ss58=coldkey_address, block_hash=block_hash_
             ),
-            subtensor.fetch_coldkey_hotkey_identities(block_hash=block_hash_),
+            subtensor.fetch_coldkey_hotkey_identities(block_hash=block_hash_)
+            if fetch_identities
+            else asyncio.sleep(0),
             subtensor.all_subnets(block_hash=block_hash_),
         )
 
@@ -288,6 +290,7 @@ async def stake_list(
         hotkey_name_: str,
         claimable_amounts_: dict,
         previous_data_: Optional[dict] = None,
+        row_cache_: Optional[RowCache] = None,
     ) -> tuple[Table, dict]:
         rows = []
         current_data_ = {}
@@ -367,94 +370,95 @@ async def stake_list(
                 "tao_emission": substake_.tao_emission.tao / (pool.tempo or 1),
             }
 
+            # Claimable amount
+            hotkey_ss58 = substake_.hotkey_ss58
+            claimable_amount = Balance.from_rao(0)
+            if (
+                hotkey_ss58 in claimable_amounts_
+                and netuid in claimable_amounts_[hotkey_ss58]
+            ):
+                claimable_amount = claimable_amounts_[hotkey_ss58][netuid]
+
+            current_data_[netuid]["claimable"] = claimable_amount.tao
+
             # Get previous values for delta tracking
             prev = previous_data_.get(netuid, {}) if previous_data_ else {}
-            unit_first = True if netuid == 0 else False
-
-            stake_cell = format_cell(
-                alpha_value.tao,
-                prev.get("stake"),
-                unit=symbol,
-                unit_first_=unit_first,
-                precision=4,
-                millify=True if not verbose else False,
-            )
 
-            rate_cell = format_cell(
-                pool.price.tao,
-                prev.get("price"),
-                unit=f"τ/{symbol}",
-                unit_first_=False,
-                precision=5,
-                millify=True if not verbose else False,
-            )
+            def format_row() -> list:
+                unit_first = True if netuid == 0 else False
 
-            exchange_cell = format_cell(
-                tao_value_.tao,
-                prev.get("tao_value"),
-                unit="τ",
-                unit_first_=True,
-                precision=4,
-                millify=True if not verbose else False,
-            )
-            # TODO why is nothing done with swap_cell
-            if netuid != 0:
-                swap_cell = format_cell(
-                    swapped_tao_value_.tao,
-                    prev.get("swapped_value"),
-                    unit="τ",
-                    unit_first_=True,
+                stake_cell = format_cell(
+                    alpha_value.tao,
+                    prev.get("stake"),
+                    unit=symbol,
+                    unit_first_=unit_first,
                     precision=4,
                     millify=True if not verbose else False,
                 )
-            else:
-                swap_cell = f"[{COLOR_PALETTE['STAKE']['NOT_REGISTERED']}]N/A[/{COLOR_PALETTE['STAKE']['NOT_REGISTERED']}]"
-
-            emission_value = substake_.emission.tao / (pool.tempo or 1)
-            emission_cell = format_cell(
-                emission_value,
-                prev.get("emission"),
-                unit=symbol,
-                unit_first_=unit_first,
-                precision=4,
-            )
 
-            tao_emission_value = substake_.tao_emission.tao / (pool.tempo or 1)
-            tao_emission_cell = format_cell(
-                tao_emission_value,
-                prev.get("tao_emission"),
-                unit="τ",
-                unit_first_=unit_first,
-                precision=4,
-            )
+                rate_cell = format_cell(
+                    pool.price.tao,
+                    prev.get("price"),
+                    unit=f"τ/{symbol}",
+                    unit_first_=False,
+                    precision=5,
+                    millify=True if not verbose else False,
+                )
 
-            subnet_name_cell = (
-                f"[{COLOR_PALETTE['GENERAL']['SYMBOL']}]{symbol if netuid != 0 else 'τ'}[/{COLOR_PALETTE['GENERAL']['SYMBOL']}]"
-                f" {get_subnet_name(dynamic_info_for_lt[netuid])}"
-            )
+                exchange_cell = format_cell(
+                    tao_value_.tao,
+                    prev.get("tao_value"),
+                    unit="τ",
+                    unit_first_=True,
+                    precision=4,
+                    millify=True if not verbose else False,
+                )
+                # TODO why is nothing done with swap_cell
+                if netuid != 0:
+                    swap_cell = format_cell(
+                        swapped_tao_value_.tao,
+                        prev.get("swapped_value"),
+                        unit="τ",
+                        unit_first_=True,
+                        precision=4,
+                        millify=True if not verbose else False,
+                    )
+                else:
+                    swap_cell = f"[{COLOR_PALETTE['STAKE']['NOT_REGISTERED']}]N/A[/{COLOR_PALETTE['STAKE']['NOT_REGISTERED']}]"
+
+                emission_value = substake_.emission.tao / (pool.tempo or 1)
+                emission_cell = format_cell(
+                    emission_value,
+                    prev.get("emission"),
+                    unit=symbol,
+                    unit_first_=unit_first,
+                    precision=4,
+                )
 
-            # Claimable amount cell
-            hotkey_ss58 = substake_.hotkey_ss58
-            claimable_amount = Balance.from_rao(0)
-            if (
-                hotkey_ss58 in claimable_amounts_
-                and netuid in claimable_amounts_[hotkey_ss58]
-            ):
-                claimable_amount = claimable_amounts_[hotkey_ss58][netuid]
+                tao_emission_value = substake_.tao_emission.tao / (pool.tempo or 1)
+                tao_emission_cell = format_cell(
+                    tao_emission_value,
+                    prev.get("tao_emission"),
+                    unit="τ",
+                    unit_first_=unit_first,
+                    precision=4,
+                )
 
-            current_data_[netuid]["claimable"] = claimable_amount.tao
+                subnet_name_cell = (
+                    f"[{COLOR_PALETTE['GENERAL']['SYMBOL']}]{symbol if netuid != 0 else 'τ'}[/{COLOR_PALETTE['GENERAL']['SYMBOL']}]"
+                    f" {get_subnet_name(dynamic_info_for_lt[netuid])}"
+                )
 
-            claimable_cell = format_cell(
-                claimable_amount.tao,
-                prev.get("claimable"),
-                unit=symbol,
-                unit_first_=unit_first,
-                precision=5,
-                millify=True if not verbose else False,
-            )
+                claimable_cell = format_cell(
+                    claimable_amount.tao,
+                    prev.get("claimable"),
+                    unit=symbol,
+                    unit_first_=unit_first,
+                    precision=5,
+                    millify=True if not verbose else False,
+                )
 
-            rows.append(
-                [
+                return [
                     str(netuid),  # Netuid
                     subnet_name_cell,
                     exchange_cell,  # Exchange value
@@ -468,6 +472,18 @@ async def stake_list(
                     tao_emission_cell,  # TAO emission rate
                     claimable_cell,  # Claimable amount
                 ]
+
+            # the row is only re-formatted if something it shows has changed
+            row_values = (
+                tuple(current_data_[netuid].items()),
+                tuple(prev.items()),
+                substake_.is_registered,
+                get_subnet_name(pool),
+            )
+            rows.append(
+                row_cache_.row(netuid, row_values, format_row)
+                if row_cache_ is not None
+                else format_row()
             )
 
         live_table = define_table(
@@ -480,19 +496,20 @@ async def stake_list(
         return live_table, current_data_
 
     # Main execution
-    block_hash = await subtensor.substrate.get_chain_head()
-    (
+    async with subtensor.at_block() as snapshot:
+        block_hash = snapshot.block_hash
         (
-            sub_stakes,
-            hotkey_identity_map,
-            dynamic_info,
-            claimable_amounts,
-        ),
-        balance,
-    ) = await asyncio.gather(
-        get_stake_data(block_hash),
-        subtensor.get_balance(coldkey_address, block_hash=block_hash),
-    )
+            (
+                sub_stakes,
+                hotkey_identity_map,
+                dynamic_info,
+                claimable_amounts,
+            ),
+            balance,
+        ) = await asyncio.gather(
+            get_stake_data(block_hash),
+            subtensor.get_balance(coldkey_address, block_hash=block_hash),
+        )
 
     # Iterate over substakes and aggregate them by hotkey.
     hotkeys_to_substakes: dict[str, list[StakeInfo]] = defaultdict(list)
@@ -525,43 +542,37 @@ async def stake_list(
 
         hotkey_name = format_hotkey_name(selected_hotkey, hotkey_identity_map)
 
-        refresh_interval = 10  # seconds
-        progress = Progress(
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(bar_width=20),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            console=console,
-        )
-        progress_task = progress.add_task("Updating: ", total=refresh_interval)
-
-        previous_block = None
-        current_block = None
         previous_data = None
+        row_cache = RowCache()
 
         with Live(console=console, auto_refresh=True) as live:
             try:
-                while True:
-                    block_hash = await subtensor.substrate.get_chain_head()
+                # the identities were just fetched
+                async for tick in follow_chain_heads(
+                    subtensor, refresh_slow_first=False
+                ):
                     (
                         sub_stakes,
-                        _hotkey_identity_map,
+                        hotkey_identity_map_live,
                         dynamic_info_,
                         claimable_amounts_live,
-                    ) = await get_stake_data(block_hash)
+                    ) = await get_stake_data(
+                        tick.block_hash, fetch_identities=tick.refresh_slow
+                    )
+                    if tick.refresh_slow:
+                        hotkey_name = format_hotkey_name(
+                            selected_hotkey, hotkey_identity_map_live
+                        )
                     selected_stakes = [
                         stake
                         for stake in sub_stakes
                         if stake.hotkey_ss58 == selected_hotkey
                     ]
 
-                    block_number = await subtensor.substrate.get_block_number(None)
-
-                    previous_block = current_block
-                    current_block = block_number
                     new_blocks = (
                         "N/A"
-                        if previous_block is None
-                        else str(current_block - previous_block)
+                        if tick.previous_block is None
+                        else str(tick.block_number - tick.previous_block)
                     )
 
                     table, current_data = create_live_table(
@@ -570,28 +581,22 @@ async def stake_list(
                         hotkey_name,
                         claimable_amounts_live,
                         previous_data,
+                        row_cache,
                     )
 
                     previous_data = current_data
-                    progress.reset(progress_task)
-                    start_time = asyncio.get_event_loop().time()
 
                     block_info = (
-                        f"Previous: [dark_sea_green]{previous_block}[/dark_sea_green] "
-                        f"Current: [dark_sea_green]{current_block}[/dark_sea_green] "
+                        f"Previous: [dark_sea_green]{tick.previous_block}[/dark_sea_green] "
+                        f"Current: [dark_sea_green]{tick.block_number}[/dark_sea_green] "
                         f"Diff: [dark_sea_green]{new_blocks}[/dark_sea_green]"
                     )
 
-                    message = f"\nLive stake view - Press [bold red]Ctrl+C[/bold red] to exit\n{block_info}"
-                    live_render = Group(message, progress, table)
-                    live.update(live_render)
-
-                    while not progress.finished:
-                        await asyncio.sleep(0.1)
-                        elapsed = asyncio.get_event_loop().time() - start_time
-                        progress.update(
-                            progress_task, completed=min(elapsed, refresh_interval)
-                        )
+                    message = (
+                        f"\nLive stake view, updated every block - Press [bold red]Ctrl+C[/bold red] to exit\n"
+                        f"{block_info}"
+                    )
+                    live.update(Group(message, table))
 
             except KeyboardInterrupt:
                 console.print("\n[bold]Stopped live updates[/bold]")
@@ -0,0 +1,119 @@
+"""
+Pricing of the rows of the stake add/remove preview tables.
+
+The targets of an operation are collected first, and then priced together, so that the preview's latency does not
+grow with the number of rows:
+- the extrinsic fee is fetched once per extrinsic type, from a single composed call. The fee of a call depends on its
+  weight, which is the same for every call of a given type, and on its encoded length, which only differs by a few
+  bytes between arguments.
+- the swap state of every subnet involved is read once, and each row's swap is simulated from it (see
+  `SubtensorInterface.get_swap_simulator`).
+The fee and swap state requests are made concurrently, as are the swaps which have to be passed on to the runtime API,
+with at most `MAX_CONCURRENT_REQUESTS` in flight at once.
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+from bittensor_wallet import Wallet
+
+from bittensor_cli.src.bittensor.balances import Balance
+from bittensor_cli.src.bittensor.chain_data import DynamicInfo, SimSwapResult
+from bittensor_cli.src.bittensor.utils import MAX_CONCURRENT_REQUESTS, gather_bounded
+
+if TYPE_CHECKING:
+    from bittensor_cli.src.bittensor.subtensor_interface import SubtensorInterface
+
+
+@dataclass
+class PreviewTarget:
+    """
+    A single row of a preview: the SubtensorModule extrinsic which would be submitted, and the swap it would make.
+    """
+
+    call_function: str
+    call_params: dict
+    origin_netuid: int
+    destination_netuid: int
+    # the amount to swap, in the origin subnet's token
+    amount: Balance
+    # whether the extrinsic fee is paid out of `amount`, before it is swapped
+    fee_from_amount: bool = False
+
+
+@dataclass
+class PreviewRow:
+    extrinsic_fee: Balance
+    sim_swap: SimSwapResult
+
+
+async def preview_stake_operations(
+    subtensor: "SubtensorInterface",
+    wallet: Wallet,
+    targets: list[PreviewTarget],
+    block_hash: Optional[str] = None,
+    dynamic_info: Optional[dict[int, DynamicInfo]] = None,
+    proxy: Optional[str] = None,
+    max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+) -> list[PreviewRow]:
+    """
+    Prices the rows of a stake operation preview.
+
+    :param subtensor: SubtensorInterface object
+    :param wallet: the wallet whose coldkey would sign the extrinsics
+    :param targets: the rows to price
+    :param block_hash: the hash of the block to read the swap state at
+    :param dynamic_info: the DynamicInfo of the subnets, by netuid, if already fetched at this block
+    :param proxy: the proxy the extrinsics would be submitted through, if any
+    :param max_concurrency: the maximum number of requests in flight at once
+
+    :return: one PreviewRow per target, in the same order
+    """
+    if not targets:
+        return []
+
+    # the first target of each extrinsic type serves as the template for that type's fee
+    templates: dict[str, dict] = {}
+    for target in targets:
+        templates.setdefault(target.call_function, target.call_params)
+
+    async def _fee(call_function: str, call_params: dict) -> Balance:
+        call = await subtensor.substrate.compose_call(
+            call_module="SubtensorModule",
+            call_function=call_function,
+            call_params=call_params,
+        )
+        return await subtensor.get_extrinsic_fee(call, wallet.coldkeypub, proxy=proxy)
+
+    netuids = {t.origin_netuid for t in targets} | {
+        t.destination_netuid for t in targets
+    }
+    swap_simulator, *fees = await gather_bounded(
+        [
+            subtensor.get_swap_simulator(
+                netuids, block_hash=block_hash, dynamic_info=dynamic_info
+            ),
+            *[_fee(fn, params) for fn, params in templates.items()],
+        ],
+        max_concurrency,
+    )
+    fee_by_type = dict(zip(templates, fees))
+
+    extrinsic_fees = [fee_by_type[target.call_function] for target in targets]
+    sim_swaps = await gather_bounded(
+        [
+            swap_simulator.sim_swap(
+                origin_netuid=target.origin_netuid,
+                destination_netuid=target.destination_netuid,
+                amount=(
+                    (target.amount - fee) if target.fee_from_amount else target.amount
+                ).rao,
+            )
+            for target, fee in zip(targets, extrinsic_fees)
+        ],
+        max_concurrency,
+    )
+    return [
+        PreviewRow(extrinsic_fee=fee, sim_swap=sim_swap)
+        for fee, sim_swap in zip(extrinsic_fees, sim_swaps)
+    ]
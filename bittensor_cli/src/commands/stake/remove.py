@@ -30,6 +30,10 @@ from bittensor_cli.src.bittensor.utils import (
     print_extrinsic_id,
     get_hotkey_identity_name,
 )
+from bittensor_cli.src.commands.stake.preview import (
+    PreviewTarget,
+    preview_stake_operations,
+)
 
 if TYPE_CHECKING:
     from bittensor_cli.src.bittensor.subtensor_interface import SubtensorInterface
@@ -112,7 +116,7 @@ async def unstake(
         netuids = (
             [int(netuid)]
             if netuid is not None
-            else await subtensor.get_all_subnet_netuids()
+            else await subtensor.get_all_subnet_netuids(block_hash=chain_head)
         )
         hotkeys_to_unstake_from = _get_hotkeys_to_unstake(
             wallet=wallet,
@@ -124,213 +128,229 @@ async def unstake(
             identities=ck_hk_identities,
         )
 
-    hotkeys_existence = await subtensor.do_hotkeys_exist(
-        [x[1] for x in hotkeys_to_unstake_from], block_hash=chain_head
-    )
-    hotkeys_to_unstake_from_that_exist = [
-        x for x in hotkeys_to_unstake_from if hotkeys_existence[x[1]] is True
-    ]
-    if not hotkeys_to_unstake_from_that_exist:
-        err_msg = "No keys existing on chain from which to unstake"
-        if json_output:
-            json_console.print_json(data={"success": False, "error": err_msg})
-        else:
-            print_error(err_msg)
-        return False
-
-    if hotkeys_to_unstake_from_that_exist != hotkeys_to_unstake_from:
-        difference = set(x[1] for x in hotkeys_to_unstake_from).symmetric_difference(
-            set(x[1] for x in hotkeys_to_unstake_from_that_exist)
-        )
-        sames = set(x[1] for x in hotkeys_to_unstake_from).intersection(
-            set(x[1] for x in hotkeys_to_unstake_from_that_exist)
-        )
-        msg = (
-            "Some hotkeys attempting to unstake are not present: "
-            + ", ".join(difference)
-            + ". Using hotkeys:\n"
-            + "\n".join(sames)
+    # Pin the rest of the preview to the block the stakes were read at, sharing repeated reads of it
+    async with subtensor.at_block(chain_head):
+        hotkeys_existence = await subtensor.do_hotkeys_exist(
+            [x[1] for x in hotkeys_to_unstake_from], block_hash=chain_head
         )
-        console.print(msg)
-        if prompt:
-            if not confirm_action("Do you want to continue?"):
-                return False
-    hotkeys_to_unstake_from = hotkeys_to_unstake_from_that_exist
+        hotkeys_to_unstake_from_that_exist = [
+            x for x in hotkeys_to_unstake_from if hotkeys_existence[x[1]] is True
+        ]
+        if not hotkeys_to_unstake_from_that_exist:
+            err_msg = "No keys existing on chain from which to unstake"
+            if json_output:
+                json_console.print_json(data={"success": False, "error": err_msg})
+            else:
+                print_error(err_msg)
+            return False
 
-    with console.status(
-        f"Retrieving stake data from {subtensor.network}...",
-        spinner="earth",
-    ):
-        stake_in_netuids = {}
-        for stake_info in stake_infos:
-            if stake_info.hotkey_ss58 not in stake_in_netuids:
-                stake_in_netuids[stake_info.hotkey_ss58] = {}
-            stake_in_netuids[stake_info.hotkey_ss58][stake_info.netuid] = (
-                stake_info.stake
+        if hotkeys_to_unstake_from_that_exist != hotkeys_to_unstake_from:
+            difference = set(
+                x[1] for x in hotkeys_to_unstake_from
+            ).symmetric_difference(
+                set(x[1] for x in hotkeys_to_unstake_from_that_exist)
             )
+            sames = set(x[1] for x in hotkeys_to_unstake_from).intersection(
+                set(x[1] for x in hotkeys_to_unstake_from_that_exist)
+            )
+            msg = (
+                "Some hotkeys attempting to unstake are not present: "
+                + ", ".join(difference)
+                + ". Using hotkeys:\n"
+                + "\n".join(sames)
+            )
+            console.print(msg)
+            if prompt:
+                if not confirm_action("Do you want to continue?"):
+                    return False
+        hotkeys_to_unstake_from = hotkeys_to_unstake_from_that_exist
 
-    # Flag to check if user wants to quit
-    skip_remaining_subnets = False
-    if len(netuids) > 1 and not amount:
-        console.print(
-            "[dark_sea_green3]Tip: Enter 'q' any time to stop going over "
-            "remaining subnets and process current unstakes.\n"
-        )
-
-    # Iterate over hotkeys and netuids to collect unstake operations
-    unstake_operations = []
-    total_received_amount = Balance.from_tao(0)
-    max_float_slippage = 0
-    table_rows = []
-    for hotkey in hotkeys_to_unstake_from:
-        if skip_remaining_subnets:
-            break
-
-        if interactive:
-            staking_address_name, staking_address_ss58, netuid = hotkey
-            netuids_to_process = [netuid]
-        else:
-            staking_address_name, staking_address_ss58, _ = hotkey
-            netuids_to_process = netuids
+        with console.status(
+            f"Retrieving stake data from {subtensor.network}...",
+            spinner="earth",
+        ):
+            stake_in_netuids = {}
+            for stake_info in stake_infos:
+                if stake_info.hotkey_ss58 not in stake_in_netuids:
+                    stake_in_netuids[stake_info.hotkey_ss58] = {}
+                stake_in_netuids[stake_info.hotkey_ss58][stake_info.netuid] = (
+                    stake_info.stake
+                )
 
-        initial_amount = amount
+        # Flag to check if user wants to quit
+        skip_remaining_subnets = False
+        if len(netuids) > 1 and not amount:
+            console.print(
+                "[dark_sea_green3]Tip: Enter 'q' any time to stop going over "
+                "remaining subnets and process current unstakes.\n"
+            )
 
-        for netuid in netuids_to_process:
+        # Iterate over hotkeys and netuids to collect unstake operations
+        unstake_operations = []
+        preview_targets = []
+        table_row_extensions = []
+        total_received_amount = Balance.from_tao(0)
+        max_float_slippage = 0
+        table_rows = []
+        for hotkey in hotkeys_to_unstake_from:
             if skip_remaining_subnets:
-                break  # Exit the loop over netuids
+                break
 
-            subnet_info = all_sn_dynamic_info.get(netuid)
-            if staking_address_ss58 not in stake_in_netuids:
-                print_error(
-                    f"No stake found for hotkey: {staking_address_ss58} on netuid: {netuid}"
-                )
-                continue  # Skip to next hotkey
+            if interactive:
+                staking_address_name, staking_address_ss58, netuid = hotkey
+                netuids_to_process = [netuid]
+            else:
+                staking_address_name, staking_address_ss58, _ = hotkey
+                netuids_to_process = netuids
 
-            current_stake_balance = stake_in_netuids[staking_address_ss58].get(netuid)
-            if current_stake_balance is None or current_stake_balance.tao == 0:
-                print_error(
-                    f"No stake to unstake from {staking_address_ss58} on netuid: {netuid}"
+            initial_amount = amount
+
+            for netuid in netuids_to_process:
+                if skip_remaining_subnets:
+                    break  # Exit the loop over netuids
+
+                subnet_info = all_sn_dynamic_info.get(netuid)
+                if staking_address_ss58 not in stake_in_netuids:
+                    print_error(
+                        f"No stake found for hotkey: {staking_address_ss58} on netuid: {netuid}"
+                    )
+                    continue  # Skip to next hotkey
+
+                current_stake_balance = stake_in_netuids[staking_address_ss58].get(
+                    netuid
                 )
-                continue  # No stake to unstake
+                if current_stake_balance is None or current_stake_balance.tao == 0:
+                    print_error(
+                        f"No stake to unstake from {staking_address_ss58} on netuid: {netuid}"
+                    )
+                    continue  # No stake to unstake
 
-            # Determine the amount we are unstaking.
-            if initial_amount:
-                amount_to_unstake_as_balance = Balance.from_tao(initial_amount)
-            else:
-                amount_to_unstake_as_balance = _ask_unstake_amount(
-                    current_stake_balance,
-                    netuid,
-                    staking_address_name
+                # Determine the amount we are unstaking.
+                if initial_amount:
+                    amount_to_unstake_as_balance = Balance.from_tao(initial_amount)
+                else:
+                    amount_to_unstake_as_balance = _ask_unstake_amount(
+                        current_stake_balance,
+                        netuid,
+                        staking_address_name
+                        if staking_address_name
+                        else staking_address_ss58,
+                        staking_address_ss58,
+                    )
+                    if amount_to_unstake_as_balance is None:
+                        skip_remaining_subnets = True
+                        break
+
+                # Check enough stake to remove.
+                amount_to_unstake_as_balance.set_unit(netuid)
+                if amount_to_unstake_as_balance > current_stake_balance:
+                    print_error(
+                        f"Not enough stake to remove:\n"
+                        f" Stake balance: [dark_orange]{current_stake_balance}[/dark_orange]"
+                        f" < Unstaking amount: [dark_orange]{amount_to_unstake_as_balance}[/dark_orange]"
+                        f" on netuid: {netuid}"
+                    )
+                    continue  # Skip to the next subnet - useful when single amount is specified for all subnets
+
+                try:
+                    current_price = subnet_info.price.tao
+                    if safe_staking:
+                        if subnet_info.is_dynamic:
+                            price_with_tolerance = current_price * (1 - rate_tolerance)
+                            rate_with_tolerance = price_with_tolerance
+                            price_limit = Balance.from_tao(
+                                rate_with_tolerance
+                            )  # Actual price to pass to extrinsic
+                        else:
+                            price_limit = Balance.from_rao(1)
+                        preview_target = _unstake_preview_target(
+                            "unstake_safe",
+                            hotkey_ss58=staking_address_ss58,
+                            amount=amount_to_unstake_as_balance,
+                            netuid=netuid,
+                            price_limit=price_limit,
+                            allow_partial_stake=allow_partial_stake,
+                        )
+                    else:
+                        preview_target = _unstake_preview_target(
+                            "unstake",
+                            hotkey_ss58=staking_address_ss58,
+                            netuid=netuid,
+                            amount=amount_to_unstake_as_balance,
+                        )
+                except ValueError:
+                    continue
+
+                base_unstake_op = {
+                    "netuid": netuid,
+                    "hotkey_name": staking_address_name
                     if staking_address_name
                     else staking_address_ss58,
-                    staking_address_ss58,
-                )
-                if amount_to_unstake_as_balance is None:
-                    skip_remaining_subnets = True
-                    break
-
-            # Check enough stake to remove.
-            amount_to_unstake_as_balance.set_unit(netuid)
-            if amount_to_unstake_as_balance > current_stake_balance:
-                print_error(
-                    f"Not enough stake to remove:\n"
-                    f" Stake balance: [dark_orange]{current_stake_balance}[/dark_orange]"
-                    f" < Unstaking amount: [dark_orange]{amount_to_unstake_as_balance}[/dark_orange]"
-                    f" on netuid: {netuid}"
-                )
-                continue  # Skip to the next subnet - useful when single amount is specified for all subnets
+                    "hotkey_ss58": staking_address_ss58,
+                    "amount_to_unstake": amount_to_unstake_as_balance,
+                    "current_stake_balance": current_stake_balance,
+                    "dynamic_info": subnet_info,
+                }
 
-            try:
-                current_price = subnet_info.price.tao
+                # Additional fields for safe unstaking
+                table_row_extension = []
                 if safe_staking:
                     if subnet_info.is_dynamic:
                         price_with_tolerance = current_price * (1 - rate_tolerance)
                         rate_with_tolerance = price_with_tolerance
-                        price_limit = Balance.from_tao(
+                        price_with_tolerance = Balance.from_tao(
                             rate_with_tolerance
-                        )  # Actual price to pass to extrinsic
+                        ).rao  # Actual price to pass to extrinsic
                     else:
-                        price_limit = Balance.from_rao(1)
-                    extrinsic_fee = await _get_extrinsic_fee(
-                        "unstake_safe",
-                        wallet,
-                        subtensor,
-                        hotkey_ss58=staking_address_ss58,
-                        amount=amount_to_unstake_as_balance,
-                        netuid=netuid,
-                        price_limit=price_limit,
-                        allow_partial_stake=allow_partial_stake,
-                        proxy=proxy,
-                    )
-                else:
-                    extrinsic_fee = await _get_extrinsic_fee(
-                        "unstake",
-                        wallet,
-                        subtensor,
-                        hotkey_ss58=staking_address_ss58,
-                        netuid=netuid,
-                        amount=amount_to_unstake_as_balance,
-                        proxy=proxy,
-                    )
-                sim_swap = await subtensor.sim_swap(
-                    netuid, 0, amount_to_unstake_as_balance.rao
-                )
-                received_amount = sim_swap.tao_amount
-                if not proxy:
-                    received_amount -= extrinsic_fee
-            except ValueError:
-                continue
-            total_received_amount += received_amount
-
-            base_unstake_op = {
-                "netuid": netuid,
-                "hotkey_name": staking_address_name
-                if staking_address_name
-                else staking_address_ss58,
-                "hotkey_ss58": staking_address_ss58,
-                "amount_to_unstake": amount_to_unstake_as_balance,
-                "current_stake_balance": current_stake_balance,
-                "received_amount": received_amount,
-                "dynamic_info": subnet_info,
-            }
-
-            base_table_row = [
-                str(netuid),  # Netuid
-                staking_address_name,  # Hotkey Name
-                str(amount_to_unstake_as_balance),  # Amount to Unstake
-                f"{subnet_info.price.tao:.6f}"
-                + f"(τ/{Balance.get_unit(netuid)})",  # Rate
-                str(sim_swap.alpha_fee),  # Fee
-                str(extrinsic_fee),  # Extrinsic fee
-                str(received_amount),  # Received Amount
-                # slippage_pct,  # Slippage Percent
-            ]
+                        rate_with_tolerance = 1
+                        price_with_tolerance = 1
 
-            # Additional fields for safe unstaking
-            if safe_staking:
-                if subnet_info.is_dynamic:
-                    price_with_tolerance = current_price * (1 - rate_tolerance)
-                    rate_with_tolerance = price_with_tolerance
-                    price_with_tolerance = Balance.from_tao(
-                        rate_with_tolerance
-                    ).rao  # Actual price to pass to extrinsic
-                else:
-                    rate_with_tolerance = 1
-                    price_with_tolerance = 1
-
-                base_unstake_op["price_with_tolerance"] = price_with_tolerance
-                base_table_row.extend(
-                    [
+                    base_unstake_op["price_with_tolerance"] = price_with_tolerance
+                    table_row_extension = [
                         # Rate with tolerance
                         f"{rate_with_tolerance:.6f} {Balance.get_unit(0)}/{Balance.get_unit(netuid)}",
                         # Partial unstake
                         f"[{'dark_sea_green3' if allow_partial_stake else 'red'}]"
                         f"{allow_partial_stake}[/{'dark_sea_green3' if allow_partial_stake else 'red'}]",
                     ]
-                )
 
-            unstake_operations.append(base_unstake_op)
-            table_rows.append(base_table_row)
+                unstake_operations.append(base_unstake_op)
+                preview_targets.append(preview_target)
+                table_row_extensions.append((staking_address_name, table_row_extension))
+
+        # price every unstake together, rather than one fee and swap request at a time
+        with console.status("Calculating fees...", spinner="earth"):
+            previews = await preview_stake_operations(
+                subtensor,
+                wallet,
+                preview_targets,
+                block_hash=chain_head,
+                dynamic_info=all_sn_dynamic_info,
+                proxy=proxy,
+            )
+    for op, (staking_address_name, table_row_extension), preview in zip(
+        unstake_operations, table_row_extensions, previews
+    ):
+        netuid = op["netuid"]
+        received_amount = preview.sim_swap.tao_amount
+        if not proxy:
+            received_amount -= preview.extrinsic_fee
+        total_received_amount += received_amount
+        op["received_amount"] = received_amount
+        table_rows.append(
+            [
+                str(netuid),  # Netuid
+                staking_address_name,  # Hotkey Name
+                str(op["amount_to_unstake"]),  # Amount to Unstake
+                f"{op['dynamic_info'].price.tao:.6f}"
+                + f"(τ/{Balance.get_unit(netuid)})",  # Rate
+                str(preview.sim_swap.alpha_fee),  # Fee
+                str(preview.extrinsic_fee),  # Extrinsic fee
+                str(received_amount),  # Received Amount
+                # slippage_pct,  # Slippage Percent
+            ]
+            + table_row_extension
+        )
 
     if not unstake_operations:
         console.print("[red]No unstake operations to perform.[/red]")
@@ -363,7 +383,7 @@ async def unstake(
     successes = []
 
     if use_batch:
-        # Batch path: compose all calls, submit as a single Utility.batch_all transaction
+        # Batch path: compose all calls, and submit them in as few Utility.batch_all transactions as fit
         with console.status(
             f"\n:satellite: Batching {total_ops} unstake operations..."
         ) as status:
@@ -404,77 +424,72 @@ async def unstake(
                         )
                     )
 
-            success, err_msg, response = await subtensor.sign_and_send_batch_extrinsic(
+            results = await subtensor.sign_and_send_batch_extrinsic(
                 calls=list(calls),
                 wallet=wallet,
                 era={"period": era},
                 proxy=proxy,
                 mev_protection=mev_protection,
                 block_hash=batch_block_hash,
+                status=status,
             )
 
-            if success and mev_protection:
-                inner_hash = err_msg
-                success, mev_error, response = await wait_for_extrinsic_by_hash(
-                    subtensor=subtensor,
-                    extrinsic_hash=inner_hash,
-                    submit_block_hash=response.block_hash,
-                    status=status,
+            # the batches succeed or fail independently, so each operation gets the outcome of its own batch
+            unstaked = []
+            for result in results:
+                ext_id = (
+                    await result.receipt.get_extrinsic_identifier()
+                    if result.success and result.receipt
+                    else None
                 )
-                if not success:
-                    err_msg = mev_error
-
-            ext_id = (
-                await response.get_extrinsic_identifier()
-                if success and response
-                else None
-            )
+                for op in unstake_operations[result.start : result.stop]:
+                    successes.append(
+                        {
+                            "netuid": op["netuid"],
+                            "hotkey_ss58": op["hotkey_ss58"],
+                            "unstake_amount": op["amount_to_unstake"].tao,
+                            "success": result.success,
+                            "extrinsic_identifier": ext_id,
+                        }
+                    )
+                    if result.success:
+                        unstaked.append(op)
+                if not result.success:
+                    print_error(
+                        f":cross_mark: [red]Batch unstaking failed[/red] for operations "
+                        f"{result.start + 1} to {result.stop} of {total_ops}: {result.message}",
+                        status=status,
+                    )
+                elif not json_output:
+                    await print_extrinsic_id(result.receipt)
 
-            for op in unstake_operations:
-                successes.append(
-                    {
-                        "netuid": op["netuid"],
-                        "hotkey_ss58": op["hotkey_ss58"],
-                        "unstake_amount": op["amount_to_unstake"].tao,
-                        "success": success,
-                        "extrinsic_identifier": ext_id,
-                    }
+            if unstaked and not json_output:
+                new_block_hash = await subtensor.substrate.get_chain_head()
+                new_balance = await subtensor.get_balance(
+                    coldkey_ss58, block_hash=new_block_hash
                 )
-
-            if success:
-                if not json_output:
-                    await print_extrinsic_id(response)
-                    new_block_hash = await subtensor.substrate.get_chain_head()
-                    new_balance = await subtensor.get_balance(
-                        coldkey_ss58, block_hash=new_block_hash
-                    )
-                    print_success(
-                        f"Batch finalized. Unstaked across {total_ops} operations."
+                print_success(
+                    f"Batch finalized. Unstaked across {len(unstaked)} of {total_ops} operations."
+                )
+                console.print(
+                    f"Balance:\n  [blue]{current_balance}[/blue] :arrow_right: "
+                    f"[{COLOR_PALETTE.S.AMOUNT}]{new_balance}"
+                )
+                for op in unstaked:
+                    new_stake = await subtensor.get_stake(
+                        hotkey_ss58=op["hotkey_ss58"],
+                        coldkey_ss58=coldkey_ss58,
+                        netuid=op["netuid"],
+                        block_hash=new_block_hash,
                     )
                     console.print(
-                        f"Balance:\n  [blue]{current_balance}[/blue] :arrow_right: "
-                        f"[{COLOR_PALETTE.S.AMOUNT}]{new_balance}"
+                        f"Subnet: [{COLOR_PALETTE.G.SUBHEAD}]{op['netuid']}"
+                        f"[/{COLOR_PALETTE.G.SUBHEAD}] "
+                        f"Hotkey: [{COLOR_PALETTE.G.HK}]{op['hotkey_ss58']}"
+                        f"[/{COLOR_PALETTE.G.HK}] "
+                        f"Stake:\n  [blue]{op['current_stake_balance']}[/blue] "
+                        f":arrow_right: [{COLOR_PALETTE.S.AMOUNT}]{new_stake}"
                     )
-                    for op in unstake_operations:
-                        new_stake = await subtensor.get_stake(
-                            hotkey_ss58=op["hotkey_ss58"],
-                            coldkey_ss58=coldkey_ss58,
-                            netuid=op["netuid"],
-                            block_hash=new_block_hash,
-                        )
-                        console.print(
-                            f"Subnet: [{COLOR_PALETTE.G.SUBHEAD}]{op['netuid']}"
-                            f"[/{COLOR_PALETTE.G.SUBHEAD}] "
-                            f"Hotkey: [{COLOR_PALETTE.G.HK}]{op['hotkey_ss58']}"
-                            f"[/{COLOR_PALETTE.G.HK}] "
-                            f"Stake:\n  [blue]{op['current_stake_balance']}[/blue] "
-                            f":arrow_right: [{COLOR_PALETTE.S.AMOUNT}]{new_stake}"
-                        )
-            else:
-                print_error(
-                    f":cross_mark: [red]Batch unstaking failed[/red]: {err_msg}",
-                    status=status,
-                )
     else:
         # Single operation path: use the existing per-operation extrinsics
         with console.status(
@@ -544,165 +559,173 @@ async def unstake_all(
     include_hotkeys = include_hotkeys or []
     exclude_hotkeys = exclude_hotkeys or []
     coldkey_ss58 = proxy or wallet.coldkeypub.ss58_address
-    block_hash = await subtensor.substrate.get_chain_head()
-    with console.status(
-        f"Retrieving stake information & identities from {subtensor.network}...",
-        spinner="earth",
-    ):
-        (
-            stake_info,
-            ck_hk_identities,
-            all_sn_dynamic_info_,
-            current_wallet_balance,
-        ) = await asyncio.gather(
-            subtensor.get_stake_for_coldkey(coldkey_ss58, block_hash=block_hash),
-            subtensor.fetch_coldkey_hotkey_identities(block_hash=block_hash),
-            subtensor.all_subnets(block_hash=block_hash),
-            subtensor.get_balance(coldkey_ss58, block_hash=block_hash),
-        )
-
-        if all_hotkeys:
-            hotkeys = _get_hotkeys_to_unstake(
-                wallet,
-                hotkey_ss58_address=hotkey_ss58_address,
-                all_hotkeys=all_hotkeys,
-                include_hotkeys=include_hotkeys,
-                exclude_hotkeys=exclude_hotkeys,
-                stake_infos=stake_info,
-                identities=ck_hk_identities,
+    # Pin every read of the preview to a single block, sharing repeated reads of it
+    async with subtensor.at_block() as snapshot:
+        block_hash = snapshot.block_hash
+        with console.status(
+            f"Retrieving stake information & identities from {subtensor.network}...",
+            spinner="earth",
+        ):
+            (
+                stake_info,
+                ck_hk_identities,
+                all_sn_dynamic_info_,
+                current_wallet_balance,
+            ) = await asyncio.gather(
+                subtensor.get_stake_for_coldkey(coldkey_ss58, block_hash=block_hash),
+                subtensor.fetch_coldkey_hotkey_identities(block_hash=block_hash),
+                subtensor.all_subnets(block_hash=block_hash),
+                subtensor.get_balance(coldkey_ss58, block_hash=block_hash),
             )
-        elif not hotkey_ss58_address:
-            hotkeys = [(wallet.hotkey_str, get_hotkey_pub_ss58(wallet), None)]
-        else:
-            hotkeys = [(None, hotkey_ss58_address, None)]
 
-        hotkeys_existence = await subtensor.do_hotkeys_exist(
-            [x[1] for x in hotkeys], block_hash=block_hash
-        )
-
-    hotkeys_to_unstake_from_that_exist = [
-        x for x in hotkeys if hotkeys_existence[x[1]] is True
-    ]
-    if not hotkeys_to_unstake_from_that_exist:
-        err_msg = "No keys existing on chain from which to unstake"
-        if json_output:
-            json_console.print_json(data={"success": False, "error": err_msg})
-        else:
-            print_error(err_msg)
-        return None
-
-    if hotkeys_to_unstake_from_that_exist != hotkeys:
-        difference = set(x[1] for x in hotkeys).symmetric_difference(
-            set(x[1] for x in hotkeys_to_unstake_from_that_exist)
-        )
-        sames = set(x[1] for x in hotkeys).intersection(
-            set(x[1] for x in hotkeys_to_unstake_from_that_exist)
-        )
-        msg = (
-            "Some hotkeys attempting to unstake are not present: "
-            + ", ".join(difference)
-            + ". Using hotkeys:\n"
-            + "\n".join(sames)
-        )
-        console.print(msg)
-        if prompt:
-            if not confirm_action("Do you want to continue?"):
-                return None
-    hotkeys = hotkeys_to_unstake_from_that_exist
+            if all_hotkeys:
+                hotkeys = _get_hotkeys_to_unstake(
+                    wallet,
+                    hotkey_ss58_address=hotkey_ss58_address,
+                    all_hotkeys=all_hotkeys,
+                    include_hotkeys=include_hotkeys,
+                    exclude_hotkeys=exclude_hotkeys,
+                    stake_infos=stake_info,
+                    identities=ck_hk_identities,
+                )
+            elif not hotkey_ss58_address:
+                hotkeys = [(wallet.hotkey_str, get_hotkey_pub_ss58(wallet), None)]
+            else:
+                hotkeys = [(None, hotkey_ss58_address, None)]
 
-    hotkey_names = {ss58: name for name, ss58, _ in hotkeys if name is not None}
-    hotkey_ss58s = [item[1] for item in hotkeys]
-    stake_info = [stake for stake in stake_info if stake.hotkey_ss58 in hotkey_ss58s]
+            hotkeys_existence = await subtensor.do_hotkeys_exist(
+                [x[1] for x in hotkeys], block_hash=block_hash
+            )
 
-    if unstake_all_alpha:
-        stake_info = [stake for stake in stake_info if stake.netuid != 0]
+        hotkeys_to_unstake_from_that_exist = [
+            x for x in hotkeys if hotkeys_existence[x[1]] is True
+        ]
+        if not hotkeys_to_unstake_from_that_exist:
+            err_msg = "No keys existing on chain from which to unstake"
+            if json_output:
+                json_console.print_json(data={"success": False, "error": err_msg})
+            else:
+                print_error(err_msg)
+            return None
 
-    if not stake_info:
-        console.print("[red]No stakes found to unstake[/red]")
-        return
+        if hotkeys_to_unstake_from_that_exist != hotkeys:
+            difference = set(x[1] for x in hotkeys).symmetric_difference(
+                set(x[1] for x in hotkeys_to_unstake_from_that_exist)
+            )
+            sames = set(x[1] for x in hotkeys).intersection(
+                set(x[1] for x in hotkeys_to_unstake_from_that_exist)
+            )
+            msg = (
+                "Some hotkeys attempting to unstake are not present: "
+                + ", ".join(difference)
+                + ". Using hotkeys:\n"
+                + "\n".join(sames)
+            )
+            console.print(msg)
+            if prompt:
+                if not confirm_action("Do you want to continue?"):
+                    return None
+        hotkeys = hotkeys_to_unstake_from_that_exist
+
+        hotkey_names = {ss58: name for name, ss58, _ in hotkeys if name is not None}
+        hotkey_ss58s = [item[1] for item in hotkeys]
+        stake_info = [
+            stake for stake in stake_info if stake.hotkey_ss58 in hotkey_ss58s
+        ]
 
-    all_sn_dynamic_info = {info.netuid: info for info in all_sn_dynamic_info_}
+        if unstake_all_alpha:
+            stake_info = [stake for stake in stake_info if stake.netuid != 0]
 
-    # Create table for unstaking all
-    table_title = (
-        "Unstaking Summary - All Stakes"
-        if not unstake_all_alpha
-        else "Unstaking Summary - All Alpha Stakes"
-    )
-    table = create_table(
-        title=(
-            f"\n[{COLOR_PALETTE.G.HEADER}]{table_title}[/{COLOR_PALETTE.G.HEADER}]\n"
-            f"Wallet: [{COLOR_PALETTE.G.COLDKEY}]{wallet.name}[/{COLOR_PALETTE.G.COLDKEY}], "
-            f"Coldkey ss58: [{COLOR_PALETTE.G.CK}]{coldkey_ss58}[/{COLOR_PALETTE.G.CK}]\n"
-            f"Network: [{COLOR_PALETTE.G.HEADER}]{subtensor.network}[/{COLOR_PALETTE.G.HEADER}]\n"
-        ),
-    )
-    table.add_column("Netuid", justify="center", style="grey89")
-    table.add_column(
-        "Hotkey", justify="center", style=COLOR_PALETTE["GENERAL"]["HOTKEY"]
-    )
-    table.add_column(
-        f"Current Stake ({Balance.get_unit(1)})",
-        justify="center",
-        style=COLOR_PALETTE["STAKE"]["STAKE_ALPHA"],
-    )
-    table.add_column(
-        f"Rate ({Balance.unit}/{Balance.get_unit(1)})",
-        justify="center",
-        style=COLOR_PALETTE["POOLS"]["RATE"],
-    )
-    table.add_column(
-        f"Fee ({Balance.get_unit(1)})",
-        justify="center",
-        style=COLOR_PALETTE["STAKE"]["STAKE_AMOUNT"],
-    )
-    table.add_column(
-        "Extrinsic Fee (τ)",
-        justify="center",
-        style=COLOR_PALETTE.STAKE.TAO,
-    )
-    table.add_column(
-        f"Received ({Balance.unit})",
-        justify="center",
-        style=COLOR_PALETTE["POOLS"]["TAO_EQUIV"],
-    )
-    # table.add_column(
-    #     "Slippage",
-    #     justify="center",
-    #     style=COLOR_PALETTE["STAKE"]["SLIPPAGE_PERCENT"],
-    # )
+        if not stake_info:
+            console.print("[red]No stakes found to unstake[/red]")
+            return
 
-    # Calculate total received
-    total_received_value = Balance(0)
-    for stake in stake_info:
-        if stake.stake.rao == 0:
-            continue
+        all_sn_dynamic_info = {info.netuid: info for info in all_sn_dynamic_info_}
 
+        # Create table for unstaking all
+        table_title = (
+            "Unstaking Summary - All Stakes"
+            if not unstake_all_alpha
+            else "Unstaking Summary - All Alpha Stakes"
+        )
+        table = create_table(
+            title=(
+                f"\n[{COLOR_PALETTE.G.HEADER}]{table_title}[/{COLOR_PALETTE.G.HEADER}]\n"
+                f"Wallet: [{COLOR_PALETTE.G.COLDKEY}]{wallet.name}[/{COLOR_PALETTE.G.COLDKEY}], "
+                f"Coldkey ss58: [{COLOR_PALETTE.G.CK}]{coldkey_ss58}[/{COLOR_PALETTE.G.CK}]\n"
+                f"Network: [{COLOR_PALETTE.G.HEADER}]{subtensor.network}[/{COLOR_PALETTE.G.HEADER}]\n"
+            ),
+        )
+        table.add_column("Netuid", justify="center", style="grey89")
+        table.add_column(
+            "Hotkey", justify="center", style=COLOR_PALETTE["GENERAL"]["HOTKEY"]
+        )
+        table.add_column(
+            f"Current Stake ({Balance.get_unit(1)})",
+            justify="center",
+            style=COLOR_PALETTE["STAKE"]["STAKE_ALPHA"],
+        )
+        table.add_column(
+            f"Rate ({Balance.unit}/{Balance.get_unit(1)})",
+            justify="center",
+            style=COLOR_PALETTE["POOLS"]["RATE"],
+        )
+        table.add_column(
+            f"Fee ({Balance.get_unit(1)})",
+            justify="center",
+            style=COLOR_PALETTE["STAKE"]["STAKE_AMOUNT"],
+        )
+        table.add_column(
+            "Extrinsic Fee (τ)",
+            justify="center",
+            style=COLOR_PALETTE.STAKE.TAO,
+        )
+        table.add_column(
+            f"Received ({Balance.unit})",
+            justify="center",
+            style=COLOR_PALETTE["POOLS"]["TAO_EQUIV"],
+        )
+        # table.add_column(
+        #     "Slippage",
+        #     justify="center",
+        #     style=COLOR_PALETTE["STAKE"]["SLIPPAGE_PERCENT"],
+        # )
+
+        # Calculate total received
+        total_received_value = Balance(0)
+        extrinsic_type = "unstake_all" if not unstake_all_alpha else "unstake_all_alpha"
+        stakes_to_preview = [
+            stake
+            for stake in stake_info
+            if stake.stake.rao != 0 and stake.netuid in all_sn_dynamic_info
+        ]
+        # price every stake together, rather than one fee and swap request at a time
+        previews = await preview_stake_operations(
+            subtensor,
+            wallet,
+            [
+                _unstake_preview_target(
+                    extrinsic_type,
+                    hotkey_ss58=stake.hotkey_ss58,
+                    netuid=stake.netuid,
+                    amount=stake.stake,
+                )
+                for stake in stakes_to_preview
+            ],
+            block_hash=block_hash,
+            dynamic_info=all_sn_dynamic_info,
+            proxy=proxy,
+        )
+    for stake, preview in zip(stakes_to_preview, previews):
         hotkey_display = hotkey_names.get(stake.hotkey_ss58, stake.hotkey_ss58)
-        subnet_info = all_sn_dynamic_info.get(stake.netuid)
+        subnet_info = all_sn_dynamic_info[stake.netuid]
         stake_amount = stake.stake
+        received_amount = preview.sim_swap.tao_amount
+        if not proxy:
+            received_amount -= preview.extrinsic_fee
 
-        try:
-            _ = subnet_info.price.tao
-            extrinsic_type = (
-                "unstake_all" if not unstake_all_alpha else "unstake_all_alpha"
-            )
-            extrinsic_fee = await _get_extrinsic_fee(
-                extrinsic_type,
-                wallet,
-                subtensor,
-                hotkey_ss58=stake.hotkey_ss58,
-                proxy=proxy,
-            )
-            sim_swap = await subtensor.sim_swap(stake.netuid, 0, stake_amount.rao)
-            received_amount = sim_swap.tao_amount
-            if not proxy:
-                received_amount -= extrinsic_fee
-
-            if received_amount < Balance.from_tao(0):
-                print_error("Not enough Alpha to pay the transaction fee.")
-                continue
-        except (AttributeError, ValueError):
+        if received_amount < Balance.from_tao(0):
+            print_error("Not enough Alpha to pay the transaction fee.")
             continue
 
         total_received_value += received_amount
@@ -713,8 +736,8 @@ async def unstake_all(
             str(stake_amount),
             f"{float(subnet_info.price):.6f}"
             + f"({Balance.get_unit(0)}/{Balance.get_unit(stake.netuid)})",
-            str(sim_swap.alpha_fee),
-            str(extrinsic_fee),
+            str(preview.sim_swap.alpha_fee),
+            str(preview.extrinsic_fee),
             str(received_amount),
         )
     console.print(table)
@@ -736,7 +759,7 @@ async def unstake_all(
     use_batch = len(hotkey_ss58s) > 1
 
     if use_batch:
-        # Batch path: compose unstake_all calls for all hotkeys into one transaction
+        # Batch path: compose unstake_all calls for all hotkeys into as few transactions as fit
         with console.status(
             f"Batching unstake-all for {len(hotkey_ss58s)} hotkeys..."
         ) as status:
@@ -754,40 +777,40 @@ async def unstake_all(
                     )
                 )
 
-            success, err_msg, response = await subtensor.sign_and_send_batch_extrinsic(
+            results = await subtensor.sign_and_send_batch_extrinsic(
                 calls=list(calls),
                 wallet=wallet,
                 era={"period": era},
                 proxy=proxy,
                 mev_protection=mev_protection,
                 block_hash=batch_block_hash,
+                status=status,
             )
 
-            if success and mev_protection:
-                inner_hash = err_msg
-                success, mev_error, response = await wait_for_extrinsic_by_hash(
-                    subtensor=subtensor,
-                    extrinsic_hash=inner_hash,
-                    submit_block_hash=response.block_hash,
-                    status=status,
+            # the batches succeed or fail independently, so each hotkey gets the outcome of its own batch
+            n_unstaked = 0
+            for result in results:
+                ext_id = (
+                    await result.receipt.get_extrinsic_identifier()
+                    if result.success and result.receipt
+                    else None
                 )
-                if not success:
-                    err_msg = mev_error
-
-            ext_id = (
-                await response.get_extrinsic_identifier()
-                if success and response
-                else None
-            )
-
-            for hk in hotkey_ss58s:
-                successes[hk] = {
-                    "success": success,
-                    "extrinsic_identifier": ext_id,
-                }
+                for hk in hotkey_ss58s[result.start : result.stop]:
+                    successes[hk] = {
+                        "success": result.success,
+                        "extrinsic_identifier": ext_id,
+                    }
+                if result.success:
+                    n_unstaked += result.stop - result.start
+                    await print_extrinsic_id(result.receipt)
+                else:
+                    print_error(
+                        f":cross_mark: [red]Batch unstake-all failed[/red] for hotkeys "
+                        f"{result.start + 1} to {result.stop} of {len(hotkey_ss58s)}: {result.message}",
+                        status=status,
+                    )
 
-            if success:
-                await print_extrinsic_id(response)
+            if n_unstaked:
                 msg_modifier = "Alpha " if unstake_all_alpha else ""
                 new_block_hash = await subtensor.substrate.get_chain_head()
                 new_balance = await subtensor.get_balance(
@@ -795,17 +818,12 @@ async def unstake_all(
                 )
                 print_success(
                     f"Batch finalized. Unstaked all {msg_modifier}stakes "
-                    f"from {len(hotkey_ss58s)} hotkeys."
+                    f"from {n_unstaked} of {len(hotkey_ss58s)} hotkeys."
                 )
                 console.print(
                     f"Balance:\n  [blue]{current_wallet_balance}[/blue] "
                     f":arrow_right: [{COLOR_PALETTE.S.AMOUNT}]{new_balance}"
                 )
-            else:
-                print_error(
-                    f":cross_mark: [red]Batch unstake-all failed[/red]: {err_msg}",
-                    status=status,
-                )
     else:
         # Single hotkey path: use existing per-hotkey extrinsic
         with console.status("Unstaking all stakes...") as status:
@@ -1190,24 +1208,19 @@ async def _unstake_all_extrinsic(
         return False, None
 
 
-async def _get_extrinsic_fee(
+def _unstake_preview_target(
     _type: str,
-    wallet: Wallet,
-    subtensor: "SubtensorInterface",
     hotkey_ss58: str,
-    netuid: Optional[int] = None,
-    amount: Optional[Balance] = None,
+    netuid: int,
+    amount: Balance,
     price_limit: Optional[Balance] = None,
     allow_partial_stake: bool = False,
-    proxy: Optional[str] = None,
-) -> Balance:
+) -> PreviewTarget:
     """
-    Retrieves the extrinsic fee for a given unstaking call.
+    Builds the preview target of a given unstaking call, for pricing its extrinsic fee and swap.
     Args:
         _type: 'unstake', 'unstake_safe', 'unstake_all', 'unstake_all_alpha' depending on the specific
             extrinsic to be called
-        wallet: Wallet object
-        subtensor: SubtensorInterface object
         hotkey_ss58: the hotkey ss58 to unstake from
         netuid: the netuid from which to remove the stake
         amount: the amount of stake to remove
@@ -1215,7 +1228,7 @@ async def _get_extrinsic_fee(
         allow_partial_stake: whether to allow partial unstaking
 
     Returns:
-        Balance object representing the extrinsic fee.
+        PreviewTarget of the unstaking call.
     """
     lookup_table = {
         "unstake": lambda: (
@@ -1240,15 +1253,15 @@ async def _get_extrinsic_fee(
         "unstake_all_alpha": lambda: ("unstake_all_alpha", {"hotkey": hotkey_ss58}),
     }
     call_fn, call_params = lookup_table[_type]()
-    call = await subtensor.substrate.compose_call(
-        call_module="SubtensorModule",
+    return PreviewTarget(
         call_function=call_fn,
         call_params=call_params,
+        origin_netuid=netuid,
+        destination_netuid=0,
+        amount=amount,
     )
-    return await subtensor.get_extrinsic_fee(call, wallet.coldkeypub, proxy=proxy)
 
 
-# Helpers
 async def _unstake_selection(
     dynamic_info,
     identities,
@@ -16,7 +16,7 @@ from bittensor_cli.src.bittensor.utils import (
     get_subnet_name,
     print_error,
     json_console,
-    jinja_env,
+    get_jinja_env,
 )
 
 if TYPE_CHECKING:
@@ -305,7 +305,7 @@ def _generate_html_single_subnet(
 
     fig_json = fig.to_json()
 
-    template = jinja_env.get_template("price-single.j2")
+    template = get_jinja_env().get_template("price-single.j2")
     html_content = template.render(
         fig_json=fig_json,
         stats=stats,
@@ -538,7 +538,7 @@ def _generate_html_multi_subnet(
 
     fig_json = fig.to_json()
 
-    template = jinja_env.get_template("price-multi.j2")
+    template = get_jinja_env().get_template("price-multi.j2")
     html_content = template.render(
         title=title,
         # We sort netuids by market cap but for buttons, they are ordered by netuid
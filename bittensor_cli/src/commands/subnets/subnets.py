@@ -4,11 +4,9 @@ import sqlite3
 from typing import TYPE_CHECKING, Optional, cast
 
 from async_substrate_interface import AsyncExtrinsicReceipt
-from async_substrate_interface.utils.storage import StorageKey
 from bittensor_wallet import Wallet
 from rich.prompt import Prompt
 from rich.console import Group
-from rich.progress import Progress, BarColumn, TextColumn
 from rich.table import Column, Table
 from rich import box
 
@@ -22,6 +20,7 @@ from bittensor_cli.src.bittensor.extrinsics.mev_shield import (
     wait_for_extrinsic_by_hash,
 )
 from rich.live import Live
+from bittensor_cli.src.bittensor.live import RowCache, follow_chain_heads
 from bittensor_cli.src.bittensor.minigraph import MiniGraph
 from bittensor_cli.src.commands.wallets import set_id, get_id
 from bittensor_cli.src.bittensor.utils import (
@@ -315,12 +314,24 @@ async def subnets_list(
 ):
     """List all subnet netuids in the network."""
 
-    async def fetch_subnet_data():
-        block_hash = await subtensor.substrate.get_chain_head()
+    async def fetch_subnet_data(
+        block_hash: Optional[str] = None,
+        block_number: Optional[int] = None,
+        mechanisms: Optional[dict[int, int]] = None,
+    ):
+        """
+        Fetches the subnets at the chain head, or at the given block. The block's number and the subnet mechanisms
+        are only fetched if not given.
+        """
+        block_hash = block_hash or await subtensor.substrate.get_chain_head()
         subnets_, mechanisms, block_number_, ema_tao_inflow = await asyncio.gather(
             subtensor.all_subnets(block_hash=block_hash),
-            subtensor.get_all_subnet_mechanisms(block_hash=block_hash),
-            subtensor.substrate.get_block_number(block_hash=block_hash),
+            subtensor.get_all_subnet_mechanisms(block_hash=block_hash)
+            if mechanisms is None
+            else asyncio.sleep(0, result=mechanisms),
+            subtensor.substrate.get_block_number(block_hash=block_hash)
+            if block_number is None
+            else asyncio.sleep(0, result=block_number),
             subtensor.get_all_subnet_ema_tao_inflow(block_hash=block_hash),
         )
 
@@ -618,7 +629,12 @@ async def subnets_list(
 
     # Live mode
     def create_table_live(
-        subnets_, previous_data_, block_number_, mechanisms, ema_tao_inflow
+        subnets_,
+        previous_data_,
+        block_number_,
+        mechanisms,
+        ema_tao_inflow,
+        row_cache_: Optional[RowCache] = None,
     ):
         def format_cell(
             value, previous_value, unit="", unit_first=False, precision=4, millify=False
@@ -755,111 +771,115 @@ async def subnets_list(
             }
             prev = previous_data_.get(netuid, {}) if previous_data_ else {}
 
-            # Prepare cells
-            if netuid == 0:
-                unit_first = True
-            else:
-                unit_first = False
-
-            netuid_cell = str(netuid)
-            subnet_name_cell = (
-                f"[{COLOR_PALETTE['GENERAL']['SYMBOL']}]{subnet.symbol if netuid != 0 else 'τ'}[/{COLOR_PALETTE['GENERAL']['SYMBOL']}]"
-                f" {get_subnet_name(subnet)}"
-            )
-            emission_cell = format_cell(
-                emission_tao,
-                prev.get("emission_tao"),
-                unit="τ",
-                unit_first=True,
-                precision=4,
-            )
+            def format_row() -> tuple:
+                # Prepare cells
+                if netuid == 0:
+                    unit_first = True
+                else:
+                    unit_first = False
 
-            tao_flow_ema_cell = format_cell(
-                tao_flow_ema,
-                prev.get("tao_flow_ema"),
-                unit="τ",
-                unit_first=True,
-                precision=4,
-            )
+                netuid_cell = str(netuid)
+                subnet_name_cell = (
+                    f"[{COLOR_PALETTE['GENERAL']['SYMBOL']}]{subnet.symbol if netuid != 0 else 'τ'}[/{COLOR_PALETTE['GENERAL']['SYMBOL']}]"
+                    f" {get_subnet_name(subnet)}"
+                )
+                emission_cell = format_cell(
+                    emission_tao,
+                    prev.get("emission_tao"),
+                    unit="τ",
+                    unit_first=True,
+                    precision=4,
+                )
 
-            price_cell = format_cell(
-                subnet.price.tao,
-                prev.get("price"),
-                unit=f"τ/{symbol}",
-                precision=4,
-                millify=False,
-            )
+                tao_flow_ema_cell = format_cell(
+                    tao_flow_ema,
+                    prev.get("tao_flow_ema"),
+                    unit="τ",
+                    unit_first=True,
+                    precision=4,
+                )
 
-            alpha_out_cell = format_cell(
-                subnet.alpha_out.tao,
-                prev.get("alpha_out"),
-                unit=f"{symbol}",
-                unit_first=unit_first,
-                precision=5,
-                millify=True if not verbose else False,
-            )
-            liquidity_cell = (
-                format_liquidity_cell(
-                    subnet.tao_in.tao,
-                    subnet.alpha_in.tao,
-                    prev.get("tao_in"),
-                    prev.get("alpha_in"),
-                    symbol,
+                price_cell = format_cell(
+                    subnet.price.tao,
+                    prev.get("price"),
+                    unit=f"τ/{symbol}",
                     precision=4,
-                    millify=not verbose,
-                    netuid=netuid,
+                    millify=False,
                 )
-                if netuid != 0
-                else "-, -"
-            )
 
-            market_cap_cell = format_cell(
-                market_cap,
-                prev.get("market_cap"),
-                unit="τ",
-                unit_first=True,
-                precision=4,
-                millify=True if not verbose else False,
-            )
+                alpha_out_cell = format_cell(
+                    subnet.alpha_out.tao,
+                    prev.get("alpha_out"),
+                    unit=f"{symbol}",
+                    unit_first=unit_first,
+                    precision=5,
+                    millify=True if not verbose else False,
+                )
+                liquidity_cell = (
+                    format_liquidity_cell(
+                        subnet.tao_in.tao,
+                        subnet.alpha_in.tao,
+                        prev.get("tao_in"),
+                        prev.get("alpha_in"),
+                        symbol,
+                        precision=4,
+                        millify=not verbose,
+                        netuid=netuid,
+                    )
+                    if netuid != 0
+                    else "-, -"
+                )
 
-            # Supply cell
-            supply_cell = format_cell(
-                supply,
-                prev.get("supply"),
-                unit=f"{symbol} [#806DAF]/21M",
-                unit_first=False,
-                precision=2,
-                millify=True if not verbose else False,
-            )
+                market_cap_cell = format_cell(
+                    market_cap,
+                    prev.get("market_cap"),
+                    unit="τ",
+                    unit_first=True,
+                    precision=4,
+                    millify=True if not verbose else False,
+                )
 
-            # Tempo cell
-            prev_blocks_since_last_step = prev.get("blocks_since_last_step")
-            if prev_blocks_since_last_step is not None:
-                if subnet.blocks_since_last_step >= prev_blocks_since_last_step:
-                    block_change = (
-                        subnet.blocks_since_last_step - prev_blocks_since_last_step
-                    )
-                else:
-                    # Tempo restarted
-                    block_change = (
-                        subnet.blocks_since_last_step + subnet.tempo + 1
-                    ) - prev_blocks_since_last_step
-                if block_change > 0:
-                    block_change_text = f" [pale_green3](+{block_change})[/pale_green3]"
-                elif block_change < 0:
-                    block_change_text = f" [hot_pink3]({block_change})[/hot_pink3]"
+                # Supply cell
+                supply_cell = format_cell(
+                    supply,
+                    prev.get("supply"),
+                    unit=f"{symbol} [#806DAF]/21M",
+                    unit_first=False,
+                    precision=2,
+                    millify=True if not verbose else False,
+                )
+
+                # Tempo cell
+                prev_blocks_since_last_step = prev.get("blocks_since_last_step")
+                if prev_blocks_since_last_step is not None:
+                    if subnet.blocks_since_last_step >= prev_blocks_since_last_step:
+                        block_change = (
+                            subnet.blocks_since_last_step - prev_blocks_since_last_step
+                        )
+                    else:
+                        # Tempo restarted
+                        block_change = (
+                            subnet.blocks_since_last_step + subnet.tempo + 1
+                        ) - prev_blocks_since_last_step
+                    if block_change > 0:
+                        block_change_text = (
+                            f" [pale_green3](+{block_change})[/pale_green3]"
+                        )
+                    elif block_change < 0:
+                        block_change_text = f" [hot_pink3]({block_change})[/hot_pink3]"
+                    else:
+                        block_change_text = ""
                 else:
                     block_change_text = ""
-            else:
-                block_change_text = ""
-            tempo_cell = (
-                (f"{subnet.blocks_since_last_step}/{subnet.tempo}{block_change_text}")
-                if netuid != 0
-                else "-/-"
-            )
+                tempo_cell = (
+                    (
+                        f"{subnet.blocks_since_last_step}/{subnet.tempo}{block_change_text}"
+                    )
+                    if netuid != 0
+                    else "-/-"
+                )
 
-            rows.append(
-                (
+                return (
                     netuid_cell,  # Netuid
                     subnet_name_cell,  # Name
                     price_cell,  # Rate τ_in/α_in
@@ -872,6 +892,20 @@ async def subnets_list(
                     tempo_cell,  # Tempo k/n
                     str(mechanisms.get(netuid, 1)),  # Mechanisms
                 )
+
+            # the row is only re-formatted if something it shows has changed
+            row_values = (
+                tuple(current_data[netuid].items()),
+                tuple(prev.items()),
+                subnet.symbol,
+                get_subnet_name(subnet),
+                subnet.tempo,
+                mechanisms.get(netuid, 1),
+            )
+            rows.append(
+                row_cache_.row(netuid, row_values, format_row)
+                if row_cache_ is not None
+                else format_row()
             )
 
         # Calculate totals
@@ -908,62 +942,51 @@ async def subnets_list(
 
     # Live mode
     if live:
-        refresh_interval = 10  # seconds
-
-        progress = Progress(
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(bar_width=20, style="green", complete_style="green"),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            console=console,
-            auto_refresh=True,
-        )
-        progress_task = progress.add_task("Updating:", total=refresh_interval)
-
-        previous_block = None
-        current_block = None
         previous_data = None
+        row_cache = RowCache()
+        mechanisms = None
 
         with Live(console=console, auto_refresh=True) as live:
             try:
-                while True:
+                async for tick in follow_chain_heads(subtensor):
                     (
                         subnets,
                         block_number,
                         mechanisms,
                         ema_tao_inflow,
-                    ) = await fetch_subnet_data()
+                    ) = await fetch_subnet_data(
+                        tick.block_hash,
+                        tick.block_number,
+                        None if tick.refresh_slow else mechanisms,
+                    )
 
-                    # Update block numbers
-                    previous_block = current_block
-                    current_block = block_number
                     new_blocks = (
                         "N/A"
-                        if previous_block is None
-                        else str(current_block - previous_block)
+                        if tick.previous_block is None
+                        else str(tick.block_number - tick.previous_block)
                     )
 
                     table, current_data = create_table_live(
-                        subnets, previous_data, block_number, mechanisms, ema_tao_inflow
+                        subnets,
+                        previous_data,
+                        block_number,
+                        mechanisms,
+                        ema_tao_inflow,
+                        row_cache,
                     )
                     previous_data = current_data
-                    progress.reset(progress_task)
-                    start_time = asyncio.get_event_loop().time()
 
                     block_info = (
-                        f"Previous: [dark_sea_green]{previous_block if previous_block else 'N/A'}[/dark_sea_green] "
-                        f"Current: [dark_sea_green]{current_block}[/dark_sea_green] "
+                        f"Previous: [dark_sea_green]{tick.previous_block if tick.previous_block else 'N/A'}[/dark_sea_green] "
+                        f"Current: [dark_sea_green]{tick.block_number}[/dark_sea_green] "
                         f"Diff: [dark_sea_green]{new_blocks}[/dark_sea_green] "
                     )
 
-                    message = f"Live view active. Press [bold red]Ctrl + C[/bold red] to exit\n{block_info}"
-
-                    live_render = Group(message, progress, table)
-                    live.update(live_render)
-
-                    while not progress.finished:
-                        await asyncio.sleep(0.1)
-                        elapsed = asyncio.get_event_loop().time() - start_time
-                        progress.update(progress_task, completed=elapsed)
+                    message = (
+                        "Live view active, updated every block. Press [bold red]Ctrl + C[/bold red] to exit\n"
+                        f"{block_info}"
+                    )
+                    live.update(Group(message, table))
 
             except KeyboardInterrupt:
                 pass  # Ctrl + C
@@ -1054,7 +1077,9 @@ async def show(
 ) -> Optional[str]:
     async def show_root():
         # TODO json_output for this, don't forget
-        with console.status(":satellite: Retrieving root network information..."):
+        with console.status(
+            ":satellite: Retrieving root network information..."
+        ) as status:
             block_hash = await subtensor.substrate.get_chain_head()
             (
                 all_subnets,
@@ -1065,7 +1090,9 @@ async def show(
                 subtensor.all_subnets(block_hash=block_hash),
                 subtensor.get_subnet_state(netuid=0, block_hash=block_hash),
                 subtensor.query_all_identities(block_hash=block_hash),
-                subtensor.get_all_coldkeys_claim_type(block_hash=block_hash),
+                subtensor.get_all_coldkeys_claim_type(
+                    block_hash=block_hash, status=status
+                ),
             )
         root_info = next((s for s in all_subnets if s.netuid == 0), None)
         if root_info is None:
@@ -1261,7 +1288,7 @@ async def show(
         mechanism_id: Optional[int],
         mechanism_count: Optional[int],
     ):
-        with console.status(":satellite: Retrieving subnet information..."):
+        with console.status(":satellite: Retrieving subnet information...") as status:
             block_hash = await subtensor.substrate.get_chain_head()
             if not await subtensor.subnet_exists(netuid=netuid_, block_hash=block_hash):
                 print_error(f"Subnet {netuid_} does not exist")
@@ -1278,7 +1305,9 @@ async def show(
                 subtensor.get_hyperparameter(
                     param_name="Burn", netuid=netuid_, block_hash=block_hash
                 ),
-                subtensor.get_all_coldkeys_claim_type(block_hash=block_hash),
+                subtensor.get_all_coldkeys_claim_type(
+                    block_hash=block_hash, status=status
+                ),
                 subtensor.get_subnet_ema_tao_inflow(
                     netuid=netuid_, block_hash=block_hash
                 ),
@@ -1760,17 +1789,6 @@ async def register(
 ):
     """Register neuron by recycling some TAO."""
 
-    async def _storage_key(storage_fn: str) -> StorageKey:
-        """
-        Generates a SubtensorModule storage key with [netuid] as the param for a given storage function
-        """
-        return await subtensor.substrate.create_storage_key(
-            pallet="SubtensorModule",
-            storage_function=storage_fn,
-            params=[netuid],
-            block_hash=block_hash,
-        )
-
     coldkey_ss58 = proxy or wallet.coldkeypub.ss58_address
     # Verify subnet exists
     print_verbose("Checking subnet status")
@@ -1904,15 +1922,22 @@ async def register(
     if not success:
         print_error(f"Failure: {msg}")
         print_verbose("Checking registration allowed and limits")
+        storage_keys = await subtensor.create_storage_keys(
+            *[
+                ("SubtensorModule", storage_fn, [[netuid]])
+                for storage_fn in (
+                    "NetworkRegistrationAllowed",
+                    "TargetRegistrationsPerInterval",
+                    "RegistrationsThisInterval",
+                    "LastAdjustmentBlock",
+                    "AdjustmentInterval",
+                )
+            ],
+            block_hash=block_hash,
+        )
         storage_key_results, current_block = await asyncio.gather(
-            subtensor.substrate.query_multi(
-                [
-                    await _storage_key("NetworkRegistrationAllowed"),
-                    await _storage_key("TargetRegistrationsPerInterval"),
-                    await _storage_key("RegistrationsThisInterval"),
-                    await _storage_key("LastAdjustmentBlock"),
-                    await _storage_key("AdjustmentInterval"),
-                ]
+            subtensor.query_multi(
+                [key for (key,) in storage_keys], block_hash=block_hash
             ),
             subtensor.substrate.get_block_number(block_hash),
         )
@@ -1959,6 +1984,10 @@ async def register(
         )
 
 
+# `metagraph_cols` columns which are read from the subnet state, rather than from the neurons
+METAGRAPH_STAKE_COLS = ("GLOBAL_STAKE", "LOCAL_STAKE", "STAKE_WEIGHT")
+
+
 # TODO: Confirm emissions, incentive, Dividends are to be fetched from subnet_state or keep NeuronInfo
 async def metagraph_cmd(
     subtensor: Optional["SubtensorInterface"],
@@ -1983,6 +2012,14 @@ async def metagraph_cmd(
                 print_error(f"Subnet with netuid: {netuid} does not exist", status)
                 return False
 
+            # Only the (cheap) lite neuron data is needed for the columns: the MiniGraph fetches weights and
+            # bonds itself, if they are ever used. Stakes are needed for the stake columns, and for the full
+            # table that is cached and exported.
+            need_stakes = (
+                html_output
+                or not no_cache
+                or any(display_cols.get(col, True) for col in METAGRAPH_STAKE_COLS)
+            )
             (
                 neurons,
                 difficulty_,
@@ -1990,7 +2027,7 @@ async def metagraph_cmd(
                 block,
                 subnet_state,
             ) = await asyncio.gather(
-                subtensor.neurons(netuid, block_hash=block_hash),
+                subtensor.neurons_lite(netuid, block_hash=block_hash),
                 subtensor.get_hyperparameter(
                     param_name="Difficulty", netuid=netuid, block_hash=block_hash
                 ),
@@ -2001,7 +2038,9 @@ async def metagraph_cmd(
                     block_hash=block_hash,
                 ),
                 subtensor.substrate.get_block_number(block_hash=block_hash),
-                subtensor.get_subnet_state(netuid=netuid),
+                subtensor.get_subnet_state(netuid=netuid, block_hash=block_hash)
+                if need_stakes
+                else asyncio.sleep(0),
             )
 
         difficulty = int(difficulty_)
@@ -2012,6 +2051,7 @@ async def metagraph_cmd(
             subtensor=subtensor,
             subnet_state=subnet_state,
             block=block,
+            block_hash=block_hash,
         )
         table_data = []
         db_table = []
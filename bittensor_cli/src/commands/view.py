@@ -10,7 +10,7 @@ from bittensor_cli.src.bittensor.subtensor_interface import SubtensorInterface
 from bittensor_cli.src.bittensor.utils import (
     console,
     WalletLike,
-    jinja_env,
+    get_jinja_env,
     get_hotkey_identity_name,
     get_coldkey_identity_name,
 )
@@ -333,7 +333,7 @@ def generate_full_page(data: dict[str, Any]) -> str:
         ((ideal_value - slippage_value) / ideal_value * 100) if ideal_value > 0 else 0
     )
 
-    template = jinja_env.get_template("view.j2")
+    template = get_jinja_env().get_template("view.j2")
 
     return template.render(
         root_symbol_html=ROOT_SYMBOL_HTML,
@@ -3,23 +3,22 @@ import hashlib
 import json
 import os
 from collections import defaultdict
-from enum import Enum
 from typing import Generator, Optional, Union
 
 import aiohttp
 from bittensor_wallet import Wallet, Keypair
 from bittensor_wallet.errors import KeyFileError
-from bittensor_wallet.keyfile import Keyfile
 from rich import box
 from rich.align import Align
 from rich.table import Column, Table
 from rich.tree import Tree
 from rich.padding import Padding
-from bittensor_cli.src import COLOR_PALETTE, COLORS
+from bittensor_cli.src import COLOR_PALETTE, COLORS, SortByBalance
 from bittensor_cli.src.bittensor import utils
-from bittensor_cli.src.bittensor.balances import Balance
+from bittensor_cli.src.bittensor.balances import Balance, BalanceArray
 from bittensor_cli.src.bittensor.chain_data import (
     DelegateInfo,
+    InfoTable,
     NeuronInfoLite,
 )
 from bittensor_cli.src.bittensor.extrinsics.mev_shield import (
@@ -51,16 +50,13 @@ from bittensor_cli.src.bittensor.utils import (
     get_hotkey_pub_ss58,
     get_hotkey_identity_name,
     print_extrinsic_id,
+    find_wallets_by_ss58,
+    get_coldkey_pub_ss58,
+    get_coldkey_ss58_addresses,
+    gather_bounded,
 )
 
 
-class SortByBalance(Enum):
-    name = "name"
-    free = "free"
-    staked = "staked"
-    total = "total"
-
-
 def _sort_by_balance_key(sort_by: SortByBalance):
     """Get the sort key function based on the enum"""
     if sort_by == SortByBalance.name:
@@ -565,6 +561,10 @@ def get_coldkey_wallets_for_path(path: str) -> list[Wallet]:
 
 def _get_wallet_by_ss58(path: str, ss58_address: str) -> Optional[Wallet]:
     """Find a wallet by its SS58 address in the given path."""
+    for wallet_name, hotkey_name in find_wallets_by_ss58(path, ss58_address):
+        if hotkey_name is None:
+            return Wallet(path=path, name=wallet_name)
+    # not indexed, or changed since: index the path's coldkeys
     ss58_addresses, wallet_names = _get_coldkey_ss58_addresses_for_path(path)
     for wallet_name, addr in zip(wallet_names, ss58_addresses):
         if addr == ss58_address:
@@ -581,16 +581,14 @@ def _get_coldkey_ss58_addresses_for_path(path: str) -> tuple[list[str], list[str
         for name in os.listdir(abs_path)
         if os.path.isdir(os.path.join(abs_path, name))
     ]
-    coldkey_paths = [
-        os.path.join(abs_path, wallet, "coldkeypub.txt")
+    wallet_names = [
+        wallet
         for wallet in wallets
         if os.path.isfile(os.path.join(abs_path, wallet, "coldkeypub.txt"))
     ]
-    ss58_addresses = [Keyfile(path).keypair.ss58_address for path in coldkey_paths]
+    ss58_addresses = get_coldkey_ss58_addresses(abs_path, wallet_names)
 
-    return ss58_addresses, [
-        os.path.basename(os.path.dirname(path)) for path in coldkey_paths
-    ]
+    return ss58_addresses, wallet_names
 
 
 async def wallet_balance(
@@ -622,14 +620,16 @@ async def wallet_balance(
             coldkeys = [wallet.coldkeypub.ss58_address]
             wallet_names = [wallet.name]
 
-        block_hash = await subtensor.substrate.get_chain_head()
-        free_balances, staked_balances = await asyncio.gather(
-            subtensor.get_balances(*coldkeys, block_hash=block_hash),
-            subtensor.get_total_stake_for_coldkey(*coldkeys, block_hash=block_hash),
-        )
+        async with subtensor.at_block():
+            free_balances, staked_balances = await asyncio.gather(
+                subtensor.get_balances(*coldkeys),
+                subtensor.get_total_stake_for_coldkey(*coldkeys),
+            )
 
-    total_free_balance: Balance = sum(free_balances.values())
-    total_staked_balance: Balance = sum(stake[0] for stake in staked_balances.values())
+    total_free_balance = BalanceArray.from_balances(free_balances.values()).sum()
+    total_staked_balance = BalanceArray.from_balances(
+        stake[0] for stake in staked_balances.values()
+    ).sum()
 
     balances = {
         name: (
@@ -965,14 +965,14 @@ async def _get_total_balance(
                 and not cold_wallet.coldkeypub_file.is_encrypted()
             )
         ]
-        total_balance += sum(
+        total_balance += BalanceArray.from_balances(
             (
                 await subtensor.get_balances(
                     *(x.coldkeypub.ss58_address for x in _balance_cold_wallets),
                     block_hash=block_hash,
                 )
             ).values()
-        )
+        ).sum()
         all_hotkeys = []
         for w in cold_wallets:
             hotkeys_for_wallet = utils.get_hotkey_wallets_for_wallet(w)
@@ -987,13 +987,13 @@ async def _get_total_balance(
             coldkey_wallet.coldkeypub_file.exists_on_device()
             and not coldkey_wallet.coldkeypub_file.is_encrypted()
         ):
-            total_balance = sum(
+            total_balance = BalanceArray.from_balances(
                 (
                     await subtensor.get_balances(
                         coldkey_wallet.coldkeypub.ss58_address, block_hash=block_hash
                     )
                 ).values()
-            )
+            ).sum()
         if not coldkey_wallet.coldkeypub_file.exists_on_device():
             return [], None
         all_hotkeys = utils.get_hotkey_wallets_for_wallet(coldkey_wallet)
@@ -1024,104 +1024,103 @@ async def overview(
         f":satellite: Synchronizing with chain [white]{subtensor.network}[/white]",
         spinner="aesthetic",
     ) as status:
-        # We are printing for every coldkey.
-        block_hash = await subtensor.substrate.get_chain_head()
-        (
-            (all_hotkeys, total_balance),
-            _dynamic_info,
-            block,
-            all_netuids,
-        ) = await asyncio.gather(
-            _get_total_balance(
-                total_balance, subtensor, wallet, all_wallets, block_hash=block_hash
-            ),
-            subtensor.all_subnets(block_hash=block_hash),
-            subtensor.substrate.get_block_number(block_hash=block_hash),
-            subtensor.get_all_subnet_netuids(block_hash=block_hash),
-        )
-        dynamic_info = {info.netuid: info for info in _dynamic_info}
-
-        # We are printing for a select number of hotkeys from all_hotkeys.
-        if include_hotkeys or exclude_hotkeys:
-            all_hotkeys = _get_hotkeys(include_hotkeys, exclude_hotkeys, all_hotkeys)
-
-        # Check we have keys to display.
-        if not all_hotkeys:
-            print_error("Aborting as no hotkeys found to process", status)
-            return
-
-        # Pull neuron info for all keys.
-        neurons: dict[str, list[NeuronInfoLite]] = {}
+        # Pin every read to a single block so balances, neurons and tempos are consistent.
+        async with subtensor.at_block() as snapshot:
+            block_hash = snapshot.block_hash
+            (
+                (all_hotkeys, total_balance),
+                _dynamic_info,
+                block,
+                all_netuids,
+            ) = await asyncio.gather(
+                _get_total_balance(
+                    total_balance, subtensor, wallet, all_wallets, block_hash=block_hash
+                ),
+                subtensor.all_subnets(block_hash=block_hash),
+                subtensor.substrate.get_block_number(block_hash=block_hash),
+                subtensor.get_all_subnet_netuids(block_hash=block_hash),
+            )
+            dynamic_info = {info.netuid: info for info in _dynamic_info}
 
-        netuids = await subtensor.filter_netuids_by_registered_hotkeys(
-            all_netuids, netuids_filter, all_hotkeys
-        )
+            # We are printing for a select number of hotkeys from all_hotkeys.
+            if include_hotkeys or exclude_hotkeys:
+                all_hotkeys = _get_hotkeys(
+                    include_hotkeys, exclude_hotkeys, all_hotkeys
+                )
 
-        for netuid in netuids:
-            neurons[str(netuid)] = []
+            # Check we have keys to display.
+            if not all_hotkeys:
+                print_error("Aborting as no hotkeys found to process", status)
+                return
 
-        all_wallet_data = {(wallet.name, wallet.path) for wallet in all_hotkeys}
+            all_wallet_data = {(wallet.name, wallet.path) for wallet in all_hotkeys}
 
-        all_coldkey_wallets = [
-            Wallet(name=wallet_name, path=wallet_path)
-            for wallet_name, wallet_path in all_wallet_data
-        ]
+            all_coldkey_wallets = [
+                Wallet(name=wallet_name, path=wallet_path)
+                for wallet_name, wallet_path in all_wallet_data
+            ]
 
-        all_coldkey_wallets, invalid_wallets = validate_coldkey_presence(
-            all_coldkey_wallets
-        )
-        for invalid_wallet in invalid_wallets:
-            print_error(
-                f"No coldkeypub found for wallet: ({invalid_wallet.name})", status
+            all_coldkey_wallets, invalid_wallets = validate_coldkey_presence(
+                all_coldkey_wallets
             )
-        all_hotkeys, _ = validate_coldkey_presence(all_hotkeys)
-
-        all_hotkey_addresses, hotkey_coldkey_to_hotkey_wallet = _get_key_address(
-            all_hotkeys
-        )
+            for invalid_wallet in invalid_wallets:
+                print_error(
+                    f"No coldkeypub found for wallet: ({invalid_wallet.name})", status
+                )
+            all_hotkeys, _ = validate_coldkey_presence(all_hotkeys)
 
-        results = await _get_neurons_for_netuids(
-            subtensor, netuids, all_hotkey_addresses
-        )
-        neurons = _process_neuron_results(results, neurons, netuids)
-        # Setup outer table.
-        grid = Table.grid(pad_edge=True)
-        data_dict = {
-            "wallet": "",
-            "network": subtensor.network,
-            "subnets": [],
-            "total_balance": 0.0,
-        }
+            all_hotkey_addresses, hotkey_coldkey_to_hotkey_wallet = _get_key_address(
+                all_hotkeys
+            )
 
-        # Add title
-        if not all_wallets:
-            title = "[underline dark_orange]Wallet[/underline dark_orange]\n"
-            details = (
-                f"[bright_cyan]{wallet.name}[/bright_cyan] : "
-                f"[bright_magenta]{wallet.coldkeypub.ss58_address}[/bright_magenta]"
+            # Pull neuron info for all keys, only on the subnets they are registered on.
+            if netuids_filter:
+                all_netuids = [n for n in all_netuids if n in netuids_filter]
+            hotkey_neurons = await _get_neurons_for_hotkeys(
+                subtensor, all_netuids, all_hotkey_addresses, block_hash=block_hash
             )
-            grid.add_row(Align(title, vertical="middle", align="center"))
-            grid.add_row(Align(details, vertical="middle", align="center"))
-            data_dict["wallet"] = f"{wallet.name}|{wallet.coldkeypub.ss58_address}"
-        else:
-            title = "[underline dark_orange]All Wallets:[/underline dark_orange]"
-            grid.add_row(Align(title, vertical="middle", align="center"))
-            data_dict["wallet"] = "All"
+            netuids = list(hotkey_neurons)
+            neurons: dict[str, list[NeuronInfoLite]] = {
+                str(netuid): neurons_ for netuid, neurons_ in hotkey_neurons.items()
+            }
+            # Setup outer table.
+            grid = Table.grid(pad_edge=True)
+            data_dict = {
+                "wallet": "",
+                "network": subtensor.network,
+                "subnets": [],
+                "total_balance": 0.0,
+            }
 
-        grid.add_row(
-            Align(
-                f"[dark_orange]Network: {subtensor.network}",
-                vertical="middle",
-                align="center",
+            # Add title
+            if not all_wallets:
+                title = "[underline dark_orange]Wallet[/underline dark_orange]\n"
+                details = (
+                    f"[bright_cyan]{wallet.name}[/bright_cyan] : "
+                    f"[bright_magenta]{wallet.coldkeypub.ss58_address}[/bright_magenta]"
+                )
+                grid.add_row(Align(title, vertical="middle", align="center"))
+                grid.add_row(Align(details, vertical="middle", align="center"))
+                data_dict["wallet"] = f"{wallet.name}|{wallet.coldkeypub.ss58_address}"
+            else:
+                title = "[underline dark_orange]All Wallets:[/underline dark_orange]"
+                grid.add_row(Align(title, vertical="middle", align="center"))
+                data_dict["wallet"] = "All"
+
+            grid.add_row(
+                Align(
+                    f"[dark_orange]Network: {subtensor.network}",
+                    vertical="middle",
+                    align="center",
+                )
             )
-        )
-        # Generate rows per netuid
-        tempos = await asyncio.gather(
-            *[
-                subtensor.get_hyperparameter("Tempo", netuid, block_hash)
-                for netuid in netuids
+            # Generate rows per netuid
+            hyperparameters = await subtensor.get_hyperparameters(
+                ["Tempo"], netuids, block_hash
+            )
+            tempos = [
+                (hyperparameters[netuid] or {}).get("Tempo") for netuid in netuids
             ]
-        )
     for netuid, subnet_tempo in zip(netuids, tempos):
         table_data = []
         subnet_dict = {
@@ -1375,26 +1374,23 @@ def _get_hotkeys(
     include_hotkeys: list[str], exclude_hotkeys: list[str], all_hotkeys: list[Wallet]
 ) -> list[Wallet]:
     """Filters a set of hotkeys (all_hotkeys) based on whether they are included or excluded."""
+    items = include_hotkeys or exclude_hotkeys
+    ss58_items = {item for item in items if is_valid_ss58_address(item)}
+    name_items = set(items) - ss58_items
 
-    def is_hotkey_matched(wallet: Wallet, item: str) -> bool:
-        if is_valid_ss58_address(item):
-            return get_hotkey_pub_ss58(wallet) == item
-        else:
-            return wallet.hotkey_str == item
+    def is_hotkey_matched(wallet: Wallet) -> bool:
+        # the addresses come from the key index, so are only looked up if needed
+        return wallet.hotkey_str in name_items or (
+            bool(ss58_items) and get_hotkey_pub_ss58(wallet) in ss58_items
+        )
 
     if include_hotkeys:
         # We are only showing hotkeys that are specified.
-        all_hotkeys = [
-            hotkey
-            for hotkey in all_hotkeys
-            if any(is_hotkey_matched(hotkey, item) for item in include_hotkeys)
-        ]
+        all_hotkeys = [hotkey for hotkey in all_hotkeys if is_hotkey_matched(hotkey)]
     else:
         # We are excluding the specified hotkeys from all_hotkeys.
         all_hotkeys = [
-            hotkey
-            for hotkey in all_hotkeys
-            if not any(is_hotkey_matched(hotkey, item) for item in exclude_hotkeys)
+            hotkey for hotkey in all_hotkeys if not is_hotkey_matched(hotkey)
         ]
     return all_hotkeys
 
@@ -1409,13 +1405,11 @@ def _get_key_address(all_hotkeys: list[Wallet]) -> tuple[list[str], dict[str, Wa
     """
     hotkey_coldkey_to_hotkey_wallet = {}
     for hotkey_wallet in all_hotkeys:
-        if hotkey_wallet.coldkeypub:
+        if coldkey_ss58 := get_coldkey_pub_ss58(hotkey_wallet):
             hotkey_ss58 = get_hotkey_pub_ss58(hotkey_wallet)
             if hotkey_ss58 not in hotkey_coldkey_to_hotkey_wallet:
                 hotkey_coldkey_to_hotkey_wallet[hotkey_ss58] = {}
-            hotkey_coldkey_to_hotkey_wallet[hotkey_ss58][
-                hotkey_wallet.coldkeypub.ss58_address
-            ] = hotkey_wallet
+            hotkey_coldkey_to_hotkey_wallet[hotkey_ss58][coldkey_ss58] = hotkey_wallet
         else:
             # occurs when there is a hotkey without an associated coldkeypub
             # TODO log this, maybe display
@@ -1443,89 +1437,40 @@ async def _calculate_total_coldkey_stake(
     return total_coldkey_stake_from_metagraph
 
 
-def _process_neuron_results(
-    results: list[tuple[int, list["NeuronInfoLite"], Optional[str]]],
-    neurons: dict[str, list["NeuronInfoLite"]],
+async def _get_neurons_for_hotkeys(
+    subtensor: SubtensorInterface,
     netuids: list[int],
-) -> dict[str, list["NeuronInfoLite"]]:
-    """
-    Filters a list of Neurons for their netuid, neuron info, and errors
-
-    :param results: [(netuid, neurons result, error message), ...]
-    :param neurons: {netuid: [], ...}
-    :param netuids: list of netuids to filter the neurons
-
-    :return: the filtered neurons dict
-    """
-    for result in results:
-        netuid, neurons_result, err_msg = result
-        if err_msg is not None:
-            console.print(f"netuid '{netuid}': {err_msg}")
-
-        if len(neurons_result) == 0:
-            # Remove netuid from overview if no neurons are found.
-            netuids.remove(netuid)
-            del neurons[str(netuid)]
-        else:
-            # Add neurons to overview.
-            neurons[str(netuid)] = neurons_result
-    return neurons
-
-
-def _map_hotkey_to_neurons(
-    all_neurons: list["NeuronInfoLite"],
-    hot_wallets: list[str],
-    netuid: int,
-) -> tuple[int, list["NeuronInfoLite"], Optional[str]]:
-    """Maps the hotkeys to their respective neurons"""
-    result: list["NeuronInfoLite"] = []
-    hotkey_to_neurons = {n.hotkey: n.uid for n in all_neurons}
-    try:
-        for hot_wallet_addr in hot_wallets:
-            uid = hotkey_to_neurons.get(hot_wallet_addr)
-            if uid is not None:
-                nn = all_neurons[uid]
-                result.append(nn)
-    except Exception as e:
-        return netuid, [], f"Error: {e}"
-
-    return netuid, result, None
-
-
-async def _fetch_neuron_for_netuid(
-    netuid: int, subtensor: SubtensorInterface
-) -> tuple[int, list[NeuronInfoLite]]:
+    hotkey_ss58s: list[str],
+    block_hash: Optional[str] = None,
+) -> dict[int, list["NeuronInfoLite"]]:
     """
-    Retrieves all neurons for a specified netuid
+    Retrieves the neurons of the given hotkeys. Where the hotkeys are registered is resolved with a single query, and
+    then only their own neurons are fetched, rather than every neuron of each subnet.
 
-    :param netuid: the netuid to query
-    :param subtensor: the SubtensorInterface to make the query
+    :param subtensor: the SubtensorInterface to make the queries
+    :param netuids: the netuids to look for the hotkeys on
+    :param hotkey_ss58s: the SS58 addresses of the hotkeys
+    :param block_hash: the hash of the block at which to query the neurons
 
-    :return: the original netuid, and a mapping of the neurons to their NeuronInfoLite objects
+    :return: {netuid: [neuron of each registered hotkey]}, only for the netuids with any of the hotkeys' neurons,
+        in the order of `netuids`
     """
-    neurons = await subtensor.neurons_lite(netuid=netuid)
-    return netuid, neurons
-
-
-async def _fetch_all_neurons(
-    netuids: list[int], subtensor
-) -> list[tuple[int, list[NeuronInfoLite]]]:
-    """Retrieves all neurons for each of the specified netuids"""
-    return list(
-        await asyncio.gather(
-            *[_fetch_neuron_for_netuid(netuid, subtensor) for netuid in netuids]
-        )
+    uids = await subtensor.get_uids_for_hotkeys(
+        hotkey_ss58s, netuids, block_hash=block_hash
     )
-
-
-async def _get_neurons_for_netuids(
-    subtensor: SubtensorInterface, netuids: list[int], hot_wallets: list[str]
-) -> list[tuple[int, list["NeuronInfoLite"], Optional[str]]]:
-    all_neurons = await _fetch_all_neurons(netuids, subtensor)
-    return [
-        _map_hotkey_to_neurons(neurons, hot_wallets, netuid)
-        for netuid, neurons in all_neurons
+    registrations = [
+        (netuid, uid) for netuid in netuids for uid in uids.get(netuid, {}).values()
     ]
+    # one runtime call per registration, which can be thousands for a large wallet
+    results = await gather_bounded(
+        subtensor.neuron_lite_for_uid(uid, netuid, block_hash=block_hash)
+        for netuid, uid in registrations
+    )
+    neurons: dict[int, list["NeuronInfoLite"]] = {}
+    for (netuid, _), neuron in zip(registrations, results):
+        if neuron is not None:
+            neurons.setdefault(netuid, []).append(neuron)
+    return neurons
 
 
 async def transfer(
@@ -1645,11 +1590,14 @@ def _make_neuron_rows(
     """Yield hotkey table rows for each neuron registered under the given coldkey."""
     hotkeys = hotkeys or []
     for netuid in all_netuids:
-        for neuron in neuron_state_dict[netuid]:
-            if neuron.coldkey == coldkey_ss58:
-                hotkey_label = _format_hotkey_label(neuron.hotkey, hotkeys)
-                stake = Balance.from_rao(neuron.stake.rao).set_unit(netuid)
-                emission = Balance.from_tao(neuron.emission).set_unit(netuid)
+        neurons = neuron_state_dict[netuid]
+        if not neurons:
+            continue
+        for i, coldkey in enumerate(neurons.coldkey):
+            if coldkey == coldkey_ss58:
+                hotkey_label = _format_hotkey_label(neurons.hotkey[i], hotkeys)
+                stake = Balance.from_rao(neurons.stake_rao[i]).set_unit(netuid)
+                emission = Balance.from_tao(neurons.emission[i]).set_unit(netuid)
                 yield [
                     coldkey_name,
                     str(netuid),
@@ -1761,14 +1709,14 @@ async def inspect(
     all_delegates: list[list[tuple[DelegateInfo, Balance]]]
     with console.status("Pulling balance data...", spinner="aesthetic"):
         balances: dict[str, Balance]
-        all_neurons: list[NeuronInfoLite]
+        all_neurons: list[Union[InfoTable, list]]
         all_delegates: list[tuple[DelegateInfo, Balance]]
 
         balances, all_neurons, all_delegates = await asyncio.gather(
             subtensor.get_balances(*coldkey_addresses, block_hash=block_hash),
             asyncio.gather(
                 *[
-                    subtensor.neurons_lite(netuid=netuid, block_hash=block_hash)
+                    subtensor.neurons_lite_table(netuid=netuid, block_hash=block_hash)
                     for netuid in all_netuids
                 ]
             ),
@@ -1776,7 +1724,7 @@ async def inspect(
                 *[subtensor.get_delegated(addr) for addr in coldkey_addresses]
             ),
         )
-    neuron_state_dict: dict[int, list | NeuronInfoLite] = {}
+    neuron_state_dict: dict[int, Union[InfoTable, list]] = {}
     for netuid, neuron in zip(all_netuids, all_neurons):
         neuron_state_dict[netuid] = neuron if neuron else []
 
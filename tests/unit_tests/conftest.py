@@ -15,6 +15,7 @@ from unittest.mock import AsyncMock, MagicMock
 from bittensor_wallet import Wallet
 
 from bittensor_cli.src.bittensor.balances import Balance
+from bittensor_cli.src.bittensor.swap_simulator import SwapPool, SwapSimulator
 
 # ---------------------------------------------------------------------------
 # Common SS58 addresses (valid Substrate SS58, format 42)
@@ -143,6 +144,19 @@ def mock_wallet_spec() -> MagicMock:
 # ---------------------------------------------------------------------------
 
 
+def mock_swap_pool(netuid: int) -> SwapPool:
+    """
+    The swap pool of every dynamic subnet of ``mock_subtensor``: 1,000 TAO and
+    4,000 alpha of protocol liquidity, at the default fee rate.
+    """
+    return SwapPool.from_reserves(
+        netuid,
+        tao_reserve=1_000_000_000_000,
+        alpha_reserve=4_000_000_000_000,
+        fee_rate=33,
+    )
+
+
 @pytest.fixture
 def mock_subtensor() -> MagicMock:
     """
@@ -180,12 +194,29 @@ def mock_subtensor() -> MagicMock:
     st.get_stake_for_coldkey = AsyncMock(return_value=[])
     st.all_subnets = AsyncMock(return_value=[])
     st.get_hyperparameter = AsyncMock(return_value=1)
+    st.get_hyperparameters = AsyncMock(
+        side_effect=lambda param_names, netuids, block_hash=None: {
+            netuid: {param_name: 1 for param_name in param_names} for netuid in netuids
+        }
+    )
     st.query = AsyncMock(return_value=None)
     st.neuron_for_uid = AsyncMock(return_value=None)
     st.sign_and_send_extrinsic = AsyncMock(return_value=(True, "", AsyncMock()))
     st.sim_swap = AsyncMock(
         return_value=MagicMock(alpha_amount=100, tao_fee=1, alpha_fee=1)
     )
+
+    # a real swap simulator, seeded with the same pool for every dynamic subnet, so previews
+    # are priced by the local swap math; ``st.sim_swap`` (the runtime API) is not used
+    async def _get_swap_simulator(netuids, block_hash=None, dynamic_info=None):
+        del dynamic_info
+        return SwapSimulator(
+            {netuid: mock_swap_pool(netuid) for netuid in netuids if netuid != 0},
+            st,
+            block_hash,
+        )
+
+    st.get_swap_simulator = AsyncMock(side_effect=_get_swap_simulator)
     st.fetch_coldkey_hotkey_identities = AsyncMock(
         return_value={"hotkeys": {}, "coldkeys": {}}
     )
@@ -4,9 +4,16 @@ Unit tests for the Balance class in bittensor_cli/src/bittensor/balances.py.
 All tests are synchronous and require no mocks — Balance is a pure value object.
 """
 
+import pickle
+
 import pytest
 
-from bittensor_cli.src.bittensor.balances import Balance, fixed_to_float
+from bittensor_cli.src.bittensor.balances import (
+    TAO_UNIT,
+    Balance,
+    BalanceArray,
+    fixed_to_float,
+)
 from bittensor_cli.src import UNITS
 
 
@@ -365,6 +372,71 @@ class TestBalanceUnit:
         assert b.unit == UNITS[0]
 
 
+# ---------------------------------------------------------------------------
+# __slots__ / pickling
+# ---------------------------------------------------------------------------
+
+
+class TestBalanceSlots:
+    def test_has_no_instance_dict(self):
+        assert not hasattr(Balance(1), "__dict__")
+
+    def test_class_units_are_the_defaults(self):
+        assert Balance.unit == TAO_UNIT
+        assert Balance(1).set_unit(3).unit == Balance.get_unit(3)
+        assert Balance.unit == TAO_UNIT
+        assert Balance(1).unit == TAO_UNIT
+
+    def test_arithmetic_result_has_default_unit(self):
+        b = Balance(2).set_unit(3) + Balance(1).set_unit(3)
+        assert b.rao == 3
+        assert b.unit == TAO_UNIT
+
+    def test_pickle_round_trip_keeps_unit(self):
+        b = pickle.loads(pickle.dumps(Balance(5).set_unit(2)))
+        assert b.rao == 5
+        assert b.unit == Balance.get_unit(2)
+
+    def test_unpickles_dict_state(self):
+        """Balances pickled before __slots__ carry their attributes as a dict."""
+        b = Balance.__new__(Balance)
+        b.__setstate__({"rao": 7, "unit": UNITS[1], "rao_unit": UNITS[1]})
+        assert b.rao == 7
+        assert b.unit == UNITS[1]
+
+
+# ---------------------------------------------------------------------------
+# BalanceArray
+# ---------------------------------------------------------------------------
+
+
+class TestBalanceArray:
+    def test_sum(self):
+        balances = [Balance.from_tao(1.5), Balance(RAO_PER_TAO), Balance(0)]
+        total = BalanceArray.from_balances(balances).sum()
+        assert total == sum(balances)
+        assert BalanceArray().sum() == Balance(0)
+
+    def test_items_are_balances_in_the_array_unit(self):
+        values = BalanceArray([1, 2], netuid=4)
+        assert [b.rao for b in values] == [1, 2]
+        assert values[1].unit == Balance.get_unit(4)
+        assert values.sum().unit == Balance.get_unit(4)
+        assert values.set_unit(None).sum().unit == TAO_UNIT
+
+    def test_append_balance_or_rao(self):
+        values = BalanceArray()
+        values.append(Balance(3))
+        values.append(4)
+        assert len(values) == 2
+        assert values.tao == [3 / RAO_PER_TAO, 4 / RAO_PER_TAO]
+
+    def test_scale_matches_balance_mul(self):
+        balances = [Balance(10), Balance(333)]
+        scaled = BalanceArray.from_balances(balances).scale(0.5)
+        assert list(scaled) == [b * 0.5 for b in balances]
+
+
 # ---------------------------------------------------------------------------
 # fixed_to_float
 # ---------------------------------------------------------------------------
@@ -1,26 +1,60 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from bittensor_cli.src.bittensor.extrinsics.pipeline import (
+    UNCHECKED_BATCH_CALLS,
+    UNCHECKED_BATCH_LENGTH,
+    BatchResult,
+    chunk_by_limits,
+)
 from bittensor_cli.src.bittensor.subtensor_interface import SubtensorInterface
 
 
+# per-extrinsic limits of a normal extrinsic, and the weight of each call
+MAX_REF_TIME = 1_000_000
+MAX_PROOF_SIZE = 10_000
+MAX_LENGTH = 5_000
+CALL_WEIGHT = {"ref_time": 1_000, "proof_size": 10}
+
+
+def _constant(module_name, constant_name, block_hash=None):
+    values = {
+        "BlockWeights": {
+            "max_block": {"ref_time": MAX_REF_TIME, "proof_size": MAX_PROOF_SIZE},
+            "per_class": {
+                "normal": {
+                    "max_extrinsic": {
+                        "ref_time": MAX_REF_TIME,
+                        "proof_size": MAX_PROOF_SIZE,
+                    },
+                    "max_total": None,
+                }
+            },
+        },
+        "BlockLength": {"max": {"normal": MAX_LENGTH}},
+    }
+    return MagicMock(value=values[constant_name])
+
+
 @pytest.fixture
 def subtensor():
     """Create a SubtensorInterface with a mocked substrate connection."""
     st = SubtensorInterface("finney")
     st.substrate = AsyncMock()
+    st.substrate.get_constant = AsyncMock(side_effect=_constant)
+    st.substrate.get_payment_info = AsyncMock(return_value={"weight": CALL_WEIGHT})
     return st
 
 
 @pytest.mark.asyncio
 async def test_batch_empty_calls_returns_error(subtensor, mock_wallet):
     """Passing an empty call list should return failure without touching the chain."""
-    success, msg, receipt = await subtensor.sign_and_send_batch_extrinsic(
+    (result,) = await subtensor.sign_and_send_batch_extrinsic(
         calls=[], wallet=mock_wallet
     )
-    assert success is False
-    assert "No calls to batch" in msg
-    assert receipt is None
+    assert result.success is False
+    assert "No calls to batch" in result.message
+    assert result.receipt is None
     subtensor.substrate.compose_call.assert_not_awaited()
 
 
@@ -36,16 +70,15 @@ async def test_batch_single_call_skips_batch_wrapper(subtensor, mock_wallet):
         new_callable=AsyncMock,
         return_value=(True, "", mock_receipt),
     ) as mock_send:
-        success, msg, receipt = await subtensor.sign_and_send_batch_extrinsic(
+        results = await subtensor.sign_and_send_batch_extrinsic(
             calls=[single_call],
             wallet=mock_wallet,
             era={"period": 3},
             proxy="5Proxy...",
-            mev_protection=True,
+            mev_protection=False,
         )
 
-    assert success is True
-    assert receipt is mock_receipt
+    assert results == [BatchResult(0, 1, True, "", mock_receipt)]
     # Should have been called with the raw call, not a batch wrapper
     mock_send.assert_awaited_once_with(
         call=single_call,
@@ -57,7 +90,7 @@ async def test_batch_single_call_skips_batch_wrapper(subtensor, mock_wallet):
         nonce=None,
         sign_with="coldkey",
         announce_only=False,
-        mev_protection=True,
+        mev_protection=False,
     )
     # compose_call should NOT have been called (no batch wrapping)
     subtensor.substrate.compose_call.assert_not_awaited()
@@ -81,13 +114,13 @@ async def test_batch_multiple_calls_wraps_in_batch_all(subtensor, mock_wallet):
         new_callable=AsyncMock,
         return_value=(True, "", mock_receipt),
     ) as mock_send:
-        success, msg, receipt = await subtensor.sign_and_send_batch_extrinsic(
+        results = await subtensor.sign_and_send_batch_extrinsic(
             calls=[call_a, call_b, call_c],
             wallet=mock_wallet,
             era={"period": 5},
         )
 
-    assert success is True
+    assert results == [BatchResult(0, 3, True, "", mock_receipt)]
     # Should compose a Utility.batch_all call
     subtensor.substrate.compose_call.assert_awaited_once_with(
         call_module="Utility",
@@ -233,11 +266,209 @@ async def test_batch_propagates_failure(subtensor, mock_wallet):
         new_callable=AsyncMock,
         return_value=(False, "batch_all interrupted at index 1", None),
     ):
-        success, err_msg, receipt = await subtensor.sign_and_send_batch_extrinsic(
+        (result,) = await subtensor.sign_and_send_batch_extrinsic(
             calls=[call_a, call_b],
             wallet=mock_wallet,
         )
 
-    assert success is False
-    assert "batch_all interrupted at index 1" in err_msg
-    assert receipt is None
+    assert result.success is False
+    assert "batch_all interrupted at index 1" in result.message
+    assert result.receipt is None
+
+
+def _calls(n, function="remove_stake", length=10):
+    return [
+        MagicMock(
+            value={"call_module": "SubtensorModule", "call_function": function},
+            data=b"\x00" * length,
+        )
+        for _ in range(n)
+    ]
+
+
+def test_chunk_by_limits_fills_each_chunk_in_order():
+    costs = [(3, 1), (3, 1), (3, 1), (1, 5), (1, 1), (20, 0)]
+    assert chunk_by_limits(costs, (7, 6)) == [(0, 2), (2, 4), (4, 5), (5, 6)]
+    assert chunk_by_limits([], (7, 6)) == []
+
+
+@pytest.mark.asyncio
+async def test_batch_within_limits_is_not_split(subtensor, mock_wallet):
+    calls = _calls(100)
+    with patch.object(
+        subtensor,
+        "sign_and_send_extrinsic",
+        new_callable=AsyncMock,
+        return_value=(True, "", MagicMock()),
+    ) as mock_send:
+        await subtensor.sign_and_send_batch_extrinsic(
+            calls=calls, wallet=mock_wallet, block_hash="0xblock"
+        )
+
+    # one payment info for all 100 calls, as they share a call function
+    subtensor.substrate.get_payment_info.assert_awaited_once()
+    subtensor.substrate.compose_call.assert_awaited_once()
+    mock_send.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_small_batch_skips_weight_estimate(subtensor, mock_wallet):
+    subtensor.substrate.get_payment_info.return_value = {
+        "weight": {"ref_time": 1, "proof_size": 4_000}
+    }
+    with patch.object(
+        subtensor,
+        "sign_and_send_extrinsic",
+        new_callable=AsyncMock,
+        return_value=(True, "", MagicMock()),
+    ) as mock_send:
+        results = await subtensor.sign_and_send_batch_extrinsic(
+            calls=_calls(UNCHECKED_BATCH_CALLS),
+            wallet=mock_wallet,
+            block_hash="0xblock",
+        )
+
+    subtensor.substrate.get_constant.assert_not_awaited()
+    subtensor.substrate.get_payment_info.assert_not_awaited()
+    mock_send.assert_awaited_once()
+    assert [(r.start, r.stop) for r in results] == [(0, UNCHECKED_BATCH_CALLS)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "weight, length, expected_sizes",
+    [
+        # 80% of the max ref time fits 800 calls
+        (CALL_WEIGHT, 1, [800, 800, 400]),
+        # 80% of the max proof size fits 8 calls
+        ({"ref_time": 1, "proof_size": 1_000}, 1, [8] * 250),
+        # 80% of the max length fits 400 calls
+        (CALL_WEIGHT, 10, [400] * 5),
+    ],
+)
+async def test_batch_over_limits_is_split_and_pipelined(
+    subtensor, mock_wallet, weight, length, expected_sizes
+):
+    calls = _calls(2_000, length=length)
+    subtensor.substrate.get_payment_info.return_value = {"weight": weight}
+    receipts = [MagicMock() for _ in expected_sizes]
+
+    with patch(
+        "bittensor_cli.src.bittensor.subtensor_interface.sign_and_send_pipelined",
+        new_callable=AsyncMock,
+        return_value=[(True, "", r) for r in receipts],
+    ) as mock_pipeline:
+        results = await subtensor.sign_and_send_batch_extrinsic(
+            calls=calls,
+            wallet=mock_wallet,
+            block_hash="0xblock",
+            batch_function="batch",
+        )
+
+    sizes = [
+        len(call.kwargs["call_params"]["calls"])
+        for call in subtensor.substrate.compose_call.await_args_list
+    ]
+    assert sizes == expected_sizes
+    assert all(
+        call.kwargs["call_function"] == "batch"
+        for call in subtensor.substrate.compose_call.await_args_list
+    )
+    mock_pipeline.assert_awaited_once()
+    assert all(r.success for r in results)
+    assert [r.receipt for r in results] == receipts
+    assert [r.stop - r.start for r in results] == expected_sizes
+    assert results[-1].stop == len(calls)
+
+
+@pytest.mark.asyncio
+async def test_batch_split_reports_each_batch(subtensor, mock_wallet):
+    # 80% of the max proof size fits 2 calls
+    subtensor.substrate.get_payment_info.return_value = {
+        "weight": {"ref_time": 1, "proof_size": 4_000}
+    }
+    receipt = MagicMock()
+    n_calls = UNCHECKED_BATCH_CALLS + 2
+    pipelined = [(True, "", receipt)] * (n_calls // 2)
+    pipelined[1] = (False, "Inability to pay", None)
+    with patch(
+        "bittensor_cli.src.bittensor.subtensor_interface.sign_and_send_pipelined",
+        new_callable=AsyncMock,
+        return_value=pipelined,
+    ):
+        results = await subtensor.sign_and_send_batch_extrinsic(
+            calls=_calls(n_calls), wallet=mock_wallet, block_hash="0xblock"
+        )
+
+    assert results[:3] == [
+        BatchResult(0, 2, True, "", receipt),
+        BatchResult(2, 4, False, "Inability to pay", None),
+        BatchResult(4, 6, True, "", receipt),
+    ]
+    assert len(results) == n_calls // 2
+
+
+@pytest.mark.asyncio
+async def test_batch_split_with_explicit_nonce_is_sequential(subtensor, mock_wallet):
+    # 80% of the max proof size fits 2 calls
+    subtensor.substrate.get_payment_info.return_value = {
+        "weight": {"ref_time": 1, "proof_size": 4_000}
+    }
+    with patch.object(
+        subtensor,
+        "sign_and_send_extrinsic",
+        new_callable=AsyncMock,
+        side_effect=[(True, "", MagicMock()), (True, "", MagicMock())]
+        + [(False, "Inability to pay", None)],
+    ) as mock_send:
+        results = await subtensor.sign_and_send_batch_extrinsic(
+            calls=_calls(UNCHECKED_BATCH_CALLS + 2),
+            wallet=mock_wallet,
+            block_hash="0xblock",
+            nonce=7,
+        )
+
+    # the batches after the failed one are not submitted
+    assert [call.kwargs["nonce"] for call in mock_send.await_args_list] == [7, 8, 9]
+    assert [r.success for r in results[:4]] == [True, True, False, False]
+    assert "Not submitted, as batch 3 of" in results[3].message
+    assert results[-1].stop == UNCHECKED_BATCH_CALLS + 2
+
+
+@pytest.mark.asyncio
+async def test_batch_with_mev_protection_waits_for_inner_extrinsics(
+    subtensor, mock_wallet
+):
+    inner_receipt = MagicMock()
+    with (
+        patch.object(
+            subtensor,
+            "sign_and_send_extrinsic",
+            new_callable=AsyncMock,
+            side_effect=[
+                (True, "0xinner1", MagicMock(block_hash="0xb1")),
+                (True, "0xinner2", MagicMock(block_hash="0xb2")),
+            ],
+        ),
+        patch(
+            "bittensor_cli.src.bittensor.subtensor_interface.wait_for_extrinsic_by_hash",
+            new_callable=AsyncMock,
+            side_effect=[(True, None, inner_receipt), (False, "Failed", None)],
+        ) as mock_wait,
+    ):
+        results = await subtensor.sign_and_send_batch_extrinsic(
+            # each call is over the length limit, so it is batched on its own
+            calls=_calls(2, length=UNCHECKED_BATCH_LENGTH),
+            wallet=mock_wallet,
+            block_hash="0xblock",
+            mev_protection=True,
+        )
+
+    assert [call.args[1:3] for call in mock_wait.await_args_list] == [
+        ("0xinner1", "0xb1"),
+        ("0xinner2", "0xb2"),
+    ]
+    assert results == [
+        BatchResult(0, 1, True, "", inner_receipt),
+        BatchResult(1, 2, False, "Failed", None),
+    ]
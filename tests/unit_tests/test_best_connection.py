@@ -0,0 +1,40 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from bittensor_cli.src.bittensor import subtensor_interface
+from bittensor_cli.src.bittensor.subtensor_interface import (
+    _latency_stats,
+    best_connection,
+)
+
+
+def test_latency_stats():
+    stats = _latency_stats([0.1, 0.3, 0.2, 0.2])
+    assert stats["p50"] == pytest.approx(0.2)
+    assert stats["p95"] == pytest.approx(0.3)
+    # |0.3 - 0.1|, |0.2 - 0.3|, |0.2 - 0.2|
+    assert stats["jitter"] == pytest.approx(0.1)
+
+
+@pytest.mark.asyncio
+async def test_best_connection_probes_concurrently_with_deadline():
+    async def _probe_endpoint(network, samples):
+        if network == "ws://unreachable":
+            await asyncio.sleep(10)
+        if network == "ws://broken":
+            raise ConnectionRefusedError("refused")
+        return {"connect": 0.01}
+
+    with patch.object(subtensor_interface, "_probe_endpoint", _probe_endpoint):
+        results = await asyncio.wait_for(
+            best_connection(
+                ["ws://unreachable", "ws://fine", "ws://broken"], timeout=0.1
+            ),
+            timeout=1,
+        )
+
+    assert results["ws://fine"] == {"connect": 0.01}
+    assert "Timed out" in results["ws://unreachable"]["error"]
+    assert results["ws://broken"] == {"error": "refused"}
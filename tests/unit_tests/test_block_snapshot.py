@@ -0,0 +1,241 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from bittensor_cli.src.bittensor.subtensor_interface import SubtensorInterface
+
+
+@pytest.fixture
+def subtensor():
+    """Create a SubtensorInterface with a mocked substrate connection."""
+    st = SubtensorInterface("finney")
+    st.substrate = AsyncMock()
+    st.substrate.get_chain_head = AsyncMock(return_value="0xpinned")
+    st.substrate.query = AsyncMock(return_value=MagicMock(value=42))
+    return st
+
+
+@pytest.mark.asyncio
+async def test_snapshot_pins_chain_head_once(subtensor):
+    async with subtensor.at_block() as snapshot:
+        assert snapshot.block_hash == "0xpinned"
+        await subtensor.query("SubtensorModule", "Tempo", [1])
+        await subtensor.query("SubtensorModule", "Tempo", [2])
+
+    subtensor.substrate.get_chain_head.assert_awaited_once()
+    for call in subtensor.substrate.query.await_args_list:
+        assert call.args[3] == "0xpinned"
+
+
+@pytest.mark.asyncio
+async def test_snapshot_memoizes_repeated_reads(subtensor):
+    async with subtensor.at_block():
+        results = await asyncio.gather(
+            *[subtensor.query("SubtensorModule", "Tempo", [1]) for _ in range(5)]
+        )
+        await subtensor.subnet_exists(1)
+        await subtensor.subnet_exists(1)
+
+    assert results == [42] * 5
+    # one read for Tempo, one for NetworksAdded
+    assert subtensor.substrate.query.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_snapshot_shares_all_subnets_fetch(subtensor):
+    subtensor._all_subnets = AsyncMock(return_value=[])
+    async with subtensor.at_block():
+        await asyncio.gather(subtensor.all_subnets(), subtensor.all_subnets())
+        await subtensor.all_subnets(block_hash="0xpinned")
+
+    subtensor._all_subnets.assert_awaited_once_with("0xpinned")
+
+
+@pytest.mark.asyncio
+async def test_explicit_block_hash_bypasses_snapshot(subtensor):
+    async with subtensor.at_block():
+        await subtensor.query("SubtensorModule", "Tempo", [1], block_hash="0xother")
+        await subtensor.query("SubtensorModule", "Tempo", [1], block_hash="0xother")
+
+    assert subtensor.substrate.query.await_count == 2
+    assert subtensor.substrate.query.await_args.args[3] == "0xother"
+
+
+@pytest.mark.asyncio
+async def test_snapshot_failed_reads_are_not_memoized(subtensor):
+    subtensor.substrate.query = AsyncMock(
+        side_effect=[ConnectionError("dropped"), MagicMock(value=7)]
+    )
+    async with subtensor.at_block():
+        with pytest.raises(ConnectionError):
+            await subtensor.query("SubtensorModule", "Tempo", [1])
+        assert await subtensor.query("SubtensorModule", "Tempo", [1]) == 7
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_released_on_exit(subtensor):
+    async with subtensor.at_block():
+        assert subtensor._snapshot is not None
+    assert subtensor._snapshot is None
+
+    await subtensor.query("SubtensorModule", "Tempo", [1])
+    assert subtensor.substrate.query.await_args.args[3] is None
+
+
+@pytest.mark.asyncio
+async def test_query_multi_pages_large_key_sets(subtensor):
+    async def _query_multi(keys, block_hash=None, runtime=None):
+        return [(key, key * 2) for key in keys]
+
+    subtensor.substrate.query_multi = AsyncMock(side_effect=_query_multi)
+    result = await subtensor.query_multi(list(range(25)), page_size=10)
+
+    assert result == [(i, i * 2) for i in range(25)]
+    assert subtensor.substrate.query_multi.await_count == 3
+    subtensor.substrate.init_runtime.assert_awaited_once()
+
+
+@pytest.fixture
+def paged_map(subtensor):
+    """A storage map of 25 records, served in pages by `substrate.query_map`."""
+
+    async def _query_map(
+        module, storage_function, params, block_hash, page_size, start_key
+    ):
+        start = 0 if start_key is None else int(start_key) + 1
+        records = [(i, i * 2) for i in range(start, min(start + page_size, 25))]
+        return MagicMock(
+            records=records, last_key=str(records[-1][0]) if records else None
+        )
+
+    subtensor.substrate.query_map = AsyncMock(side_effect=_query_map)
+    return subtensor
+
+
+@pytest.mark.asyncio
+async def test_stream_query_map_reads_pages_at_one_block(paged_map):
+    status = MagicMock()
+    records = [
+        record
+        async for record in paged_map.stream_query_map(
+            "SubtensorModule", "Weights", [1], page_size=10, status=status
+        )
+    ]
+
+    assert records == [(i, i * 2) for i in range(25)]
+    assert paged_map.substrate.query_map.await_count == 3
+    assert {
+        call.kwargs["block_hash"]
+        for call in paged_map.substrate.query_map.await_args_list
+    } == {"0xpinned"}
+    status.update.assert_called_with("Reading SubtensorModule.Weights: 25 records...")
+
+
+@pytest.mark.asyncio
+async def test_stream_query_map_stops_early(paged_map):
+    stream = paged_map.stream_query_map("SubtensorModule", "Weights", page_size=10)
+    async for key, _ in stream:
+        if key == 3:
+            break
+    await stream.aclose()
+    await asyncio.sleep(0)
+
+    # the first page, and the prefetch of the second, which is cancelled
+    assert paged_map.substrate.query_map.await_count <= 2
+    assert all(
+        call.kwargs["start_key"] in (None, "9")
+        for call in paged_map.substrate.query_map.call_args_list
+    )
+
+
+@pytest.fixture
+def storage(subtensor):
+    """SubtensorModule storage of subnets 1 and 2 (subnet 3 does not exist), read through `query_multi`."""
+    values = {
+        ("NetworksAdded", 1): True,
+        ("NetworksAdded", 2): True,
+        ("Tempo", 1): 360,
+        ("Tempo", 2): 99,
+        ("Burn", 1): 10,
+        ("Burn", 2): 20,
+    }
+
+    async def _create_storage_keys(*queries, block_hash=None):
+        return [
+            [(fn, params[0]) for params in params_list]
+            for _, fn, params_list in queries
+        ]
+
+    async def _query_multi(keys, block_hash=None):
+        return [(key, values.get(key)) for key in keys]
+
+    subtensor.create_storage_keys = AsyncMock(side_effect=_create_storage_keys)
+    subtensor.query_multi = AsyncMock(side_effect=_query_multi)
+    return subtensor
+
+
+@pytest.mark.asyncio
+async def test_hyperparameters_of_many_subnets_in_one_query(storage):
+    result = await storage.get_hyperparameters(["Tempo", "Burn"], [1, 2, 3])
+
+    assert result == {
+        1: {"Tempo": 360, "Burn": 10},
+        2: {"Tempo": 99, "Burn": 20},
+        3: None,
+    }
+    storage.query_multi.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_checks_subnet_existence_once(storage):
+    async with storage.at_block():
+        await storage.get_hyperparameters(["Tempo"], [1, 2])
+        assert await storage.get_hyperparameter("Burn", 1) == 10
+        # shared with the single reads of the snapshot
+        assert await storage.subnet_exists(2) is True
+
+    read_keys = [
+        key for call in storage.query_multi.await_args_list for key in call.args[0]
+    ]
+    assert sorted(read_keys) == sorted(
+        [
+            ("NetworksAdded", 1),
+            ("NetworksAdded", 2),
+            ("Tempo", 1),
+            ("Tempo", 2),
+            ("Burn", 1),
+        ]
+    )
+    storage.substrate.query.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_serves_tempo_from_loaded_subnets(storage):
+    storage._all_subnets = AsyncMock(
+        return_value=[MagicMock(netuid=1, tempo=360, blocks_since_last_step=7)]
+    )
+    async with storage.at_block():
+        await storage.all_subnets()
+        result = await storage.get_hyperparameters(
+            ["Tempo", "BlocksSinceLastStep"], [1]
+        )
+
+    assert result == {1: {"Tempo": 360, "BlocksSinceLastStep": 7}}
+    storage.query_multi.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_snapshots_do_not_clash(subtensor):
+    async def _read_at(block_hash):
+        async with subtensor.at_block(block_hash):
+            await asyncio.sleep(0)
+            await subtensor.query("SubtensorModule", "Tempo", [1])
+            await asyncio.sleep(0)
+            return subtensor._pinned_block_hash(None)
+
+    assert await asyncio.gather(_read_at("0xa"), _read_at("0xb")) == ["0xa", "0xb"]
+    assert sorted(
+        call.args[3] for call in subtensor.substrate.query.await_args_list
+    ) == ["0xa", "0xb"]
+    assert subtensor._snapshot is None
@@ -12,8 +12,9 @@ from bittensor_cli.src.bittensor.chain_data import (
     DynamicInfo,
     StakeInfo,
     NeuronInfo,
+    NeuronInfoLite,
 )
-from bittensor_cli.src.bittensor.balances import Balance
+from bittensor_cli.src.bittensor.balances import Balance, fixed_to_float
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -341,6 +342,81 @@ class TestAlphaToTaoWithSlippage:
         assert pct < 0.01
 
 
+# ---------------------------------------------------------------------------
+# DynamicInfo.swap_rao / swaps_rao
+# ---------------------------------------------------------------------------
+
+
+class TestSwapRao:
+    # reserves large enough that their product does not fit in a float's mantissa
+    ALPHA_IN = 3_141_592_653_589_793_238
+    TAO_IN = 2_718_281_828_459_045
+
+    def _make_info(self, netuid=1) -> DynamicInfo:
+        return DynamicInfo._fix_decoded(
+            _make_dynamic_decoded(
+                netuid=netuid, alpha_in_rao=self.ALPHA_IN, tao_in_rao=self.TAO_IN
+            )
+        )
+
+    def test_stake_is_exact_constant_product(self):
+        info = self._make_info()
+        amount = 123_456_789_123
+        received, ideal = info.swap_rao(amount, to_alpha=True)
+        k = self.ALPHA_IN * self.TAO_IN
+        assert received == self.ALPHA_IN - k // (self.TAO_IN + amount)
+        assert ideal == info.tao_to_alpha(Balance.from_rao(amount)).rao
+        assert ideal >= received
+
+    def test_unstake_is_exact_constant_product(self):
+        info = self._make_info()
+        amount = 987_654_321_987_654
+        received, ideal = info.swap_rao(amount, to_alpha=False)
+        k = self.ALPHA_IN * self.TAO_IN
+        assert received == self.TAO_IN - k // (self.ALPHA_IN + amount)
+        assert ideal == info.alpha_to_tao(Balance.from_rao(amount)).rao
+        assert ideal >= received
+
+    def test_ideal_is_at_the_swap_pallet_price(self):
+        """The ideal amount uses `price` (AlphaSqrtPrice), even when it differs from the reserve ratio."""
+        info = self._make_info()
+        info.price = Balance.from_rao(1_234_567)
+        amount = 987_654_321_987_654
+        _, ideal = info.swap_rao(amount, to_alpha=False)
+        assert ideal == info.alpha_to_tao(Balance.from_rao(amount)).rao
+        assert ideal == amount * 1_234_567 // TAO
+        _, ideal = info.swap_rao(amount, to_alpha=True)
+        assert ideal == info.tao_to_alpha(Balance.from_rao(amount)).rao
+        assert ideal == pytest.approx(amount * TAO / 1_234_567, abs=1)
+
+    def test_price_matches_fixed_to_float(self):
+        info = self._make_info()
+        price = fixed_to_float({"bits": info.price_u64f64})
+        assert price == pytest.approx(info.price.tao, rel=1e-12)
+
+    def test_non_dynamic_is_one_to_one(self):
+        info = self._make_info(netuid=0)
+        assert info.swap_rao(5 * TAO, to_alpha=True) == (5 * TAO, 5 * TAO)
+
+    def test_slippage_methods_use_integer_swap(self):
+        info = self._make_info()
+        amount = Balance.from_tao(1_000.0)
+        received, ideal = info.swap_rao(amount.rao, to_alpha=False)
+        tao_returned, slippage, _ = info.alpha_to_tao_with_slippage(amount)
+        assert tao_returned.rao == received
+        assert slippage.rao == max(ideal - received, 0)
+
+    def test_batch_matches_single_swaps(self):
+        pools = {1: self._make_info(1), 0: self._make_info(0)}
+        netuids = [1, 0, 1]
+        amounts = [TAO, 2 * TAO, 3 * TAO]
+        received, ideal = DynamicInfo.swaps_rao(pools, netuids, amounts, to_alpha=True)
+        expected = [
+            pools[n].swap_rao(a, to_alpha=True) for n, a in zip(netuids, amounts)
+        ]
+        assert list(zip(received, ideal)) == expected
+
+
 # ---------------------------------------------------------------------------
 # StakeInfo._fix_decoded
 # ---------------------------------------------------------------------------
@@ -444,3 +520,80 @@ class TestNeuronInfoFixDecoded:
         assert isinstance(info.stake_dict, dict)
         # One entry from _ACCOUNT_ID → 5 TAO
         assert len(info.stake_dict) == 1
+
+
+# ---------------------------------------------------------------------------
+# InfoBase.table_from_any
+# ---------------------------------------------------------------------------
+
+
+def _make_neuron_lite_decoded(uid: int, coldkey: str) -> dict:
+    """Construct a decoded dict for NeuronInfoLite, with the SS58 addresses the runtime API returns."""
+    # addresses are built at runtime, so equal addresses are distinct (non-interned) objects
+    decoded = _make_neuron_decoded(emission_rao=(uid + 1) * TAO)
+    del decoded["weights"], decoded["bonds"]
+    decoded.update(
+        hotkey=f"5Hotkey{uid}",
+        coldkey=f"{coldkey}{uid % 2}",
+        uid=uid,
+        rank=65535,
+        stake=[("5Staker", uid * TAO), ("5Other", TAO)],
+    )
+    return decoded
+
+
+class TestTableFromAny:
+    def _decoded(self):
+        return [_make_neuron_lite_decoded(uid, "5Cold") for uid in range(4)]
+
+    def test_columns_match_list_decoding(self):
+        """Each column holds the same values as the row objects' fields."""
+        decoded = self._decoded()
+        table = NeuronInfoLite.table_from_any(decoded)
+        rows = NeuronInfoLite.list_from_any(decoded)
+        assert len(table) == len(rows)
+        assert list(table.uid) == [n.uid for n in rows]
+        assert table.hotkey == [n.hotkey for n in rows]
+        assert table.coldkey == [n.coldkey for n in rows]
+        assert list(table.stake_rao) == [n.stake.rao for n in rows]
+        assert list(table.emission) == pytest.approx([n.emission for n in rows])
+        assert list(table.rank) == pytest.approx([n.rank for n in rows])
+
+    def test_addresses_are_interned(self):
+        """Repeated SS58 addresses share a single string object."""
+        decoded = self._decoded()
+        assert decoded[1]["coldkey"] is not decoded[3]["coldkey"]
+        table = NeuronInfoLite.table_from_any(decoded)
+        assert table.coldkey[1] is table.coldkey[3]
+
+    def test_rows_are_materialized_lazily_and_cached(self, monkeypatch):
+        """Rows are only decoded when indexed, and only once."""
+        decoded = self._decoded()
+        table = NeuronInfoLite.table_from_any(decoded)
+        calls = []
+        original = NeuronInfoLite.from_any.__func__
+        monkeypatch.setattr(
+            NeuronInfoLite,
+            "from_any",
+            classmethod(lambda cls, data: calls.append(data) or original(cls, data)),
+        )
+        assert calls == []
+        assert table[2].uid == 2
+        assert table[-2] is table[2]
+        assert [n.uid for n in table[1:3]] == [1, 2]
+        assert len(calls) == 2
+
+    def test_unknown_column_raises_attribute_error(self):
+        table = NeuronInfoLite.table_from_any([])
+        assert len(table) == 0
+        with pytest.raises(AttributeError):
+            _ = table.weights
+
+    def test_stake_info_table(self):
+        """StakeInfo amounts are kept in rao."""
+        decoded = [_make_stake_decoded(netuid=n, stake_rao=n * TAO) for n in (1, 2)]
+        decoded = [d | {"hotkey": "5Hot", "coldkey": "5Cold"} for d in decoded]
+        table = StakeInfo.table_from_any(decoded)
+        assert list(table.netuid) == [1, 2]
+        assert list(table.stake_rao) == [TAO, 2 * TAO]
+        assert table[1].stake.rao == 2 * TAO
@@ -0,0 +1,84 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from bittensor_cli.src.commands.stake.children_hotkeys import get_children
+from bittensor_cli.src.bittensor.balances import Balance
+from bittensor_cli.src.bittensor.subtensor_interface import SubtensorInterface
+
+from .conftest import ALT_HOTKEY_SS58, DEST_SS58, HOTKEY_SS58, PROXY_SS58
+
+# storage function: {(hotkey, netuid): value}
+STORAGE = {
+    "ChildKeys": {
+        (HOTKEY_SS58, 1): [(2**63, ALT_HOTKEY_SS58)],
+        (HOTKEY_SS58, 3): [(2**62, ALT_HOTKEY_SS58), (2**62, DEST_SS58)],
+    },
+    "ParentKeys": {(HOTKEY_SS58, 2): [(2**64 - 1, PROXY_SS58)]},
+    "ChildkeyTake": {(ALT_HOTKEY_SS58, 3): 6553},
+}
+
+
+@pytest.fixture
+def subtensor():
+    st = SubtensorInterface("finney")
+    st.substrate = AsyncMock()
+    st.get_all_subnet_netuids = AsyncMock(return_value=[0, 1, 2, 3])
+
+    async def _create_storage_keys(*queries, block_hash=None):
+        return [
+            [
+                SimpleNamespace(storage_function=fn, params=params)
+                for params in params_list
+            ]
+            for _, fn, params_list in queries
+        ]
+
+    async def _query_multi(keys, block_hash=None):
+        return [(k, STORAGE[k.storage_function].get(tuple(k.params))) for k in keys]
+
+    st.create_storage_keys = AsyncMock(side_effect=_create_storage_keys)
+    st.query_multi = AsyncMock(side_effect=_query_multi)
+    return st
+
+
+@pytest.mark.asyncio
+async def test_children_and_parents_of_all_netuids_in_one_query(subtensor):
+    children, parents = await subtensor.get_children_all_netuids(
+        HOTKEY_SS58, block_hash="0xhash"
+    )
+
+    assert children == {
+        1: [(2**63, ALT_HOTKEY_SS58)],
+        3: [(2**62, ALT_HOTKEY_SS58), (2**62, DEST_SS58)],
+    }
+    assert parents == {2: [(2**64 - 1, PROXY_SS58)]}
+    subtensor.query_multi.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_children_reads_children_and_takes_in_bulk(subtensor, mock_wallet):
+    subtensor.get_total_stake_for_hotkey = AsyncMock(
+        side_effect=lambda *hotkeys, netuids: {
+            hk: {n: Balance.from_tao(1) for n in netuids} for hk in hotkeys
+        }
+    )
+    with patch(
+        "bittensor_cli.src.commands.stake.children_hotkeys.get_hotkey_pub_ss58",
+        return_value=HOTKEY_SS58,
+    ):
+        output = await get_children(mock_wallet, subtensor)
+
+    assert output == {
+        1: {ALT_HOTKEY_SS58: 2**63},
+        3: {ALT_HOTKEY_SS58: 2**62, DEST_SS58: 2**62},
+    }
+    # one query for the children (and parents), and one for all of their takes
+    assert subtensor.query_multi.await_count == 2
+    take_keys = subtensor.query_multi.await_args_list[1].args[0]
+    assert {tuple(k.params) for k in take_keys} == {
+        (ALT_HOTKEY_SS58, 1),
+        (ALT_HOTKEY_SS58, 3),
+        (DEST_SS58, 3),
+    }
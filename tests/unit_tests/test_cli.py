@@ -636,6 +636,16 @@ def test_stake_transfer_calls_proxy_validation():
 # ============================================================================
 
 
+def _stream_of(records):
+    """Mocks `SubtensorInterface.stream_query_map`, yielding the given records."""
+
+    async def _stream(*args, **kwargs):
+        for record in records:
+            yield record
+
+    return MagicMock(side_effect=_stream)
+
+
 @pytest.mark.asyncio
 async def test_get_current_weights_for_uid_success():
     """Test fetching current weights for a specific UID."""
@@ -646,11 +656,13 @@ async def test_get_current_weights_for_uid_success():
         (0, [(0, 32768), (1, 16384), (2, 16384)]),
         (1, [(0, 65535), (1, 0), (2, 0)]),
     ]
-    mock_subtensor.weights = AsyncMock(return_value=mock_weights_data)
+    mock_subtensor.stream_query_map = _stream_of(mock_weights_data)
 
     result = await get_current_weights_for_uid(mock_subtensor, netuid=0, uid=0)
 
-    mock_subtensor.weights.assert_called_once_with(netuid=0)
+    mock_subtensor.stream_query_map.assert_called_once_with(
+        module="SubtensorModule", storage_function="Weights", params=[0]
+    )
     assert 0 in result
     assert 1 in result
     assert 2 in result
@@ -666,7 +678,7 @@ async def test_get_current_weights_for_uid_not_found():
         (0, [(0, 32768), (1, 16384)]),
         (1, [(0, 65535)]),
     ]
-    mock_subtensor.weights = AsyncMock(return_value=mock_weights_data)
+    mock_subtensor.stream_query_map = _stream_of(mock_weights_data)
 
     result = await get_current_weights_for_uid(mock_subtensor, netuid=0, uid=5)
 
@@ -677,7 +689,7 @@ async def test_get_current_weights_for_uid_not_found():
 async def test_get_current_weights_for_uid_empty():
     """Test fetching weights when the network has no weights set."""
     mock_subtensor = MagicMock()
-    mock_subtensor.weights = AsyncMock(return_value=[])
+    mock_subtensor.stream_query_map = _stream_of([])
 
     result = await get_current_weights_for_uid(mock_subtensor, netuid=0, uid=0)
 
@@ -1060,3 +1072,62 @@ def test_proxy_remove_with_delegate_calls_remove_proxy(mock_proxy_commands):
 
         # Should call _run_command with the result
         mock_run_command.assert_called_once()
+
+
+def test_config_is_parsed_once_until_it_changes(tmp_path, monkeypatch):
+    """Test that the parsed config is cached until the config file is modified"""
+    config_path = tmp_path / "config.yml"
+    monkeypatch.setenv("BTCLI_CONFIG_PATH", str(config_path))
+    cli_manager = CLIManager()
+    config = cli_manager._load_config()
+    assert config_path.exists()
+    cache_path = tmp_path / ".config.yml.json"
+    written = config_path.stat().st_mtime_ns
+    cached = cache_path.stat().st_mtime_ns
+
+    with patch("bittensor_cli.cli.safe_load") as mock_safe_load:
+        assert cli_manager._load_config() == config
+        mock_safe_load.assert_not_called()
+    # nothing was missing, so neither the config file nor its cache is rewritten
+    assert config_path.stat().st_mtime_ns == written
+    assert cache_path.stat().st_mtime_ns == cached
+
+    config_path.write_text(config_path.read_text().replace("network:", "# network:"))
+    with patch("bittensor_cli.cli.safe_load", return_value={}) as mock_safe_load:
+        cli_manager._load_config()
+        mock_safe_load.assert_called_once()
+
+
+def test_config_with_non_string_keys_is_not_cached(tmp_path, monkeypatch):
+    """Test that a config which JSON cannot represent faithfully is re-parsed rather than cached"""
+    config_path = tmp_path / "config.yml"
+    monkeypatch.setenv("BTCLI_CONFIG_PATH", str(config_path))
+    cli_manager = CLIManager()
+    cli_manager._load_config()
+    (tmp_path / ".config.yml.json").unlink()
+    with open(config_path, "a") as f:
+        f.write("netuid_aliases:\n  1: apex\n")
+
+    config = cli_manager._load_config()
+    assert config["netuid_aliases"] == {1: "apex"}
+    assert not (tmp_path / ".config.yml.json").exists()
+
+
+def test_proxies_are_loaded_on_first_access(tmp_path, monkeypatch):
+    """Test that the proxy address book is only read when used"""
+    db_path = tmp_path / "bittensor.db"
+    monkeypatch.setenv("BTCLI_PROXIES_PATH", str(db_path))
+    cli_manager = CLIManager()
+    assert cli_manager.proxies == {}
+    assert not db_path.exists()
+
+    db_path.touch()
+    cli_manager = CLIManager()
+    with patch(
+        "bittensor_cli.cli.ProxyAddressBook.read_rows",
+        return_value=[("my_proxy", "5F...", 0, "5G...", "Any", "")],
+    ) as mock_read_rows:
+        assert cli_manager._proxies is None
+        assert cli_manager.proxies["my_proxy"]["address"] == "5F..."
+        assert cli_manager.proxies["my_proxy"]["proxy_type"] == "Any"
+        mock_read_rows.assert_called_once()
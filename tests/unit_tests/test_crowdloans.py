@@ -0,0 +1,82 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from bittensor_cli.src.bittensor.subtensor_interface import SubtensorInterface
+
+from .conftest import COLDKEY_SS58
+
+LEASE_CALL = "0x0a0b"
+TRANSFER_CALL = "0x0501"
+
+
+def _fund_info(call):
+    return {
+        "creator": COLDKEY_SS58,
+        "funds_account": COLDKEY_SS58,
+        "deposit": 10,
+        "min_contribution": 1,
+        "cap": 100,
+        "raised": 50,
+        "end": 1000,
+        "finalized": False,
+        "contributors_count": 2,
+        "target_address": None,
+        "call": {"Inline": call} if call else None,
+    }
+
+
+@pytest.fixture
+def subtensor():
+    st = SubtensorInterface("finney")
+    st.substrate = AsyncMock()
+    st.substrate.init_runtime = AsyncMock(
+        return_value=SimpleNamespace(runtime_version=300)
+    )
+    methods = {LEASE_CALL: "register_leased_network", TRANSFER_CALL: "transfer"}
+
+    async def _create_scale_object(type_string, data, block_hash, runtime):
+        call = "0x" + data.data.hex()
+        return MagicMock(
+            decode=lambda: {
+                "call_module": "SubtensorModule",
+                "call_function": methods[call],
+            }
+        )
+
+    st.substrate.create_scale_object = AsyncMock(side_effect=_create_scale_object)
+    records = [
+        (1, _fund_info(LEASE_CALL)),
+        (2, _fund_info(TRANSFER_CALL)),
+        (3, _fund_info(LEASE_CALL)),
+        (4, _fund_info(None)),
+    ]
+
+    async def _stream(*args, **kwargs):
+        for record in records:
+            yield record
+
+    st.stream_query_map = MagicMock(side_effect=_stream)
+    return st
+
+
+@pytest.mark.asyncio
+async def test_crowdloan_calls_are_decoded_once_per_distinct_call(subtensor):
+    crowdloans = await subtensor.get_crowdloans(block_hash="0xhash")
+
+    assert {
+        fund_id: loan.call_details and loan.call_details["method"]
+        for fund_id, loan in crowdloans.items()
+    } == {
+        1: "register_leased_network",
+        2: "transfer",
+        3: "register_leased_network",
+        4: None,
+    }
+    subtensor.substrate.init_runtime.assert_awaited_once()
+    assert subtensor.substrate.create_scale_object.await_count == 2
+
+    # remembered for the rest of the session
+    await subtensor.get_crowdloans(block_hash="0xhash")
+    assert subtensor.substrate.create_scale_object.await_count == 2
@@ -0,0 +1,167 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from async_substrate_interface.errors import SubstrateRequestException
+
+from bittensor_cli.src.bittensor.extrinsics.pipeline import sign_and_send_pipelined
+from bittensor_cli.src.bittensor.substrate_pool import SubstratePool
+
+HEAD = 100
+
+
+def _receipt(**kwargs):
+    async def _is_success():
+        return True
+
+    return SimpleNamespace(is_success=_is_success(), **kwargs)
+
+
+@pytest.fixture
+def chain(mock_subtensor, mock_wallet):
+    """
+    A chain whose next block (HEAD + 1) includes every extrinsic accepted into the pool. Extrinsics are
+    `(call, nonce)` namespaces, and the first nonce is 5.
+    """
+    substrate = mock_subtensor.substrate
+    pool = []
+
+    async def _sign(call, keypair, nonce, era=None):
+        return SimpleNamespace(
+            call=call, nonce=nonce, extrinsic_hash=f"{call}:{nonce}".encode()
+        )
+
+    async def _submit(extrinsic, wait_for_inclusion, wait_for_finalization):
+        assert not (wait_for_inclusion or wait_for_finalization)
+        pool.append(extrinsic)
+
+    async def _subscribe(handler, finalized_only=False):
+        while await handler({"header": {"number": HEAD + 1}}, 0, "sub") is None:
+            pass
+
+    substrate.get_account_next_index = AsyncMock(return_value=5)
+    substrate.get_block_number = AsyncMock(return_value=HEAD)
+    substrate.create_signed_extrinsic = AsyncMock(side_effect=_sign)
+    substrate.submit_extrinsic = AsyncMock(side_effect=_submit)
+    substrate.subscribe_block_headers = AsyncMock(side_effect=_subscribe)
+    substrate.get_block_hash = AsyncMock(side_effect=lambda n: f"0xblock{n}")
+    substrate.get_extrinsics = AsyncMock(side_effect=lambda block_hash: list(pool))
+    with patch(
+        "bittensor_cli.src.bittensor.extrinsics.pipeline.AsyncExtrinsicReceipt",
+        side_effect=_receipt,
+    ):
+        yield SimpleNamespace(
+            subtensor=mock_subtensor, wallet=mock_wallet, substrate=substrate, pool=pool
+        )
+
+
+@pytest.mark.asyncio
+async def test_pipeline_signs_consecutive_nonces_and_waits_together(chain):
+    results = await sign_and_send_pipelined(
+        chain.subtensor, ["a", "b", "c"], chain.wallet
+    )
+
+    assert [(e.call, e.nonce) for e in chain.pool] == [("a", 5), ("b", 6), ("c", 7)]
+    chain.substrate.get_account_next_index.assert_awaited_once()
+    chain.substrate.subscribe_block_headers.assert_awaited_once()
+    assert [success for success, _, _ in results] == [True] * 3
+    assert [receipt.block_hash for _, _, receipt in results] == ["0xblock101"] * 3
+    assert [receipt.extrinsic_idx for _, _, receipt in results] == [0, 1, 2]
+    chain.substrate.clear_nonce_cache_for_account.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_pipeline_shifts_nonces_down_after_rejection(chain):
+    submit = chain.substrate.submit_extrinsic.side_effect
+
+    async def _reject_b(extrinsic, **kwargs):
+        if extrinsic.call == "b":
+            raise SubstrateRequestException("Invalid Transaction: Inability to pay")
+        await submit(extrinsic, **kwargs)
+
+    chain.substrate.submit_extrinsic.side_effect = _reject_b
+    results = await sign_and_send_pipelined(
+        chain.subtensor, ["a", "b", "c"], chain.wallet
+    )
+
+    # "c" takes the nonce "b" did not consume, so it is not stuck behind a gap
+    assert [(e.call, e.nonce) for e in chain.pool] == [("a", 5), ("c", 6)]
+    assert [success for success, _, _ in results] == [True, False, True]
+    assert "Inability to pay" in results[1][1]
+
+
+@pytest.mark.asyncio
+async def test_pipeline_resubmits_once_with_fresh_nonce(chain):
+    submit = chain.substrate.submit_extrinsic.side_effect
+    # another transaction from the account used nonce 5 in the meantime
+    chain.substrate.get_account_next_index.side_effect = [5, 6]
+
+    async def _stale(extrinsic, **kwargs):
+        if extrinsic.nonce == 5:
+            raise SubstrateRequestException(
+                "Invalid Transaction: Transaction is outdated"
+            )
+        await submit(extrinsic, **kwargs)
+
+    chain.substrate.submit_extrinsic.side_effect = _stale
+    results = await sign_and_send_pipelined(chain.subtensor, ["a", "b"], chain.wallet)
+
+    assert [(e.call, e.nonce) for e in chain.pool] == [("a", 6), ("b", 7)]
+    assert all(success for success, _, _ in results)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_without_waiting_does_not_follow_blocks(chain):
+    results = await sign_and_send_pipelined(
+        chain.subtensor,
+        ["a", "b"],
+        chain.wallet,
+        wait_for_inclusion=False,
+        wait_for_finalization=False,
+    )
+
+    chain.substrate.subscribe_block_headers.assert_not_awaited()
+    assert [success for success, _, _ in results] == [True, True]
+    assert results[1][2].extrinsic_hash == f"0x{b'b:6'.hex()}"
+
+
+@pytest.mark.asyncio
+async def test_pipeline_reports_extrinsics_not_included(chain):
+    chain.substrate.get_extrinsics.side_effect = lambda block_hash: chain.pool[:1]
+    results = await sign_and_send_pipelined(
+        chain.subtensor, ["a", "b"], chain.wallet, timeout_blocks=0
+    )
+
+    assert results[0][0] is True
+    assert results[1][0] is False
+    assert "not included" in results[1][1]
+
+
+@pytest.mark.asyncio
+async def test_pipeline_rescans_blocks_not_yet_available(chain):
+    # the first head is announced before its block can be looked up
+    block_hashes = iter([None, "0xblock101"])
+    chain.substrate.get_block_hash.side_effect = lambda n: next(block_hashes)
+    results = await sign_and_send_pipelined(chain.subtensor, ["a", "b"], chain.wallet)
+
+    assert [success for success, _, _ in results] == [True, True]
+    assert [receipt.block_hash for _, _, receipt in results] == ["0xblock101"] * 2
+
+
+@pytest.mark.asyncio
+async def test_pipeline_looks_blocks_up_on_pinned_endpoint(chain):
+    # the fastest endpoint of the pool lags behind the pinned one, whose subscription announces the blocks
+    lagging = MagicMock(url="ws://lagging")
+    lagging.get_block_number = AsyncMock(return_value=HEAD)
+    lagging.get_block_hash = AsyncMock(return_value=None)
+    lagging.get_extrinsics = AsyncMock(return_value=[])
+    chain.substrate.url = "ws://pinned"
+    pool = SubstratePool([chain.substrate, lagging])
+    pool.latency = {"ws://pinned": 0.5, "ws://lagging": 0.05}
+    chain.subtensor.substrate = pool
+
+    results = await sign_and_send_pipelined(chain.subtensor, ["a", "b"], chain.wallet)
+
+    assert [success for success, _, _ in results] == [True, True]
+    lagging.get_block_hash.assert_not_awaited()
+    lagging.get_extrinsics.assert_not_awaited()
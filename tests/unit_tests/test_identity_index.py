@@ -0,0 +1,201 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from async_substrate_interface.errors import SubstrateRequestException
+from scalecodec.utils.ss58 import ss58_decode
+
+from bittensor_cli.src.bittensor.query_cache import QueryCache
+from bittensor_cli.src.bittensor.subtensor_interface import SubtensorInterface
+
+from .conftest import (
+    ALT_HOTKEY_SS58,
+    COLDKEY_SS58,
+    DEST_SS58,
+    HOTKEY_SS58,
+    PROXY_SS58,
+)
+
+IDENTITY_PREFIX = "0x" + "11" * 32
+OWNED_PREFIX = "0x" + "22" * 32
+
+
+def _key(storage_function, coldkey):
+    prefix = IDENTITY_PREFIX if storage_function == "IdentitiesV2" else OWNED_PREFIX
+    return SimpleNamespace(
+        storage_function=storage_function,
+        params=[coldkey],
+        to_hex=lambda: f"{prefix}{'ab' * 16}{ss58_decode(coldkey)}",
+    )
+
+
+@pytest.fixture
+def chain():
+    """
+    A chain whose identity storage is `chain.identities` and `chain.owned_hotkeys`, at whichever block is read.
+    `state_queryStorage` reports `chain.changed` (coldkeys) as changed after the first block of the range.
+    """
+    st = SubtensorInterface("finney")
+    st.substrate = AsyncMock()
+    state = SimpleNamespace(
+        identities={COLDKEY_SS58: {"name": "cold"}, PROXY_SS58: {"name": "proxy"}},
+        owned_hotkeys={COLDKEY_SS58: [HOTKEY_SS58], PROXY_SS58: [ALT_HOTKEY_SS58]},
+        changed=set(),
+        subtensor=st,
+    )
+    st.substrate.get_block_number = AsyncMock(
+        side_effect=lambda block_hash: int(block_hash[2:])
+    )
+
+    async def _query_map(module, storage_function, block_hash, **kwargs):
+        return SimpleNamespace(records=list(state.identities.items()), last_key=None)
+
+    async def _create_storage_keys(*queries, block_hash=None):
+        return [
+            [_key(name, *params) for params in params_list]
+            for _, name, params_list in queries
+        ]
+
+    async def _query_multi(keys, block_hash=None):
+        storage = {
+            "IdentitiesV2": state.identities,
+            "OwnedHotkeys": state.owned_hotkeys,
+        }
+        return [(k, storage[k.storage_function].get(k.params[0])) for k in keys]
+
+    async def _rpc_request(method, params):
+        if method == "state_getKeys":
+            return {
+                "result": [_key("IdentitiesV2", ck).to_hex() for ck in state.identities]
+            }
+        changed_keys = [
+            _key(name, ck).to_hex()
+            for ck in state.changed
+            for name in ("IdentitiesV2", "OwnedHotkeys")
+        ]
+        return {
+            "result": [
+                {"block": params[1], "changes": [[k, None] for k in params[0]]},
+                {
+                    "block": params[2],
+                    "changes": [[k, "0x00"] for k in params[0] if k in changed_keys],
+                },
+            ]
+        }
+
+    st.substrate.query_map = AsyncMock(side_effect=_query_map)
+    st.create_storage_keys = AsyncMock(side_effect=_create_storage_keys)
+    st.query_multi = AsyncMock(side_effect=_query_multi)
+    st.substrate.rpc_request = AsyncMock(side_effect=_rpc_request)
+    st.substrate.init_runtime = AsyncMock(return_value=MagicMock())
+    with patch(
+        "bittensor_cli.src.bittensor.identity_index.StorageKey.create_from_storage_function",
+        return_value=MagicMock(to_hex=lambda: IDENTITY_PREFIX),
+    ):
+        yield state
+
+
+def _read_coldkeys(chain, storage_function="IdentitiesV2"):
+    return {
+        k.params[0]
+        for call in chain.subtensor.query_multi.await_args_list
+        for k in call.args[0]
+        if k.storage_function == storage_function
+    }
+
+
+@pytest.mark.asyncio
+async def test_full_fetch_builds_coldkey_hotkey_identities(chain):
+    identities = await chain.subtensor.fetch_coldkey_hotkey_identities("0x100")
+
+    assert identities["coldkeys"][COLDKEY_SS58] == {
+        "identity": {"name": "cold"},
+        "hotkeys": [HOTKEY_SS58],
+    }
+    assert identities["hotkeys"][ALT_HOTKEY_SS58] == {
+        "coldkey": PROXY_SS58,
+        "identity": {"name": "proxy"},
+    }
+    # the same block is served from the session
+    assert await chain.subtensor.query_all_identities("0x100") == chain.identities
+    chain.subtensor.substrate.query_map.assert_awaited_once()
+    chain.subtensor.substrate.rpc_request.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_owned_hotkeys_are_only_read_when_needed(chain):
+    identities = await chain.subtensor.query_all_identities("0x100")
+
+    assert identities == chain.identities
+    chain.subtensor.query_multi.assert_not_awaited()
+    # the caller gets its own copy of the shared index
+    identities.clear()
+    assert (await chain.subtensor.get_identity_index("0x100")).identities
+
+    await chain.subtensor.fetch_coldkey_hotkey_identities("0x100")
+    await chain.subtensor.fetch_coldkey_hotkey_identities("0x100")
+    assert _read_coldkeys(chain, "OwnedHotkeys") == {COLDKEY_SS58, PROXY_SS58}
+    chain.subtensor.query_multi.assert_awaited_once()
+    chain.subtensor.substrate.query_map.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_delta_rereads_only_changed_and_new_coldkeys(chain):
+    await chain.subtensor.get_identity_index("0x100", owned_hotkeys=True)
+    chain.subtensor.query_multi.reset_mock()
+
+    chain.identities[PROXY_SS58] = {"name": "renamed"}
+    chain.identities[DEST_SS58] = {"name": "new"}
+    chain.owned_hotkeys[DEST_SS58] = []
+    del chain.identities[COLDKEY_SS58]
+    chain.changed = {PROXY_SS58}
+    index = await chain.subtensor.get_identity_index("0x110", owned_hotkeys=True)
+
+    assert index.identities == chain.identities
+    assert index.owned_hotkeys == {PROXY_SS58: [ALT_HOTKEY_SS58], DEST_SS58: []}
+    assert _read_coldkeys(chain) == {PROXY_SS58, DEST_SS58}
+    chain.subtensor.substrate.query_map.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_delta_falls_back_to_full_fetch_when_unsupported(chain):
+    await chain.subtensor.get_identity_index("0x100")
+    chain.subtensor.substrate.rpc_request.side_effect = SubstrateRequestException(
+        "Method not found"
+    )
+
+    await chain.subtensor.get_identity_index("0x110")
+    await chain.subtensor.get_identity_index("0x120")
+
+    assert chain.subtensor.substrate.query_map.await_count == 3
+    # the delta is not attempted again once the node has rejected it
+    assert chain.subtensor.substrate.rpc_request.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_persisted_index_is_served_within_ttl_and_updated_after(chain, tmp_path):
+    cache = QueryCache(db_path=str(tmp_path / "query_cache.db"))
+    chain.subtensor.query_cache = cache
+    await chain.subtensor.get_identity_index("0x100")
+
+    # a later session, reading at the chain head
+    chain.subtensor._identity_index = None
+    chain.subtensor.substrate.get_chain_head = AsyncMock(return_value="0x110")
+    assert (await chain.subtensor.get_identity_index()).block == 100
+    chain.subtensor._identity_index = None
+    chain.changed = {COLDKEY_SS58}
+    chain.subtensor.substrate.get_chain_head.return_value = "0x1000"
+    assert (await chain.subtensor.get_identity_index()).block == 1000
+
+    chain.subtensor.substrate.query_map.assert_awaited_once()
+    assert _read_coldkeys(chain) == {COLDKEY_SS58}
+
+
+@pytest.mark.asyncio
+async def test_persisted_index_is_not_served_for_explicit_blocks(chain, tmp_path):
+    cache = QueryCache(db_path=str(tmp_path / "query_cache.db"))
+    chain.subtensor.query_cache = cache
+    await chain.subtensor.get_identity_index("0x100")
+
+    chain.subtensor._identity_index = None
+    assert (await chain.subtensor.get_identity_index("0x110")).block == 110
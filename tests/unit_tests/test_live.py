@@ -0,0 +1,96 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from bittensor_cli.src.bittensor.live import RowCache, follow_chain_heads
+
+
+@pytest.fixture
+def heads():
+    """
+    A chain whose new heads are the numbers put in the returned queue. Putting None ends the subscription with an
+    error.
+    """
+    feed = asyncio.Queue()
+
+    async def _subscribe(handler, finalized_only=False):
+        while (number := await feed.get()) is not None:
+            await handler({"header": {"number": number}}, 0, "sub")
+        raise ConnectionError("subscription closed")
+
+    subtensor = MagicMock()
+    subtensor.substrate.subscribe_block_headers = AsyncMock(side_effect=_subscribe)
+    subtensor.substrate.get_block_hash = AsyncMock(side_effect=lambda n: f"0x{n}")
+    feed.subtensor = subtensor
+    return feed
+
+
+@pytest.mark.asyncio
+async def test_ticks_once_per_block_with_periodic_slow_refresh(heads):
+    ticks = follow_chain_heads(heads.subtensor, slow_refresh_blocks=2)
+    seen = []
+    for number in range(100, 104):
+        heads.put_nowait(number)
+        seen.append(await anext(ticks))
+    await ticks.aclose()
+
+    assert [t.block_number for t in seen] == [100, 101, 102, 103]
+    assert [t.block_hash for t in seen] == ["0x100", "0x101", "0x102", "0x103"]
+    assert [t.previous_block for t in seen] == [None, 100, 101, 102]
+    assert [t.refresh_slow for t in seen] == [True, False, True, False]
+    heads.subtensor.substrate.subscribe_block_headers.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_skips_heads_which_arrived_during_a_slow_tick(heads):
+    ticks = follow_chain_heads(heads.subtensor, refresh_slow_first=False)
+    for number in (100, 101, 102):
+        heads.put_nowait(number)
+
+    tick = await anext(ticks)
+    await ticks.aclose()
+
+    assert (tick.block_number, tick.previous_block, tick.refresh_slow) == (
+        102,
+        None,
+        False,
+    )
+    heads.subtensor.substrate.get_block_hash.assert_awaited_once_with(102)
+
+
+@pytest.mark.asyncio
+async def test_heads_not_yet_available_are_not_ticked(heads):
+    heads.subtensor.substrate.get_block_hash.side_effect = lambda n: (
+        None if n == 100 else f"0x{n}"
+    )
+    ticks = follow_chain_heads(heads.subtensor)
+    heads.put_nowait(100)
+    heads.put_nowait(101)
+
+    tick = await anext(ticks)
+    await ticks.aclose()
+
+    assert (tick.block_number, tick.block_hash, tick.previous_block) == (
+        101,
+        "0x101",
+        None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_subscription_errors_are_raised(heads):
+    heads.put_nowait(None)
+    with pytest.raises(ConnectionError):
+        await anext(follow_chain_heads(heads.subtensor))
+
+
+def test_row_cache_formats_only_changed_rows():
+    format_row = MagicMock(side_effect=lambda: ["row"])
+    cache = RowCache()
+
+    for values in ((1, 2), (1, 2), (1, 3)):
+        assert cache.row(0, values, format_row) == ["row"]
+    cache.row(1, (1, 3), format_row)
+
+    assert format_row.call_count == 3
@@ -0,0 +1,100 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from bittensor_cli.src.bittensor.minigraph import CSRMatrix, MiniGraph
+
+
+def _neuron(uid: int, weights=(), bonds=()):
+    neuron = MagicMock(
+        uid=uid,
+        hotkey=f"hk{uid}",
+        trust=0.5,
+        rank=0.25,
+        active=True,
+        validator_permit=uid == 0,
+        weights=list(weights),
+        bonds=list(bonds),
+    )
+    return neuron
+
+
+def test_csr_from_rows_normalizes_and_densifies():
+    matrix = CSRMatrix.from_rows(
+        [[(0, 1), (2, 3)], [], [(1, 5)]], n_cols=3, normalize=True
+    )
+    assert len(matrix) == 3
+    assert matrix.nnz == 3
+    assert list(matrix.indptr) == [0, 2, 2, 3]
+    assert matrix.dense() == [
+        pytest.approx([0.25, 0.0, 0.75]),
+        pytest.approx([0.0, 0.0, 0.0]),
+        pytest.approx([0.0, 1.0, 0.0]),
+    ]
+    assert list(matrix[-1]) == pytest.approx([0.0, 1.0, 0.0])
+
+
+def test_csr_drops_out_of_range_columns():
+    matrix = CSRMatrix.from_rows([[(0, 1), (7, 1)]], n_cols=2, normalize=True)
+    assert list(matrix.indices) == [0]
+    assert list(matrix[0]) == pytest.approx([1.0, 0.0])
+
+
+@pytest.mark.asyncio
+async def test_minigraph_builds_columns_and_sparse_weights():
+    neurons = [
+        _neuron(0, weights=[(1, 10), (2, 30)], bonds=[(1, 7)]),
+        _neuron(1),
+        _neuron(2, weights=[(0, 1)]),
+    ]
+    subnet_state = MagicMock(hotkeys=["hk1"], stake_weight=[0.9])
+    subnet_state.global_stake = [MagicMock(tao=2.0)]
+    subnet_state.local_stake = [MagicMock(tao=3.0)]
+    subtensor = MagicMock(network="finney")
+
+    async with MiniGraph(1, neurons, subtensor, subnet_state, block=100) as graph:
+        assert list(graph.uids) == [0, 1, 2]
+        assert list(graph.validator_permit) == [1, 0, 0]
+        assert list(graph.local_stake) == [0.0, 3.0, 0.0]
+        assert list(graph.weights[0]) == pytest.approx([0.0, 0.25, 0.75])
+        assert list(graph.bonds[0]) == [0.0, 7.0, 0.0]
+
+
+@pytest.mark.asyncio
+async def test_minigraph_root_weights_are_indexed_by_netuid():
+    neurons = [_neuron(0, weights=[(1, 1), (3, 1), (9, 5)])]
+    subnet_state = MagicMock(hotkeys=[])
+    subtensor = MagicMock(network="finney")
+    subtensor.query = AsyncMock(return_value=4)
+
+    graph = MiniGraph(0, neurons, subtensor, subnet_state, block=1, block_hash="0xabc")
+    async with graph:
+        # netuid 9 does not exist
+        assert list(graph.weights[0]) == pytest.approx([0.0, 0.5, 0.0, 0.5])
+    # the subnet count is read at the graph's block, as its rows are
+    subtensor.query.assert_awaited_once_with(
+        module="SubtensorModule",
+        storage_function="TotalNetworks",
+        params=[],
+        block_hash="0xabc",
+    )
+
+
+@pytest.mark.asyncio
+async def test_minigraph_fetches_weights_and_bonds_for_lite_neurons():
+    neurons = [_neuron(0), _neuron(1)]
+    for neuron in neurons:
+        del neuron.weights
+        del neuron.bonds
+    subtensor = MagicMock(network="finney")
+    subtensor.weights = AsyncMock(return_value=[(1, [(0, 4)])])
+    subtensor.bonds = AsyncMock(return_value=[])
+
+    graph = MiniGraph(1, neurons, subtensor, None, block=1, block_hash="0xabc")
+    assert list(graph.global_stake) == [0.0, 0.0]
+    subtensor.weights.assert_not_awaited()
+
+    async with graph:
+        assert list(graph.weights[1]) == pytest.approx([1.0, 0.0])
+        assert list(graph.bonds[0]) == [0.0, 0.0]
+    subtensor.weights.assert_awaited_once_with(1, block_hash="0xabc")
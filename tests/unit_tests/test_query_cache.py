@@ -0,0 +1,175 @@
+import sqlite3
+from unittest.mock import AsyncMock
+
+import pytest
+
+from bittensor_cli.src.bittensor.query_cache import QueryCache
+from bittensor_cli.src.bittensor.subtensor_interface import SubtensorInterface
+
+ENDPOINT = "wss://entrypoint-finney.opentensor.ai:443"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return QueryCache(db_path=str(tmp_path / "query_cache.db"))
+
+
+def test_exact_block_hash_roundtrip(cache):
+    cache.set(ENDPOINT, "all_subnets", "0xaa", 100, [{"netuid": 1}])
+    assert cache.get(ENDPOINT, "all_subnets", "0xaa") == (
+        True,
+        [{"netuid": 1}],
+    )
+    assert cache.get(ENDPOINT, "all_subnets", "0xbb") == (False, None)
+    assert cache.get("ws://127.0.0.1:9944", "all_subnets", "0xaa")[0] is False
+
+
+def test_get_recent_respects_ttl(cache):
+    cache.set(ENDPOINT, "query_all_identities", "0xaa", 100, {"a": 1})
+    cache.set(ENDPOINT, "query_all_identities", "0xbb", 103, {"a": 2})
+
+    assert cache.get_recent(ENDPOINT, "query_all_identities", 105, 5) == (
+        True,
+        {"a": 2},
+    )
+    # the newest entry is too old
+    assert cache.get_recent(ENDPOINT, "query_all_identities", 110, 5)[0] is False
+    # entries newer than the requested block are never served
+    assert cache.get_recent(ENDPOINT, "query_all_identities", 101, 5) == (
+        True,
+        {"a": 1},
+    )
+
+
+def test_lru_eviction_keeps_size_under_cap(tmp_path):
+    cache = QueryCache(db_path=str(tmp_path / "query_cache.db"), max_size_bytes=3_500)
+    for idx in range(3):
+        cache.set(ENDPOINT, "q", f"0x{idx}", idx, b"x" * 1_000)
+    # touch the oldest entry so it survives eviction
+    cache.get(ENDPOINT, "q", "0x0")
+    cache.set(ENDPOINT, "q", "0x3", 3, b"x" * 1_000)
+
+    stats = cache.stats()
+    assert stats["size_bytes"] <= 3_500
+    assert cache.get(ENDPOINT, "q", "0x0")[0] is True
+    assert cache.get(ENDPOINT, "q", "0x3")[0] is True
+    assert cache.get(ENDPOINT, "q", "0x1")[0] is False
+
+
+def test_stats_and_clear(cache):
+    cache.set(ENDPOINT, "get_subnet_prices", "0xaa", 1, [(1, 2)])
+    cache.set(ENDPOINT, "neurons:[1]", "0xaa", 1, [])
+    cache.set(ENDPOINT, "neurons:[2]", "0xaa", 1, [])
+
+    stats = cache.stats()
+    assert stats["entries"] == 3
+    assert stats["queries"]["neurons"][0] == 2
+
+    assert cache.clear() == 3
+    assert cache.stats()["entries"] == 0
+
+
+def test_unpicklable_values_are_skipped(cache):
+    cache.set(ENDPOINT, "q", "0xaa", 1, lambda: None)
+    assert cache.get(ENDPOINT, "q", "0xaa")[0] is False
+
+
+def test_corrupt_entries_are_misses_and_removed(cache):
+    cache.set(ENDPOINT, "q", "0xaa", 1, {"a": 1})
+    cache.set(ENDPOINT, "r", "0xaa", 1, {"a": 1})
+    conn = sqlite3.connect(cache.db_path)
+    conn.execute(f"UPDATE {cache.table} SET value = ?", (b"\x80\x05garbage",))
+    conn.commit()
+    conn.close()
+
+    assert cache.get(ENDPOINT, "q", "0xaa") == (False, None)
+    assert cache.get_recent(ENDPOINT, "r", 1, 5) == (False, None)
+    assert cache.stats()["entries"] == 0
+
+
+def test_entries_of_other_versions_are_not_served(cache):
+    cache.set(ENDPOINT, "q", "0xaa", 1, {"a": 1})
+    conn = sqlite3.connect(cache.db_path)
+    conn.execute(f"UPDATE {cache.table} SET version = '0.0.1/1'")
+    conn.commit()
+    conn.close()
+
+    # a later invocation
+    cache = QueryCache(db_path=cache.db_path)
+    assert cache.get(ENDPOINT, "q", "0xaa") == (False, None)
+    assert cache.stats()["entries"] == 0
+
+
+def test_database_errors_are_misses(tmp_path):
+    # a directory where the database should be, so it cannot be opened
+    (tmp_path / "query_cache.db").mkdir()
+    cache = QueryCache(db_path=str(tmp_path / "query_cache.db"))
+
+    cache.set(ENDPOINT, "q", "0xaa", 1, {"a": 1})
+    assert cache.get(ENDPOINT, "q", "0xaa") == (False, None)
+    assert cache.get_recent(ENDPOINT, "q", 1, 5) == (False, None)
+
+
+@pytest.mark.asyncio
+async def test_subtensor_serves_head_relative_queries_from_cache(cache):
+    subtensor = SubtensorInterface("finney", query_cache=cache)
+    subtensor.substrate = AsyncMock()
+    subtensor.substrate.get_chain_head = AsyncMock(
+        side_effect=["0xaa", "0xbb", "0xaa", "0xcc"]
+    )
+    subtensor.substrate.get_block_number = AsyncMock(side_effect=[100, 102, 400])
+    fetch = AsyncMock(return_value={"5F...": {"name": "x"}})
+
+    first = await subtensor._cached_query("query_all_identities", None, fetch)
+    second = await subtensor._cached_query("query_all_identities", None, fetch)
+    # exact block hash hits skip the block number lookup entirely
+    third = await subtensor._cached_query("query_all_identities", None, fetch)
+    await subtensor._cached_query("query_all_identities", None, fetch)
+
+    assert first == second == third
+    assert fetch.await_count == 2
+    fetch.assert_awaited_with("0xcc")
+
+
+@pytest.mark.asyncio
+async def test_subtensor_serves_explicit_blocks_only_exactly(cache):
+    subtensor = SubtensorInterface("finney", query_cache=cache)
+    subtensor.substrate = AsyncMock()
+    subtensor.substrate.get_block_number = AsyncMock(side_effect=[100, 102])
+    fetch = AsyncMock(side_effect=[{"a": 1}, {"a": 2}])
+
+    assert await subtensor._cached_query("query_all_identities", "0xaa", fetch) == {
+        "a": 1
+    }
+    # within the TTL of the first read, but a historical block must not be served another block's state
+    assert await subtensor._cached_query("query_all_identities", "0xbb", fetch) == {
+        "a": 2
+    }
+    async with subtensor.at_block("0xbb"):
+        assert await subtensor._cached_query("query_all_identities", None, fetch) == {
+            "a": 2
+        }
+    assert fetch.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_all_subnets_and_prices_are_cached_together(cache):
+    subtensor = SubtensorInterface("finney", query_cache=cache)
+    subtensor.substrate = AsyncMock()
+    subtensor.substrate.get_block_number = AsyncMock(return_value=100)
+    subtensor.query_runtime_api = AsyncMock(return_value=[])
+    subtensor._subnet_price_records = AsyncMock(return_value=[])
+
+    await subtensor.all_subnets(block_hash="0xaa")
+    await subtensor.all_subnets(block_hash="0xaa")
+
+    subtensor.query_runtime_api.assert_awaited_once()
+    subtensor._subnet_price_records.assert_awaited_once_with("0xaa", page_size=129)
+    assert set(cache.stats()["queries"]) == {"all_subnets"}
+
+
+def test_stats_do_not_create_the_database(tmp_path):
+    cache = QueryCache(db_path=str(tmp_path / "cache" / "query_cache.db"))
+    assert cache.stats()["entries"] == 0
+    assert cache.clear() == 0
+    assert not (tmp_path / "cache").exists()
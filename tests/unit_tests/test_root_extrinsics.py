@@ -7,7 +7,7 @@ async helper functions (get_current_weights_for_uid, get_limits).
 """
 
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 from bittensor_cli.src.bittensor.extrinsics.root import (
     normalize_max_weight,
@@ -168,10 +168,18 @@ class TestGenerateWeightHash:
 # ---------------------------------------------------------------------------
 
 
+def _mock_weights(subtensor, records):
+    async def _stream(*args, **kwargs):
+        for record in records:
+            yield record
+
+    subtensor.stream_query_map = MagicMock(side_effect=_stream)
+
+
 class TestGetCurrentWeightsForUid:
     async def test_returns_weights_for_matching_uid(self, mock_subtensor):
         # Return [(uid, [(dest, raw_weight), ...])]
-        mock_subtensor.weights = AsyncMock(return_value=[(5, [(0, 65535), (1, 32767)])])
+        _mock_weights(mock_subtensor, [(5, [(0, 65535), (1, 32767)])])
         result = await get_current_weights_for_uid(
             subtensor=mock_subtensor, netuid=0, uid=5
         )
@@ -181,19 +189,34 @@ class TestGetCurrentWeightsForUid:
         assert 0.4 < result[1] < 0.6
 
     async def test_returns_empty_for_nonmatching_uid(self, mock_subtensor):
-        mock_subtensor.weights = AsyncMock(return_value=[(3, [(0, 65535)])])
+        _mock_weights(mock_subtensor, [(3, [(0, 65535)])])
         result = await get_current_weights_for_uid(
             subtensor=mock_subtensor, netuid=0, uid=99
         )
         assert result == {}
 
     async def test_returns_empty_when_no_weights(self, mock_subtensor):
-        mock_subtensor.weights = AsyncMock(return_value=[])
+        _mock_weights(mock_subtensor, [])
         result = await get_current_weights_for_uid(
             subtensor=mock_subtensor, netuid=0, uid=0
         )
         assert result == {}
 
+    async def test_stops_reading_once_uid_is_found(self, mock_subtensor):
+        read = []
+
+        async def _stream(*args, **kwargs):
+            for record in [(1, [(0, 1)]), (5, [(0, 65535)]), (7, [(0, 1)])]:
+                read.append(record[0])
+                yield record
+
+        mock_subtensor.stream_query_map = MagicMock(side_effect=_stream)
+        result = await get_current_weights_for_uid(
+            subtensor=mock_subtensor, netuid=0, uid=5
+        )
+        assert result == {0: pytest.approx(1.0)}
+        assert read == [1, 5]
+
 
 # ---------------------------------------------------------------------------
 # get_limits (async)
@@ -202,16 +225,14 @@ class TestGetCurrentWeightsForUid:
 
 class TestGetLimits:
     async def test_returns_int_and_float(self, mock_subtensor):
-        call_count = [0]
-
-        async def side_effect(param, netuid):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                return "4"  # MinAllowedWeights as string (int-able)
-            return "32767"  # MaxWeightsLimit as string
-
-        mock_subtensor.get_hyperparameter = AsyncMock(side_effect=side_effect)
+        mock_subtensor.get_hyperparameters = AsyncMock(
+            return_value={
+                # as strings (int-able)
+                0: {"MinAllowedWeights": "4", "MaxWeightsLimit": "32767"}
+            }
+        )
         min_w, max_w = await get_limits(mock_subtensor)
+        mock_subtensor.get_hyperparameters.assert_awaited_once()
         assert isinstance(min_w, int)
         assert isinstance(max_w, float)
         assert min_w == 4
@@ -1,14 +1,15 @@
-from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from bittensor_cli.src.bittensor.balances import Balance
+from bittensor_cli.src.bittensor.extrinsics.pipeline import BatchResult
 from bittensor_cli.src.commands.stake.add import stake_add
 
 from .conftest import (
     ALT_HOTKEY_SS58,
     COLDKEY_SS58 as TEST_SS58,
+    mock_swap_pool,
 )
 
 
@@ -19,15 +20,22 @@ class MockSubnetInfo:
         self.is_dynamic = netuid != 0
 
 
-def _sim_swap_side_effect():
-    async def sim_swap_mock(origin_netuid, destination_netuid, amount):
-        del origin_netuid, amount
-        return SimpleNamespace(
-            alpha_amount=Balance.from_tao(1).set_unit(destination_netuid),
-            tao_fee=Balance.from_tao(0.1),
-        )
+def _receipt(extrinsic_id: str) -> MagicMock:
+    return MagicMock(get_extrinsic_identifier=AsyncMock(return_value=extrinsic_id))
+
+
+def _received_column(print_table: MagicMock) -> list[str]:
+    """The "received" cells of the printed stake table."""
+    table = print_table.call_args.args[0]
+    return list(table.columns[4].cells)
+
 
-    return AsyncMock(side_effect=sim_swap_mock)
+def _simulated_alpha(netuid: int, amount: Balance) -> str:
+    """The alpha received for staking ``amount`` (net of the mock extrinsic fee) on the mock pool."""
+    received, _ = mock_swap_pool(netuid).swap(
+        (amount - Balance.from_tao(0.01)).rao, to_alpha=True
+    )
+    return str(Balance.from_rao(received).set_unit(netuid))
 
 
 @pytest.mark.asyncio
@@ -37,11 +45,15 @@ async def test_stake_add_zero_price_does_not_raise(
     mock_subtensor,
     safe_staking,
 ):
-    mock_subtensor.sim_swap = _sim_swap_side_effect()
     mock_subtensor.all_subnets.return_value = [MockSubnetInfo(netuid=427, price_tao=0)]
 
-    with patch(
-        "bittensor_cli.src.commands.stake.add.confirm_action", return_value=False
+    with (
+        patch(
+            "bittensor_cli.src.commands.stake.add.confirm_action", return_value=False
+        ),
+        patch(
+            "bittensor_cli.src.commands.stake.add._print_table_and_slippage"
+        ) as print_table,
     ):
         await stake_add(
             wallet=mock_wallet,
@@ -68,7 +80,11 @@ async def test_stake_add_zero_price_does_not_raise(
     composed_call = mock_subtensor.substrate.compose_call.await_args.kwargs
     expected_fn = "add_stake_limit" if safe_staking else "add_stake"
     assert composed_call["call_function"] == expected_fn
-    assert mock_subtensor.sim_swap.await_count == 1
+    # priced by the local swap simulation, not the runtime API
+    mock_subtensor.sim_swap.assert_not_awaited()
+    assert _received_column(print_table) == [
+        _simulated_alpha(427, Balance.from_tao(10.0))
+    ]
 
 
 @pytest.mark.asyncio
@@ -76,14 +92,18 @@ async def test_stake_add_mixed_prices_including_zero_does_not_raise(
     mock_wallet,
     mock_subtensor,
 ):
-    mock_subtensor.sim_swap = _sim_swap_side_effect()
     mock_subtensor.all_subnets.return_value = [
         MockSubnetInfo(netuid=427, price_tao=0),
         MockSubnetInfo(netuid=1, price_tao=2.0),
     ]
 
-    with patch(
-        "bittensor_cli.src.commands.stake.add.confirm_action", return_value=False
+    with (
+        patch(
+            "bittensor_cli.src.commands.stake.add.confirm_action", return_value=False
+        ),
+        patch(
+            "bittensor_cli.src.commands.stake.add._print_table_and_slippage"
+        ) as print_table,
     ):
         await stake_add(
             wallet=mock_wallet,
@@ -106,8 +126,14 @@ async def test_stake_add_mixed_prices_including_zero_does_not_raise(
             proxy=None,
         )
 
-    assert mock_subtensor.substrate.compose_call.await_count == 2
-    assert mock_subtensor.sim_swap.await_count == 2
+    # both rows are add_stake_limit, so the fee is fetched from a single composed call
+    assert mock_subtensor.substrate.compose_call.await_count == 1
+    mock_subtensor.get_extrinsic_fee.assert_awaited_once()
+    mock_subtensor.sim_swap.assert_not_awaited()
+    assert _received_column(print_table) == [
+        _simulated_alpha(427, Balance.from_tao(10.0)),
+        _simulated_alpha(1, Balance.from_tao(10.0)),
+    ]
 
 
 @pytest.mark.asyncio
@@ -115,17 +141,12 @@ async def test_stake_add_multi_hotkey_multi_netuid_preserves_operation_mapping(
     mock_wallet,
     mock_subtensor,
 ):
-    mock_subtensor.sim_swap = _sim_swap_side_effect()
     mock_subtensor.all_subnets.return_value = [
         MockSubnetInfo(netuid=427, price_tao=1.5),
         MockSubnetInfo(netuid=1, price_tao=2.0),
     ]
     mock_subtensor.sign_and_send_batch_extrinsic = AsyncMock(
-        return_value=(
-            True,
-            "",
-            MagicMock(get_extrinsic_identifier=AsyncMock(return_value="0x1")),
-        )
+        return_value=[BatchResult(0, 4, True, "", _receipt("0x1"))]
     )
 
     prompt_amounts = [
@@ -193,17 +214,12 @@ async def test_stake_add_stake_all_distributes_across_all_operations(
     mock_wallet,
     mock_subtensor,
 ):
-    mock_subtensor.sim_swap = _sim_swap_side_effect()
     mock_subtensor.all_subnets.return_value = [
         MockSubnetInfo(netuid=427, price_tao=1.5),
         MockSubnetInfo(netuid=1, price_tao=2.0),
     ]
     mock_subtensor.sign_and_send_batch_extrinsic = AsyncMock(
-        return_value=(
-            True,
-            "",
-            MagicMock(get_extrinsic_identifier=AsyncMock(return_value="0x1")),
-        )
+        return_value=[BatchResult(0, 4, True, "", _receipt("0x1"))]
     )
 
     with patch(
@@ -243,3 +259,60 @@ async def test_stake_add_stake_all_distributes_across_all_operations(
         call.kwargs["call_params"]["amount_staked"] == expected_amount
         for call in batched_stake_calls
     )
+
+
+@pytest.mark.asyncio
+async def test_stake_add_split_batch_reports_each_operation(
+    mock_wallet,
+    mock_subtensor,
+):
+    mock_subtensor.all_subnets.return_value = [
+        MockSubnetInfo(netuid=427, price_tao=1.5),
+        MockSubnetInfo(netuid=1, price_tao=2.0),
+    ]
+    # the operations were split into two batches, and only the first was included
+    mock_subtensor.sign_and_send_batch_extrinsic = AsyncMock(
+        return_value=[
+            BatchResult(0, 2, True, "", _receipt("100-1")),
+            BatchResult(2, 4, False, "Inability to pay", None),
+        ]
+    )
+
+    with (
+        patch(
+            "bittensor_cli.src.commands.stake.add.unlock_key",
+            return_value=MagicMock(success=True),
+        ),
+        patch("bittensor_cli.src.commands.stake.add.json_console") as json_console,
+    ):
+        await stake_add(
+            wallet=mock_wallet,
+            subtensor=mock_subtensor,
+            netuids=[427, 1],
+            stake_all=True,
+            amount=0,
+            prompt=False,
+            decline=False,
+            quiet=True,
+            all_hotkeys=False,
+            include_hotkeys=[TEST_SS58, ALT_HOTKEY_SS58],
+            exclude_hotkeys=[],
+            safe_staking=False,
+            rate_tolerance=0.05,
+            allow_partial_stake=True,
+            json_output=True,
+            era=16,
+            mev_protection=False,
+            proxy=None,
+        )
+
+    output = json_console.print_json.call_args.kwargs["data"]
+    assert output["staking_success"] == {
+        427: {TEST_SS58: True, ALT_HOTKEY_SS58: False},
+        1: {TEST_SS58: True, ALT_HOTKEY_SS58: False},
+    }
+    assert output["extrinsic_ids"] == {
+        427: {TEST_SS58: "100-1"},
+        1: {TEST_SS58: "100-1"},
+    }
+    assert output["error_messages"][1][ALT_HOTKEY_SS58] == "Inability to pay"
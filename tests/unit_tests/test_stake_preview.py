@@ -0,0 +1,102 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from bittensor_cli.src.bittensor.balances import Balance
+from bittensor_cli.src.commands.stake.preview import (
+    PreviewTarget,
+    gather_bounded,
+    preview_stake_operations,
+)
+
+from .conftest import ALT_HOTKEY_SS58, HOTKEY_SS58, mock_swap_pool
+
+
+def _add_stake(hotkey, netuid, tao):
+    return PreviewTarget(
+        call_function="add_stake",
+        call_params={"hotkey": hotkey, "netuid": netuid, "amount_staked": tao},
+        origin_netuid=0,
+        destination_netuid=netuid,
+        amount=Balance.from_tao(tao),
+        fee_from_amount=True,
+    )
+
+
+@pytest.mark.asyncio
+async def test_preview_fetches_one_fee_per_extrinsic_type(mock_wallet, mock_subtensor):
+    targets = [
+        _add_stake(HOTKEY_SS58, 1, 1),
+        _add_stake(ALT_HOTKEY_SS58, 2, 2),
+        PreviewTarget(
+            call_function="remove_stake",
+            call_params={"hotkey": HOTKEY_SS58},
+            origin_netuid=3,
+            destination_netuid=0,
+            amount=Balance.from_tao(3),
+        ),
+    ]
+
+    rows = await preview_stake_operations(
+        mock_subtensor, mock_wallet, targets, block_hash="0xhash"
+    )
+
+    assert len(rows) == 3
+    assert [
+        call.kwargs["call_function"]
+        for call in mock_subtensor.substrate.compose_call.await_args_list
+    ] == ["add_stake", "remove_stake"]
+    assert mock_subtensor.get_extrinsic_fee.await_count == 2
+    mock_subtensor.get_swap_simulator.assert_awaited_once_with(
+        {0, 1, 2, 3}, block_hash="0xhash", dynamic_info=None
+    )
+    assert all(row.extrinsic_fee == Balance.from_tao(0.01) for row in rows)
+
+
+@pytest.mark.asyncio
+async def test_preview_swaps_amount_net_of_fee(mock_wallet, mock_subtensor):
+    targets = [_add_stake(HOTKEY_SS58, 1, 1)]
+    targets.append(PreviewTarget(**{**vars(targets[0]), "fee_from_amount": False}))
+
+    rows = await preview_stake_operations(mock_subtensor, mock_wallet, targets)
+
+    amounts = [
+        (Balance.from_tao(1) - Balance.from_tao(0.01)).rao,
+        Balance.from_tao(1).rao,
+    ]
+    assert [row.sim_swap.tao_amount.rao for row in rows] == amounts
+    assert [row.sim_swap.alpha_amount.rao for row in rows] == [
+        mock_swap_pool(1).swap(amount, to_alpha=True)[0] for amount in amounts
+    ]
+    mock_subtensor.sim_swap.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_preview_of_nothing_makes_no_requests(mock_wallet, mock_subtensor):
+    assert await preview_stake_operations(mock_subtensor, mock_wallet, []) == []
+    mock_subtensor.get_swap_simulator.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_gather_bounded_limits_concurrency():
+    state = SimpleNamespace(running=0, peak=0)
+
+    async def _task(i):
+        state.running += 1
+        state.peak = max(state.peak, state.running)
+        await asyncio.sleep(0)
+        state.running -= 1
+        return i
+
+    assert await gather_bounded([_task(i) for i in range(10)], limit=3) == list(
+        range(10)
+    )
+    assert state.peak == 3
+
+
+@pytest.mark.asyncio
+async def test_gather_bounded_propagates_errors():
+    with pytest.raises(ValueError):
+        await gather_bounded([AsyncMock(side_effect=ValueError)()])
@@ -0,0 +1,45 @@
+import re
+import subprocess
+import sys
+
+# cumulative import time of `bittensor_cli.cli`, in microseconds
+STARTUP_BUDGET_US = 800_000
+# dependencies which only specific commands need, and so must not be imported at startup
+DEFERRED_MODULES = [
+    "aiohttp",
+    "async_substrate_interface.async_substrate",
+    "git",
+    "jinja2",
+    "netaddr",
+    "plotille",
+    "plotly",
+    "bittensor_cli.src.bittensor.subtensor_interface",
+]
+
+
+def _import_times() -> dict[str, int]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import bittensor_cli.cli"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|\s+(\S+)", line)
+        if match:
+            times[match.group(2)] = int(match.group(1))
+    return times
+
+
+def test_command_modules_are_not_imported_at_startup():
+    imported = _import_times()
+    assert "bittensor_cli.cli" in imported
+    for module in DEFERRED_MODULES:
+        assert module not in imported, f"{module} is imported at startup"
+
+
+def test_startup_import_time_within_budget():
+    # best of three, to smooth out noise from the test machine
+    elapsed = min(_import_times()["bittensor_cli.cli"] for _ in range(3))
+    assert elapsed < STARTUP_BUDGET_US
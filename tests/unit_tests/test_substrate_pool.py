@@ -0,0 +1,93 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from bittensor_cli.src.bittensor.substrate_pool import SubstratePool
+from bittensor_cli.src.bittensor.subtensor_interface import SubtensorInterface
+
+
+def _substrate(url: str, **methods):
+    substrate = MagicMock()
+    substrate.url = url
+    substrate.initialize = AsyncMock()
+    substrate.rpc_request = AsyncMock(return_value={"result": {}})
+    for name, value in methods.items():
+        setattr(substrate, name, value)
+    return substrate
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_fastest_endpoint():
+    slow = _substrate("ws://slow", query=AsyncMock(return_value="slow"))
+    fast = _substrate("ws://fast", query=AsyncMock(return_value="fast"))
+    pool = SubstratePool([slow, fast])
+    pool.latency = {"ws://slow": 0.5, "ws://fast": 0.05}
+
+    assert await pool.query("SubtensorModule", "Tempo", [1]) == "fast"
+    slow.query.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_failed_read_is_retried_on_sibling():
+    broken = _substrate("ws://broken", query=AsyncMock(side_effect=ConnectionError()))
+    healthy = _substrate("ws://healthy", query=AsyncMock(return_value=1))
+    pool = SubstratePool([broken, healthy])
+    pool.latency = {"ws://broken": 0.01, "ws://healthy": 0.1}
+
+    assert await pool.query("SubtensorModule", "Tempo", [1]) == 1
+    assert not pool.is_healthy(broken)
+    assert pool.ranked() == [healthy, broken]
+
+
+@pytest.mark.asyncio
+async def test_non_read_methods_stay_on_pinned_endpoint():
+    pinned = _substrate("ws://pinned", submit_extrinsic=AsyncMock())
+    other = _substrate("ws://other", submit_extrinsic=AsyncMock())
+    pool = SubstratePool([pinned, other])
+    pool.latency = {"ws://pinned": 0.5, "ws://other": 0.05}
+
+    await pool.submit_extrinsic("xt")
+    pinned.submit_extrinsic.assert_awaited_once_with("xt")
+    other.submit_extrinsic.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_chain_head_is_read_from_pinned_endpoint():
+    # the fastest endpoint is a block ahead of the pinned one
+    pinned = _substrate(
+        "ws://pinned",
+        get_chain_head=AsyncMock(return_value="0x100"),
+        compose_call=AsyncMock(),
+    )
+    ahead = _substrate("ws://ahead", get_chain_head=AsyncMock(return_value="0x101"))
+    pool = SubstratePool([pinned, ahead])
+    pool.latency = {"ws://pinned": 0.5, "ws://ahead": 0.05}
+
+    block_hash = await pool.get_chain_head()
+    await pool.compose_call("SubtensorModule", "add_stake", {}, block_hash=block_hash)
+
+    assert block_hash == "0x100"
+    ahead.get_chain_head.assert_not_awaited()
+    pinned.compose_call.assert_awaited_once_with(
+        "SubtensorModule", "add_stake", {}, block_hash="0x100"
+    )
+
+
+@pytest.mark.asyncio
+async def test_unreachable_pinned_endpoint_is_replaced():
+    down = _substrate("ws://down", initialize=AsyncMock(side_effect=OSError()))
+    up = _substrate("ws://up")
+    pool = SubstratePool([down, up])
+
+    await pool.initialize()
+    assert pool.primary is up
+    assert not pool.is_healthy(down)
+
+
+def test_multiple_networks_create_pool():
+    st = SubtensorInterface(["finney", "ws://127.0.0.1:9945"])
+    assert isinstance(st.substrate, SubstratePool)
+    assert st.network == "finney"
+    assert st.chain_endpoints[1] == "ws://127.0.0.1:9945"
+
+    assert not isinstance(SubtensorInterface(["finney"]).substrate, SubstratePool)
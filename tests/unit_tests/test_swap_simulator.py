@@ -0,0 +1,200 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from bittensor_cli.src.bittensor.balances import Balance
+from bittensor_cli.src.bittensor.subtensor_interface import SubtensorInterface
+from bittensor_cli.src.bittensor.swap_simulator import (
+    FEE_RATE_DENOMINATOR,
+    SwapPool,
+    SwapSimulator,
+    fee_amount,
+)
+
+TAO = 1_000_000_000
+
+
+def _pool(netuid=1, tao=1_000 * TAO, alpha=4_000 * TAO, fee_rate=33, exact=True):
+    return SwapPool(netuid, tao, alpha, fee_rate, exact)
+
+
+def test_pool_from_sqrt_price_matches_reserves():
+    """Virtual reserves are L * sqrt(P) TAO and L / sqrt(P) alpha."""
+    # sqrt(P) = 0.5 → P = 0.25
+    pool = SwapPool.from_sqrt_price(1, 1 << 63, liquidity=2_000 * TAO, fee_rate=0)
+    assert pool.tao_reserve == 1_000 * TAO
+    assert pool.alpha_reserve == 4_000 * TAO
+    assert pool.price == Balance.from_tao(0.25)
+
+
+def test_swap_takes_fee_then_follows_constant_product():
+    pool = _pool()
+    amount = 10 * TAO
+    received, fee = pool.swap(amount, to_alpha=True)
+    assert fee == fee_amount(amount, 33)
+    k = pool.tao_reserve * pool.alpha_reserve
+    new_tao = pool.tao_reserve + amount - fee
+    # the pool never ends below its constant product
+    assert (pool.alpha_reserve - received) * new_tao >= k
+    assert (pool.alpha_reserve - received - 1) * new_tao < k
+
+
+def test_simulate_matches_sim_swap_result_shape():
+    simulator = SwapSimulator({1: _pool()})
+    stake = simulator.simulate(0, 1, 10 * TAO)
+    assert stake.tao_amount.rao == 10 * TAO
+    assert stake.alpha_amount.rao == _pool().swap(10 * TAO, to_alpha=True)[0]
+    assert stake.alpha_fee.rao == 0
+
+    unstake = simulator.simulate(1, 0, 10 * TAO)
+    assert unstake.alpha_amount.rao == 10 * TAO
+    assert unstake.tao_fee.rao == 0
+    assert unstake.alpha_fee.rao == fee_amount(10 * TAO, 33)
+
+
+def test_root_swaps_one_to_one():
+    result = SwapSimulator({}).simulate(0, 0, 5 * TAO)
+    assert result.alpha_amount.rao == 5 * TAO
+    assert result.tao_fee.rao == 0
+
+
+def test_move_charges_destination_fee_in_origin_alpha():
+    simulator = SwapSimulator({1: _pool(1), 2: _pool(2, alpha=2_000 * TAO)})
+    result = simulator.simulate(1, 2, 100 * TAO)
+    intermediate = simulator.simulate(1, 0, 100 * TAO)
+    assert result.tao_amount == intermediate.tao_amount
+    assert result.tao_fee.rao > 0
+    assert result.alpha_fee == result.tao_fee / simulator.pools[1].price.tao
+
+
+@pytest.mark.asyncio
+async def test_sim_swap_falls_back_for_user_liquidity():
+    subtensor = SimpleNamespace(sim_swap=AsyncMock(return_value="runtime"))
+    simulator = SwapSimulator(
+        {1: _pool(1), 2: _pool(2, exact=False)}, subtensor, "0xhash"
+    )
+    assert (await simulator.sim_swap(0, 1, TAO)).alpha_amount.rao > 0
+    subtensor.sim_swap.assert_not_awaited()
+
+    assert await simulator.sim_swap(0, 2, TAO) == "runtime"
+    subtensor.sim_swap.assert_awaited_once_with(0, 2, TAO, block_hash="0xhash")
+
+
+@pytest.mark.asyncio
+async def test_get_swap_simulator_reads_state_in_one_query():
+    st = SubtensorInterface("finney")
+    st.substrate = AsyncMock()
+    st.create_storage_keys = AsyncMock(
+        side_effect=lambda *queries, block_hash: [
+            [f"{fn}:{params[0]}" for params in params_list]
+            for _, fn, params_list in queries
+        ]
+    )
+    # netuid 1 is initialized, netuid 2 is seeded from its reserves
+    values = {
+        "AlphaSqrtPrice": [{"bits": 1 << 63}, {"bits": 0}],
+        "CurrentLiquidity": [2_000 * TAO, 0],
+        "FeeRate": [33, 33],
+        "SwapV3Initialized": [True, False],
+        "EnabledUserLiquidity": [False, True],
+    }
+    st.query_multi = AsyncMock(
+        return_value=[(None, v) for column in values.values() for v in column]
+    )
+    dynamic_info = {
+        2: SimpleNamespace(tao_in=Balance(5 * TAO), alpha_in=Balance(7 * TAO))
+    }
+
+    simulator = await st.get_swap_simulator(
+        [0, 2, 1, 2], block_hash="0xhash", dynamic_info=dynamic_info
+    )
+
+    st.query_multi.assert_awaited_once()
+    assert simulator.pools[1] == SwapPool(1, 1_000 * TAO, 4_000 * TAO, 33, True)
+    assert simulator.pools[2] == SwapPool.from_reserves(2, 5 * TAO, 7 * TAO, 33, False)
+    assert simulator.block_hash == "0xhash"
+    assert simulator.verify is False
+
+
+# Swaps with their expected `SwapRuntimeApi` results, worked out from the Swap pallet's formulas: the fee is
+# `amount * U64F64(FeeRate / u16::MAX)` truncated, and the rest is swapped along the pool's constant product, rounded
+# down. Pool "v3" has sqrt price 0.5 and 2,000 TAO of liquidity. Pool "uninitialized" is a subnet whose swap is seeded
+# from 5 TAO and 7 alpha of reserves, through the pallet's sqrt price and liquidity, so its virtual reserves are a rao
+# below the real ones.
+SIM_SWAP_CASES = {
+    "stake": ("v3", 0, 1, 10 * TAO, 10 * TAO, 39_584_215_264, 5_035_477, 0),
+    "unstake": ("v3", 1, 0, 250 * TAO, 58_795_650_511, 250 * TAO, 0, 125_886_930),
+    # amount * 33 // u16::MAX would be a rao more for both of these
+    "unstake fee rounding": ("v3", 1, 0, 65_535, 16_375, 65_535, 0, 32),
+    "stake fee rounding": ("v3", 0, 1, 65_535_000, 65_535_000, 261_990_843, 32_999, 0),
+    "uninitialized": ("uninitialized", 0, 1, TAO, TAO, 1_166_177_066, 503_547, 0),
+}
+SIM_SWAP_POOLS = {
+    "v3": SwapPool.from_sqrt_price(1, 1 << 63, liquidity=2_000 * TAO, fee_rate=33),
+    "uninitialized": SwapPool.from_reserves(1, 5 * TAO, 7 * TAO, fee_rate=33),
+}
+
+
+@pytest.mark.parametrize(
+    "pool, origin, destination, amount, tao, alpha, tao_fee, alpha_fee",
+    SIM_SWAP_CASES.values(),
+    ids=SIM_SWAP_CASES.keys(),
+)
+def test_simulate_matches_runtime_results(
+    pool, origin, destination, amount, tao, alpha, tao_fee, alpha_fee
+):
+    result = SwapSimulator({1: SIM_SWAP_POOLS[pool]}).simulate(
+        origin, destination, amount
+    )
+    assert (
+        result.tao_amount.rao,
+        result.alpha_amount.rao,
+        result.tao_fee.rao,
+        result.alpha_fee.rao,
+    ) == (tao, alpha, tao_fee, alpha_fee)
+
+
+def test_fee_is_rounded_as_u64f64():
+    assert fee_amount(65_535, 33) == 32
+    assert 65_535 * 33 // FEE_RATE_DENOMINATOR == 33
+    assert fee_amount(10 * TAO, 0) == 0
+
+
+def test_uninitialized_pool_is_seeded_like_the_pallet():
+    pool = SIM_SWAP_POOLS["uninitialized"]
+    assert (pool.tao_reserve, pool.alpha_reserve) == (5 * TAO - 1, 7 * TAO - 1)
+    assert SwapPool.from_reserves(1, 5 * TAO, 0, fee_rate=33).swap(TAO, True) == (
+        0,
+        fee_amount(TAO, 33),
+    )
+
+
+@pytest.mark.asyncio
+async def test_verification_mode_cross_checks_the_runtime():
+    pool = SIM_SWAP_POOLS["v3"]
+    local = SwapSimulator({1: pool}).simulate(0, 1, 10 * TAO)
+    subtensor = SimpleNamespace(sim_swap=AsyncMock(return_value=local))
+    simulator = SwapSimulator({1: pool}, subtensor, "0xhash", verify=True)
+
+    with patch(
+        "bittensor_cli.src.bittensor.swap_simulator.print_console"
+    ) as print_console:
+        assert await simulator.sim_swap(0, 1, 10 * TAO) == local
+        print_console.assert_not_called()
+
+        runtime = SwapSimulator({1: _pool(alpha=2_000 * TAO)}).simulate(0, 1, 10 * TAO)
+        subtensor.sim_swap.return_value = runtime
+        # a mismatch is reported, and the runtime's result is used
+        assert await simulator.sim_swap(0, 1, 10 * TAO) is runtime
+        print_console.assert_called_once()
+
+    subtensor.sim_swap.assert_awaited_with(0, 1, 10 * TAO, block_hash="0xhash")
+
+
+@pytest.mark.asyncio
+async def test_verification_mode_is_enabled_from_the_environment(monkeypatch):
+    monkeypatch.setenv("BTCLI_VERIFY_SWAP_SIMULATION", "1")
+    st = SubtensorInterface("finney")
+    st.substrate = AsyncMock()
+    assert (await st.get_swap_simulator([0], block_hash="0xhash")).verify is True
@@ -1,3 +1,4 @@
+import os
 from bittensor_cli.src.bittensor import utils
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
@@ -131,3 +132,130 @@ class TestConfirmAction:
             result = confirm_action("Do you want to proceed?")
             assert result is True
             mock_ask.assert_called_once()
+
+
+class TestHotkeyScan:
+    """Tests for the scanning of the hotkeys of wallets directories."""
+
+    @staticmethod
+    def _forget_index():
+        # as in a new process
+        utils._key_index.clear()
+        utils._key_index_loaded.clear()
+        utils._key_index_updated.clear()
+        utils._key_index_removed.clear()
+
+    @pytest.fixture
+    def wallets_path(self, tmp_path, monkeypatch):
+        from bittensor_wallet import Wallet
+
+        monkeypatch.setenv("BTCLI_PROXIES_PATH", str(tmp_path / "bittensor.db"))
+        self._forget_index()
+        path = tmp_path / "wallets"
+        addresses = {}
+        for name in ("cold1", "cold2"):
+            wallet = Wallet(name=name, path=str(path), hotkey="default")
+            wallet.create_new_coldkey(use_password=False, suppress=True)
+            addresses[(name, None)] = wallet.coldkeypub.ss58_address
+            for hotkey in ("default", "other"):
+                wallet = Wallet(name=name, path=str(path), hotkey=hotkey)
+                wallet.create_new_hotkey(use_password=False, suppress=True)
+                addresses[(name, hotkey)] = wallet.hotkey.ss58_address
+        hotkeys = path / "cold1" / "hotkeys"
+        # a hotkey with only its public file, an encrypted hotkey, and an unrelated file
+        (hotkeys / "other").unlink()
+        (hotkeys / "locked").write_bytes(b"$NACL" + bytes(64))
+        (hotkeys / ".DS_Store").write_bytes(b"\x00\x01")
+        yield path, addresses
+        self._forget_index()
+
+    def test_scan_reads_public_files(self, wallets_path):
+        from bittensor_wallet import Wallet
+
+        path, addresses = wallets_path
+        hotkey_wallets = utils.get_hotkey_wallets_for_wallet(
+            Wallet(name="cold1", path=str(path)), show_encrypted=True
+        )
+        encrypted = [w for w in hotkey_wallets if isinstance(w, utils.WalletLike)]
+        assert [w.hotkey_str for w in encrypted] == ["locked"]
+        assert {
+            w.hotkey_str: utils.get_hotkey_pub_ss58(w)
+            for w in hotkey_wallets
+            if not isinstance(w, utils.WalletLike)
+        } == {
+            "default": addresses[("cold1", "default")],
+            "other": addresses[("cold1", "other")],
+        }
+
+        with_nulls = utils.get_hotkey_wallets_for_wallet(
+            Wallet(name="cold1", path=str(path)), show_nulls=True
+        )
+        assert len(with_nulls) == 3 and with_nulls.count(None) == 1
+
+    def test_all_wallets_for_path(self, wallets_path):
+        path, addresses = wallets_path
+        assert sorted(
+            (w.name, w.hotkey_str) for w in utils.get_all_wallets_for_path(str(path))
+        ) == sorted(k for k in addresses if k[1] is not None)
+
+    def test_index_is_reused_until_files_change(self, wallets_path):
+        path, addresses = wallets_path
+        utils.get_all_wallets_for_path(str(path))
+
+        with patch.object(
+            utils,
+            "deserialize_keypair_from_keyfile_data",
+            wraps=utils.deserialize_keypair_from_keyfile_data,
+        ) as deserialize:
+            utils.get_all_wallets_for_path(str(path))
+            assert deserialize.call_count == 0
+
+            pub_file = path / "cold2" / "hotkeys" / "defaultpub.txt"
+            mtime = pub_file.stat().st_mtime_ns
+            os.utime(pub_file, ns=(mtime + 1_000_000_000, mtime + 1_000_000_000))
+            wallets = utils.get_all_wallets_for_path(str(path))
+            assert deserialize.call_count == 1
+
+            default = next(
+                w for w in wallets if (w.name, w.hotkey_str) == ("cold2", "default")
+            )
+            assert utils.get_hotkey_pub_ss58(default) == addresses[("cold2", "default")]
+            assert deserialize.call_count == 1
+
+    def test_index_is_persisted(self, wallets_path):
+        from bittensor_cli.src.commands.wallets import (
+            _get_coldkey_ss58_addresses_for_path,
+            _get_wallet_by_ss58,
+        )
+
+        path, addresses = wallets_path
+        utils.get_all_wallets_for_path(str(path))
+        coldkeys, names = _get_coldkey_ss58_addresses_for_path(str(path))
+        assert dict(zip(names, coldkeys)) == {
+            name: addresses[(name, None)] for name in ("cold1", "cold2")
+        }
+        self._forget_index()
+
+        with patch.object(
+            utils,
+            "deserialize_keypair_from_keyfile_data",
+            wraps=utils.deserialize_keypair_from_keyfile_data,
+        ) as deserialize:
+            assert len(utils.get_all_wallets_for_path(str(path))) == 4
+            assert utils.find_wallets_by_ss58(
+                str(path), addresses[("cold2", "other")]
+            ) == [("cold2", "other")]
+            wallet = _get_wallet_by_ss58(str(path), addresses[("cold2", None)])
+            assert wallet.name == "cold2"
+            assert deserialize.call_count == 0
+
+        # a deleted hotkey is removed from the index
+        (path / "cold2" / "hotkeys" / "other").unlink()
+        (path / "cold2" / "hotkeys" / "otherpub.txt").unlink()
+        utils.get_all_wallets_for_path(str(path))
+        assert (
+            utils.find_wallets_by_ss58(str(path), addresses[("cold2", "other")]) == []
+        )
+        self._forget_index()
+        utils._load_key_index([str(path)])
+        assert str(path / "cold2" / "hotkeys" / "other") not in utils._key_index
@@ -0,0 +1,85 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from bittensor_cli.src.bittensor.subtensor_interface import SubtensorInterface
+from bittensor_cli.src.bittensor.utils import MAX_CONCURRENT_REQUESTS
+from bittensor_cli.src.commands.wallets import _get_neurons_for_hotkeys
+
+from .conftest import ALT_HOTKEY_SS58, DEST_SS58, HOTKEY_SS58
+
+# (netuid, hotkey): uid
+REGISTRATIONS = {(1, HOTKEY_SS58): 0, (3, HOTKEY_SS58): 12, (3, ALT_HOTKEY_SS58): 4}
+
+
+@pytest.fixture
+def subtensor():
+    st = SubtensorInterface("finney")
+    st.substrate = AsyncMock()
+
+    async def _create_storage_keys(*queries, block_hash=None):
+        return [
+            [SimpleNamespace(params=params) for params in params_list]
+            for _, _, params_list in queries
+        ]
+
+    async def _query_multi(keys, block_hash=None):
+        return [(k, REGISTRATIONS.get(tuple(k.params))) for k in keys]
+
+    async def _neuron_lite_for_uid(uid, netuid, block_hash=None):
+        return SimpleNamespace(netuid=netuid, uid=uid)
+
+    st.create_storage_keys = AsyncMock(side_effect=_create_storage_keys)
+    st.query_multi = AsyncMock(side_effect=_query_multi)
+    st.neuron_lite_for_uid = AsyncMock(side_effect=_neuron_lite_for_uid)
+    return st
+
+
+@pytest.mark.asyncio
+async def test_uids_of_many_hotkeys_in_one_query(subtensor):
+    uids = await subtensor.get_uids_for_hotkeys(
+        [HOTKEY_SS58, ALT_HOTKEY_SS58, DEST_SS58], [0, 1, 2, 3], block_hash="0xhash"
+    )
+
+    assert uids == {1: {HOTKEY_SS58: 0}, 3: {HOTKEY_SS58: 12, ALT_HOTKEY_SS58: 4}}
+    subtensor.query_multi.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_overview_fetches_only_the_hotkeys_neurons(subtensor):
+    neurons = await _get_neurons_for_hotkeys(
+        subtensor, [0, 1, 2, 3], [HOTKEY_SS58, ALT_HOTKEY_SS58], block_hash="0xhash"
+    )
+
+    assert {
+        netuid: [n.uid for n in neurons_] for netuid, neurons_ in neurons.items()
+    } == {1: [0], 3: [12, 4]}
+    assert subtensor.neuron_lite_for_uid.await_count == 3
+    subtensor.query_multi.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_overview_bounds_concurrent_neuron_requests(subtensor):
+    hotkeys = [f"hotkey{i}" for i in range(100)]
+    subtensor.get_uids_for_hotkeys = AsyncMock(
+        return_value={
+            netuid: {hk: i for i, hk in enumerate(hotkeys)} for netuid in (1, 2)
+        }
+    )
+    in_flight = peak = 0
+
+    async def _neuron_lite_for_uid(uid, netuid, block_hash=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return SimpleNamespace(netuid=netuid, uid=uid)
+
+    subtensor.neuron_lite_for_uid.side_effect = _neuron_lite_for_uid
+    neurons = await _get_neurons_for_hotkeys(subtensor, [1, 2], hotkeys)
+
+    assert [len(neurons_) for neurons_ in neurons.values()] == [100, 100]
+    assert peak == MAX_CONCURRENT_REQUESTS